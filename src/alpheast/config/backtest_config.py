@@ -5,6 +5,8 @@ from typing import List, Optional
 from alpheast.models.interval import Interval
 
 
+logger = logging.getLogger(__name__)
+
 class BacktestConfig:
     def __init__(
         self,
@@ -33,7 +35,7 @@ class BacktestConfig:
             raise ValueError("Initial cash must be positive.")
         
     def log(self):
-        logging.info(f"Symbols: {self.symbols}, Start Date: {self.start_date}, End Date: {self.end_date}, Initial Cash: {self.initial_cash}, Interval: {self.interval}, Trans: {self.transaction_cost_percent}")
+        logger.info("Symbols: %s, Start Date: %s, End Date: %s, Initial Cash: %s, Interval: %s, Trans: %s", self.symbols, self.start_date, self.end_date, self.initial_cash, self.interval, self.transaction_cost_percent)
 
 class BacktestingOptions:
     def __init__(
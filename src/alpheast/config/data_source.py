@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional
 
+from alpheast.data.bar_store import BarStore
 from alpheast.data.price_bar_client import PriceBarClient
 from alpheast.models.price_bar import PriceBar
 
@@ -11,6 +12,7 @@ class DataSourceType(Enum):
     DIRECT = "DIRECT"
     STD_CLIENT = "STD_CLIENT"
     CUSTOM_CLIENT = "CUSTOM_CLIENT"
+    REPLAY = "REPLAY"
 
 class SupportedProvider(Enum):
     ALPHA_VANTAGE = "ALPHA_VANTAGE"
@@ -21,4 +23,6 @@ class DataSource:
     price_bar_data: Optional[Dict[str, List[PriceBar]]] = None # Symbol -> its price data
     api_key: Optional[str] = None
     provider: Optional[SupportedProvider] = None
-    custom_client: Optional[PriceBarClient] = None
\ No newline at end of file
+    custom_client: Optional[PriceBarClient] = None
+    bar_store: Optional[BarStore] = None # Columnar alternative to price_bar_data for DIRECT sources
+    event_log_path: Optional[str] = None # Recorded event log whose market events REPLAY sources stream
\ No newline at end of file
@@ -0,0 +1,32 @@
+
+from dataclasses import dataclass
+
+
+@dataclass
+class MarginConfig:
+    """
+    Margin settings for long/short backtests.
+
+    Short sale proceeds are credited to cash but encumbered: opening a short of value V
+    uses `initial_margin * V` of buying power, and the account's equity must stay above
+    `maintenance_margin` times the short market value, otherwise the open shorts are
+    partially covered at the end of the timestamp.
+
+    Attributes:
+        allow_short: Whether SELL signals may open short positions.
+        initial_margin: Fraction of a short's value required as additional collateral when opening it (e.g. 0.5 for Reg T).
+        maintenance_margin: Minimum equity as a fraction of the short market value.
+        borrow_fee_rate: Annual fee on the short market value, charged on every daily update.
+    """
+    allow_short: bool = True
+    initial_margin: float = 0.5
+    maintenance_margin: float = 0.3
+    borrow_fee_rate: float = 0.0
+
+    def __post_init__(self):
+        if self.initial_margin < 0 or self.maintenance_margin < 0:
+            raise ValueError("Margin requirements must not be negative.")
+        if self.maintenance_margin > self.initial_margin:
+            raise ValueError("Maintenance margin must not exceed the initial margin.")
+        if self.borrow_fee_rate < 0:
+            raise ValueError("Borrow fee rate must not be negative.")
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from alpheast.events.event_enums import EventType
+
+
+@dataclass
+class RecordingConfig:
+    """
+    Recording of the engine's event stream to a binary event log (see `alpheast.events.event_log`).
+
+    The log can be replayed with `DataSource(type=DataSourceType.REPLAY, event_log_path=...)`: its market events
+    feed new strategies, and with `replay_fills=True` its fills feed a new portfolio configuration.
+
+    Attributes:
+        file_path: Log file, written while the engine runs (gzipped if it ends in ".gz"). Stepping mode sessions
+            after a `reset()` are written next to it as "<name>.1.<extension>", "<name>.2.<extension>", ...
+        event_types: Event types to record, all if None. Replays need MARKET, and FILL for `replay_fills`.
+        buffer_size: Write buffer size in bytes, which bounds the memory used by the recording.
+    """
+    file_path: str
+    event_types: Optional[List[EventType]] = None
+    buffer_size: int = 1 << 20
+
+    def __post_init__(self):
+        if self.buffer_size < 1:
+            raise ValueError("Recording buffer size must be at least 1 byte.")
+        if self.event_types is not None and not self.event_types:
+            raise ValueError("Recording needs at least one event type.")
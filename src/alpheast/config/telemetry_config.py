@@ -0,0 +1,32 @@
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class TelemetryConfig:
+    """
+    Live event loop telemetry in Prometheus text exposition format.
+
+    A background thread samples the engine every `interval_seconds` and publishes the metrics
+    to `file_path` (rewritten atomically, e.g. for node_exporter's textfile collector),
+    to an HTTP endpoint on `http_host:http_port`, or both.
+
+    Attributes:
+        interval_seconds: Time between two samples.
+        file_path: File the metrics are written to, None to disable.
+        http_port: Port of the local /metrics endpoint, None to disable (0 picks a free port).
+        http_host: Interface the endpoint binds to.
+        labels: Constant labels added to every metric, e.g. {"run": "minute_bars_2024"}.
+    """
+    interval_seconds: float = 5.0
+    file_path: Optional[str] = None
+    http_port: Optional[int] = None
+    http_host: str = "127.0.0.1"
+    labels: Dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.interval_seconds <= 0:
+            raise ValueError("Telemetry interval must be positive.")
+        if self.file_path is None and self.http_port is None:
+            raise ValueError("Telemetry needs a file path, an HTTP port or both.")
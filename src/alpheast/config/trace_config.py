@@ -0,0 +1,28 @@
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TraceConfig:
+    """
+    Timeline trace of the event loop in the Chrome trace event format, which Perfetto (ui.perfetto.dev)
+    and chrome://tracing open directly.
+
+    Every sampled timestamp becomes one span containing a span per dispatched event
+    and, inside it, a span per handler call (DataHandler, strategies, PortfolioManager, ...).
+
+    Attributes:
+        file_path: JSON file the trace is written to when the run ends (gzipped if it ends in ".gz").
+        sample_every: Trace every N-th timestamp only, to bound the overhead and the file size.
+        max_timestamps: Stop tracing after this many sampled timestamps, None for no limit.
+    """
+    file_path: str
+    sample_every: int = 1
+    max_timestamps: Optional[int] = None
+
+    def __post_init__(self):
+        if self.sample_every < 1:
+            raise ValueError("Trace sampling interval must be at least 1.")
+        if self.max_timestamps is not None and self.max_timestamps < 1:
+            raise ValueError("Maximum number of traced timestamps must be at least 1.")
@@ -10,6 +10,8 @@ from alpheast.models.interval import Interval
 from alpheast.models.price_bar import PriceBar
 
 
+logger = logging.getLogger(__name__)
+
 class AlphaVantageStdPriceBarClient(PriceBarClient):
     BASE_URL = "https://www.alphavantage.co/query"
     
@@ -27,7 +29,7 @@ class AlphaVantageStdPriceBarClient(PriceBarClient):
         if not api_key:
             raise ValueError("Alpha Vantage API key cannot be empty.")
         self.api_key = api_key
-        logging.info("AlphaVantage Client initialized")
+        logger.info("AlphaVantage Client initialized")
 
     def get_price_bar_data(
         self,
@@ -36,11 +38,11 @@ class AlphaVantageStdPriceBarClient(PriceBarClient):
         end_date: datetime, 
         interval: Interval
     ) -> List[PriceBar]:
-        logging.info(f"Fetching price bar data for {symbol} from Alpha Vantage...")
+        logger.info("Fetching price bar data for %s from Alpha Vantage...", symbol)
         
         function = self._FUNCTION_MAP.get(interval)
         if not function:
-            logging.error(f"Unsupported interval for Alpha Vantage: {interval.value}")
+            logger.error("Unsupported interval for Alpha Vantage: %s", interval.value)
             return []
         
         
@@ -59,7 +61,7 @@ class AlphaVantageStdPriceBarClient(PriceBarClient):
         data = self._make_request(params)
 
         if not data or time_series_key not in data:
-            logging.error(f"Could not retrieve {interval.value} time series data for {symbol}. Raw data: {data}")
+            logger.error("Could not retrieve %s time series data for %s. Raw data: %s", interval.value, symbol, data)
             return []
 
         price_bar_data: List[PriceBar] = []
@@ -80,12 +82,12 @@ class AlphaVantageStdPriceBarClient(PriceBarClient):
                         volume=int(values["5. volume"])
                     ))
                 except KeyError as ke:
-                    logging.warning(f"Missing key in Alpha Vantage data for {symbol} on {date_str}: {ke}")
+                    logger.warning("Missing key in Alpha Vantage data for %s on %s: %s", symbol, date_str, ke)
                 except ValueError as ve:
-                    logging.warning(f"Value conversion error for {symbol} on {date_str}: {ve}")
+                    logger.warning("Value conversion error for %s on %s: %s", symbol, date_str, ve)
 
         price_bar_data.sort(key=lambda x: x.timestamp)
-        logging.info(f"Retrieved {len(price_bar_data)} EOD prices for {symbol} within specified data range.")
+        logger.info("Retrieved %s EOD prices for %s within specified data range.", len(price_bar_data), symbol)
         return price_bar_data
     
 
@@ -98,19 +100,19 @@ class AlphaVantageStdPriceBarClient(PriceBarClient):
             data = response.json()
             
             if "Error Message" in data:
-                logging.error(f"Alpha Vantage API Error: {data["Error Message"]}")
+                logger.error("Alpha Vantage API Error: %s", data["Error Message"])
                 return None
             if "Note" in data:
-                logging.warning(f"Alpha Vantage API Note: {data["Note"]}")
+                logger.warning("Alpha Vantage API Note: %s", data["Note"])
             return data
         except requests.exceptions.HTTPError as http_error:
-            logging.error(f"HTTP error occurred: {http_error}")
+            logger.error("HTTP error occurred: %s", http_error)
         except requests.exceptions.ConnectionError as conn_error:
-            logging.error(f"Connection error occurred while fetching from Alpha Vantage: {conn_error}. Request params: {params}")
+            logger.error("Connection error occurred while fetching from Alpha Vantage: %s. Request params: %s", conn_error, params)
         except requests.exceptions.Timeout as timeout_error:
-            logging.error(f"Timeout occurred while fetching from Alpha Vantage: {timeout_error}. Request params: {params}")
+            logger.error("Timeout occurred while fetching from Alpha Vantage: %s. Request params: %s", timeout_error, params)
         except ValueError:
-            logging.error(f"Could not decode JSON response from Alpha Vantage. Response: {response.text}. Request params: {params}")
+            logger.error("Could not decode JSON response from Alpha Vantage. Response: %s. Request params: %s", response.text, params)
         except Exception as e:
-            logging.error(f"An unexpected error occurred during Alpha Vantage request: {e}. Request params: {params}")
+            logger.error("An unexpected error occurred during Alpha Vantage request: %s. Request params: %s", e, params)
         return None
\ No newline at end of file
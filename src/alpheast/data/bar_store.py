@@ -0,0 +1,133 @@
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from alpheast.models.price_bar import PriceBar
+
+
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+class BarStore:
+    """
+    Columnar store of price bars: one sorted datetime64 array and one float64 array per field for every symbol.
+    It is much smaller than lists of PriceBar objects, so it can be shared with worker processes cheaply.
+    The PriceBar lists and the DataHandler frame are built from it once and cached.
+    `slice` returns views on a range of the timeline that reuse all of this without copying.
+    """
+    def __init__(self, columns: Dict[str, Dict[str, np.ndarray]]):
+        self._columns = columns
+        self._price_bar_data: Optional[Dict[str, List[PriceBar]]] = None
+        self._frames: Dict[tuple, pd.DataFrame] = {}
+        self._timeline: Optional[np.ndarray] = None
+        self._parent: Optional["BarStore"] = None
+        self._symbol_ranges: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def from_price_bar_data(cls, price_bar_data: Dict[str, List[PriceBar]]) -> "BarStore":
+        columns = {}
+        for symbol, price_bars in price_bar_data.items():
+            bars = sorted(price_bars, key=lambda bar: bar.timestamp)
+            symbol_columns = {"timestamp": np.array([bar.timestamp for bar in bars], dtype="datetime64[ns]")}
+            for field in BAR_FIELDS:
+                symbol_columns[field] = np.fromiter((float(getattr(bar, field)) for bar in bars), dtype=np.float64, count=len(bars))
+            columns[symbol] = symbol_columns
+        return cls(columns)
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def timeline(self) -> np.ndarray:
+        """
+        Sorted distinct timestamps over all symbols.
+        """
+        if self._timeline is None:
+            self._timeline = np.unique(np.concatenate([columns["timestamp"] for columns in self._columns.values()])) \
+                if self._columns else np.empty(0, dtype="datetime64[ns]")
+        return self._timeline
+
+    def slice(self, start: int, end: int) -> "BarStore":
+        """
+        The bars of the timeline positions [start, end) as a new store whose columns are views on this one.
+        The cached PriceBar lists and frames of this store are shared too (sliced, not rebuilt).
+        """
+        timeline = self.timeline
+        start, end = max(0, start), min(end, len(timeline))
+        if start >= end:
+            raise ValueError(f"Empty bar store slice [{start}, {end}).")
+        first, last = timeline[start], timeline[end - 1]
+
+        columns = {}
+        symbol_ranges = {}
+        for symbol, symbol_columns in self._columns.items():
+            timestamps = symbol_columns["timestamp"]
+            low = int(np.searchsorted(timestamps, first, side="left"))
+            high = int(np.searchsorted(timestamps, last, side="right"))
+            columns[symbol] = {field: array[low:high] for field, array in symbol_columns.items()}
+            symbol_ranges[symbol] = (low, high)
+
+        sliced = BarStore(columns)
+        sliced._timeline = timeline[start:end]
+        sliced._parent = self
+        sliced._symbol_ranges = symbol_ranges
+        return sliced
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for symbol_columns in self._columns.values() for array in symbol_columns.values())
+
+    def get_column(self, symbol: str, field: str) -> np.ndarray:
+        return self._columns[symbol][field]
+
+    def to_price_bar_data(self) -> Dict[str, List[PriceBar]]:
+        """
+        The bars as PriceBar lists per symbol (Decimal prices), built on first use.
+        """
+        if self._price_bar_data is None:
+            if self._parent is not None:
+                parent_data = self._parent.to_price_bar_data()
+                self._price_bar_data = {
+                    symbol: parent_data[symbol][low:high] for symbol, (low, high) in self._symbol_ranges.items()
+                }
+            else:
+                self._price_bar_data = {symbol: self._build_price_bars(symbol) for symbol in self._columns}
+        return self._price_bar_data
+
+    def to_frame(self, symbols: List[str]) -> pd.DataFrame:
+        """
+        All bars of `symbols` in one frame sorted by timestamp and symbol, as streamed by the DataHandler.
+        Built on first use per symbol list; callers must not modify it.
+        """
+        key = tuple(symbols)
+        frame = self._frames.get(key)
+        if frame is None:
+            present = [symbol for symbol in symbols if symbol in self._columns]
+            if not present:
+                return pd.DataFrame()
+            if self._parent is not None:
+                # The parent frame is sorted by timestamp first, so the slice is one contiguous block of rows
+                parent_frame = self._parent.to_frame(symbols)
+                parent_timestamps = parent_frame["timestamp"].to_numpy()
+                low = np.searchsorted(parent_timestamps, self.timeline[0], side="left")
+                high = np.searchsorted(parent_timestamps, self.timeline[-1], side="right")
+                frame = parent_frame.iloc[low:high]
+                self._frames[key] = frame
+                return frame
+            frame = pd.DataFrame({
+                "timestamp": np.concatenate([self._columns[symbol]["timestamp"] for symbol in present]),
+                "symbol": np.concatenate([np.full(len(self._columns[symbol]["timestamp"]), symbol, dtype=object) for symbol in present]),
+                **{field: np.concatenate([self._columns[symbol][field] for symbol in present]) for field in BAR_FIELDS}
+            })
+            frame = frame.sort_values(by=["timestamp", "symbol"]).reset_index(drop=True)
+            self._frames[key] = frame
+        return frame
+
+    def _build_price_bars(self, symbol: str) -> List[PriceBar]:
+        columns = self._columns[symbol]
+        timestamps = pd.DatetimeIndex(columns["timestamp"]).to_pydatetime()
+        # repr() gives the shortest string that round-trips the float, so the Decimals match the loaded ones
+        fields = [[Decimal(repr(value)) for value in columns[field].tolist()] for field in BAR_FIELDS]
+        return [PriceBar(symbol, timestamp, *values) for timestamp, *values in zip(timestamps, *fields)]
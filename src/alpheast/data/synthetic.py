@@ -0,0 +1,229 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+import math
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from alpheast.data.bar_store import BarStore
+from alpheast.models.interval import Interval
+from alpheast.models.price_bar import PriceBar
+from alpheast.shared.metrics import TRADING_DAYS_PER_YEAR
+
+
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+SESSION_MINUTES = 390
+_INTRADAY_MINUTES = {
+    Interval.HOURLY: 60,
+    Interval.MINUTE_30: 30,
+    Interval.MINUTE_15: 15,
+    Interval.MINUTE_5: 5,
+    Interval.MINUTE_1: 1,
+}
+# Offset objects rather than aliases, whose names changed between pandas versions (e.g. "BM" -> "BME")
+_CALENDAR_FREQUENCIES = {
+    Interval.DAILY: (pd.offsets.BDay(), TRADING_DAYS_PER_YEAR),
+    Interval.WEEKLY: (pd.offsets.Week(weekday=4), 52),
+    Interval.MONTHLY: (pd.offsets.BMonthEnd(), 12),
+}
+
+class PriceModel(ABC):
+    """
+    Base class of the synthetic price processes. Parameters are annualized; `log_returns` turns
+    (symbols x bars) standard normal shocks, already correlated across symbols, into log returns per bar.
+    """
+    @abstractmethod
+    def log_returns(self, shocks: np.ndarray, dt: float, rng: np.random.Generator) -> np.ndarray:
+        pass
+
+@dataclass
+class GeometricBrownianMotion(PriceModel):
+    """
+    Lognormal prices with constant drift and volatility.
+    """
+    drift: float = 0.07
+    volatility: float = 0.2
+
+    def log_returns(self, shocks: np.ndarray, dt: float, rng: np.random.Generator) -> np.ndarray:
+        return (self.drift - 0.5 * self.volatility ** 2) * dt + self.volatility * math.sqrt(dt) * shocks
+
+@dataclass
+class JumpDiffusion(PriceModel):
+    """
+    Merton jump diffusion: GBM plus idiosyncratic Poisson jumps with normally distributed log sizes.
+    The drift is compensated, so `drift` is still the expected return.
+
+    Attributes:
+        jump_intensity: Expected number of jumps per year.
+        jump_mean: Mean log size of a jump (negative for crashes).
+        jump_volatility: Standard deviation of the log size of a jump.
+    """
+    drift: float = 0.07
+    volatility: float = 0.15
+    jump_intensity: float = 3.0
+    jump_mean: float = -0.04
+    jump_volatility: float = 0.06
+
+    def log_returns(self, shocks: np.ndarray, dt: float, rng: np.random.Generator) -> np.ndarray:
+        compensator = self.jump_intensity * (math.exp(self.jump_mean + 0.5 * self.jump_volatility ** 2) - 1.0)
+        diffusion = GeometricBrownianMotion(self.drift - compensator, self.volatility).log_returns(shocks, dt, rng)
+        jumps = rng.poisson(self.jump_intensity * dt, shocks.shape)
+        jump_sizes = self.jump_mean * jumps + self.jump_volatility * np.sqrt(jumps) * rng.standard_normal(shocks.shape)
+        return diffusion + jump_sizes
+
+@dataclass
+class RegimeSwitching(PriceModel):
+    """
+    GBM whose drift and volatility follow a market-wide Markov chain of regimes, e.g. calm/bull and volatile/bear.
+
+    Attributes:
+        drifts: Annual drift of every regime.
+        volatilities: Annual volatility of every regime.
+        transition_matrix: Probability of moving from regime i (row) to regime j (column) from one bar to the next.
+    """
+    drifts: Sequence[float] = (0.12, -0.2)
+    volatilities: Sequence[float] = (0.12, 0.35)
+    transition_matrix: Sequence[Sequence[float]] = ((0.99, 0.01), (0.03, 0.97))
+
+    def __post_init__(self):
+        matrix = np.asarray(self.transition_matrix, dtype=np.float64)
+        if matrix.shape != (len(self.drifts), len(self.drifts)) or len(self.volatilities) != len(self.drifts):
+            raise ValueError("Regime drifts, volatilities and transition matrix must have matching sizes.")
+        if not np.allclose(matrix.sum(axis=1), 1.0) or (matrix < 0).any():
+            raise ValueError("Rows of the transition matrix must be probability distributions.")
+
+    def regime_path(self, num_bars: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Regime of every bar, starting in regime 0. Only the switches are simulated: the time spent in a
+        regime is geometric, and the next regime is drawn from the off-diagonal row of the transition matrix.
+        """
+        matrix = np.asarray(self.transition_matrix, dtype=np.float64)
+        path = np.empty(num_bars, dtype=np.int64)
+        position, regime = 0, 0
+        while position < num_bars:
+            stay = matrix[regime, regime]
+            duration = num_bars if stay >= 1.0 else int(rng.geometric(1.0 - stay))
+            path[position:position + duration] = regime
+            position += duration
+            leave = matrix[regime].copy()
+            leave[regime] = 0.0
+            if leave.sum() > 0:
+                regime = int(rng.choice(len(leave), p=leave / leave.sum()))
+        return path
+
+    def log_returns(self, shocks: np.ndarray, dt: float, rng: np.random.Generator) -> np.ndarray:
+        regimes = self.regime_path(shocks.shape[1], rng)
+        drift = np.asarray(self.drifts, dtype=np.float64)[regimes]
+        volatility = np.asarray(self.volatilities, dtype=np.float64)[regimes]
+        return (drift - 0.5 * volatility ** 2) * dt + volatility * math.sqrt(dt) * shocks
+
+def synthetic_timestamps(start: datetime, num_bars: int, interval: Interval) -> np.ndarray:
+    """
+    `num_bars` bar timestamps from `start`: business days, Friday week ends and business month ends
+    for the calendar intervals, bars of the 9:30-16:00 session on business days for the intraday ones.
+    """
+    if interval in _CALENDAR_FREQUENCIES:
+        frequency, _ = _CALENDAR_FREQUENCIES[interval]
+        return pd.date_range(start, periods=num_bars, freq=frequency).values.astype("datetime64[ns]")
+
+    minutes = _INTRADAY_MINUTES[interval]
+    bars_per_session = math.ceil(SESSION_MINUTES / minutes)
+    days = pd.bdate_range(pd.Timestamp(start).normalize(), periods=math.ceil(num_bars / bars_per_session)).values
+    offsets = (SESSION_OPEN + pd.to_timedelta(np.arange(bars_per_session) * minutes, unit="min")).values
+    return (days[:, None] + offsets[None, :]).ravel()[:num_bars].astype("datetime64[ns]")
+
+def bars_per_year(interval: Interval) -> int:
+    if interval in _CALENDAR_FREQUENCIES:
+        return _CALENDAR_FREQUENCIES[interval][1]
+    return TRADING_DAYS_PER_YEAR * math.ceil(SESSION_MINUTES / _INTRADAY_MINUTES[interval])
+
+def correlated_shocks(num_symbols: int, num_bars: int, correlation: Union[float, np.ndarray], rng: np.random.Generator) -> np.ndarray:
+    """
+    (symbols x bars) standard normals whose rows have the given correlation (one value for all pairs, or a matrix).
+    """
+    shocks = rng.standard_normal((num_symbols, num_bars))
+    if np.isscalar(correlation):
+        if correlation == 0.0:
+            return shocks
+        matrix = np.full((num_symbols, num_symbols), float(correlation))
+        np.fill_diagonal(matrix, 1.0)
+    else:
+        matrix = np.asarray(correlation, dtype=np.float64)
+        if matrix.shape != (num_symbols, num_symbols):
+            raise ValueError(f"Correlation matrix must be {num_symbols}x{num_symbols}.")
+    try:
+        cholesky = np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        raise ValueError("Correlation matrix must be positive definite.")
+    return cholesky @ shocks
+
+def generate_bar_store(
+    symbols: Union[int, List[str]],
+    num_bars: int,
+    interval: Interval = Interval.DAILY,
+    model: Optional[PriceModel] = None,
+    correlation: Union[float, np.ndarray] = 0.0,
+    start: datetime = datetime(2020, 1, 1),
+    initial_price: float = 100.0,
+    base_volume: float = 1_000_000.0,
+    seed: Optional[int] = None
+) -> BarStore:
+    """
+    Generates synthetic OHLCV bars for stress tests and scaling benchmarks, directly in columnar form.
+
+    Closes follow the price model; every bar opens at the previous close, and high/low extend beyond the
+    open and close by half-normal amounts of the symbol's bar volatility. All symbols share the timeline.
+    Millions of bars take well under a second, since everything is generated as (symbols x bars) arrays.
+
+    Args:
+        symbols: Symbol names, or the number of symbols to name SYN0000, SYN0001, ...
+        num_bars: Bars per symbol.
+        interval: Bar interval, which sets the timestamps and the time step of the price model.
+        model: Price process (GeometricBrownianMotion with default parameters if None).
+        correlation: Correlation of the symbols' shocks, one value for all pairs or a matrix.
+        start: First bar's date.
+        initial_price: Price every symbol starts from.
+        base_volume: Median volume per bar.
+        seed: Seed of the random generator; equal seeds give equal bars.
+
+    Returns:
+        A BarStore, usable as `DataSource(type=DataSourceType.DIRECT, bar_store=...)`.
+    """
+    if isinstance(symbols, int):
+        symbols = [f"SYN{i:04d}" for i in range(symbols)]
+    if num_bars < 1 or not symbols:
+        raise ValueError("At least one symbol and one bar are required.")
+
+    rng = np.random.default_rng(seed)
+    model = model or GeometricBrownianMotion()
+    num_symbols = len(symbols)
+
+    log_returns = model.log_returns(correlated_shocks(num_symbols, num_bars, correlation, rng), 1.0 / bars_per_year(interval), rng)
+    log_close = math.log(initial_price) + np.cumsum(log_returns, axis=1)
+    log_open = np.concatenate((np.full((num_symbols, 1), math.log(initial_price)), log_close[:, :-1]), axis=1)
+
+    bar_volatility = log_returns.std(axis=1, keepdims=True)
+    log_high = np.maximum(log_open, log_close) + 0.5 * bar_volatility * np.abs(rng.standard_normal((num_symbols, num_bars)))
+    log_low = np.minimum(log_open, log_close) - 0.5 * bar_volatility * np.abs(rng.standard_normal((num_symbols, num_bars)))
+    volume = np.round(base_volume * rng.lognormal(0.0, 0.3, (num_symbols, num_bars)))
+
+    timestamps = synthetic_timestamps(start, num_bars, interval)
+    fields = {
+        "open": np.round(np.exp(log_open), 4),
+        "high": np.round(np.exp(log_high), 4),
+        "low": np.round(np.exp(log_low), 4),
+        "close": np.round(np.exp(log_close), 4),
+        "volume": volume,
+    }
+    return BarStore({
+        symbol: {"timestamp": timestamps, **{field: values[i] for field, values in fields.items()}}
+        for i, symbol in enumerate(symbols)
+    })
+
+def generate_price_bar_data(*args, **kwargs) -> Dict[str, List[PriceBar]]:
+    """
+    Like `generate_bar_store`, but returns PriceBar lists per symbol (for `DataSource(price_bar_data=...)`).
+    """
+    return generate_bar_store(*args, **kwargs).to_price_bar_data()
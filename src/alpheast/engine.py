@@ -1,22 +1,40 @@
 from decimal import Decimal
+from functools import partial
 import logging
 import os
 import queue
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from alpheast.config.config_loader import ConfigLoader
-from alpheast.config.data_source import DataSource
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.config.margin_config import MarginConfig
+from alpheast.config.recording_config import RecordingConfig
+from alpheast.config.telemetry_config import TelemetryConfig
+from alpheast.config.trace_config import TraceConfig
 from alpheast.models.backtest_results import BacktestResults
+from alpheast.events.event_log import EventLogWriter
 from alpheast.events.event_queue import EventQueue
 from alpheast.handlers.data_handler import DataHandler
+from alpheast.handlers.replay_execution_handler import ReplayExecutionHandler
 from alpheast.handlers.simulated_execution_handler import SimulatedExecutionHandler
+from alpheast.indicators.declarative import precompute_indicators
+from alpheast.indicators.indicator_registry import IndicatorRegistry
 from alpheast.config.backtest_config import BacktestingOptions
 from alpheast.events.event_enums import EventType
+from alpheast.models.lot_method import LotMethod
 from alpheast.portfolio.portfolio_manager import PortfolioManager
 from alpheast.shared.utils.project_root_finder import find_project_root
 from alpheast.strategy.base_strategy import BaseStrategy
 from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.joint_allocation import JointAllocation
 from alpheast.shared.metrics import calculate_performance_metrics
+from alpheast.shared.profiling import EngineProfiler, ProfilingReport, component_names
+from alpheast.shared.rolling_metrics import calculate_rolling_metrics
+from alpheast.shared.telemetry import TelemetryExporter
+from alpheast.shared.tracing import EventTracer
+from alpheast.shared.trade_analytics import calculate_round_trips
+
+logger = logging.getLogger(__name__)
 
 class BacktestingEngine:
     """
@@ -31,8 +49,27 @@ class BacktestingEngine:
         data_source: DataSource,
         strategies: List[BaseStrategy],
         position_sizing_method: Optional[BasePositionSizing] = None,
-        is_stepping_mode: Optional[bool] = False
+        is_stepping_mode: Optional[bool] = False,
+        rolling_windows: Optional[List[int]] = None,
+        lot_method: LotMethod = LotMethod.FIFO,
+        margin_config: Optional[MarginConfig] = None,
+        joint_allocation: Optional[JointAllocation] = None,
+        profile: bool = False,
+        telemetry: Optional[TelemetryConfig] = None,
+        trace: Optional[TraceConfig] = None,
+        record: Optional[RecordingConfig] = None,
+        replay_fills: bool = False
     ):
+        if replay_fills and data_source.type != DataSourceType.REPLAY:
+            raise ValueError("Replaying fills needs a REPLAY data source with the recorded event log.")
+        for window in rolling_windows or []:
+            if not isinstance(window, int) or window < 3:
+                raise ValueError("Rolling window must be at least 3.")
+        if not (margin_config is not None and margin_config.allow_short):
+            shorting_strategies = [strategy.__class__.__name__ for strategy in strategies if strategy.requires_short_selling]
+            if shorting_strategies:
+                raise ValueError(f"{', '.join(shorting_strategies)} sell short, which needs a MarginConfig that allows shorting.")
+
         self._initialize_config(options)
         self.event_queue = EventQueue()
 
@@ -45,10 +82,13 @@ class BacktestingEngine:
             data_source=data_source
         )
 
+        self.indicator_registry = IndicatorRegistry()
         self.strategies: List[BaseStrategy] = []
         for strategy_instance in strategies:
             strategy_instance.set_event_queue(self.event_queue)
+            strategy_instance.set_indicator_registry(self.indicator_registry)
             self.strategies.append(strategy_instance)
+        self._precompute_indicators()
         
         decimal_transaction_cost = Decimal(str(self.config.transaction_cost_percent))
         decimal_slippage_percent = Decimal(str(self.config.slippage_percent))
@@ -59,18 +99,36 @@ class BacktestingEngine:
             initial_cash=self.config.initial_cash,
             transaction_cost_percent=decimal_transaction_cost,
             slippage_percent=decimal_slippage_percent,
-            position_sizing_method=position_sizing_method
+            position_sizing_method=position_sizing_method,
+            lot_method=lot_method,
+            margin_config=margin_config,
+            joint_allocation=joint_allocation,
+            external_fills=replay_fills
         )
 
-        self.execution_handler = SimulatedExecutionHandler(
-            event_queue=self.event_queue,
-            transaction_cost_percent=decimal_transaction_cost,
-            slippage_percent=decimal_slippage_percent
-        )
+        if replay_fills:
+            self.execution_handler = ReplayExecutionHandler(self.event_queue, data_source.event_log_path)
+        else:
+            self.execution_handler = SimulatedExecutionHandler(
+                event_queue=self.event_queue,
+                transaction_cost_percent=decimal_transaction_cost,
+                slippage_percent=decimal_slippage_percent
+            )
 
         self.is_stepping_mode = is_stepping_mode
-
-        logging.info("Backtesting Engine initialized.")
+        self.rolling_windows = rolling_windows or []
+
+        self.profiler = EngineProfiler() if profile else None
+        self.tracer = EventTracer(trace) if trace is not None else None
+        if self.profiler is not None or self.tracer is not None:
+            self._enable_instrumentation()
+        self.telemetry = TelemetryExporter(telemetry, self.get_telemetry_snapshot) if telemetry is not None else None
+        self.recorder = None
+        if record is not None:
+            self.recorder = EventLogWriter(record.file_path, self._recording_metadata(), record.event_types, record.buffer_size)
+            self._enable_recording()
+
+        logger.info("Backtesting Engine initialized.")
         
     def _initialize_config(self, options: BacktestingOptions):
         """
@@ -89,7 +147,7 @@ class BacktestingEngine:
                 backtest_options = ConfigLoader.load_backtest_config_from_json(json_file_path)
                 is_json_loaded = True
             except Exception as e:
-                logging.warning(f"Failed to load alpheast_config.json: {e}")
+                logger.warning("Failed to load alpheast_config.json: %s", e)
 
         if is_json_loaded:
             backtest_options.override(options)
@@ -107,16 +165,25 @@ class BacktestingEngine:
         if self.is_stepping_mode:
             raise RuntimeError("Engine is in stepping mode, you need to call step_forward() instead.")
         
-        logging.info(f"Starting Backtest for {self.config.symbols} from {self.config.start_date} to {self.config.end_date}")
-
-        while self.data_handler.continue_backtest() or not self.event_queue.empty():
-            # --- 1. Push next MarketEvents for the current interval ---
-            if self.data_handler.continue_backtest():
-                self.data_handler.stream_next_market_event()
-
-            # --- 2. Process all events currently in the queue ---
-            while not self.event_queue.empty():
-                self._process_next_event()
+        logger.info("Starting Backtest for %s from %s to %s", self.config.symbols, self.config.start_date, self.config.end_date)
+
+        if self.telemetry is not None:
+            self.telemetry.start()
+        try:
+            while self.data_handler.continue_backtest() or not self.event_queue.empty():
+                # --- 1. Push next MarketEvents for the current interval ---
+                if self.data_handler.continue_backtest():
+                    self.data_handler.stream_next_market_event()
+
+                # --- 2. Process all events currently in the queue ---
+                self._process_timestamp_events()
+        finally:
+            if self.telemetry is not None:
+                self.telemetry.stop()
+            if self.tracer is not None:
+                self.tracer.write()
+            if self.recorder is not None:
+                self.recorder.close()
 
         # -- Post-Backtest Analysis ---
         return self._finalize_backtest_results()
@@ -130,16 +197,65 @@ class BacktestingEngine:
         if not self.is_stepping_mode:
             raise RuntimeError("Engine is not in stepping mode, you need to call run() instead.")
         
+        if self.telemetry is not None and not self.telemetry.is_running:
+            self.telemetry.start()
+
         market_event_available = False
         if self.data_handler.continue_backtest():
             self.data_handler.stream_next_market_event()
             market_event_available = True
 
-        while not self.event_queue.empty():
-            self._process_next_event()
+        self._process_timestamp_events()
 
         return market_event_available
 
+    def get_online_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the streaming metrics maintained by the PortfolioManager,
+        available at any step without finalizing the backtest.
+        """
+        return self.portfolio_manager.get_online_metrics()
+
+    def get_telemetry_snapshot(self) -> Dict[str, Any]:
+        """
+        Cheap counters of the event loop, safe to read from another thread while the engine runs.
+        """
+        queue_depth = self.event_queue.qsize()
+        return {
+            "event_counts": {event_type.value: count for event_type, count in dict(self.event_queue.event_counts).items()},
+            "events_processed": self.event_queue.total_events - queue_depth,
+            "queue_depth": queue_depth,
+            "open_orders": self.execution_handler.get_open_order_count(),
+            "pending_orders": self.portfolio_manager.get_pending_order_count(),
+            "simulated_time": self.portfolio_manager.get_latest_timestamp(),
+        }
+
+    def stop_telemetry(self):
+        """
+        Stops the telemetry of a stepping mode session (a full run stops it by itself).
+        """
+        if self.telemetry is not None:
+            self.telemetry.stop()
+
+    def write_trace(self) -> Optional[str]:
+        """
+        Writes the trace recorded so far (a full run writes it by itself) and returns the file path.
+        """
+        return self.tracer.write() if self.tracer is not None else None
+
+    def stop_recording(self):
+        """
+        Closes the event log of a stepping mode session (a full run closes it by itself).
+        """
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def get_profiling_report(self) -> Optional[ProfilingReport]:
+        """
+        Returns the per-component latencies recorded so far, None unless the engine was created with `profile=True`.
+        """
+        return self.profiler.report() if self.profiler is not None else None
+
     def reset(self):
         """
         Resets the engine's internal state for a new sequence of step-by-step execution.
@@ -156,23 +272,69 @@ class BacktestingEngine:
                 break 
             
         self.data_handler.reset()
+        self.indicator_registry.reset()
         self.portfolio_manager.reset() 
         self.execution_handler.reset()
+        if self.profiler is not None:
+            self.profiler.reset()
+        if self.tracer is not None:
+            self.tracer.reset()
+        if self.recorder is not None:
+            # The next event starts the log of a new session next to the earlier one
+            self.recorder.close()
         
         self.strategies_initialized = False
         self.current_simulation_date = None
-        logging.info("Backtesting Engine reset complete.")
+        logger.info("Backtesting Engine reset complete.")
 
         
+    def _precompute_indicators(self):
+        """
+        Computes the indicators declared by the strategies over each symbol's whole series,
+        each distinct indicator once per symbol, and hands every strategy its arrays.
+        """
+        declarations = {id(strategy): strategy.declare_indicators() for strategy in self.strategies}
+        specs = {spec for declared in declarations.values() for spec in declared.values()}
+        if not specs:
+            return
+
+        for symbol in self.config.symbols:
+            bar_index, values = precompute_indicators(specs, self.data_handler.price_bar_data.get(symbol, []))
+            for strategy in self.strategies:
+                declared = declarations[id(strategy)]
+                if declared:
+                    strategy.set_precomputed_indicators(symbol, bar_index, {name: values[spec] for name, spec in declared.items()})
+
+        logger.info("Precomputed %s indicators for %s symbols.", len(specs), len(self.config.symbols))
+
+    def _process_timestamp_events(self):
+        """
+        Processes all events of the current timestamp, then lets the strategies and the PortfolioManager
+        act on the timestamp as a whole (e.g. cross-sectional signals, margin calls) and processes what that produced.
+        """
+        while not self.event_queue.empty():
+            self._process_next_event()
+
+        for strategy in self.strategies:
+            strategy.on_timestamp_end()
+        while not self.event_queue.empty():
+            self._process_next_event()
+
+        self.portfolio_manager.on_timestamp_end()
+        while not self.event_queue.empty():
+            self._process_next_event()
+
     def _process_next_event(self):
         event = self.event_queue.get()
 
         if event is None:
             return
 
-        logging.debug(f"Processing event: {event}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing event: %s", event)
 
         if event.type == EventType.MARKET:
+            self.indicator_registry.on_market_event(event)
             for strategy in self.strategies:
                 strategy.on_market_event(event)
                 
@@ -182,6 +344,9 @@ class BacktestingEngine:
         elif event.type == EventType.SIGNAL:
             self.portfolio_manager.on_signal_event(event)
 
+        elif event.type == EventType.TARGET_WEIGHTS:
+            self.portfolio_manager.on_target_weights_event(event)
+
         elif event.type == EventType.ORDER:
             self.execution_handler.on_order_event(event)
 
@@ -192,7 +357,116 @@ class BacktestingEngine:
             self.portfolio_manager.on_daily_update_event(event)
 
         else:
-            logging.warning(f"Unknown event type received: {event.type}")
+            logger.warning("Unknown event type received: %s", event.type)
+
+    def _enable_recording(self):
+        """
+        Records every event as it is put on the queue, in the order it will be processed.
+        Like instrumentation, this replaces `put` on this engine's queue only.
+        """
+        put = self.event_queue.put
+        record = self.recorder.record
+
+        def recording_put(event):
+            record(event)
+            put(event)
+        self.event_queue.put = recording_put
+
+    def _recording_metadata(self) -> Dict[str, Any]:
+        return {
+            "symbols": self.config.symbols,
+            "start_date": str(self.config.start_date),
+            "end_date": str(self.config.end_date),
+            "interval": self.config.interval.value,
+            "initial_cash": self.config.initial_cash,
+            "transaction_cost_percent": self.config.transaction_cost_percent,
+            "slippage_percent": self.config.slippage_percent,
+            "strategies": component_names(self.strategies),
+        }
+
+    def _enable_instrumentation(self):
+        """
+        Switches the event loop to instrumented versions of its steps, which report every handler call to the
+        profiler and/or the tracer. They replace the plain ones on this instance only, so an engine without
+        profiling or tracing runs exactly the uninstrumented code.
+        """
+        if self.profiler is not None and self.tracer is not None:
+            profiled_call = self.profiler.call
+            traced_call = self.tracer.call
+            self._instrumented_call = lambda name, event_type, handler, *args: traced_call(name, event_type, profiled_call, name, event_type, handler, *args)
+        else:
+            self._instrumented_call = (self.profiler or self.tracer).call
+
+        strategy_names = component_names(self.strategies)
+        portfolio_manager = "PortfolioManager"
+        execution_handler = type(self.execution_handler).__name__
+
+        self._instrumented_handlers = {
+            EventType.MARKET: [
+                ("IndicatorRegistry", self.indicator_registry.on_market_event),
+                *((name, strategy.on_market_event) for name, strategy in zip(strategy_names, self.strategies)),
+                (portfolio_manager, self.portfolio_manager.on_market_event),
+                (execution_handler, self.execution_handler.on_market_event),
+            ],
+            EventType.SIGNAL: [(portfolio_manager, self.portfolio_manager.on_signal_event)],
+            EventType.TARGET_WEIGHTS: [(portfolio_manager, self.portfolio_manager.on_target_weights_event)],
+            EventType.ORDER: [(execution_handler, self.execution_handler.on_order_event)],
+            EventType.FILL: [(portfolio_manager, self.portfolio_manager.on_fill_event)],
+            EventType.DAILY_UPDATE: [(portfolio_manager, self.portfolio_manager.on_daily_update_event)],
+        }
+        self._instrumented_strategy_hooks = [(name, strategy.on_timestamp_end) for name, strategy in zip(strategy_names, self.strategies)]
+
+        stream_next_market_event = partial(self._instrumented_call, "DataHandler", "STREAM", self.data_handler.stream_next_market_event)
+        if self.tracer is not None:
+            # A traced timestamp spans the streaming of its bars and the processing of all resulting events
+            def stream_next_market_event(stream=stream_next_market_event):
+                self.tracer.begin_timestamp()
+                stream()
+        self.data_handler.stream_next_market_event = stream_next_market_event
+        self._process_timestamp_events = self._process_timestamp_events_instrumented
+        self._process_next_event = self._process_next_event_instrumented
+
+    def _process_timestamp_events_instrumented(self):
+        if self.tracer is not None and not self.tracer.in_timestamp:
+            self.tracer.begin_timestamp()
+
+        while not self.event_queue.empty():
+            self._process_next_event()
+
+        for name, on_timestamp_end in self._instrumented_strategy_hooks:
+            self._instrumented_call(name, "TIMESTAMP_END", on_timestamp_end)
+        while not self.event_queue.empty():
+            self._process_next_event()
+
+        self._instrumented_call("PortfolioManager", "TIMESTAMP_END", self.portfolio_manager.on_timestamp_end)
+        while not self.event_queue.empty():
+            self._process_next_event()
+
+        if self.tracer is not None:
+            self.tracer.end_timestamp(self.portfolio_manager.get_latest_timestamp())
+
+    def _process_next_event_instrumented(self):
+        event = self.event_queue.get()
+
+        if event is None:
+            return
+
+        handlers = self._instrumented_handlers.get(event.type)
+        if handlers is None:
+            logger.warning("Unknown event type received: %s", event.type)
+            return
+
+        event_type = event.type.value
+        if self.profiler is not None:
+            self.profiler.record_event(event_type, self.event_queue.qsize())
+        if self.tracer is not None:
+            self.tracer.call(event_type, "event", self._call_instrumented_handlers, handlers, event_type, event)
+        else:
+            self._call_instrumented_handlers(handlers, event_type, event)
+
+    def _call_instrumented_handlers(self, handlers, event_type: str, event):
+        for name, handler in handlers:
+            self._instrumented_call(name, event_type, handler, event)
 
     def _finalize_backtest_results(self) -> Optional[BacktestResults]:
         """
@@ -204,15 +478,26 @@ class BacktestingEngine:
         final_portfolio_summary = self.portfolio_manager.get_summary()
 
         if not daily_values:
-            logging.error("No daily values recorded, skipping Summary.")
+            logger.error("No daily values recorded, skipping Summary.")
             return None
 
+        round_trips = calculate_round_trips(trade_log, self.data_handler.price_bar_data)
         performance_metrics = calculate_performance_metrics(
             daily_values=daily_values,
             trade_log=trade_log,
-            benchmark_daily_values=benchmark_daily_values
+            benchmark_daily_values=benchmark_daily_values,
+            round_trips=round_trips
         )
 
+        rolling_metrics = {
+            window: calculate_rolling_metrics(
+                daily_values=daily_values,
+                window=window,
+                benchmark_daily_values=benchmark_daily_values
+            )
+            for window in self.rolling_windows
+        }
+
         results = BacktestResults(
             performance_metrics=performance_metrics,
             daily_values=daily_values,
@@ -221,8 +506,11 @@ class BacktestingEngine:
             final_portfolio_summary=final_portfolio_summary,
             start_date=self.config.start_date,
             end_date=self.config.end_date,
-            initial_cash=self.config.initial_cash
+            initial_cash=self.config.initial_cash,
+            rolling_metrics=rolling_metrics,
+            round_trips=round_trips,
+            profiling_report=self.get_profiling_report()
         )
 
-        logging.info("--- Backtest Finished ---")
+        logger.info("--- Backtest Finished ---")
         return results
\ No newline at end of file
@@ -59,6 +59,27 @@ class SignalEvent(Event):
     def __repr__(self):
         return f"SignalEvent(symbol='{self.symbol}', timestamp={self.timestamp.date()}, direction='{self.direction}')"
 
+class TargetWeightsEvent(Event):
+    """
+    Handles a strategy's target portfolio weights for the whole universe at a timestamp.
+    Symbols that are not in `weights` are targeted at zero; a NaN weight keeps the symbol's current position.
+    """
+    def __init__(
+        self,
+        timestamp: datetime,
+        weights: Dict[str, float]
+    ):
+        self._type = EventType.TARGET_WEIGHTS
+        self.timestamp = timestamp
+        self.weights = weights
+
+    @property
+    def type(self) -> EventType:
+        return self._type
+
+    def __repr__(self):
+        return f"TargetWeightsEvent(timestamp={self.timestamp.date()}, weights={self.weights})"
+
 class OrderEvent(Event):
     """
     Handles placing an order with the execution handler.
@@ -4,6 +4,7 @@ from enum import Enum
 class EventType(Enum):
     MARKET = "MARKET"
     SIGNAL = "SIGNAL"
+    TARGET_WEIGHTS = "TARGET_WEIGHTS"
     ORDER = "ORDER"
     FILL = "FILL"
     DAILY_UPDATE = "DAILY_UPDATE"
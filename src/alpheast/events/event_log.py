@@ -0,0 +1,429 @@
+from array import array
+from datetime import datetime, timezone
+from decimal import Decimal
+import gzip
+import json
+import logging
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from alpheast.data.bar_store import BAR_FIELDS, BarStore
+from alpheast.events.event import DailyUpdateEvent, Event, FillEvent, MarketEvent, OrderEvent, SignalEvent, TargetWeightsEvent
+from alpheast.events.event_enums import EventType, OrderType
+from alpheast.models.signal import Signal
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOG_MAGIC = b"ALPHEVLG"
+EVENT_LOG_VERSION = 1
+
+# Every record is framed as (record type, payload length), little-endian.
+# Strings that repeat (symbols) are defined once by a STRING record and referenced by their index.
+RECORD_CODES = {
+    "STRING": 0,
+    EventType.MARKET: 1,
+    EventType.SIGNAL: 2,
+    EventType.TARGET_WEIGHTS: 3,
+    EventType.ORDER: 4,
+    EventType.FILL: 5,
+    EventType.DAILY_UPDATE: 6,
+}
+EVENT_LOG_SCHEMA = {
+    "STRING": ["text: utf-8 bytes (the whole payload), referenced by its definition index"],
+    "MARKET": ["symbol: u32 string ref", "timestamp: i64 ns", "fields: u8 bit mask over " + ",".join(BAR_FIELDS), "value: f64 per present field"],
+    "SIGNAL": ["symbol: u32 string ref", "timestamp: i64 ns", "direction: u8 Signal index"],
+    "TARGET_WEIGHTS": ["timestamp: i64 ns", "count: u32", "(symbol: u32 string ref, weight: f64) per weight"],
+    "ORDER": ["order_id: u16 length + utf-8", "symbol: u32 string ref", "timestamp: i64 ns", "direction: u8 Signal index",
+              "order_type: u8 OrderType index", "quantity: decimal", "price: u8 present flag + decimal"],
+    "FILL": ["order_id: u16 length + utf-8", "symbol: u32 string ref", "timestamp: i64 ns", "direction: u8 Signal index",
+             "successful: u8", "quantity: decimal", "fill_price: decimal", "commission: decimal"],
+    "DAILY_UPDATE": ["timestamp: i64 ns"],
+    "decimal": "i8 exponent + i64 coefficient, or exponent -128 + u16 length + ascii text when it does not fit",
+}
+
+_FRAME = struct.Struct("<BI")
+_MARKET = struct.Struct("<IqB")
+_SIGNAL = struct.Struct("<IqB")
+_TARGET_WEIGHTS = struct.Struct("<qI")
+_WEIGHT = struct.Struct("<Id")
+_ORDER = struct.Struct("<IqBB")
+_FILL = struct.Struct("<IqBB")
+_TIMESTAMP = struct.Struct("<q")
+_LENGTH = struct.Struct("<H")
+_HEADER_LENGTH = struct.Struct("<I")
+_DECIMAL = struct.Struct("<bq")
+_DECIMAL_TEXT = -128
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+_SIGNALS = list(Signal)
+_ORDER_TYPES = list(OrderType)
+_SIGNAL_INDEX = {signal: index for index, signal in enumerate(_SIGNALS)}
+_ORDER_TYPE_INDEX = {order_type: index for index, order_type in enumerate(_ORDER_TYPES)}
+_EPOCH = datetime(1970, 1, 1)
+
+class EventLogWriter:
+    """
+    Streams events to a compact binary log: a JSON header with the schema and the run's metadata,
+    then one length-prefixed record per event, written through a fixed-size buffer so memory stays bounded.
+
+    Decimals keep their exact coefficient and exponent and floats are stored as f64, so replayed
+    events compare equal to the recorded ones. Timestamps are stored in nanoseconds (timezone-aware
+    ones as UTC) and come back as naive pandas Timestamps. Market events keep their OHLCV fields only.
+
+    :param file_path: File to write (gzipped if it ends in ".gz"). Reopening the writer never overwrites an earlier
+        session: the second session goes to "<name>.1.<extension>" (e.g. "run.1.log.gz"), the third to "<name>.2.<extension>", ...
+    :param metadata: JSON-serializable description of the run, stored in the header.
+    :param event_types: Event types to record, all if None.
+    :param buffer_size: Write buffer size in bytes.
+    """
+    def __init__(
+        self,
+        file_path: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        event_types: Optional[List[EventType]] = None,
+        buffer_size: int = 1 << 20
+    ):
+        self.base_path = file_path
+        self.file_path = file_path
+        self.metadata = metadata or {}
+        self.event_types = set(event_types) if event_types is not None else set(EventType)
+        self.buffer_size = buffer_size
+        self.records_written = 0
+        self.sessions = 0
+
+        self._file: Optional[BinaryIO] = None
+        self._raw: Optional[BinaryIO] = None
+        self._strings: Dict[str, int] = {}
+        self._encoders = {
+            EventType.MARKET: self._encode_market,
+            EventType.SIGNAL: self._encode_signal,
+            EventType.TARGET_WEIGHTS: self._encode_target_weights,
+            EventType.ORDER: self._encode_order,
+            EventType.FILL: self._encode_fill,
+            EventType.DAILY_UPDATE: self._encode_daily_update,
+        }
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def open(self):
+        """
+        Creates the file of a new session and writes the header.
+        """
+        self.close()
+        if self.sessions:
+            self.file_path = _session_path(self.base_path, self.sessions)
+            logger.info("Recording session %s to %s, the earlier sessions are kept.", self.sessions + 1, self.file_path)
+        self.sessions += 1
+
+        raw = open(self.file_path, "wb", buffering=self.buffer_size)
+        self._file = gzip.GzipFile(fileobj=raw, mode="wb") if self.file_path.endswith(".gz") else raw
+        self._raw = raw
+        self._strings.clear()
+        self.records_written = 0
+
+        header = json.dumps({
+            "version": EVENT_LOG_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "record_codes": {_record_name(key): code for key, code in RECORD_CODES.items()},
+            "schema": EVENT_LOG_SCHEMA,
+            "enums": {"Signal": [signal.value for signal in _SIGNALS], "OrderType": [order_type.value for order_type in _ORDER_TYPES]},
+            "event_types": sorted(event_type.value for event_type in self.event_types),
+            "metadata": self.metadata,
+        }, default=str).encode()
+        self._file.write(EVENT_LOG_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+
+    def record(self, event: Event):
+        """
+        Appends one event, opening the file on the first one.
+        """
+        if event.type not in self.event_types:
+            return
+        if self._file is None:
+            self.open()
+        payload = self._encoders[event.type](event)
+        self._file.write(_FRAME.pack(RECORD_CODES[event.type], len(payload)) + payload)
+        self.records_written += 1
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.close()
+        if self._raw is not self._file:
+            self._raw.close()
+        self._file = None
+        self._raw = None
+        logger.info("Recorded %s events to %s", self.records_written, self.file_path)
+
+    def _string_ref(self, text: str) -> int:
+        index = self._strings.get(text)
+        if index is None:
+            index = self._strings[text] = len(self._strings)
+            encoded = text.encode()
+            self._file.write(_FRAME.pack(RECORD_CODES["STRING"], len(encoded)) + encoded)
+        return index
+
+    def _encode_market(self, event: MarketEvent) -> bytes:
+        mask, values = 0, []
+        for bit, field in enumerate(BAR_FIELDS):
+            value = event.data.get(field)
+            if value is not None:
+                mask |= 1 << bit
+                values.append(float(value))
+        return _MARKET.pack(self._string_ref(event.symbol), _to_nanoseconds(event.timestamp), mask) + struct.pack(f"<{len(values)}d", *values)
+
+    def _encode_signal(self, event: SignalEvent) -> bytes:
+        return _SIGNAL.pack(self._string_ref(event.symbol), _to_nanoseconds(event.timestamp), _SIGNAL_INDEX[event.direction])
+
+    def _encode_target_weights(self, event: TargetWeightsEvent) -> bytes:
+        parts = [_TARGET_WEIGHTS.pack(_to_nanoseconds(event.timestamp), len(event.weights))]
+        parts.extend(_WEIGHT.pack(self._string_ref(symbol), float(weight)) for symbol, weight in event.weights.items())
+        return b"".join(parts)
+
+    def _encode_order(self, event: OrderEvent) -> bytes:
+        return b"".join((
+            _encode_text(event.order_id),
+            _ORDER.pack(self._string_ref(event.symbol), _to_nanoseconds(event.timestamp), _SIGNAL_INDEX[event.direction], _ORDER_TYPE_INDEX[event.order_type]),
+            _encode_decimal(event.quantity),
+            b"\x00" if event.price is None else b"\x01" + _encode_decimal(event.price),
+        ))
+
+    def _encode_fill(self, event: FillEvent) -> bytes:
+        return b"".join((
+            _encode_text(event.order_id),
+            _FILL.pack(self._string_ref(event.symbol), _to_nanoseconds(event.timestamp), _SIGNAL_INDEX[event.direction], bool(event.successful)),
+            _encode_decimal(event.quantity),
+            _encode_decimal(event.fill_price),
+            _encode_decimal(event.commission),
+        ))
+
+    def _encode_daily_update(self, event: DailyUpdateEvent) -> bytes:
+        return _TIMESTAMP.pack(_to_nanoseconds(event.timestamp))
+
+class EventLogReader:
+    """
+    Streams the events of a log written by EventLogWriter, one record at a time.
+
+    :param file_path: The log file (gzipped if it ends in ".gz").
+    """
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        with self._open() as f:
+            self.header = _read_header(f)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.header.get("metadata", {})
+
+    def __iter__(self) -> Iterator[Event]:
+        return self.events()
+
+    def events(self, event_types: Optional[List[EventType]] = None) -> Iterator[Event]:
+        """
+        The recorded events in order, optionally only those of `event_types`.
+        """
+        wanted = {event_type.value for event_type in event_types} if event_types is not None else None
+        signals = [Signal(value) for value in self.header["enums"]["Signal"]]
+        order_types = [OrderType(value) for value in self.header["enums"]["OrderType"]]
+        for name, payload, strings in self._payloads():
+            if wanted is None or name in wanted:
+                yield _decode_event(name, payload, strings, signals, order_types)
+
+    def _payloads(self) -> Iterator[Tuple[str, bytes, List[str]]]:
+        """
+        (record type, payload, strings defined so far) of every event record, without decoding the payload.
+        """
+        codes = {code: name for name, code in self.header["record_codes"].items()}
+        strings: List[str] = []
+        with self._open() as f:
+            _read_header(f)
+            for name, payload in _read_records(f, codes):
+                if name == "STRING":
+                    strings.append(payload.decode())
+                else:
+                    yield name, payload, strings
+
+    def _open(self) -> BinaryIO:
+        if self.file_path.endswith(".gz"):
+            return gzip.open(self.file_path, "rb")
+        return open(self.file_path, "rb", buffering=1 << 20)
+
+def read_bar_store(file_path: str, symbols: Optional[List[str]] = None) -> BarStore:
+    """
+    The recorded market events of an event log as a BarStore, e.g. to replay them into new strategies
+    without loading the original data again. Fields missing from a bar are NaN.
+
+    Args:
+        file_path: The event log.
+        symbols: Only keep these symbols, all if None.
+
+    Returns:
+        A BarStore with one bar per recorded market event.
+    """
+    columns: Dict[str, Tuple[array, Dict[str, array]]] = {}
+    wanted = set(symbols) if symbols is not None else None
+
+    for name, payload, strings in EventLogReader(file_path)._payloads():
+        if name != EventType.MARKET.value:
+            continue
+        symbol_ref, timestamp, mask = _MARKET.unpack_from(payload)
+        symbol = strings[symbol_ref]
+        if wanted is not None and symbol not in wanted:
+            continue
+        symbol_columns = columns.get(symbol)
+        if symbol_columns is None:
+            symbol_columns = columns[symbol] = (array("q"), {field: array("d") for field in BAR_FIELDS})
+        symbol_columns[0].append(timestamp)
+        values = iter(struct.unpack_from(f"<{bin(mask).count('1')}d", payload, _MARKET.size))
+        for bit, field in enumerate(BAR_FIELDS):
+            symbol_columns[1][field].append(next(values) if mask & (1 << bit) else float("nan"))
+
+    return BarStore({
+        symbol: {
+            "timestamp": np.frombuffer(timestamps, dtype=np.int64).astype("datetime64[ns]"),
+            **{field: np.frombuffer(values, dtype=np.float64).copy() for field, values in fields.items()}
+        }
+        for symbol, (timestamps, fields) in columns.items()
+    })
+
+def _record_name(key: Any) -> str:
+    return key.value if isinstance(key, EventType) else key
+
+def _read_header(f: BinaryIO) -> Dict[str, Any]:
+    magic = f.read(len(EVENT_LOG_MAGIC))
+    if magic != EVENT_LOG_MAGIC:
+        raise ValueError("Not an alpheast event log.")
+    (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+    header = json.loads(f.read(length))
+    if header.get("version") != EVENT_LOG_VERSION:
+        raise ValueError(f"Unsupported event log version {header.get('version')}, expected {EVENT_LOG_VERSION}.")
+    return header
+
+def _read_records(f: BinaryIO, codes: Dict[int, str]) -> Iterator[Tuple[str, bytes]]:
+    while True:
+        frame = f.read(_FRAME.size)
+        if not frame:
+            return
+        if len(frame) < _FRAME.size:
+            raise ValueError("Truncated event log record.")
+        code, length = _FRAME.unpack(frame)
+        payload = f.read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated event log record.")
+        name = codes.get(code)
+        if name is None:
+            raise ValueError(f"Unknown event log record type {code}.")
+        yield name, payload
+
+def _decode_event(name: str, payload: bytes, strings: List[str], signals: List[Signal], order_types: List[OrderType]) -> Event:
+    if name == "MARKET":
+        symbol_ref, timestamp, mask = _MARKET.unpack_from(payload)
+        values = iter(struct.unpack_from(f"<{bin(mask).count('1')}d", payload, _MARKET.size))
+        data = {field: next(values) for bit, field in enumerate(BAR_FIELDS) if mask & (1 << bit)}
+        return MarketEvent(symbol=strings[symbol_ref], timestamp=_from_nanoseconds(timestamp), data=data)
+
+    if name == "SIGNAL":
+        symbol_ref, timestamp, direction = _SIGNAL.unpack_from(payload)
+        return SignalEvent(symbol=strings[symbol_ref], timestamp=_from_nanoseconds(timestamp), direction=signals[direction])
+
+    if name == "TARGET_WEIGHTS":
+        timestamp, count = _TARGET_WEIGHTS.unpack_from(payload)
+        weights = {
+            strings[symbol_ref]: weight
+            for symbol_ref, weight in (_WEIGHT.unpack_from(payload, _TARGET_WEIGHTS.size + i * _WEIGHT.size) for i in range(count))
+        }
+        return TargetWeightsEvent(timestamp=_from_nanoseconds(timestamp), weights=weights)
+
+    if name == "ORDER":
+        order_id, offset = _decode_text(payload, 0)
+        symbol_ref, timestamp, direction, order_type = _ORDER.unpack_from(payload, offset)
+        quantity, offset = _decode_decimal(payload, offset + _ORDER.size)
+        price = None
+        if payload[offset]:
+            price, offset = _decode_decimal(payload, offset + 1)
+        return OrderEvent(
+            order_id=order_id,
+            symbol=strings[symbol_ref],
+            timestamp=_from_nanoseconds(timestamp),
+            direction=signals[direction],
+            quantity=quantity,
+            order_type=order_types[order_type],
+            price=price
+        )
+
+    if name == "FILL":
+        order_id, offset = _decode_text(payload, 0)
+        symbol_ref, timestamp, direction, successful = _FILL.unpack_from(payload, offset)
+        quantity, offset = _decode_decimal(payload, offset + _FILL.size)
+        fill_price, offset = _decode_decimal(payload, offset)
+        commission, offset = _decode_decimal(payload, offset)
+        return FillEvent(
+            order_id=order_id,
+            symbol=strings[symbol_ref],
+            timestamp=_from_nanoseconds(timestamp),
+            direction=signals[direction],
+            quantity=quantity,
+            fill_price=fill_price,
+            commission=commission,
+            successful=bool(successful)
+        )
+
+    if name == "DAILY_UPDATE":
+        (timestamp,) = _TIMESTAMP.unpack_from(payload)
+        return DailyUpdateEvent(timestamp=_from_nanoseconds(timestamp))
+
+    raise ValueError(f"Unknown event log record type {name}.")
+
+def _session_path(file_path: str, session: int) -> str:
+    """
+    `file_path` with the session number before its extensions, e.g. "runs/run.log.gz" -> "runs/run.2.log.gz".
+    """
+    directory, name = os.path.split(file_path)
+    stem, dot, extensions = name.partition(".")
+    return os.path.join(directory, f"{stem}.{session}{dot}{extensions}")
+
+def _to_nanoseconds(timestamp: datetime) -> int:
+    if isinstance(timestamp, pd.Timestamp):
+        return timestamp.value
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+def _from_nanoseconds(nanoseconds: int) -> pd.Timestamp:
+    return pd.Timestamp(nanoseconds)
+
+def _encode_text(text: str) -> bytes:
+    encoded = text.encode()
+    return _LENGTH.pack(len(encoded)) + encoded
+
+def _decode_text(payload: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _LENGTH.unpack_from(payload, offset)
+    start = offset + _LENGTH.size
+    return payload[start:start + length].decode(), start + length
+
+def _encode_decimal(value: Decimal) -> bytes:
+    sign, digits, exponent = value.as_tuple()
+    # Special values, -0 and coefficients beyond i64 go as text
+    if isinstance(exponent, int) and -127 <= exponent <= 127 and not (sign and not value):
+        coefficient = int("".join(map(str, digits)))
+        coefficient = -coefficient if sign else coefficient
+        if _INT64_MIN <= coefficient <= _INT64_MAX:
+            return _DECIMAL.pack(exponent, coefficient)
+    text = str(value).encode("ascii")
+    return struct.pack("<b", _DECIMAL_TEXT) + _LENGTH.pack(len(text)) + text
+
+def _decode_decimal(payload: bytes, offset: int) -> Tuple[Decimal, int]:
+    (exponent,) = struct.unpack_from("<b", payload, offset)
+    if exponent == _DECIMAL_TEXT:
+        text, end = _decode_text(payload, offset + 1)
+        return Decimal(text), end
+    _, coefficient = _DECIMAL.unpack_from(payload, offset)
+    digits = tuple(int(digit) for digit in str(abs(coefficient)))
+    return Decimal((int(coefficient < 0), digits, exponent)), offset + _DECIMAL.size
@@ -1,21 +1,28 @@
 
 import logging
 import queue
-from typing import Optional
+from typing import Dict, Optional
 
 from alpheast.events.event import Event
+from alpheast.events.event_enums import EventType
 
 
+logger = logging.getLogger(__name__)
+
 class EventQueue:
     """
     A synchronized queue for managing events in the event-driven backtesting system.
     """
     def __init__(self):
         self._queue = queue.Queue()
-        logging.info(f"EventQueue initialized.")
+        self.total_events = 0 # Events ever put on the queue
+        self.event_counts: Dict[EventType, int] = {} # The same, per event type
+        logger.info("EventQueue initialized.")
 
     def put(self, event: Event):
         self._queue.put(event)
+        self.total_events += 1
+        self.event_counts[event.type] = self.event_counts.get(event.type, 0) + 1
 
     def get(self) -> Optional[Event]:
         try:
@@ -23,5 +30,8 @@ class EventQueue:
         except queue.Empty:
             return None
         
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
     def empty(self) -> bool:
         return self._queue.empty()
\ No newline at end of file
@@ -4,13 +4,17 @@ from typing import Dict, List, Optional
 import pandas as pd
 from alpheast.config.data_source import DataSource, DataSourceType, SupportedProvider
 from alpheast.data.alpha_vantage_price_bar_client import AlphaVantageStdPriceBarClient
+from alpheast.data.bar_store import BarStore
 from alpheast.data.price_bar_client import PriceBarClient
 from alpheast.events.event import DailyUpdateEvent, MarketEvent
+from alpheast.events.event_log import read_bar_store
 from alpheast.events.event_queue import EventQueue
 from alpheast.models.interval import Interval
 from alpheast.models.price_bar import PriceBar
 
 
+logger = logging.getLogger(__name__)
+
 class DataHandler:
     """
     A concrete data handler that fetches price data from the database
@@ -33,6 +37,7 @@ class DataHandler:
         self.interval = interval
 
         self.data_source = data_source
+        self._bar_store: Optional[BarStore] = data_source.bar_store
         self._load_data_from_data_source()
 
         self._all_data_df: pd.DataFrame = pd.DataFrame()
@@ -44,7 +49,7 @@ class DataHandler:
         self._last_processed_date: date = None
         self._last_processed_timestamp: Optional[datetime] = None
 
-        logging.info(f"DataHandler initialized for symbols {symbols} from {start_date} to {end_date} with interval {interval.value}")
+        logger.info("DataHandler initialized for symbols %s from %s to %s with interval %s", symbols, start_date, end_date, interval.value)
         self._preprocess_data()
 
     def stream_next_market_event(self):
@@ -54,7 +59,7 @@ class DataHandler:
         This function will now stream all events for a single timestamp in one go.
         """
         if not self.continue_backtest():
-            logging.debug("No more data to stream.")
+            logger.debug("No more data to stream.")
             return
 
         current_timestamp = None
@@ -74,7 +79,7 @@ class DataHandler:
             elif current_date > self._last_processed_date:
                 daily_update_event = DailyUpdateEvent(timestamp=datetime.combine(self._last_processed_date, datetime.min.time()))
                 self.event_queue.put(daily_update_event)
-                logging.debug(f"Pushed DailyUpdateEvent for {self._last_processed_date}")
+                logger.debug("Pushed DailyUpdateEvent for %s", self._last_processed_date)
                 self._last_processed_date = current_date
             
             market_data = {
@@ -91,14 +96,15 @@ class DataHandler:
                 data=market_data
             )
             self.event_queue.put(market_event)
-            logging.debug(f"Pushed MarketEvent for {row.symbol} on {row.timestamp}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pushed MarketEvent for %s on %s", row.symbol, row.timestamp)
             
             self._load_next_row()
 
         if not self.continue_backtest() and self._last_processed_date is not None:
             daily_update_event = DailyUpdateEvent(timestamp=datetime.combine(self._last_processed_date, datetime.min.time()))
             self.event_queue.put(daily_update_event)
-            logging.debug(f"Pushed final DailyUpdateEvent for {self._last_processed_date}")
+            logger.debug("Pushed final DailyUpdateEvent for %s", self._last_processed_date)
             self._last_processed_date = None
             
     def continue_backtest(self) -> bool:
@@ -111,13 +117,24 @@ class DataHandler:
         self._preprocess_data() 
         self._last_processed_date = None
         self._last_processed_timestamp = None
-        logging.info(f"DataHandler RESET complete. Ready to stream from {self.start_date}.")
+        logger.info("DataHandler RESET complete. Ready to stream from %s.", self.start_date)
 
     def _preprocess_data(self):
         """
         Loads data for all specified symbols and interval, sorts it,
         and prepares a direct iterator over the DataFrame's rows.
         """
+        if self._bar_store is not None:
+            self._all_data_df = self._bar_store.to_frame(self.symbols)
+            if self._all_data_df.empty:
+                logger.warning("No price data found for any of the symbols %s at interval %s", self.symbols, self.interval.value)
+                self._has_more_data = False
+                return
+            self._df_iterator = self._all_data_df.itertuples(index=False)
+            self._load_next_row()
+            logger.info("Loaded data for %s symbols across %s unique timestamps.", len(self.symbols), self._all_data_df['timestamp'].nunique())
+            return
+
         all_rows_data = []
         for symbol in self.symbols:
             price_bars = self.price_bar_data[symbol]
@@ -134,7 +151,7 @@ class DataHandler:
                 })
 
         if not all_rows_data:
-            logging.warning(f"No price data found for any of the symbols {self.symbols} at interval {self.interval.value}")
+            logger.warning("No price data found for any of the symbols %s at interval %s", self.symbols, self.interval.value)
             self._has_more_data = False
             return
 
@@ -145,7 +162,7 @@ class DataHandler:
 
         self._load_next_row()
 
-        logging.info(f"Loaded data for {len(self.symbols)} symbols across {len(self._all_data_df['timestamp'].unique())} unique timestamps.")
+        logger.info("Loaded data for %s symbols across %s unique timestamps.", len(self.symbols), len(self._all_data_df['timestamp'].unique()))
 
     def _load_next_row(self):
         """
@@ -158,7 +175,7 @@ class DataHandler:
         except StopIteration:
             self._current_row_data = None
             self._has_more_data = False
-            logging.debug("No more rows available from data handler.")
+            logger.debug("No more rows available from data handler.")
 
 
     def _load_data_from_data_source(self):
@@ -166,9 +183,18 @@ class DataHandler:
         type = self.data_source.type
 
         if type == DataSourceType.DIRECT:
-            price_bar_data = self.data_source.price_bar_data
+            if self.data_source.bar_store is not None:
+                price_bar_data = self.data_source.bar_store.to_price_bar_data()
+            else:
+                price_bar_data = self.data_source.price_bar_data
             if price_bar_data is None:
                 raise ValueError("The provided price bar data is None, stopping backtest.")
+        elif type == DataSourceType.REPLAY:
+            if self.data_source.event_log_path is None:
+                raise ValueError("The provided event log path is None, stopping backtest.")
+
+            self._bar_store = read_bar_store(self.data_source.event_log_path, self.symbols)
+            price_bar_data = self._bar_store.to_price_bar_data()
         elif type == DataSourceType.CUSTOM_CLIENT:
             if self.data_source.custom_client is None:
                 raise ValueError("The provided Custom Data Client is None, stopping backtest.")
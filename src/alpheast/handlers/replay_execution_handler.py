@@ -0,0 +1,95 @@
+from collections import deque
+from datetime import datetime
+import logging
+from typing import Deque, Dict, Iterator, Optional, Tuple
+
+from alpheast.events.event import FillEvent, MarketEvent, OrderEvent
+from alpheast.events.event_enums import EventType
+from alpheast.events.event_log import EventLogReader
+from alpheast.events.event_queue import EventQueue
+from alpheast.handlers.execution_handler import ExecutionHandler
+
+
+logger = logging.getLogger(__name__)
+
+class ReplayExecutionHandler(ExecutionHandler):
+    """
+    An execution handler that replays the fills of a recorded event log instead of simulating them,
+    so the recorded trades can be run through a different portfolio configuration without the strategies
+    and execution model that produced them. Orders placed during the replay are dropped.
+
+    Every fill is put on the queue on the market event of its symbol during the timestamp it was recorded in,
+    which is where the simulated execution handler produced it, so the fills arrive in the recorded order.
+    The log is streamed one timestamp at a time.
+    """
+    def __init__(self, event_queue: EventQueue, event_log_path: str):
+        self.event_queue = event_queue
+        self.event_log_path = event_log_path
+        self.dropped_orders = 0
+
+        self._recorded_fills: Iterator[Tuple[Optional[datetime], FillEvent]] = iter(())
+        self._next_fill: Optional[Tuple[Optional[datetime], FillEvent]] = None
+        self._fills: Dict[str, Deque[FillEvent]] = {}
+        self._timestamp: Optional[datetime] = None
+        self.reset()
+        logger.info("ReplayExecutionHandler initialized from %s.", event_log_path)
+
+    def get_open_order_count(self) -> int:
+        return sum(len(fills) for fills in self._fills.values())
+
+    def on_market_event(self, event: MarketEvent):
+        """
+        Puts the recorded fills of the event's symbol and timestamp on the queue.
+        """
+        if event.timestamp != self._timestamp:
+            self._load_timestamp(event.timestamp)
+
+        fills = self._fills.get(event.symbol)
+        while fills:
+            self.event_queue.put(fills.popleft())
+
+    def on_order_event(self, event: OrderEvent):
+        self.dropped_orders += 1
+        logger.debug("Dropped order %s for %s during fill replay.", event.order_id, event.symbol)
+
+    def reset(self):
+        """
+        Restarts the replay from the beginning of the log.
+        """
+        self._recorded_fills = self._read_recorded_fills()
+        self._next_fill = next(self._recorded_fills, None)
+        self._fills = {}
+        self._timestamp = None
+        self.dropped_orders = 0
+
+    def _read_recorded_fills(self) -> Iterator[Tuple[Optional[datetime], FillEvent]]:
+        """
+        (timestamp of the latest recorded market event, fill) for every recorded fill.
+        """
+        market_timestamp = None
+        for event in EventLogReader(self.event_log_path).events([EventType.MARKET, EventType.FILL]):
+            if event.type == EventType.MARKET:
+                market_timestamp = event.timestamp
+            else:
+                yield market_timestamp, event
+
+    def _load_timestamp(self, timestamp: datetime):
+        """
+        Reads the fills recorded while the market events of `timestamp` were processed.
+        Fills of earlier timestamps that were never replayed are skipped.
+        """
+        unreplayed = self.get_open_order_count()
+        skipped = 0
+        self._fills = {}
+        self._timestamp = timestamp
+
+        while self._next_fill is not None and (self._next_fill[0] is None or self._next_fill[0] <= timestamp):
+            fill_timestamp, fill = self._next_fill
+            if fill_timestamp == timestamp:
+                self._fills.setdefault(fill.symbol, deque()).append(fill)
+            else:
+                skipped += 1
+            self._next_fill = next(self._recorded_fills, None)
+
+        if unreplayed or skipped:
+            logger.warning("Skipped %s recorded fills before %s that had no market event to be replayed on.", unreplayed + skipped, timestamp)
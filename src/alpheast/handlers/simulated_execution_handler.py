@@ -10,6 +10,8 @@ from alpheast.events.event import FillEvent, MarketEvent, OrderEvent
 from alpheast.handlers.execution_handler import ExecutionHandler
 
 
+logger = logging.getLogger(__name__)
+
 class SimulatedExecutionHandler(ExecutionHandler):
     """
     A concrete execution handler that simulates order execution.
@@ -29,7 +31,10 @@ class SimulatedExecutionHandler(ExecutionHandler):
 
         self._open_orders: Deque[str, OrderEvent] = deque()
         self._open_orders_by_id: Dict[str, OrderEvent] = {}
-        logging.info("SimulatedExecutionHandler initialized.")
+        logger.info("SimulatedExecutionHandler initialized.")
+
+    def get_open_order_count(self) -> int:
+        return len(self._open_orders)
 
     def on_market_event(self, event: MarketEvent):
         """
@@ -42,7 +47,8 @@ class SimulatedExecutionHandler(ExecutionHandler):
             "high": Decimal(str(event.data["high"])),
             "low": Decimal(str(event.data["low"]))
         }
-        logging.debug(f"ExecutionHandler updated latest price for {event.symbol} to {self._latest_market_prices[event.symbol]['price']:.2f} on {event.timestamp.date()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ExecutionHandler updated latest price for %s to %.2f on %s", event.symbol, self._latest_market_prices[event.symbol]['price'], event.timestamp.date())
 
         orders_to_requeue = deque()
 
@@ -68,7 +74,7 @@ class SimulatedExecutionHandler(ExecutionHandler):
     def on_order_event(self, event: OrderEvent):
         self._open_orders.append(event)
         self._open_orders_by_id[event.order_id] = event
-        logging.info(f"ExecutionHandler received and opened order {event.order_id} for {event.symbol} ({event.direction} {event.quantity}) at {event.timestamp.date()}")
+        logger.info("ExecutionHandler received and opened order %s for %s (%s %s) at %s", event.order_id, event.symbol, event.direction, event.quantity, event.timestamp.date())
 
     def reset(self):
         """
@@ -76,14 +82,14 @@ class SimulatedExecutionHandler(ExecutionHandler):
         """
         self._open_orders.clear()
         self._open_orders_by_id.clear()
-        logging.info("SimulatedExecutionHandler reset open orders.")
+        logger.info("SimulatedExecutionHandler reset open orders.")
 
     def _attempt_fill_market_order(self, order: OrderEvent):
         try:
             fill_price_data = self._latest_market_prices.get(order.symbol)
 
             if not fill_price_data:
-                logging.warning(f"No market data available for {order.symbol} to fill order on {order.timestamp.date()}. Skipping fill.")
+                logger.warning("No market data available for %s to fill order on %s. Skipping fill.", order.symbol, order.timestamp.date())
                 self.push_failed_fill_event(order)
                 return
 
@@ -103,7 +109,7 @@ class SimulatedExecutionHandler(ExecutionHandler):
             self._remove_order_from_open_orders(order.order_id)
 
         except Exception as e:
-            logging.error(f"Error simulating order fill for {order.symbol} on {order.timestamp.date()}: {e}", exc_info=True)
+            logger.error("Error simulating order fill for %s on %s: %s", order.symbol, order.timestamp.date(), e, exc_info=True)
             self.push_failed_fill_event(order)
 
     def _attempt_fill_limit_order(self, order: OrderEvent):
@@ -115,7 +121,7 @@ class SimulatedExecutionHandler(ExecutionHandler):
             fill_price_data = self._latest_market_prices.get(order.symbol)
 
             if not fill_price_data:
-                logging.warning(f"No market data available for {order.symbol} to fill order on {order.timestamp.date()}. Skipping fill.")
+                logger.warning("No market data available for %s to fill order on %s. Skipping fill.", order.symbol, order.timestamp.date())
                 return False
 
             can_fill = False
@@ -136,11 +142,11 @@ class SimulatedExecutionHandler(ExecutionHandler):
                 self._remove_order_from_open_orders(order.order_id)
                 return True
             else:
-                logging.debug(f"Limit order {order.order_id} for {order.symbol} ({order.direction} at {order.price:.2f}) not filled on {order.timestamp.date()}. Low: {fill_price_data['low']:.2f}, High: {fill_price_data['high']:.2f}")
+                logger.debug("Limit order %s for %s (%s at %.2f) not filled on %s. Low: %.2f, High: %.2f", order.order_id, order.symbol, order.direction, order.price, order.timestamp.date(), fill_price_data['low'], fill_price_data['high'])
                 return False
             
         except Exception as e:
-            logging.error(f"Error simulating limit order fill for {order.symbol} on {order.timestamp.date()} (Order ID: {order.order_id}): {e}", exc_info=True)
+            logger.error("Error simulating limit order fill for %s on %s (Order ID: %s): %s", order.symbol, order.timestamp.date(), order.order_id, e, exc_info=True)
             self.push_failed_fill_event(order)
             return True 
         
@@ -173,16 +179,20 @@ class SimulatedExecutionHandler(ExecutionHandler):
         
         # Log based on success and order type
         if successful:
-            log_message = (
-                f"Filled {order.order_type.name} order {order.order_id}: "
-                f"{order.direction.name} {order.quantity} of {order.symbol} at {fill_price:.2f} "
-                f"(Commission: {commission:.2f})"
-            )
             if order.order_type == OrderType.LIMIT:
-                 log_message += f" (Limit: {order.price:.2f})" # Add limit price for context
-            logging.info(f"{log_message} on {order.timestamp.date()}")
+                logger.info(
+                    "Filled %s order %s: %s %s of %s at %.2f (Commission: %.2f) (Limit: %.2f) on %s",
+                    order.order_type.name, order.order_id, order.direction.name, order.quantity, order.symbol,
+                    fill_price, commission, order.price, order.timestamp.date()
+                )
+            else:
+                logger.info(
+                    "Filled %s order %s: %s %s of %s at %.2f (Commission: %.2f) on %s",
+                    order.order_type.name, order.order_id, order.direction.name, order.quantity, order.symbol,
+                    fill_price, commission, order.timestamp.date()
+                )
         else:
-            logging.warning(f"Failed to fill order {order.order_id} for {order.symbol} on {order.timestamp.date()}.")
+            logger.warning("Failed to fill order %s for %s on %s.", order.order_id, order.symbol, order.timestamp.date())
 
     # HELPER METHOD 2: Handles removing orders from the internal tracking dictionary
     def _remove_order_from_open_orders(self, order_id: str):
@@ -192,4 +202,4 @@ class SimulatedExecutionHandler(ExecutionHandler):
         if order_id in self._open_orders_by_id:
             del self._open_orders_by_id[order_id]
         else:
-            logging.warning(f"Attempted to remove order {order_id} from _open_orders but it was not found. It might have been removed already.")
+            logger.warning("Attempted to remove order %s from _open_orders but it was not found. It might have been removed already.", order_id)
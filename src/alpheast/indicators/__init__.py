@@ -0,0 +1,3 @@
+"""
+This package defines streaming technical indicators with O(1) updates per bar, used by the built-in strategies.
+"""
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from alpheast.indicators.base_indicator import BaseIndicator
+
+
+class ATR(BaseIndicator):
+    """
+    Average True Range with Wilder's smoothing, seeded with the simple average of the first `period` true ranges.
+    Fed with (high, low, close).
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self._previous_close: Optional[float] = None
+        self._average = 0.0
+        self._count = 0
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        previous_close = self._previous_close
+        self._previous_close = close
+
+        if previous_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+
+        self._count += 1
+        if self._count <= self.period:
+            # Running simple average during the seeding period
+            self._average += (true_range - self._average) / self._count
+            if self._count < self.period:
+                return self._value
+        else:
+            self._average = (self._average * (self.period - 1) + true_range) / self.period
+
+        self._value = self._average
+        return self._value
+
+    def reset(self):
+        self._previous_close = None
+        self._average = 0.0
+        self._count = 0
+        self._value = None
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class BaseIndicator(ABC):
+    """
+    Abstract base class for streaming indicators.
+    An indicator is fed one bar at a time through `update` and keeps only the state it needs,
+    so every update is O(1). Values are floats; `value` is None until the indicator is warmed up.
+    `inputs` names the bar fields `update` takes, in order.
+    """
+    inputs: Tuple[str, ...] = ("close",)
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"{self.__class__.__name__} period must be at least 1.")
+        self.period = period
+        self._value: Optional[float] = None
+
+    @abstractmethod
+    def update(self, *args: float) -> Optional[float]:
+        """
+        Feeds the next bar's input(s) and returns the new value (None during warm-up).
+        """
+        pass
+
+    @abstractmethod
+    def reset(self):
+        """
+        Clears all state, as if no bar had been seen.
+        """
+        pass
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._value
+
+    @property
+    def is_ready(self) -> bool:
+        return self._value is not None
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from alpheast.indicators import vectorized
+from alpheast.models.price_bar import PriceBar
+
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+MACD_OUTPUTS = ("macd", "signal", "histogram")
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """
+    A declared indicator: a vectorized function of one or more price columns.
+    Specs are hashable, so identical declarations of several strategies are computed only once per symbol.
+    Build them with the functions of this module, e.g. `sma("close", 50)`.
+    """
+    function: str
+    sources: Tuple[str, ...]
+    params: Tuple[Any, ...] = ()
+
+    def compute(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        inputs = [columns[source] for source in self.sources]
+        if self.function == "macd":
+            *periods, output = self.params
+            return vectorized.macd(*inputs, *periods)[MACD_OUTPUTS.index(output)]
+        return _KERNELS[self.function](*inputs, *self.params)
+
+_KERNELS = {
+    "sma": vectorized.rolling_mean,
+    "ema": vectorized.ema,
+    "rolling_std": vectorized.rolling_std,
+    "rolling_max": vectorized.rolling_max,
+    "rolling_min": vectorized.rolling_min,
+    "rsi": vectorized.rsi,
+    "atr": vectorized.atr,
+}
+
+def sma(source: str, period: int) -> IndicatorSpec:
+    return IndicatorSpec("sma", (_validate_source(source),), (_validate_period(period),))
+
+def ema(source: str, period: int) -> IndicatorSpec:
+    return IndicatorSpec("ema", (_validate_source(source),), (_validate_period(period),))
+
+def rolling_std(source: str, period: int, ddof: int = 1) -> IndicatorSpec:
+    if period <= ddof:
+        raise ValueError("Rolling standard deviation period must be greater than ddof.")
+    return IndicatorSpec("rolling_std", (_validate_source(source),), (period, ddof))
+
+def rolling_max(source: str, period: int) -> IndicatorSpec:
+    return IndicatorSpec("rolling_max", (_validate_source(source),), (_validate_period(period),))
+
+def rolling_min(source: str, period: int) -> IndicatorSpec:
+    return IndicatorSpec("rolling_min", (_validate_source(source),), (_validate_period(period),))
+
+def rsi(source: str, period: int = 14) -> IndicatorSpec:
+    return IndicatorSpec("rsi", (_validate_source(source),), (_validate_period(period),))
+
+def macd(source: str, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, output: str = "histogram") -> IndicatorSpec:
+    """
+    `output` selects the "macd" line, the "signal" line or the "histogram".
+    """
+    if not (1 <= fast_period < slow_period):
+        raise ValueError("Fast period must be less than slow period and positive.")
+    if output not in MACD_OUTPUTS:
+        raise ValueError(f"MACD output must be one of {MACD_OUTPUTS}, got '{output}'.")
+    return IndicatorSpec("macd", (_validate_source(source),), (fast_period, slow_period, _validate_period(signal_period), output))
+
+def atr(period: int = 14) -> IndicatorSpec:
+    return IndicatorSpec("atr", ("high", "low", "close"), (_validate_period(period),))
+
+def precompute_indicators(
+    specs: Iterable[IndicatorSpec],
+    price_bars: List[PriceBar]
+) -> Tuple[Dict[datetime, int], Dict[IndicatorSpec, np.ndarray]]:
+    """
+    Computes the specs over one symbol's whole price series.
+
+    Returns:
+        The position of every bar timestamp in the series and one array per spec, aligned to those positions.
+    """
+    bars = sorted(price_bars, key=lambda bar: bar.timestamp)
+    bar_index = {bar.timestamp: i for i, bar in enumerate(bars)}
+    columns = {
+        column: np.fromiter((float(getattr(bar, column)) for bar in bars), dtype=np.float64, count=len(bars))
+        for column in PRICE_COLUMNS
+    }
+    values = {}
+    for spec in set(specs):
+        values[spec] = spec.compute(columns)
+        # Shared between strategies, so nobody may write into it
+        values[spec].flags.writeable = False
+    return bar_index, values
+
+def _validate_source(source: str) -> str:
+    if source not in PRICE_COLUMNS:
+        raise ValueError(f"Indicator source must be one of {PRICE_COLUMNS}, got '{source}'.")
+    return source
+
+def _validate_period(period: int) -> int:
+    if period < 1:
+        raise ValueError("Indicator period must be at least 1.")
+    return period
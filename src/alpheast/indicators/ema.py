@@ -0,0 +1,31 @@
+from typing import Optional
+
+from alpheast.indicators.base_indicator import BaseIndicator
+
+
+class EMA(BaseIndicator):
+    """
+    Exponential Moving Average with smoothing factor 2 / (period + 1),
+    seeded with the simple average of the first `period` values.
+    """
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.alpha = 2.0 / (period + 1)
+        self._seed_sum = 0.0
+        self._count = 0
+
+    def update(self, value: float) -> Optional[float]:
+        if self._value is not None:
+            self._value += (value - self._value) * self.alpha
+            return self._value
+
+        self._seed_sum += value
+        self._count += 1
+        if self._count == self.period:
+            self._value = self._seed_sum / self.period
+        return self._value
+
+    def reset(self):
+        self._seed_sum = 0.0
+        self._count = 0
+        self._value = None
@@ -0,0 +1,92 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from alpheast.events.event import MarketEvent
+from alpheast.indicators.base_indicator import BaseIndicator
+
+
+logger = logging.getLogger(__name__)
+
+IndicatorKey = Tuple[str, Type[BaseIndicator], Tuple[Any, ...]]
+
+class IndicatorRegistry:
+    """
+    Engine-level cache of streaming indicators keyed by (symbol, indicator class, params).
+    Every distinct indicator is updated once per bar, before the strategies see the bar,
+    and shared with all strategies that subscribed to it. Subscribers only read it.
+    """
+    def __init__(self):
+        self._indicators: Dict[IndicatorKey, BaseIndicator] = {}
+        self._by_symbol: Dict[str, List[BaseIndicator]] = {}
+        self._subscriber_counts: Dict[IndicatorKey, int] = {}
+
+    def subscribe(self, symbol: str, indicator_cls: Type[BaseIndicator], *params: Any) -> BaseIndicator:
+        key = (symbol, indicator_cls, params)
+        indicator = self._indicators.get(key)
+        if indicator is None:
+            indicator = indicator_cls(*params)
+            self._indicators[key] = indicator
+            self._by_symbol.setdefault(symbol, []).append(indicator)
+            logger.debug("Registered %s%s for %s.", indicator_cls.__name__, params, symbol)
+        self._subscriber_counts[key] = self._subscriber_counts.get(key, 0) + 1
+        return indicator
+
+    def on_market_event(self, event: MarketEvent):
+        indicators = self._by_symbol.get(event.symbol)
+        if not indicators:
+            return
+        data = event.data
+        for indicator in indicators:
+            indicator.update(*(float(data[field]) for field in indicator.inputs))
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Number of distinct indicators and of subscriptions served by them.
+        """
+        return {
+            "indicators": len(self._indicators),
+            "subscriptions": sum(self._subscriber_counts.values()),
+        }
+
+    def reset(self):
+        for indicator in self._indicators.values():
+            indicator.reset()
+
+class IndicatorSubscription:
+    """
+    A strategy's handle on an indicator. It starts out with a private instance, which the strategy feeds itself,
+    and is switched to the registry's shared instance when the engine attaches an IndicatorRegistry.
+    Attributes of the indicator (e.g. `macd_line`) are readable through the handle.
+    """
+    def __init__(self, symbol: str, indicator_cls: Type[BaseIndicator], params: Tuple[Any, ...]):
+        self.symbol = symbol
+        self.indicator_cls = indicator_cls
+        self.params = params
+        self.indicator: BaseIndicator = indicator_cls(*params)
+        self.is_shared = False
+
+    def attach(self, registry: IndicatorRegistry):
+        self.indicator = registry.subscribe(self.symbol, self.indicator_cls, *self.params)
+        self.is_shared = True
+
+    def update(self, event: MarketEvent):
+        """
+        Feeds the private instance; a shared instance is fed by the registry.
+        """
+        if self.is_shared or event.symbol != self.symbol:
+            return
+        data = event.data
+        self.indicator.update(*(float(data[field]) for field in self.indicator.inputs))
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.indicator.value
+
+    @property
+    def is_ready(self) -> bool:
+        return self.indicator.is_ready
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "indicator":
+            raise AttributeError(name)
+        return getattr(self.indicator, name)
@@ -0,0 +1,60 @@
+from typing import Optional
+
+from alpheast.indicators.base_indicator import BaseIndicator
+from alpheast.indicators.ema import EMA
+from alpheast.indicators.sma import SMA
+
+
+class MACD(BaseIndicator):
+    """
+    Moving Average Convergence Divergence.
+
+    Both EMAs start together once `slow_period` closes are available, each seeded with the simple
+    average of its own last `period` closes. The signal line is an EMA of the MACD line.
+    `value` is the histogram (MACD line minus signal line); the lines are available as attributes.
+    """
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        if not (1 <= fast_period < slow_period):
+            raise ValueError("Fast period must be less than slow period and positive.")
+        super().__init__(slow_period)
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+
+        self._fast_seed = SMA(fast_period)
+        self._slow_seed = SMA(slow_period)
+        self._fast_ema: Optional[float] = None
+        self._slow_ema: Optional[float] = None
+        self._fast_alpha = 2.0 / (fast_period + 1)
+        self._slow_alpha = 2.0 / (slow_period + 1)
+        self._signal = EMA(signal_period)
+
+        self.macd_line: Optional[float] = None
+        self.signal_line: Optional[float] = None
+
+    def update(self, value: float) -> Optional[float]:
+        if self._slow_ema is None:
+            self._fast_seed.update(value)
+            if self._slow_seed.update(value) is None:
+                return self._value
+            self._fast_ema = self._fast_seed.value
+            self._slow_ema = self._slow_seed.value
+        else:
+            self._fast_ema += (value - self._fast_ema) * self._fast_alpha
+            self._slow_ema += (value - self._slow_ema) * self._slow_alpha
+
+        self.macd_line = self._fast_ema - self._slow_ema
+        self.signal_line = self._signal.update(self.macd_line)
+        if self.signal_line is not None:
+            self._value = self.macd_line - self.signal_line
+        return self._value
+
+    def reset(self):
+        self._fast_seed.reset()
+        self._slow_seed.reset()
+        self._fast_ema = None
+        self._slow_ema = None
+        self._signal.reset()
+        self.macd_line = None
+        self.signal_line = None
+        self._value = None
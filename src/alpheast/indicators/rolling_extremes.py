@@ -0,0 +1,42 @@
+from collections import deque
+from typing import Optional
+
+from alpheast.indicators.base_indicator import BaseIndicator
+
+
+class RollingMax(BaseIndicator):
+    """
+    Maximum of the last `period` values with a monotonic deque: amortized O(1) per update.
+    """
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._candidates = deque() # (index, value), values decreasing
+        self._index = 0
+
+    def update(self, value: float) -> Optional[float]:
+        while self._candidates and self._candidates[-1][1] <= value:
+            self._candidates.pop()
+        self._candidates.append((self._index, value))
+        if self._candidates[0][0] <= self._index - self.period:
+            self._candidates.popleft()
+
+        self._index += 1
+        if self._index >= self.period:
+            self._value = self._candidates[0][1]
+        return self._value
+
+    def reset(self):
+        self._candidates.clear()
+        self._index = 0
+        self._value = None
+
+class RollingMin(RollingMax):
+    """
+    Minimum of the last `period` values with a monotonic deque: amortized O(1) per update.
+    """
+    def update(self, value: float) -> Optional[float]:
+        result = super().update(-value)
+        if result is None:
+            return None
+        self._value = -result
+        return self._value
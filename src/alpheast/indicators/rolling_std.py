@@ -0,0 +1,47 @@
+from collections import deque
+import math
+from typing import Optional
+
+from alpheast.indicators.base_indicator import BaseIndicator
+
+
+class RollingStd(BaseIndicator):
+    """
+    Rolling mean and standard deviation over the last `period` values,
+    with Welford's update generalized to a sliding window (add the new value and drop the oldest in one step).
+    """
+    def __init__(self, period: int, ddof: int = 1):
+        if period <= ddof:
+            raise ValueError("RollingStd period must be greater than ddof.")
+        super().__init__(period)
+        self.ddof = ddof
+        self._window = deque(maxlen=period)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        if len(self._window) < self.period:
+            self._window.append(value)
+            delta = value - self._mean
+            self._mean += delta / len(self._window)
+            self._m2 += delta * (value - self._mean)
+        else:
+            oldest = self._window[0]
+            self._window.append(value)
+            previous_mean = self._mean
+            self._mean += (value - oldest) / self.period
+            self._m2 += (value - oldest) * (value - self._mean + oldest - previous_mean)
+
+        if len(self._window) == self.period:
+            self._value = math.sqrt(max(self._m2, 0.0) / (self.period - self.ddof))
+        return self._value
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self.is_ready else None
+
+    def reset(self):
+        self._window.clear()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._value = None
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from alpheast.indicators.base_indicator import BaseIndicator
+
+
+class RSI(BaseIndicator):
+    """
+    Relative Strength Index with Wilder's smoothing.
+    The average gain/loss is the simple average of the first `period` price changes, then smoothed with 1 / period.
+    """
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self._previous: Optional[float] = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._count = 0
+
+    def update(self, value: float) -> Optional[float]:
+        previous = self._previous
+        self._previous = value
+        if previous is None:
+            return self._value
+
+        change = value - previous
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        self._count += 1
+        if self._count <= self.period:
+            self._avg_gain += (gain - self._avg_gain) / self._count
+            self._avg_loss += (loss - self._avg_loss) / self._count
+            if self._count < self.period:
+                return self._value
+        else:
+            self._avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+            self._avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+
+        if self._avg_loss == 0:
+            self._value = 100.0
+        else:
+            self._value = 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss)
+        return self._value
+
+    def reset(self):
+        self._previous = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._count = 0
+        self._value = None
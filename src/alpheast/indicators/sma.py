@@ -0,0 +1,38 @@
+from collections import deque
+import math
+from typing import Optional
+
+from alpheast.indicators.base_indicator import BaseIndicator
+
+
+class SMA(BaseIndicator):
+    """
+    Simple Moving Average over a running sum.
+    The sum is rebuilt from the window once per `period` updates, so rounding errors cannot accumulate.
+    """
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._window = deque(maxlen=period)
+        self._sum = 0.0
+        self._updates_since_rebuild = 0
+
+    def update(self, value: float) -> Optional[float]:
+        if len(self._window) == self.period:
+            self._sum -= self._window[0]
+        self._window.append(value)
+        self._sum += value
+
+        self._updates_since_rebuild += 1
+        if self._updates_since_rebuild >= self.period:
+            self._sum = math.fsum(self._window)
+            self._updates_since_rebuild = 0
+
+        if len(self._window) == self.period:
+            self._value = self._sum / self.period
+        return self._value
+
+    def reset(self):
+        self._window.clear()
+        self._sum = 0.0
+        self._updates_since_rebuild = 0
+        self._value = None
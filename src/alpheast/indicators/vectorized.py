@@ -0,0 +1,76 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Vectorized counterparts of the streaming indicators, computed over a whole price series at once.
+# Every kernel is causal: the value at index i only depends on the inputs at indices <= i,
+# and it is NaN wherever the streaming indicator would still be warming up.
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    return pd.Series(values).rolling(period, min_periods=period).mean().to_numpy()
+
+def rolling_std(values: np.ndarray, period: int, ddof: int = 1) -> np.ndarray:
+    return pd.Series(values).rolling(period, min_periods=period).std(ddof=ddof).to_numpy()
+
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    return pd.Series(values).rolling(period, min_periods=period).max().to_numpy()
+
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    return pd.Series(values).rolling(period, min_periods=period).min().to_numpy()
+
+def seeded_ema(values: np.ndarray, alpha: float, period: int, seed_index: Optional[int] = None) -> np.ndarray:
+    """
+    Exponential moving average with smoothing factor `alpha`, seeded at `seed_index` with the simple average
+    of the `period` values ending there (by default the first index with `period` values after any leading NaNs).
+    """
+    result = np.full(len(values), np.nan)
+    finite = np.flatnonzero(np.isfinite(values))
+    if len(finite) == 0:
+        return result
+    if seed_index is None:
+        seed_index = int(finite[0]) + period - 1
+    if seed_index >= len(values):
+        return result
+
+    seeded = np.array(values[seed_index:], dtype=np.float64)
+    seeded[0] = np.mean(values[seed_index - period + 1:seed_index + 1])
+    result[seed_index:] = pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return result
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    return seeded_ema(values, 2.0 / (period + 1), period)
+
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    result = np.full(len(values), np.nan)
+    if len(values) < 2:
+        return result
+
+    changes = np.diff(values)
+    avg_gain = seeded_ema(np.maximum(changes, 0.0), 1.0 / period, period)
+    avg_loss = seeded_ema(np.maximum(-changes, 0.0), 1.0 / period, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result[1:] = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    result[1:][np.isnan(avg_gain)] = np.nan
+    return result
+
+def macd(values: np.ndarray, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the MACD line, the signal line and the histogram.
+    Both EMAs start together at the slow warm-up, like the streaming MACD.
+    """
+    slow = seeded_ema(values, 2.0 / (slow_period + 1), slow_period)
+    fast = seeded_ema(values, 2.0 / (fast_period + 1), fast_period, seed_index=slow_period - 1)
+    macd_line = fast - slow
+    signal_line = seeded_ema(macd_line, 2.0 / (signal_period + 1), signal_period)
+    return macd_line, signal_line, macd_line - signal_line
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    true_range = high - low
+    if len(close) > 1:
+        previous_close = close[:-1]
+        true_range[1:] = np.maximum.reduce([
+            true_range[1:], np.abs(high[1:] - previous_close), np.abs(low[1:] - previous_close)
+        ])
+    return seeded_ema(true_range, 1.0 / period, period)
@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from alpheast.shared.plotting import PerformancePlotter
+from alpheast.shared.profiling import ProfilingReport
 
 
 class BacktestResults:
@@ -16,7 +17,10 @@ class BacktestResults:
         final_portfolio_summary: Dict[str, Any],
         start_date: Any,
         end_date: Any,
-        initial_cash: float
+        initial_cash: float,
+        rolling_metrics: Optional[Dict[int, Dict[str, Any]]] = None,
+        round_trips: Optional[Dict[str, Any]] = None,
+        profiling_report: Optional[ProfilingReport] = None
     ):
         self.performance_metrics = performance_metrics
         self.daily_values = daily_values
@@ -26,6 +30,9 @@ class BacktestResults:
         self.start_date = start_date
         self.end_date = end_date
         self.initial_cash = initial_cash
+        self.rolling_metrics = rolling_metrics or {} # Window -> rolling metric time series
+        self.round_trips = round_trips or {} # Field -> array, one entry per round trip
+        self.profiling_report = profiling_report # Only set when the engine ran with profile=True
     
     def print_summary(self):
         """Prints a concise summary of the backtest results."""
@@ -33,6 +40,9 @@ class BacktestResults:
         print(f"Initial Cash: ${self.initial_cash:.2f}")
         print(f"Final Cash: ${self.final_portfolio_summary["cash"]:.2f}")
         print(f"Final Holdings: {self.final_portfolio_summary["holdings"]}")
+        if "realized_pnl" in self.final_portfolio_summary:
+            print(f"Realized P&L: ${self.final_portfolio_summary["realized_pnl"]:.2f}")
+            print(f"Unrealized P&L: ${self.final_portfolio_summary["unrealized_pnl"]:.2f}")
         print(f"Total Trades: {len(self.trade_log)}")
 
         if "strategy" in self.performance_metrics and "error" not in self.performance_metrics["strategy"]:
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CrossSection:
+    """
+    The bars of a whole universe at one timestamp, as arrays aligned to `symbols`.
+    Symbols without a bar at this timestamp have NaN prices and `valid` set to False.
+    """
+    timestamp: datetime
+    symbols: List[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    valid: np.ndarray
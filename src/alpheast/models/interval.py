@@ -3,7 +3,7 @@ from enum import Enum
 
 
 class Interval(Enum):
-    MONTHLY = "1m"
+    MONTHLY = "1mo"
     WEEKLY = "1w"
     DAILY = "1d"
     HOURLY = "1h"
@@ -0,0 +1,20 @@
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+
+@dataclass
+class Lot:
+    """
+    Represents an open tax lot of a position.
+    The cost is the remaining cost basis of the lot, including the commission paid to open it.
+    """
+    symbol: str
+    quantity: Decimal
+    cost: Decimal
+    timestamp: datetime
+
+    @property
+    def unit_cost(self) -> Decimal:
+        return self.cost / self.quantity
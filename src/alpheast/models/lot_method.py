@@ -0,0 +1,8 @@
+
+from enum import Enum
+
+
+class LotMethod(Enum):
+    FIFO = "FIFO"
+    LIFO = "LIFO"
+    AVERAGE_COST = "AVERAGE_COST"
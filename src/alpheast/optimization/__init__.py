@@ -0,0 +1,3 @@
+"""
+This package provides tools for evaluating many strategy parameter sets against the same data.
+"""
\ No newline at end of file
@@ -0,0 +1,235 @@
+from dataclasses import dataclass, field
+import itertools
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.data.bar_store import BarStore
+from alpheast.optimization.parameter_sweep import (
+    ParameterSweep, PositionSizingFactory, StrategyFactory, SweepResult, TimeWindow
+)
+from alpheast.optimization.walk_forward import Objective, stitch_backtest_results
+
+
+logger = logging.getLogger(__name__)
+
+FoldMasks = Tuple[np.ndarray, np.ndarray] # (train, test) boolean masks over the bar store's timeline
+SAMPLES = ("train", "test")
+
+def purged_kfold_masks(num_timestamps: int, n_splits: int = 5, purge: int = 0, embargo: int = 0) -> List[FoldMasks]:
+    """
+    Purged k-fold over the timeline: every contiguous block of timestamps is the test set once.
+
+    Args:
+        num_timestamps: Length of the timeline.
+        n_splits: Number of blocks.
+        purge: Timestamps dropped from the train set right before each test block (the lookback that overlaps it).
+        embargo: Timestamps dropped from the train set right after each test block.
+
+    Returns:
+        One (train mask, test mask) pair per block.
+    """
+    if n_splits < 2:
+        raise ValueError("Cross-validation needs at least 2 splits.")
+    groups = _group_windows(num_timestamps, n_splits)
+    return [_purged_masks(num_timestamps, [group], purge, embargo) for group in groups]
+
+def combinatorial_purged_masks(
+    num_timestamps: int,
+    n_groups: int = 6,
+    n_test_groups: int = 2,
+    purge: int = 0,
+    embargo: int = 0
+) -> List[FoldMasks]:
+    """
+    Combinatorial purged cross-validation: the timeline is cut into `n_groups` contiguous blocks and every
+    combination of `n_test_groups` blocks is the test set once, with purging and embargo around each test block.
+
+    Returns:
+        One (train mask, test mask) pair per combination, in `itertools.combinations` order.
+    """
+    if not 0 < n_test_groups < n_groups:
+        raise ValueError("The number of test groups must be between 1 and the number of groups - 1.")
+    groups = _group_windows(num_timestamps, n_groups)
+    return [
+        _purged_masks(num_timestamps, [groups[i] for i in combination], purge, embargo)
+        for combination in itertools.combinations(range(n_groups), n_test_groups)
+    ]
+
+def _group_windows(num_timestamps: int, n_groups: int) -> List[TimeWindow]:
+    if num_timestamps < n_groups:
+        raise ValueError(f"Cannot cut {num_timestamps} timestamps into {n_groups} groups.")
+    edges = np.linspace(0, num_timestamps, n_groups + 1).astype(int)
+    return [(int(start), int(end)) for start, end in zip(edges[:-1], edges[1:])]
+
+def _purged_masks(num_timestamps: int, test_windows: List[TimeWindow], purge: int, embargo: int) -> FoldMasks:
+    if purge < 0 or embargo < 0:
+        raise ValueError("Purge and embargo must not be negative.")
+    train = np.ones(num_timestamps, dtype=bool)
+    test = np.zeros(num_timestamps, dtype=bool)
+    for start, end in test_windows:
+        test[start:end] = True
+        train[max(start - purge, 0):min(end + embargo, num_timestamps)] = False
+    return train, test
+
+def mask_segments(mask: np.ndarray) -> List[TimeWindow]:
+    """
+    The contiguous runs of True in a timeline mask as [start, end) windows.
+    """
+    padded = np.concatenate(([0], np.asarray(mask, dtype=np.int8), [0]))
+    changes = np.flatnonzero(np.diff(padded))
+    return [(int(start), int(end)) for start, end in zip(changes[::2], changes[1::2])]
+
+@dataclass(frozen=True)
+class CrossValidationRecord:
+    """
+    Metrics of one parameter set on the train or test part of one split.
+    A part made of several segments is backtested per segment and the segments are stitched.
+    """
+    split: int
+    sample: str
+    param_index: int
+    params: Dict[str, Any]
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+@dataclass
+class CrossValidationResult:
+    """
+    All records of a cross-validation, with helpers to read them as distributions over the splits.
+    """
+    parameter_sets: List[Dict[str, Any]]
+    splits: List[FoldMasks]
+    records: List[CrossValidationRecord]
+
+    def metric_distribution(self, metric: Objective, sample: str = "test") -> np.ndarray:
+        """
+        The metric (name or function of the metrics) per split and parameter set, shape (splits, parameter sets).
+        Failed or missing runs are NaN.
+        """
+        values = np.full((len(self.splits), len(self.parameter_sets)), np.nan)
+        for record in self.records:
+            if record.sample == sample:
+                values[record.split, record.param_index] = _score(record.metrics, metric)
+        return values
+
+    def selected_test_scores(self, objective: Objective) -> np.ndarray:
+        """
+        Per split, the test score of the parameter set that scored best on the train part (NaN if none did).
+        Its spread, and how far it falls below the train scores, is the overfitting estimate.
+        """
+        train = self.metric_distribution(objective, "train")
+        test = self.metric_distribution(objective, "test")
+        selected = np.full(len(self.splits), np.nan)
+        for split in range(len(self.splits)):
+            if np.isfinite(train[split]).any():
+                selected[split] = test[split, int(np.nanargmax(train[split]))]
+        return selected
+
+class PurgedCrossValidator:
+    """
+    Evaluates every parameter set on the train and test parts of every split over one preloaded BarStore.
+
+    Each part is cut into its contiguous segments; every distinct (parameter set, segment) pair is one run of a
+    single ParameterSweep, so the bars are loaded once per worker and segments shared between splits (common in
+    combinatorial CV) are backtested only once. Strategies start cold in every segment.
+
+    :param options: Backtest options shared by all runs.
+    :param price_bar_data: Price bars per symbol, or a BarStore.
+    :param strategy_factory: Builds the strategies of a run from its parameters.
+    :param parameter_sets: Candidate parameters, e.g. from `expand_parameter_grid`.
+    :param splits: (train, test) masks over the store's timeline, e.g. from `purged_kfold_masks`.
+    :param position_sizing_factory: Builds the position sizing method of a run from its parameters.
+    :param evaluate_train: Whether to backtest the train parts too (needed for `selected_test_scores`).
+    :param engine_kwargs: Further keyword arguments for every BacktestingEngine.
+    :param max_workers: Number of worker processes (CPU count if None).
+    """
+    def __init__(
+        self,
+        options: BacktestingOptions,
+        price_bar_data: Any,
+        strategy_factory: StrategyFactory,
+        parameter_sets: List[Dict[str, Any]],
+        splits: List[FoldMasks],
+        position_sizing_factory: Optional[PositionSizingFactory] = None,
+        evaluate_train: bool = True,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None
+    ):
+        self.options = options
+        self.bar_store = price_bar_data if isinstance(price_bar_data, BarStore) else BarStore.from_price_bar_data(price_bar_data)
+        self.strategy_factory = strategy_factory
+        self.parameter_sets = list(parameter_sets)
+        self.position_sizing_factory = position_sizing_factory
+        self.samples = SAMPLES if evaluate_train else ("test",)
+        self.engine_kwargs = engine_kwargs
+        self.max_workers = max_workers
+
+        num_timestamps = len(self.bar_store.timeline)
+        self.splits = [(np.asarray(train, dtype=bool), np.asarray(test, dtype=bool)) for train, test in splits]
+        for train, test in self.splits:
+            if len(train) != num_timestamps or len(test) != num_timestamps:
+                raise ValueError(f"Split masks must cover the {num_timestamps} timestamps of the bar store.")
+
+    def run(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> CrossValidationResult:
+        segments = {
+            (split, sample): mask_segments(masks[SAMPLES.index(sample)])
+            for split, masks in enumerate(self.splits)
+            for sample in self.samples
+        }
+
+        # --- 1. One sweep over the distinct (parameter set, segment) pairs ---
+        runs: Dict[Tuple[int, TimeWindow], int] = {}
+        for windows in segments.values():
+            for window in windows:
+                for param_index in range(len(self.parameter_sets)):
+                    runs.setdefault((param_index, window), len(runs))
+
+        sweep = ParameterSweep(
+            self.options,
+            self.bar_store,
+            self.strategy_factory,
+            [self.parameter_sets[param_index] for param_index, _ in runs],
+            position_sizing_factory=self.position_sizing_factory,
+            engine_kwargs=self.engine_kwargs,
+            max_workers=self.max_workers,
+            time_windows=[window for _, window in runs],
+            keep_backtest_results=any(len(windows) > 1 for windows in segments.values())
+        )
+        logger.info("Cross-validating %s parameter sets on %s splits (%s distinct runs).", len(self.parameter_sets), len(self.splits), len(runs))
+        sweep_results = {result.run_index: result for result in sweep.run(progress_callback)}
+
+        # --- 2. Combine the segments of every split part ---
+        records = []
+        for (split, sample), windows in segments.items():
+            for param_index, params in enumerate(self.parameter_sets):
+                metrics, error = _combine_segments([sweep_results.get(runs[(param_index, window)]) for window in windows])
+                records.append(CrossValidationRecord(split, sample, param_index, params, metrics, error))
+
+        return CrossValidationResult(parameter_sets=self.parameter_sets, splits=self.splits, records=records)
+
+def _combine_segments(results: List[Optional[SweepResult]]) -> Tuple[Dict[str, Any], Optional[str]]:
+    if not results:
+        return {}, "The mask selects no timestamps."
+    for result in results:
+        if result is None:
+            return {}, "The run was cancelled."
+        if not result.succeeded:
+            return {}, result.error
+    if len(results) == 1:
+        return results[0].metrics, None
+
+    stitched = stitch_backtest_results([result.backtest_results for result in results])
+    metrics = {
+        name: value.item() if hasattr(value, "item") else value
+        for name, value in stitched.performance_metrics["strategy"].items()
+    }
+    return metrics, None
+
+def _score(metrics: Dict[str, Any], metric: Objective) -> float:
+    if not metrics:
+        return float("nan")
+    value = metric(metrics) if callable(metric) else metrics.get(metric)
+    return float(value) if isinstance(value, (int, float)) else float("nan")
@@ -0,0 +1,183 @@
+import logging
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from alpheast.indicators.vectorized import rolling_mean
+from alpheast.models.price_bar import PriceBar
+from alpheast.shared.metrics import TRADING_DAYS_PER_YEAR
+
+
+logger = logging.getLogger(__name__)
+
+GRID_METRIC_FIELDS = [
+    "fast_period", "slow_period", "final_portfolio_value", "total_return", "annualized_return",
+    "annualized_volatility", "sharpe_ratio", "max_drawdown", "total_trades"
+]
+
+def evaluate_sma_crossover_grid(
+    price_bars: List[PriceBar],
+    fast_periods: Sequence[int],
+    slow_periods: Sequence[int],
+    initial_cash: float = 100_000.0,
+    allocation_percent: float = 0.05,
+    transaction_cost_percent: float = 0.001,
+    slippage_percent: float = 0.0005,
+    risk_free_rate: float = 0.0
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluates SMACrossoverStrategy for every (fast, slow) pair of the grid with fast < slow in one pass over the bars.
+
+    Every distinct SMA period is computed once into a (period x time) array. The variants' portfolios are columns of
+    cash and position arrays that are advanced together bar by bar, following the engine's order of events:
+    a signal is sized with FixedAllocationSizing on the bar's close, filled at the next bar's close with slippage
+    and commission, and the equity is recorded at the end of every day.
+
+    Args:
+        price_bars: Bars of a single symbol.
+        fast_periods: Candidate fast SMA periods.
+        slow_periods: Candidate slow SMA periods.
+        initial_cash: Starting cash of every variant.
+        allocation_percent: Share of cash spent per BUY, as in FixedAllocationSizing.
+        transaction_cost_percent: Commission as a fraction of the traded value.
+        slippage_percent: Slippage as a fraction of the price.
+        risk_free_rate: Annual risk-free rate for the Sharpe ratio.
+
+    Returns:
+        A columnar dictionary (field -> NumPy array) with one entry per variant. Returns, volatility and
+        drawdown are percentages like in `calculate_performance_metrics`, but not rounded.
+    """
+    fast_grid, slow_grid = np.meshgrid(np.asarray(fast_periods, dtype=np.int64), np.asarray(slow_periods, dtype=np.int64), indexing="ij")
+    is_valid = (fast_grid >= 1) & (fast_grid < slow_grid)
+    fast_of_variant, slow_of_variant = fast_grid[is_valid], slow_grid[is_valid]
+    if len(fast_of_variant) == 0 or not price_bars:
+        logger.warning("No valid (fast < slow) parameter pairs or no price bars for the grid evaluation.")
+        return {field: np.empty(0) for field in GRID_METRIC_FIELDS}
+
+    bars = sorted(price_bars, key=lambda bar: bar.timestamp)
+    close = np.array([float(bar.close) for bar in bars])
+    dates = np.array([bar.timestamp.date() for bar in bars])
+
+    # One row per distinct period, shared by every variant using it
+    periods, period_row = np.unique(np.concatenate((fast_of_variant, slow_of_variant)), return_inverse=True)
+    sma = np.vstack([rolling_mean(close, int(period)) for period in periods])
+    fast_row = period_row[:len(fast_of_variant)]
+    slow_row = period_row[len(fast_of_variant):]
+
+    daily_equity, total_trades = _simulate_crossovers(
+        close, dates, sma[fast_row], sma[slow_row], initial_cash, allocation_percent, transaction_cost_percent, slippage_percent
+    )
+
+    metrics = _calculate_equity_metrics(daily_equity, risk_free_rate)
+    metrics["fast_period"] = fast_of_variant
+    metrics["slow_period"] = slow_of_variant
+    metrics["total_trades"] = total_trades
+    return {field: metrics[field] for field in GRID_METRIC_FIELDS}
+
+def _simulate_crossovers(
+    close: np.ndarray,
+    dates: np.ndarray,
+    fast_line: np.ndarray,
+    slow_line: np.ndarray,
+    initial_cash: float,
+    allocation_percent: float,
+    transaction_cost_percent: float,
+    slippage_percent: float
+):
+    """
+    Advances one long-only crossover portfolio per row of `fast_line` / `slow_line` over the bars.
+    Returns the daily equity (variants x days) and the number of fills per variant.
+    """
+    num_variants = fast_line.shape[0]
+    cash = np.full(num_variants, float(initial_cash))
+    position = np.zeros(num_variants)
+    has_position = np.zeros(num_variants, dtype=bool) # The strategy's own view, as in SMACrossoverStrategy
+    pending_buy = np.zeros(num_variants)
+    pending_sell = np.zeros(num_variants)
+    total_trades = np.zeros(num_variants, dtype=np.int64)
+
+    is_day_end = np.append(dates[1:] != dates[:-1], True)
+    daily_equity = np.empty((num_variants, int(is_day_end.sum())))
+    day = 0
+
+    buy_price_factor = 1 + slippage_percent
+    sell_price_factor = 1 - slippage_percent
+    buy_cost_factor = buy_price_factor * (1 + transaction_cost_percent)
+
+    for t in range(len(close)):
+        price = close[t]
+
+        # Signals see the portfolio before this bar's fills, like the PortfolioManager does
+        fast, slow = fast_line[:, t], slow_line[:, t]
+        is_buy_signal = (fast > slow) & ~has_position
+        is_sell_signal = (fast < slow) & has_position
+        has_position = (has_position | is_buy_signal) & ~is_sell_signal
+
+        quantity = np.where(is_buy_signal & (position == 0), np.round(cash * allocation_percent / price), 0.0)
+        new_buy = np.where((quantity > 0) & (cash >= quantity * price * buy_cost_factor), quantity, 0.0)
+        new_sell = np.where(is_sell_signal & (position - pending_sell > 0), position - pending_sell, 0.0)
+
+        if t == len(close) - 1:
+            # The final daily update is processed before the fills of the last bar
+            daily_equity[:, day] = cash + position * price
+
+        # Fill the orders placed on the previous bar
+        fill_buy = pending_buy * price * buy_price_factor
+        buy_total = fill_buy * (1 + transaction_cost_percent)
+        can_buy = (pending_buy > 0) & (cash >= buy_total)
+        cash -= np.where(can_buy, buy_total, 0.0)
+        position += np.where(can_buy, pending_buy, 0.0)
+
+        fill_sell = pending_sell * max(0.01, price * sell_price_factor)
+        cash += fill_sell * (1 - transaction_cost_percent)
+        position -= pending_sell
+
+        total_trades += can_buy.astype(np.int64) + (pending_sell > 0).astype(np.int64)
+        pending_buy, pending_sell = new_buy, new_sell
+
+        if is_day_end[t] and t < len(close) - 1:
+            daily_equity[:, day] = cash + position * price
+            day += 1
+
+    return daily_equity, total_trades
+
+def _calculate_equity_metrics(daily_equity: np.ndarray, risk_free_rate: float) -> Dict[str, np.ndarray]:
+    """
+    The equity metrics of `calculate_performance_metrics` for many equity curves (rows) at once.
+    Like there, the first day only serves as the base of the first daily return.
+    """
+    num_variants, num_days = daily_equity.shape
+    final_value = daily_equity[:, -1]
+    if num_days < 2:
+        zeros = np.zeros(num_variants)
+        return {
+            "final_portfolio_value": final_value, "total_return": zeros, "annualized_return": zeros,
+            "annualized_volatility": zeros, "sharpe_ratio": np.full(num_variants, np.nan), "max_drawdown": zeros
+        }
+
+    daily_returns = daily_equity[:, 1:] / daily_equity[:, :-1] - 1
+    values = daily_equity[:, 1:]
+    num_returns = values.shape[1]
+
+    total_return = values[:, -1] / values[:, 0] - 1
+    with np.errstate(invalid="ignore"):
+        annualized_return = np.where(
+            1 + total_return >= 0, (1 + total_return) ** (TRADING_DAYS_PER_YEAR / num_returns) - 1, 0.0
+        )
+    annualized_volatility = (
+        daily_returns.std(axis=1, ddof=1) * np.sqrt(TRADING_DAYS_PER_YEAR) if num_returns > 1 else np.zeros(num_variants)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = np.where(annualized_volatility != 0, (annualized_return - risk_free_rate) / annualized_volatility, np.nan)
+
+    peak = np.maximum.accumulate(values, axis=1)
+    max_drawdown = ((values - peak) / peak).min(axis=1)
+
+    return {
+        "final_portfolio_value": final_value,
+        "total_return": total_return * 100,
+        "annualized_return": annualized_return * 100,
+        "annualized_volatility": annualized_volatility * 100,
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown": max_drawdown * 100,
+    }
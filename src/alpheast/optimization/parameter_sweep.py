@@ -0,0 +1,243 @@
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import copy
+from dataclasses import dataclass, field
+from datetime import timedelta
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.bar_store import BarStore
+from alpheast.engine import BacktestingEngine
+from alpheast.models.backtest_results import BacktestResults
+from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.strategy.base_strategy import BaseStrategy
+
+
+logger = logging.getLogger(__name__)
+
+StrategyFactory = Callable[[Dict[str, Any]], List[BaseStrategy]]
+PositionSizingFactory = Callable[[Dict[str, Any]], Optional[BasePositionSizing]]
+TimeWindow = Tuple[int, int] # [start, end) positions on the bar store's timeline
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Compact record of one run of a parameter sweep.
+    `metrics` holds the scalar strategy metrics of the run, `error` the traceback if the run failed.
+    `backtest_results` is only kept when the sweep was asked for it.
+    """
+    run_index: int
+    params: Dict[str, Any]
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+    time_window: Optional[TimeWindow] = None
+    backtest_results: Optional[BacktestResults] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+def expand_parameter_grid(parameter_grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    All combinations of the grid's values, e.g. {"fast": [5, 10], "slow": [50]} -> [{"fast": 5, "slow": 50}, {"fast": 10, "slow": 50}].
+    """
+    names = list(parameter_grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(parameter_grid[name] for name in names))]
+
+class ParameterSweep:
+    """
+    Runs one BacktestingEngine per parameter set over a process pool.
+
+    The bars are loaded once into a columnar BarStore. On platforms with fork the workers inherit it
+    copy-on-write (together with the factories, which then need not be picklable); elsewhere it is pickled
+    once per worker, not once per run. Every run is isolated: an exception becomes a failed SweepResult
+    and the sweep continues. Results are streamed back in completion order.
+
+    :param options: Backtest options shared by all runs.
+    :param price_bar_data: Price bars per symbol, or a BarStore.
+    :param strategy_factory: Builds the strategies of a run from its parameters.
+    :param parameter_sets: Parameters of every run, e.g. from `expand_parameter_grid`.
+    :param position_sizing_factory: Builds the position sizing method of a run from its parameters (engine default if None).
+    :param engine_kwargs: Further keyword arguments for every BacktestingEngine.
+    :param max_workers: Number of worker processes (CPU count if None). With 1 the runs execute in this process.
+    :param time_windows: Optional timeline window per parameter set; the run then only sees that slice of the bars.
+    :param keep_backtest_results: Whether to send the full BacktestResults back with every record.
+    """
+    def __init__(
+        self,
+        options: BacktestingOptions,
+        price_bar_data: Any,
+        strategy_factory: StrategyFactory,
+        parameter_sets: List[Dict[str, Any]],
+        position_sizing_factory: Optional[PositionSizingFactory] = None,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        time_windows: Optional[List[Optional[TimeWindow]]] = None,
+        keep_backtest_results: bool = False
+    ):
+        self.options = options
+        self.bar_store = price_bar_data if isinstance(price_bar_data, BarStore) else BarStore.from_price_bar_data(price_bar_data)
+        self.strategy_factory = strategy_factory
+        self.parameter_sets = list(parameter_sets)
+        self.position_sizing_factory = position_sizing_factory
+        self.engine_kwargs = engine_kwargs or {}
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.time_windows = list(time_windows) if time_windows is not None else [None] * len(self.parameter_sets)
+        if len(self.time_windows) != len(self.parameter_sets):
+            raise ValueError("Expected one time window per parameter set.")
+        self.keep_backtest_results = keep_backtest_results
+
+        self._cancelled = threading.Event()
+
+    def run(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> Iterator[SweepResult]:
+        """
+        Yields one SweepResult per run as runs complete.
+        `progress_callback(completed, total)` is called after every run; `cancel()` may be called from it or from another thread.
+        """
+        self._cancelled.clear()
+        total = len(self.parameter_sets)
+        logger.info("Starting parameter sweep of %s runs on %s workers (%.1f MB of bars).", total, self.max_workers, self.bar_store.nbytes / 1e6)
+
+        if self.max_workers == 1:
+            results = self._run_in_process()
+        else:
+            results = self._run_in_pool()
+
+        for completed, result in enumerate(results, start=1):
+            if not result.succeeded:
+                logger.warning("Sweep run %s with %s failed: %s", result.run_index, result.params, result.error.strip().splitlines()[-1])
+            yield result
+            if progress_callback is not None:
+                progress_callback(completed, total)
+
+    def run_all(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> List[SweepResult]:
+        """
+        Runs the sweep to completion (or cancellation) and returns the results in parameter order.
+        """
+        return sorted(self.run(progress_callback), key=lambda result: result.run_index)
+
+    def cancel(self):
+        """
+        Stops the sweep: runs that have not started are dropped, running ones are finished.
+        """
+        self._cancelled.set()
+
+    def _worker_state(self) -> Dict[str, Any]:
+        return {
+            "options": self.options,
+            "bar_store": self.bar_store,
+            "strategy_factory": self.strategy_factory,
+            "position_sizing_factory": self.position_sizing_factory,
+            "engine_kwargs": self.engine_kwargs,
+            "keep_backtest_results": self.keep_backtest_results,
+            "windows": {},
+        }
+
+    def _run_in_process(self) -> Iterator[SweepResult]:
+        state = self._worker_state()
+        for run_index, params in enumerate(self.parameter_sets):
+            if self._cancelled.is_set():
+                logger.info("Parameter sweep cancelled.")
+                return
+            yield _execute_run(state, run_index, params, self.time_windows[run_index])
+
+    def _run_in_pool(self) -> Iterator[SweepResult]:
+        # Materialize the PriceBars and frames (of every window) before forking so the workers inherit them
+        state = self._worker_state()
+        self.bar_store.to_price_bar_data()
+        self.bar_store.to_frame(self.options.symbols)
+        for time_window in set(self.time_windows) - {None}:
+            bar_store, _ = _get_window_inputs(state, time_window)
+            bar_store.to_frame(self.options.symbols)
+
+        start_methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in start_methods else None)
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(state,)
+        )
+        futures: Dict[Future, int] = {}
+        try:
+            for run_index, params in enumerate(self.parameter_sets):
+                futures[executor.submit(_run_in_worker, run_index, params, self.time_windows[run_index])] = run_index
+
+            for future in as_completed(futures):
+                if self._cancelled.is_set():
+                    logger.info("Parameter sweep cancelled.")
+                    break
+                run_index = futures[future]
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    yield SweepResult(
+                        run_index, self.parameter_sets[run_index], error=traceback.format_exc(), time_window=self.time_windows[run_index]
+                    )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+_worker_state: Dict[str, Any] = {}
+
+def _initialize_worker(state: Dict[str, Any]):
+    _worker_state.update(state)
+
+def _run_in_worker(run_index: int, params: Dict[str, Any], time_window: Optional[TimeWindow]) -> SweepResult:
+    return _execute_run(_worker_state, run_index, params, time_window)
+
+def _get_window_inputs(state: Dict[str, Any], time_window: Optional[TimeWindow]):
+    """
+    The bar store slice and options of a window, cached per process so all runs of a window share the slice.
+    """
+    if time_window is None:
+        return state["bar_store"], state["options"]
+
+    windows = state["windows"]
+    if time_window not in windows:
+        bar_store = state["bar_store"].slice(*time_window)
+        options = copy.copy(state["options"])
+        options.start_date = pd.Timestamp(bar_store.timeline[0]).date()
+        options.end_date = pd.Timestamp(bar_store.timeline[-1]).date() + timedelta(days=1)
+        windows[time_window] = (bar_store, options)
+    return windows[time_window]
+
+def _execute_run(state: Dict[str, Any], run_index: int, params: Dict[str, Any], time_window: Optional[TimeWindow] = None) -> SweepResult:
+    start_time = time.perf_counter()
+    try:
+        bar_store, options = _get_window_inputs(state, time_window)
+        position_sizing_factory = state["position_sizing_factory"]
+        engine = BacktestingEngine(
+            options=options,
+            data_source=DataSource(type=DataSourceType.DIRECT, bar_store=bar_store),
+            strategies=state["strategy_factory"](params),
+            position_sizing_method=position_sizing_factory(params) if position_sizing_factory is not None else None,
+            **state["engine_kwargs"]
+        )
+        results = engine.run()
+        if results is None:
+            raise RuntimeError("The backtest recorded no daily values.")
+        metrics = {
+            name: value.item() if hasattr(value, "item") else value
+            for name, value in results.performance_metrics["strategy"].items()
+        }
+        return SweepResult(
+            run_index, params, metrics,
+            duration_seconds=time.perf_counter() - start_time,
+            time_window=time_window,
+            backtest_results=results if state["keep_backtest_results"] else None
+        )
+    except Exception:
+        return SweepResult(
+            run_index, params, error=traceback.format_exc(), duration_seconds=time.perf_counter() - start_time, time_window=time_window
+        )
@@ -0,0 +1,227 @@
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.data.bar_store import BarStore
+from alpheast.models.backtest_results import BacktestResults
+from alpheast.optimization.parameter_sweep import (
+    ParameterSweep, PositionSizingFactory, StrategyFactory, SweepResult, TimeWindow
+)
+from alpheast.shared.metrics import calculate_performance_metrics
+from alpheast.shared.trade_analytics import ROUND_TRIP_FIELDS
+
+
+logger = logging.getLogger(__name__)
+
+Objective = Union[str, Callable[[Dict[str, Any]], float]]
+
+@dataclass(frozen=True)
+class WalkForwardFold:
+    """
+    One in-sample / out-of-sample step of a walk-forward analysis.
+    `best_params` is None if no in-sample run produced a usable score.
+    """
+    index: int
+    in_sample: TimeWindow
+    out_of_sample: TimeWindow
+    best_params: Optional[Dict[str, Any]]
+    in_sample_score: float
+    out_of_sample_metrics: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+@dataclass
+class WalkForwardResult:
+    """
+    The folds of a walk-forward analysis and the stitched out-of-sample backtest (None if no fold succeeded).
+    """
+    folds: List[WalkForwardFold]
+    results: Optional[BacktestResults]
+
+def walk_forward_windows(
+    num_timestamps: int,
+    in_sample_size: int,
+    out_of_sample_size: int,
+    anchored: bool = False
+) -> List[Tuple[TimeWindow, TimeWindow]]:
+    """
+    Consecutive (in-sample, out-of-sample) windows of timeline positions. The out-of-sample windows tile the
+    timeline after the first in-sample window; each in-sample window ends where its out-of-sample window starts.
+    With `anchored` every in-sample window starts at the beginning of the timeline, otherwise it rolls along.
+    """
+    if in_sample_size < 1 or out_of_sample_size < 1:
+        raise ValueError("In-sample and out-of-sample sizes must be at least 1.")
+
+    windows = []
+    out_of_sample_start = in_sample_size
+    while out_of_sample_start < num_timestamps:
+        in_sample_start = 0 if anchored else out_of_sample_start - in_sample_size
+        out_of_sample_end = min(out_of_sample_start + out_of_sample_size, num_timestamps)
+        windows.append(((in_sample_start, out_of_sample_start), (out_of_sample_start, out_of_sample_end)))
+        out_of_sample_start = out_of_sample_end
+    return windows
+
+class WalkForwardOptimizer:
+    """
+    Walk-forward optimization over one preloaded BarStore.
+
+    Every fold's in-sample window is a zero-copy slice of the store. The in-sample grids of all folds run together
+    on one process pool, the best parameters of each fold (by `objective`, higher is better) are then run on the
+    fold's out-of-sample window, and the out-of-sample equity curves are stitched into one BacktestResults.
+    Strategies start cold in every window, so indicators warm up inside it.
+
+    :param options: Backtest options shared by all runs.
+    :param price_bar_data: Price bars per symbol, or a BarStore.
+    :param strategy_factory: Builds the strategies of a run from its parameters.
+    :param parameter_sets: Candidate parameters, e.g. from `expand_parameter_grid`.
+    :param in_sample_size: Timestamps per in-sample window.
+    :param out_of_sample_size: Timestamps per out-of-sample window.
+    :param position_sizing_factory: Builds the position sizing method of a run from its parameters.
+    :param objective: Name of a strategy metric, or a function of the metrics, to maximize.
+    :param anchored: Whether in-sample windows all start at the beginning of the data.
+    :param engine_kwargs: Further keyword arguments for every BacktestingEngine.
+    :param max_workers: Number of worker processes (CPU count if None).
+    """
+    def __init__(
+        self,
+        options: BacktestingOptions,
+        price_bar_data: Any,
+        strategy_factory: StrategyFactory,
+        parameter_sets: List[Dict[str, Any]],
+        in_sample_size: int,
+        out_of_sample_size: int,
+        position_sizing_factory: Optional[PositionSizingFactory] = None,
+        objective: Objective = "sharpe_ratio",
+        anchored: bool = False,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None
+    ):
+        self.options = options
+        self.bar_store = price_bar_data if isinstance(price_bar_data, BarStore) else BarStore.from_price_bar_data(price_bar_data)
+        self.strategy_factory = strategy_factory
+        self.parameter_sets = list(parameter_sets)
+        self.position_sizing_factory = position_sizing_factory
+        self.objective = objective
+        self.engine_kwargs = engine_kwargs
+        self.max_workers = max_workers
+        self.windows = walk_forward_windows(len(self.bar_store.timeline), in_sample_size, out_of_sample_size, anchored)
+
+    def run(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> WalkForwardResult:
+        if not self.windows:
+            raise ValueError("Not enough data for a single walk-forward fold.")
+        total = len(self.windows) * (len(self.parameter_sets) + 1)
+
+        # --- 1. In-sample grids of all folds in one sweep ---
+        in_sample_sweep = self._create_sweep(
+            parameter_sets=[params for _ in self.windows for params in self.parameter_sets],
+            time_windows=[in_sample for in_sample, _ in self.windows for _ in self.parameter_sets]
+        )
+        in_sample_results = in_sample_sweep.run_all(progress_callback and (lambda completed, _: progress_callback(completed, total)))
+
+        best = self._select_best(in_sample_results)
+
+        # --- 2. Out-of-sample runs with each fold's best parameters ---
+        runnable = [i for i, (params, _) in enumerate(best) if params is not None]
+        offset = len(in_sample_results)
+        out_of_sample_sweep = self._create_sweep(
+            parameter_sets=[best[i][0] for i in runnable],
+            time_windows=[self.windows[i][1] for i in runnable],
+            keep_backtest_results=True
+        )
+        out_of_sample_results = out_of_sample_sweep.run_all(progress_callback and (lambda completed, _: progress_callback(offset + completed, total)))
+        out_of_sample_by_fold = dict(zip(runnable, out_of_sample_results))
+
+        folds = []
+        for i, (in_sample, out_of_sample) in enumerate(self.windows):
+            params, score = best[i]
+            result = out_of_sample_by_fold.get(i)
+            folds.append(WalkForwardFold(
+                index=i,
+                in_sample=in_sample,
+                out_of_sample=out_of_sample,
+                best_params=params,
+                in_sample_score=score,
+                out_of_sample_metrics=result.metrics if result is not None else {},
+                error=result.error if result is not None else "No in-sample run produced a usable score."
+            ))
+
+        stitched = [result.backtest_results for result in out_of_sample_results if result.succeeded]
+        logger.info("Walk-forward analysis finished: %s of %s folds ran out of sample.", len(stitched), len(self.windows))
+        return WalkForwardResult(folds=folds, results=stitch_backtest_results(stitched) if stitched else None)
+
+    def _create_sweep(self, parameter_sets, time_windows, keep_backtest_results: bool = False) -> ParameterSweep:
+        return ParameterSweep(
+            self.options,
+            self.bar_store,
+            self.strategy_factory,
+            parameter_sets,
+            position_sizing_factory=self.position_sizing_factory,
+            engine_kwargs=self.engine_kwargs,
+            max_workers=self.max_workers,
+            time_windows=time_windows,
+            keep_backtest_results=keep_backtest_results
+        )
+
+    def _select_best(self, in_sample_results: List[SweepResult]) -> List[Tuple[Optional[Dict[str, Any]], float]]:
+        num_params = len(self.parameter_sets)
+        best = []
+        for fold in range(len(self.windows)):
+            scores = [self._score(result) for result in in_sample_results[fold * num_params:(fold + 1) * num_params]]
+            if not np.isfinite(scores).any():
+                best.append((None, float("nan")))
+                continue
+            i = int(np.nanargmax(np.where(np.isfinite(scores), scores, np.nan)))
+            best.append((self.parameter_sets[i], scores[i]))
+        return best
+
+    def _score(self, result: SweepResult) -> float:
+        if not result.succeeded:
+            return float("nan")
+        value = self.objective(result.metrics) if callable(self.objective) else result.metrics.get(self.objective)
+        return float(value) if isinstance(value, (int, float)) else float("nan")
+
+def stitch_backtest_results(results: List[BacktestResults]) -> BacktestResults:
+    """
+    Chains consecutive backtests into one: each equity curve (and benchmark curve) is scaled so it starts
+    where the previous one ended, trade logs and round trips are concatenated, and metrics are recalculated.
+    Trade quantities are those of the individual runs, which all started with the same cash.
+    """
+    daily_values = _stitch_values([result.daily_values for result in results], [result.initial_cash for result in results])
+    benchmark_daily_values = _stitch_values(
+        [result.benchmark_daily_values for result in results], [result.initial_cash for result in results]
+    )
+    trade_log = [trade for result in results for trade in result.trade_log]
+    round_trips = {
+        field: np.concatenate([result.round_trips[field] for result in results if result.round_trips])
+        for field in ROUND_TRIP_FIELDS
+    } if any(result.round_trips for result in results) else None
+
+    performance_metrics = calculate_performance_metrics(
+        daily_values=daily_values,
+        trade_log=trade_log,
+        benchmark_daily_values=benchmark_daily_values,
+        round_trips=round_trips
+    )
+    return BacktestResults(
+        performance_metrics=performance_metrics,
+        daily_values=daily_values,
+        benchmark_daily_values=benchmark_daily_values,
+        trade_log=trade_log,
+        final_portfolio_summary=results[-1].final_portfolio_summary,
+        start_date=results[0].start_date,
+        end_date=results[-1].end_date,
+        initial_cash=results[0].initial_cash,
+        round_trips=round_trips
+    )
+
+def _stitch_values(curves: List[List[Dict[str, Any]]], initial_values: List[float]) -> List[Dict[str, Any]]:
+    stitched = []
+    scale = 1.0
+    for curve, initial_value in zip(curves, initial_values):
+        for entry in curve:
+            stitched.append({"date": entry["date"], "value": float(entry["value"]) * scale})
+        if stitched:
+            scale = stitched[-1]["value"] / float(initial_value)
+    return stitched
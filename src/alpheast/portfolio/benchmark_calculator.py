@@ -5,6 +5,8 @@ import logging
 from typing import Any, Dict, List
 
 
+logger = logging.getLogger(__name__)
+
 class BenchmarkCalculator:
     """
     Manages the calculation and tracking of benchmark portfolio values.
@@ -22,7 +24,7 @@ class BenchmarkCalculator:
         self.transaction_cost_percent = transaction_cost_percent
         self.slippage_percent = slippage_percent
 
-        logging.info(f"BenchmarkCalculator initialized for symbols: {', '.join(self.symbols)}")
+        logger.info("BenchmarkCalculator initialized for symbols: %s", ', '.join(self.symbols))
 
     def initialize_benchmark_holdings(self, initial_cash_total: Decimal, current_market_prices: Dict[str, Decimal]):
         """
@@ -30,17 +32,17 @@ class BenchmarkCalculator:
         across all symbols. This is called once at the first daily update.
         """
         if self._benchmark_initialized:
-            logging.debug("Benchmark already initialized. Skipping re-initialization.")
+            logger.debug("Benchmark already initialized. Skipping re-initialization.")
             return
         
         available_symbols_for_benchmark = [s for s in self.symbols if s in current_market_prices and current_market_prices[s] > Decimal("0")]
         if not available_symbols_for_benchmark:
-            logging.warning("No valid market prices available for any symbols to initialize benchmark. Skipping benchmark initialization.")
+            logger.warning("No valid market prices available for any symbols to initialize benchmark. Skipping benchmark initialization.")
             self._benchmark_initialized = True
             return
         
         if len(available_symbols_for_benchmark) == 0:
-            logging.warning("No valid symbols with positive prices to initialize benchmark. Skipping benchmark initialization.")
+            logger.warning("No valid symbols with positive prices to initialize benchmark. Skipping benchmark initialization.")
             self._benchmark_initialized = True
             return
 
@@ -51,31 +53,27 @@ class BenchmarkCalculator:
 
             price_with_slippage = price_at_initialization * (Decimal("1") + self.slippage_percent)
             if price_with_slippage <= Decimal("0"):
-                logging.warning(f"Calculated effective buy price for {symbol} is zero or negative ({price_with_slippage:.2f}). Skipping allocation for this symbol.")
+                logger.warning("Calculated effective buy price for %s is zero or negative (%.2f). Skipping allocation for this symbol.", symbol, price_with_slippage)
                 continue
             
             effective_cost_per_share_with_fees = price_with_slippage * (Decimal("1") + self.transaction_cost_percent)
             if effective_cost_per_share_with_fees <= Decimal("0"):
-                 logging.warning(f"Effective cost per share for {symbol} (incl. fees) is zero or negative ({effective_cost_per_share_with_fees:.2f}). Skipping allocation for this symbol.")
+                 logger.warning("Effective cost per share for %s (incl. fees) is zero or negative (%.2f). Skipping allocation for this symbol.", symbol, effective_cost_per_share_with_fees)
                  continue
 
             quantity = (cash_per_symbol / effective_cost_per_share_with_fees).quantize(Decimal("1")) # Quantize to whole shares
 
             if quantity <= Decimal("0"):
-                logging.warning(f"Calculated zero or negative quantity for {symbol} with cash {cash_per_symbol:.2f}. Skipping allocation for this symbol.")
+                logger.warning("Calculated zero or negative quantity for %s with cash %.2f. Skipping allocation for this symbol.", symbol, cash_per_symbol)
                 continue
 
             self._benchmark_holdings[symbol] = quantity
-            logging.info(
-                f"Benchmark initialized for {symbol}: Bought {quantity} shares "
-                f"at effective price ${price_with_slippage:.2f} (incl. slippage and fees), "
-                f"investing ${cash_per_symbol:.2f}."
-            )
+            logger.info("Benchmark initialized for %s: Bought %s shares at effective price $%.2f (incl. slippage and fees), investing $%.2f.", symbol, quantity, price_with_slippage, cash_per_symbol)
        
         if self._benchmark_holdings:
             self._benchmark_initialized = True
         else:
-            logging.warning("Benchmark could not be initialized for any symbol after accounting for frictions. Total benchmark value will be 0.")
+            logger.warning("Benchmark could not be initialized for any symbol after accounting for frictions. Total benchmark value will be 0.")
             self._benchmark_initialized = True 
 
     def calculate_and_record_benchmark_value(self, current_date: datetime.date, latest_market_prices: Dict[str, Decimal]):
@@ -89,15 +87,15 @@ class BenchmarkCalculator:
                 if symbol in latest_market_prices:
                     benchmark_value += quantity * latest_market_prices[symbol]
                 else:
-                    logging.warning(f"Benchmark symbol {symbol} has no market price on {current_date}. Its contribution to benchmark value will be 0 for today.")
+                    logger.warning("Benchmark symbol %s has no market price on %s. Its contribution to benchmark value will be 0 for today.", symbol, current_date)
         else:
-            logging.debug(f"Benchmark not initialized. Benchmark value will be $0.00 on {current_date}.")
+            logger.debug("Benchmark not initialized. Benchmark value will be $0.00 on %s.", current_date)
         
         self._benchmark_daily_values.append({
             "date": current_date,
             "value": benchmark_value
         })
-        logging.debug(f"Benchmark portfolio value on {current_date}: ${benchmark_value:.2f}")
+        logger.debug("Benchmark portfolio value on %s: $%.2f", current_date, benchmark_value)
 
     def is_initialized(self) -> bool:
         return self._benchmark_initialized
@@ -0,0 +1,161 @@
+
+import math
+from typing import Any, Dict, Optional
+
+from alpheast.shared.metrics import TRADING_DAYS_PER_YEAR
+
+
+class OnlineMetrics:
+    """
+    Streaming accumulators over the strategy's equity curve and trading activity.
+    Every update is O(1), so the metrics can be queried at any step (e.g. in stepping mode)
+    without rebuilding the daily values into a DataFrame.
+
+    Returns are computed between consecutive recorded values, matching the daily returns
+    used by `calculate_performance_metrics`. Values are kept as raw fractions (not rounded percentages).
+    """
+    def __init__(self, initial_value: float, risk_free_rate: float = 0.0):
+        self.initial_value = float(initial_value)
+        self.risk_free_rate = risk_free_rate
+        self.reset()
+
+    def reset(self):
+        self._last_value: Optional[float] = None
+        self._num_values: int = 0
+
+        # Welford accumulators over period returns
+        self._num_returns: int = 0
+        self._mean_return: float = 0.0
+        self._m2: float = 0.0
+
+        self._peak_value: float = 0.0
+        self._current_drawdown: float = 0.0
+        self._max_drawdown: float = 0.0
+
+        self._current_exposure: float = 0.0
+        self._exposure_sum: float = 0.0
+        self._value_sum: float = 0.0
+
+        self._traded_notional: float = 0.0
+        self._num_fills: int = 0
+
+    def update_value(self, total_value: float, gross_exposure_value: float = 0.0):
+        """
+        Records a new portfolio value (e.g. at the end of a trading day).
+
+        Args:
+            total_value: The total portfolio value (cash + holdings).
+            gross_exposure_value: The gross market value of all open positions.
+        """
+        total_value = float(total_value)
+
+        if self._last_value is not None and self._last_value != 0.0:
+            period_return = total_value / self._last_value - 1.0
+            self._num_returns += 1
+            delta = period_return - self._mean_return
+            self._mean_return += delta / self._num_returns
+            self._m2 += delta * (period_return - self._mean_return)
+
+        if self._num_values == 0 or total_value > self._peak_value:
+            self._peak_value = total_value
+        self._current_drawdown = (total_value - self._peak_value) / self._peak_value if self._peak_value > 0 else 0.0
+        self._max_drawdown = min(self._max_drawdown, self._current_drawdown)
+
+        self._current_exposure = float(gross_exposure_value) / total_value if total_value > 0 else 0.0
+        self._exposure_sum += self._current_exposure
+        self._value_sum += total_value
+
+        self._last_value = total_value
+        self._num_values += 1
+
+    def record_fill(self, notional: float):
+        """
+        Records the traded notional of a fill (quantity * price), used for turnover.
+        """
+        self._traded_notional += abs(float(notional))
+        self._num_fills += 1
+
+    @property
+    def mean_return(self) -> float:
+        return self._mean_return
+
+    @property
+    def return_variance(self) -> float:
+        """Sample variance of period returns (ddof=1)."""
+        if self._num_returns < 2:
+            return 0.0
+        return self._m2 / (self._num_returns - 1)
+
+    @property
+    def return_volatility(self) -> float:
+        return math.sqrt(self.return_variance)
+
+    @property
+    def annualized_volatility(self) -> float:
+        return self.return_volatility * math.sqrt(TRADING_DAYS_PER_YEAR)
+
+    @property
+    def sharpe_ratio(self) -> Optional[float]:
+        """Annualized arithmetic Sharpe ratio of the period returns seen so far, None if undefined."""
+        volatility = self.return_volatility
+        if volatility == 0.0:
+            return None
+        excess_mean = self._mean_return - self.risk_free_rate / TRADING_DAYS_PER_YEAR
+        return excess_mean / volatility * math.sqrt(TRADING_DAYS_PER_YEAR)
+
+    @property
+    def total_return(self) -> float:
+        if self._last_value is None or self.initial_value == 0.0:
+            return 0.0
+        return self._last_value / self.initial_value - 1.0
+
+    @property
+    def peak_value(self) -> float:
+        return self._peak_value
+
+    @property
+    def current_drawdown(self) -> float:
+        return self._current_drawdown
+
+    @property
+    def max_drawdown(self) -> float:
+        return self._max_drawdown
+
+    @property
+    def exposure(self) -> float:
+        return self._current_exposure
+
+    @property
+    def average_exposure(self) -> float:
+        return self._exposure_sum / self._num_values if self._num_values else 0.0
+
+    @property
+    def turnover(self) -> float:
+        """Total traded notional divided by the average portfolio value."""
+        if self._num_values == 0:
+            return self._traded_notional / self.initial_value if self.initial_value else 0.0
+        average_value = self._value_sum / self._num_values
+        return self._traded_notional / average_value if average_value else 0.0
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the current value of every online metric.
+        """
+        return {
+            "current_value": self._last_value if self._last_value is not None else self.initial_value,
+            "total_return": self.total_return,
+            "num_returns": self._num_returns,
+            "mean_return": self._mean_return,
+            "return_variance": self.return_variance,
+            "return_volatility": self.return_volatility,
+            "annualized_volatility": self.annualized_volatility,
+            "sharpe_ratio": self.sharpe_ratio,
+            "peak_value": self._peak_value,
+            "current_drawdown": self._current_drawdown,
+            "max_drawdown": self._max_drawdown,
+            "exposure": self._current_exposure,
+            "average_exposure": self.average_exposure,
+            "traded_notional": self._traded_notional,
+            "turnover": self.turnover,
+            "num_fills": self._num_fills,
+        }
@@ -1,14 +1,28 @@
 
+from collections import deque
 from datetime import datetime
-from decimal import Decimal, getcontext
+from decimal import ROUND_CEILING, Decimal, getcontext
 import logging
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, List, Optional
 
+from alpheast.config.margin_config import MarginConfig
+from alpheast.models.lot import Lot
+from alpheast.models.lot_method import LotMethod
+from alpheast.shared.metrics import TRADING_DAYS_PER_YEAR
+
+
+logger = logging.getLogger(__name__)
 
 getcontext().prec = 10
 
 class Portfolio:
-    def __init__(self, initial_cash: float, transaction_cost_percent: Decimal = Decimal("0.001")):
+    def __init__(
+        self,
+        initial_cash: float,
+        transaction_cost_percent: Decimal = Decimal("0.001"),
+        lot_method: LotMethod = LotMethod.FIFO,
+        margin_config: Optional[MarginConfig] = None
+    ):
         """
         Initializes the portfolio.
 
@@ -16,18 +30,37 @@ class Portfolio:
             initial_cash: The starting cash balance for the backtest.
             transaction_cost_percent: Percentage cost per trade (e.g., 0.001 for 0.1%).
                                       Using Decimal for precision.
+            lot_method: How sells are matched against open lots (FIFO, LIFO or average cost).
+            margin_config: Optional margin settings. Without it the portfolio is long only.
         """
         if initial_cash <= 0:
             raise ValueError("Initial cash must be positive.")
         self.cash: Decimal = Decimal(str(initial_cash))
-        self.holdings: Dict[str, Decimal] = {} # Symbol -> Quantity
+        self.holdings: Dict[str, Decimal] = {} # Symbol -> Quantity (negative for short positions)
         self.initial_cash: Decimal = Decimal(str(initial_cash))
         self.transaction_cost_percent: Decimal = transaction_cost_percent
 
         self.daily_values: List[Dict[str, Any]] = []
         self.trade_log: List[Dict[str, Any]] = []
 
-        logging.info(f"Portfolio initialized with cash: ${self.cash:.2f}")
+        # Lot accounting, kept incrementally on every fill
+        self.lot_method: LotMethod = lot_method
+        self._lots: Dict[str, Deque[Lot]] = {} # Symbol -> open lots, oldest first
+        self.cost_basis: Dict[str, Decimal] = {} # Symbol -> cost basis of its open lots
+        self.realized_pnl: Dict[str, Decimal] = {} # Symbol -> realized P&L
+        self.total_realized_pnl: Decimal = Decimal("0")
+
+        # Margin accounting, kept incrementally on every fill and price update
+        self.margin_config: Optional[MarginConfig] = margin_config
+        self.initial_margin = Decimal(str(margin_config.initial_margin)) if margin_config else Decimal("0")
+        self.maintenance_margin = Decimal(str(margin_config.maintenance_margin)) if margin_config else Decimal("0")
+        self._daily_borrow_fee_rate = Decimal(str(margin_config.borrow_fee_rate)) / TRADING_DAYS_PER_YEAR if margin_config else Decimal("0")
+        self._marks: Dict[str, Decimal] = {} # Symbol -> latest known price
+        self.long_market_value: Decimal = Decimal("0")
+        self.short_market_value: Decimal = Decimal("0") # Absolute value of the short positions
+        self.total_borrow_fees: Decimal = Decimal("0")
+
+        logger.info("Portfolio initialized with cash: $%.2f", self.cash)
 
     def get_holding_quantity(self, symbol: str) -> Decimal:
         return self.holdings.get(symbol, Decimal("0"))
@@ -40,6 +73,7 @@ class Portfolio:
     def buy(self, symbol: str, quantity: Decimal, price: Decimal, timestamp: datetime, commission: Decimal = Decimal('0.0')) -> Dict[str, Any]:
         """
         Executes a buy order, updates cash, holdings, and logs the trade.
+        Buying a symbol that is held short covers the short position first.
         Assumes the order is valid (e.g., sufficient cash checked externally by PortfolioManager).
         Accepts commission directly from the fill event.
         """
@@ -49,13 +83,18 @@ class Portfolio:
 
         trade_cost_raw = quantity * price
         total_cost = trade_cost_raw + commission
+
+        current_holding = self.get_holding_quantity(symbol)
+        cover_quantity = min(quantity, max(-current_holding, Decimal("0")))
         
-        if self.cash < total_cost:
-            logging.error(f"Attempted to buy {quantity} of {symbol} at {price:.2f} on {timestamp.date()} but insufficient cash! Cash: {self.cash:.2f}, Cost: {total_cost:.2f}")
+        # Covering a short is always allowed, it only releases margin
+        if cover_quantity < quantity and self.cash < total_cost:
+            logger.error("Attempted to buy %s of %s at %.2f on %s but insufficient cash! Cash: %.2f, Cost: %.2f", quantity, symbol, price, timestamp.date(), self.cash, total_cost)
             raise ValueError("Insufficient cash to perform buy operation (should be caught by PM).")
 
         self.cash -= total_cost
-        self.holdings[symbol] = self.holdings.get(symbol, Decimal("0")) + quantity
+        self._set_position(symbol, current_holding + quantity, price)
+        realized_pnl = self._apply_fill_to_lots(symbol, quantity, -total_cost, cover_quantity, timestamp)
 
         trade_info = {
             "timestamp": timestamp,
@@ -65,16 +104,18 @@ class Portfolio:
             "price": price,      
             "commission": commission,
             "total_cost": total_cost,
+            "realized_pnl": realized_pnl,
             "cash_after_trade": self.cash
         }
         self.trade_log.append(trade_info)
-        logging.info(f"BUY {quantity} {symbol} @ ${price:.2f} (Comm: ${commission:.2f}) on {timestamp.date()}. New Cash: ${self.cash:.2f}")
+        logger.info("BUY %s %s @ $%.2f (Comm: $%.2f) on %s. New Cash: $%.2f", quantity, symbol, price, commission, timestamp.date(), self.cash)
         return trade_info
 
     def sell(self, symbol: str, quantity: Decimal, price: Decimal, timestamp: datetime, commission: Decimal = Decimal('0.0')) -> Dict[str, Any]:
         """
         Executes a sell order, updates cash, holdings, and logs the trade.
-        Assumes the order is valid (e.g., sufficient holdings checked externally by PortfolioManager).
+        If short selling is allowed, selling more than the holding opens (or adds to) a short position.
+        Assumes the order is valid (e.g., sufficient holdings or margin checked externally by PortfolioManager).
         Accepts commission directly from the fill event.
         """
         quantity = Decimal(str(quantity))
@@ -82,9 +123,10 @@ class Portfolio:
         commission = Decimal(str(commission))
 
         current_holding_in_portfolio = self.holdings.get(symbol, Decimal("0")) 
+        close_quantity = min(quantity, max(current_holding_in_portfolio, Decimal("0")))
         
-        if current_holding_in_portfolio < quantity:
-            logging.error(f"Attempted to sell {quantity} of {symbol} on {timestamp.date()} but insufficient holdings! Holding: {self.holdings.get(symbol, Decimal('0'))}")
+        if close_quantity < quantity and not self.allows_short:
+            logger.error("Attempted to sell %s of %s on %s but insufficient holdings! Holding: %s", quantity, symbol, timestamp.date(), self.holdings.get(symbol, Decimal('0')))
             # raise ValueError(f"Insufficient holdings of {symbol} to perform sell operation.")
             return
 
@@ -92,9 +134,8 @@ class Portfolio:
         total_revenue = trade_revenue_raw - commission
 
         self.cash += total_revenue
-        self.holdings[symbol] -= quantity
-        if self.holdings[symbol] == Decimal("0"):
-            del self.holdings[symbol]
+        self._set_position(symbol, current_holding_in_portfolio - quantity, price)
+        realized_pnl = self._apply_fill_to_lots(symbol, -quantity, total_revenue, close_quantity, timestamp)
 
         trade_info = {
             "timestamp": timestamp,
@@ -104,10 +145,11 @@ class Portfolio:
             "price": price,
             "commission": commission,
             "total_revenue": total_revenue,
+            "realized_pnl": realized_pnl,
             "cash_after_trade": self.cash
         }
         self.trade_log.append(trade_info)
-        logging.info(f"SELL {quantity} {symbol} @ ${price:.2f} (Comm: ${commission:.2f}) on {timestamp.date()}. New Cash: ${self.cash:.2f}")
+        logger.info("SELL %s %s @ $%.2f (Comm: $%.2f) on %s. New Cash: $%.2f", quantity, symbol, price, commission, timestamp.date(), self.cash)
         return trade_info
     
     def get_current_value(self, current_prices: Dict[str, Decimal]) -> Decimal:
@@ -123,7 +165,7 @@ class Portfolio:
             if symbol in current_prices:
                 holdings_value += quantity * current_prices[symbol]
             else:
-                logging.warning(f"Price for {symbol} not available to calculate portfolio valule. Assuming 0.")
+                logger.warning("Price for %s not available to calculate portfolio valule. Assuming 0.", symbol)
     
         return self.cash + holdings_value
     
@@ -144,7 +186,7 @@ class Portfolio:
                 price = current_market_prices[symbol]
                 total_holdings_value += quantity * price
             else:
-                logging.warning(f"Market price not available for held symbol '{symbol}' when calculating total value. Assuming 0 for this holding on this calculation.")
+                logger.warning("Market price not available for held symbol '%s' when calculating total value. Assuming 0 for this holding on this calculation.", symbol)
         
         return self.cash + total_holdings_value
 
@@ -160,6 +202,109 @@ class Portfolio:
             "holdings": {s: float(q) for s, q in self.holdings.items()}
         })
 
+    @property
+    def allows_short(self) -> bool:
+        return self.margin_config is not None and self.margin_config.allow_short
+
+    @property
+    def equity(self) -> Decimal:
+        """
+        Cash plus long market value minus short market value, from the incrementally kept market values.
+        """
+        return self.cash + self.long_market_value - self.short_market_value
+
+    @property
+    def buying_power(self) -> Decimal:
+        """
+        Cash that is not encumbered as collateral for short positions.
+        Buying for V uses V of buying power, opening a short of V uses `initial_margin * V`.
+        """
+        return self.cash - self.short_market_value * (Decimal("1") + self.initial_margin)
+
+    @property
+    def maintenance_requirement(self) -> Decimal:
+        return self.short_market_value * self.maintenance_margin
+
+    @property
+    def margin_excess(self) -> Decimal:
+        return self.equity - self.maintenance_requirement
+
+    def is_margin_call(self) -> bool:
+        return self.short_market_value > Decimal("0") and self.margin_excess < Decimal("0")
+
+    def update_market_price(self, symbol: str, price: Decimal):
+        """
+        Marks a symbol to a new price, adjusting the long/short market values by the price change only: O(1).
+        """
+        quantity = self.holdings.get(symbol)
+        if quantity:
+            self._adjust_market_values(quantity, price - self._marks.get(symbol, price))
+        self._marks[symbol] = price
+
+    def charge_borrow_fee(self, timestamp: datetime) -> Decimal:
+        """
+        Charges one day of borrow fees on the current short market value.
+        """
+        if self.short_market_value <= Decimal("0") or self._daily_borrow_fee_rate == Decimal("0"):
+            return Decimal("0")
+
+        fee = self.short_market_value * self._daily_borrow_fee_rate
+        self.cash -= fee
+        self.total_borrow_fees += fee
+        logger.debug("Charged borrow fee of $%.2f on $%.2f short market value on %s.", fee, self.short_market_value, timestamp.date())
+        return fee
+
+    def get_margin_call_covers(self) -> Dict[str, Decimal]:
+        """
+        Returns the quantities to cover per short position to bring the account back to its initial margin.
+        All shorts are covered by the same fraction. Empty if there is no margin call.
+        """
+        if not self.is_margin_call():
+            return {}
+
+        target_short_value = max(self.equity, Decimal("0")) / self.initial_margin if self.initial_margin > 0 else Decimal("0")
+        fraction = min(Decimal("1"), (self.short_market_value - target_short_value) / self.short_market_value)
+
+        covers = {}
+        for symbol, quantity in self.holdings.items():
+            if quantity < Decimal("0"):
+                covers[symbol] = min(-quantity, (-quantity * fraction).to_integral_value(rounding=ROUND_CEILING))
+        return covers
+
+    def get_unrealized_pnl(self, current_prices: Dict[str, Decimal]) -> Decimal:
+        """
+        Calculates the unrealized P&L of the open lots from their incrementally kept cost basis.
+        """
+        unrealized_pnl = Decimal("0")
+        for symbol, cost_basis in self.cost_basis.items():
+            if symbol in current_prices:
+                unrealized_pnl += self.holdings.get(symbol, Decimal("0")) * current_prices[symbol] - cost_basis
+            else:
+                logger.warning("Price for %s not available to calculate unrealized P&L. Skipping it.", symbol)
+        return unrealized_pnl
+
+    def get_lots(self, symbol: str) -> List[Lot]:
+        """
+        Returns copies of the open lots of a symbol, oldest first.
+        """
+        return [Lot(lot.symbol, lot.quantity, lot.cost, lot.timestamp) for lot in self._lots.get(symbol, ())]
+
+    def get_lot_report(self) -> List[Dict[str, Any]]:
+        """
+        Provides one row per open lot, for lot-level reporting.
+        """
+        return [
+            {
+                "symbol": lot.symbol,
+                "quantity": float(lot.quantity),
+                "unit_cost": float(lot.unit_cost),
+                "cost_basis": float(lot.cost),
+                "opened_at": lot.timestamp
+            }
+            for lots in self._lots.values()
+            for lot in lots
+        ]
+
     def get_summary(self) -> Dict[str, Any]:
         """
         Provides a summary of the portfolio's final state.
@@ -168,9 +313,120 @@ class Portfolio:
             "initial_cash": float(self.initial_cash),
             "cash": float(self.cash),
             "holdings": {s: float(q) for s, q in self.holdings.items()},
+            "cost_basis": {s: float(c) for s, c in self.cost_basis.items()},
+            "realized_pnl": float(self.total_realized_pnl),
+            "borrow_fees": float(self.total_borrow_fees),
             "total_trades": len(self.trade_log)
         }
 
+    def _set_position(self, symbol: str, new_quantity: Decimal, price: Decimal):
+        """
+        Sets a symbol's holding and updates the long/short market values, re-marking the symbol at the fill price.
+        """
+        self._adjust_market_values(self.holdings.get(symbol, Decimal("0")), -self._marks.get(symbol, price))
+        self._adjust_market_values(new_quantity, price)
+        self._marks[symbol] = price
+
+        if new_quantity == Decimal("0"):
+            self.holdings.pop(symbol, None)
+        else:
+            self.holdings[symbol] = new_quantity
+
+        if not self.holdings:
+            # Flat book, drop any rounding residue of the incremental updates
+            self.long_market_value = Decimal("0")
+            self.short_market_value = Decimal("0")
+
+    def _adjust_market_values(self, quantity: Decimal, price_change: Decimal):
+        if quantity > Decimal("0"):
+            self.long_market_value += quantity * price_change
+        elif quantity < Decimal("0"):
+            self.short_market_value -= quantity * price_change
+
+    def _apply_fill_to_lots(
+        self,
+        symbol: str,
+        signed_quantity: Decimal,
+        cash_flow: Decimal,
+        closing_quantity: Decimal,
+        timestamp: datetime
+    ) -> Decimal:
+        """
+        Closes `closing_quantity` of the open lots and opens a lot with the rest of the fill.
+        The fill's cash flow (negative for buys) is split pro rata between both parts.
+        Returns the realized P&L of the closed part.
+        """
+        quantity = abs(signed_quantity)
+        realized_pnl = Decimal("0")
+
+        if closing_quantity > Decimal("0"):
+            closing_cash_flow = cash_flow * closing_quantity / quantity
+            realized_pnl = closing_cash_flow - self._close_lots(symbol, closing_quantity)
+            cash_flow -= closing_cash_flow
+            self.realized_pnl[symbol] = self.realized_pnl.get(symbol, Decimal("0")) + realized_pnl
+            self.total_realized_pnl += realized_pnl
+
+        opening_quantity = quantity - closing_quantity
+        if opening_quantity > Decimal("0"):
+            self._open_lot(symbol, opening_quantity if signed_quantity > 0 else -opening_quantity, -cash_flow, timestamp)
+
+        return realized_pnl
+
+    def _open_lot(self, symbol: str, quantity: Decimal, cost: Decimal, timestamp: datetime):
+        """
+        Adds a lot for a fill that opens or extends a position. Short lots have a negative quantity
+        and a negative cost (the proceeds net of commission).
+        Under average cost accounting, all lots of a symbol are merged into one.
+        """
+        lots = self._lots.get(symbol)
+        if lots is None:
+            lots = self._lots[symbol] = deque()
+
+        if self.lot_method == LotMethod.AVERAGE_COST and lots:
+            lots[0].quantity += quantity
+            lots[0].cost += cost
+        else:
+            lots.append(Lot(symbol, quantity, cost, timestamp))
+
+        self.cost_basis[symbol] = self.cost_basis.get(symbol, Decimal("0")) + cost
+
+    def _close_lots(self, symbol: str, quantity: Decimal) -> Decimal:
+        """
+        Consumes `quantity` units of open lots (long or short) according to the lot method and returns their cost basis.
+        Amortized O(1) per lot consumed: lots are only ever taken from the ends of the deque.
+        """
+        lots = self._lots.get(symbol)
+        consumed_cost = Decimal("0")
+        remaining = quantity
+        take_newest = self.lot_method == LotMethod.LIFO
+
+        while remaining > Decimal("0") and lots:
+            lot = lots[-1] if take_newest else lots[0]
+            lot_quantity = abs(lot.quantity)
+            if lot_quantity <= remaining:
+                consumed_cost += lot.cost
+                remaining -= lot_quantity
+                if take_newest:
+                    lots.pop()
+                else:
+                    lots.popleft()
+            else:
+                partial_cost = lot.cost * remaining / lot_quantity
+                lot.cost -= partial_cost
+                lot.quantity -= remaining if lot.quantity > 0 else -remaining
+                consumed_cost += partial_cost
+                remaining = Decimal("0")
+
+        if remaining > Decimal("0"):
+            logger.warning("Closed %s of %s without a matching open lot. Assuming a zero cost basis for it.", remaining, symbol)
+
+        if lots:
+            self.cost_basis[symbol] -= consumed_cost
+        else:
+            self._lots.pop(symbol, None)
+            self.cost_basis.pop(symbol, None)
+        return consumed_cost
+
     def _calculate_cost(self, quantity: Decimal, price: Decimal) -> Decimal:
         trade_value = quantity * price
         return trade_value * self.transaction_cost_percent
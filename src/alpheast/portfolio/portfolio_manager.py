@@ -1,18 +1,31 @@
 from datetime import datetime
 from decimal import Decimal
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 import uuid
+
+import numpy as np
+
+from alpheast.config.margin_config import MarginConfig
 from alpheast.portfolio.benchmark_calculator import BenchmarkCalculator
+from alpheast.portfolio.online_metrics import OnlineMetrics
 from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.joint_allocation import JointAllocation
+from alpheast.position_sizing.risk_estimators import RiskEstimators
 from alpheast.events.event_queue import EventQueue
 from alpheast.events.event_enums import OrderType
-from alpheast.events.event import DailyUpdateEvent, FillEvent, MarketEvent, OrderEvent, SignalEvent
+from alpheast.events.event import DailyUpdateEvent, FillEvent, MarketEvent, OrderEvent, SignalEvent, TargetWeightsEvent
+from alpheast.models.lot_method import LotMethod
 from alpheast.models.signal import Signal
 from alpheast.portfolio.portfolio import Portfolio
 from alpheast.position_sizing.common.fixed_allocation_sizing import FixedAllocationSizing
 
 
+logger = logging.getLogger(__name__)
+
+def _to_quantity(value: float) -> Decimal:
+    return Decimal(int(value)) if float(value).is_integer() else Decimal(str(value))
+
 class PortfolioManager:
     """
     Manages the portfolio's cash and holdings, processes signals from strategies,
@@ -27,27 +40,49 @@ class PortfolioManager:
         transaction_cost_percent: Decimal = Decimal("0.001"),
         slippage_percent: Decimal = Decimal("0.0005"),
         position_sizing_method: Optional[BasePositionSizing] = None,
+        lot_method: LotMethod = LotMethod.FIFO,
+        margin_config: Optional[MarginConfig] = None,
+        joint_allocation: Optional[JointAllocation] = None,
+        external_fills: bool = False
     ):
         self.event_queue = event_queue
         self.initial_cash = initial_cash
         self.symbols = symbols
+        self.lot_method = lot_method
+        self.margin_config = margin_config
+        self.external_fills = external_fills # Fills of orders placed elsewhere (e.g. replayed) are expected
 
-        self.portfolio_account = Portfolio(initial_cash, transaction_cost_percent)
+        self.portfolio_account = Portfolio(initial_cash, transaction_cost_percent, lot_method, margin_config)
         self._latest_market_prices: Dict[str, Decimal] = {}
+        self._latest_timestamp: Optional[datetime] = None
         self._current_date: Optional[datetime.date] = None
         
         self._pending_orders: Dict[str, OrderEvent] = {}
         self._committed_sell_quantities: Dict[str, Decimal] = {}
+        self._margin_calls: List[Dict[str, Any]] = []
+
+        # Rebalancing: buys of a batch wait until the batch's sells have filled
+        self._rebalance_sell_order_ids: Set[str] = set()
+        self._deferred_rebalance_buys: Dict[str, Decimal] = {}
+
+        # Batch sizing: BUY signals are collected per timestamp and sized jointly at its end
+        self.joint_allocation = joint_allocation
+        self._buffered_buy_signals: Dict[str, SignalEvent] = {}
 
         self._daily_values: List[Dict[str, Any]] = []
         self._trade_log: List[Dict[str, Any]] = []
         
         self.slippage_percent = slippage_percent
         self.position_sizing_method = position_sizing_method or FixedAllocationSizing(0.05)
+        self.risk_estimators = RiskEstimators(symbols)
+        self.position_sizing_method.set_risk_estimators(self.risk_estimators)
+        if self.joint_allocation == JointAllocation.VOLATILITY_SCALED:
+            self.risk_estimators.enable_volatility()
         
         self.benchmark_calculator = BenchmarkCalculator(symbols, transaction_cost_percent, slippage_percent)
+        self.online_metrics = OnlineMetrics(initial_cash)
 
-        logging.info(f"PortfolioManager initialized. Initial cash: ${self.portfolio_account.cash:.2f}")
+        logger.info("PortfolioManager initialized. Initial cash: $%.2f", self.portfolio_account.cash)
 
     def on_market_event(self, event: MarketEvent):
         """
@@ -55,6 +90,12 @@ class PortfolioManager:
         records the portfolio's daily value if a new day has started.
         """
         self._latest_market_prices[event.symbol] = Decimal(str(event.data["close"]))
+        self._latest_timestamp = event.timestamp
+        if self.risk_estimators.enabled:
+            close = float(event.data["close"])
+            self.risk_estimators.update(event.symbol, float(event.data.get("high", close)), float(event.data.get("low", close)), close)
+        if self.margin_config is not None:
+            self.portfolio_account.update_market_price(event.symbol, self._latest_market_prices[event.symbol])
         
     def on_signal_event(self, event: SignalEvent):
         """
@@ -62,27 +103,23 @@ class PortfolioManager:
         Decides whether to place an order by generating an OrderEvent.
         """
         if event.symbol not in self._latest_market_prices:
-            logging.warning(f"Cannot process SignalEvent for {event.symbol} on {event.timestamp.date()}: No market data available yet.")
+            logger.warning("Cannot process SignalEvent for %s on %s: No market data available yet.", event.symbol, event.timestamp.date())
             return
         
         current_price = self._latest_market_prices[event.symbol]
         current_holding = self.portfolio_account.get_holding_quantity(event.symbol)
 
-        cash_for_new_order_consideration = self.portfolio_account.cash
-        for order_id, order in self._pending_orders.items():
-            if order.direction == Signal.BUY:
-                estimated_pending_fill_price = order.price * (Decimal("1") + self.slippage_percent)
-                estimated_pending_fill_price = max(Decimal("0.01"), estimated_pending_fill_price)
-
-                estimated_pending_cost = (order.quantity * estimated_pending_fill_price) * (Decimal("1") + self.portfolio_account.transaction_cost_percent)
-                cash_for_new_order_consideration -= estimated_pending_cost
-                
-        cash_for_new_order_consideration = max(Decimal("0"), cash_for_new_order_consideration)
+        cash_for_new_order_consideration = self._get_available_buying_power()
 
         if event.direction == Signal.BUY:
-            self._buy_on_signal_event(event, current_holding, current_price, cash_for_new_order_consideration)
+            if current_holding < Decimal("0"):
+                self._cover_on_signal_event(event, current_holding, current_price)
+            elif self.joint_allocation is not None:
+                self._buffer_buy_signal_event(event, current_holding)
+            else:
+                self._buy_on_signal_event(event, current_holding, current_price, cash_for_new_order_consideration)
         elif event.direction == Signal.SELL:
-            self._sell_on_signal_event(event, current_holding, current_price)
+            self._sell_on_signal_event(event, current_holding, current_price, cash_for_new_order_consideration)
 
     def on_fill_event(self, event: FillEvent):
         """
@@ -98,8 +135,8 @@ class PortfolioManager:
 
                 if self._committed_sell_quantities[event.symbol] <= Decimal("0.00000001"):
                     del self._committed_sell_quantities[event.symbol]
-        else:
-            logging.warning(f"Received FillEvent for unknown or already processed order ID: {event.order_id}. This might indicate a logic error or out-of-order event processing.")
+        elif not self.external_fills:
+            logger.warning("Received FillEvent for unknown or already processed order ID: %s. This might indicate a logic error or out-of-order event processing.", event.order_id)
 
         if event.successful:
             if event.direction == Signal.BUY:
@@ -128,9 +165,69 @@ class PortfolioManager:
                 "successful": event.successful,
                 "order_id": event.order_id
             })
-            logging.info(f"Portfolio updated: {event.direction} {event.quantity} of {event.symbol} at {event.fill_price:.2f}. New cash: ${self.portfolio_account.cash:.2f}")
+            self.online_metrics.record_fill(event.quantity * event.fill_price)
+            logger.info("Portfolio updated: %s %s of %s at %.2f. New cash: $%.2f", event.direction, event.quantity, event.symbol, event.fill_price, self.portfolio_account.cash)
         else:
-            logging.warning(f"Fill for {event.symbol} on {event.timestamp.date()} was not successful.")
+            logger.warning("Fill for %s on %s was not successful.", event.symbol, event.timestamp.date())
+
+        if event.order_id in self._rebalance_sell_order_ids:
+            self._rebalance_sell_order_ids.discard(event.order_id)
+            if not self._rebalance_sell_order_ids and self._deferred_rebalance_buys:
+                self._place_deferred_rebalance_buys(event.timestamp)
+
+    def on_target_weights_event(self, event: TargetWeightsEvent):
+        """
+        Rebalances the portfolio to the event's target weights in one batch.
+        All deltas are computed in one vectorized pass over the universe, netted against
+        the pending orders, and sells are placed before buys: the buys are held back until
+        the batch's sells have filled, then scaled down to the buying power actually available.
+        """
+        allow_short = self.margin_config is not None and self.margin_config.allow_short
+        symbols = list(dict.fromkeys([*event.weights.keys(), *self.portfolio_account.holdings.keys()]))
+
+        missing_prices = [symbol for symbol in symbols if symbol not in self._latest_market_prices]
+        if missing_prices:
+            logger.warning("No market data for %s on %s. Leaving them out of the rebalance.", missing_prices, event.timestamp.date())
+            symbols = [symbol for symbol in symbols if symbol in self._latest_market_prices]
+        if not symbols:
+            return
+
+        weights = np.array([float(event.weights.get(symbol, 0.0)) for symbol in symbols])
+        if not allow_short and (weights < 0).any():
+            logger.warning("Negative target weights on %s require short selling. Treating them as zero.", event.timestamp.date())
+            weights = np.maximum(weights, 0.0)
+
+        prices = np.array([float(self._latest_market_prices[symbol]) for symbol in symbols])
+        pending_quantities = self._get_pending_quantities()
+        current_quantities = np.array([
+            float(self.portfolio_account.get_holding_quantity(symbol) + pending_quantities.get(symbol, Decimal("0")))
+            for symbol in symbols
+        ])
+        portfolio_value = float(self.portfolio_account.get_total_value(self._latest_market_prices))
+
+        target_quantities = np.trunc(weights * portfolio_value / prices)
+        # NaN weights keep the current position (holding and pending orders)
+        deltas = np.where(np.isnan(weights), 0.0, target_quantities - current_quantities)
+
+        # A new batch replaces buys still waiting for an earlier batch's sells. Those sells stay pending and are
+        # netted above, but the new buys only wait for this batch's sells, so one that never fills cannot hold them back
+        self._deferred_rebalance_buys = {}
+        self._rebalance_sell_order_ids = set()
+
+        for index in np.nonzero(deltas <= -1)[0]:
+            symbol = symbols[index]
+            quantity = _to_quantity(-deltas[index])
+            order_event = self._place_order(symbol, event.timestamp, Signal.SELL, quantity, self._latest_market_prices[symbol])
+            self._committed_sell_quantities[symbol] = self._committed_sell_quantities.get(symbol, Decimal("0")) + quantity
+            self._rebalance_sell_order_ids.add(order_event.order_id)
+
+        self._deferred_rebalance_buys = {
+            symbols[index]: _to_quantity(deltas[index]) for index in np.nonzero(deltas >= 1)[0]
+        }
+        logger.info("Rebalancing on %s: %s sells, %s buys.", event.timestamp.date(), int((deltas <= -1).sum()), len(self._deferred_rebalance_buys))
+
+        if not self._rebalance_sell_order_ids and self._deferred_rebalance_buys:
+            self._place_deferred_rebalance_buys(event.timestamp)
 
     def on_daily_update_event(self, event: DailyUpdateEvent):
         """
@@ -144,7 +241,10 @@ class PortfolioManager:
                 self._latest_market_prices
             )
             if not self.benchmark_calculator.is_initialized():
-                logging.warning(f"Benchmark could not be initialized on {self._current_date}. Daily benchmark values will be 0.")
+                logger.warning("Benchmark could not be initialized on %s. Daily benchmark values will be 0.", self._current_date)
+
+        if self.margin_config is not None:
+            self.portfolio_account.charge_borrow_fee(event.timestamp)
 
         self._calculate_and_record_strategy_value()
         self.benchmark_calculator.calculate_and_record_benchmark_value( # NEW: Delegate benchmark calculation
@@ -152,21 +252,63 @@ class PortfolioManager:
             self._latest_market_prices
         )
 
+    def on_timestamp_end(self):
+        """
+        Called by the engine once all events of a timestamp have been processed.
+        Sizes the buffered BUY signals jointly, then checks the maintenance margin once
+        for the whole book and, on a margin call, places the covering orders for all
+        short positions in one batch.
+        """
+        self.risk_estimators.on_timestamp_end()
+
+        if self._buffered_buy_signals:
+            self._place_buffered_buy_orders()
+
+        if self.margin_config is None or not self.portfolio_account.is_margin_call():
+            return
+
+        pending_cover_symbols = {order.symbol for order in self._pending_orders.values() if order.direction == Signal.BUY}
+        covers = {
+            symbol: quantity
+            for symbol, quantity in self.portfolio_account.get_margin_call_covers().items()
+            if symbol not in pending_cover_symbols and quantity > Decimal("0")
+        }
+        if not covers:
+            return
+
+        self._margin_calls.append({
+            "timestamp": self._latest_timestamp,
+            "equity": self.portfolio_account.equity,
+            "maintenance_requirement": self.portfolio_account.maintenance_requirement,
+            "covers": covers
+        })
+        logger.warning("Margin call on %s: equity $%.2f below maintenance requirement $%.2f. Covering %s.", self._latest_timestamp, self.portfolio_account.equity, self.portfolio_account.maintenance_requirement, covers)
+
+        for symbol, quantity in covers.items():
+            self._place_order(symbol, self._latest_timestamp, Signal.BUY, quantity, self._latest_market_prices[symbol])
+
     def reset(self):
         """
         Resets the portfolio manager's state for a new backtest run.
         This clears all holdings, cash, and market price memory.
         """
-        self.portfolio_account = Portfolio(Decimal(str(self.initial_cash)))
+        self.portfolio_account = Portfolio(Decimal(str(self.initial_cash)), lot_method=self.lot_method, margin_config=self.margin_config)
         self._latest_market_prices = {}
+        self._latest_timestamp = None
         self._daily_values = []
         self._trade_log = []
         self._pending_orders = {}
         self._committed_sell_quantities = {}
+        self._margin_calls = []
+        self._rebalance_sell_order_ids = set()
+        self._deferred_rebalance_buys = {}
+        self._buffered_buy_signals = {}
+        self.risk_estimators.reset()
 
         self.benchmark_calculator = BenchmarkCalculator(self.symbols, self.portfolio_account.transaction_cost_percent, self.slippage_percent)
+        self.online_metrics = OnlineMetrics(self.initial_cash)
 
-        logging.info("Portfolio Manager reset complete.")
+        logger.info("Portfolio Manager reset complete.")
 
     def _buy_on_signal_event(
         self, 
@@ -187,7 +329,7 @@ class PortfolioManager:
             )
 
             if calculated_quantity <= Decimal("0"):
-                logging.warning(f"Calculated quantity for {event.symbol} is {calculated_quantity}. Skipping BUY signal on {event.timestamp.date()}.")
+                logger.warning("Calculated quantity for %s is %s. Skipping BUY signal on %s.", event.symbol, calculated_quantity, event.timestamp.date())
                 return
 
             estimated_fill_price_with_slippage = current_price * (Decimal("1") + self.slippage_percent)
@@ -207,22 +349,26 @@ class PortfolioManager:
                 )
                 self.event_queue.put(order_event)
                 self._pending_orders[order_event.order_id] = order_event
-                logging.info(f"PortfolioManager placed BUY order for {calculated_quantity} of {event.symbol} at {current_price:.2f} on {event.timestamp.date()}")
+                logger.info("PortfolioManager placed BUY order for %s of %s at %.2f on %s", calculated_quantity, event.symbol, current_price, event.timestamp.date())
             else:
-                logging.warning(f"Not enough cash to BUY {calculated_quantity} of {event.symbol} at {current_price:.2f} on {event.timestamp.date()}. Current cash: ${self.portfolio_account.cash:.2f}")
+                logger.warning("Not enough cash to BUY %s of %s at %.2f on %s. Current cash: $%.2f", calculated_quantity, event.symbol, current_price, event.timestamp.date(), self.portfolio_account.cash)
         else:
-            logging.debug(f"Already holding {event.symbol}. Skipping BUY signal on {event.timestamp.date()}.")
+            logger.debug("Already holding %s. Skipping BUY signal on %s.", event.symbol, event.timestamp.date())
 
     def _sell_on_signal_event(
         self,
         event: SignalEvent,
         current_holding: Decimal,
-        current_price: Decimal
+        current_price: Decimal,
+        buying_power_available_for_new_order: Decimal = Decimal("0")
     ):
         available_holding = current_holding - self._committed_sell_quantities.get(event.symbol, Decimal("0"))
 
         if available_holding <= Decimal("0"):
-            logging.debug(f"Not holding {event.symbol}. Skipping SELL signal on {event.timestamp.date()}.")
+            if available_holding == Decimal("0") and self.margin_config is not None and self.margin_config.allow_short:
+                self._short_on_signal_event(event, current_price, buying_power_available_for_new_order)
+            else:
+                logger.debug("Not holding %s. Skipping SELL signal on %s.", event.symbol, event.timestamp.date())
             return
         
         # Sell all current (uncommitted) holding
@@ -241,7 +387,161 @@ class PortfolioManager:
         self._pending_orders[order_event.order_id] = order_event
         self._committed_sell_quantities[event.symbol] = self._committed_sell_quantities.get(event.symbol, Decimal("0")) + quantity_to_sell
 
-        logging.info(f"PortfolioManager placed SELL order for {quantity_to_sell} of {event.symbol} at {current_price:.2f} on {event.timestamp.date()}")
+        logger.info("PortfolioManager placed SELL order for %s of %s at %.2f on %s", quantity_to_sell, event.symbol, current_price, event.timestamp.date())
+
+    def _buffer_buy_signal_event(self, event: SignalEvent, current_holding: Decimal):
+        if current_holding != Decimal("0"):
+            logger.debug("Already holding %s. Skipping BUY signal on %s.", event.symbol, event.timestamp.date())
+            return
+        self._buffered_buy_signals[event.symbol] = event
+
+    def _place_buffered_buy_orders(self):
+        """
+        Sizes all BUY signals of the timestamp in one call to the position sizing method,
+        sharing the available cash according to `joint_allocation`.
+        """
+        signals = list(self._buffered_buy_signals.values())
+        self._buffered_buy_signals = {}
+
+        symbols = [signal.symbol for signal in signals]
+        prices = np.array([float(self._latest_market_prices[symbol]) for symbol in symbols])
+        volatilities = self.risk_estimators.volatility.get_volatilities(symbols) if self.risk_estimators.volatility else None
+        cost_factor = (1 + float(self.slippage_percent)) * (1 + float(self.portfolio_account.transaction_cost_percent))
+
+        quantities = self.position_sizing_method.calculate_quantities(
+            symbols=symbols,
+            current_prices=prices,
+            portfolio_cash=self._get_available_buying_power(),
+            portfolio_holdings=self.portfolio_account.holdings,
+            allocation=self.joint_allocation,
+            volatilities=volatilities,
+            cost_factor=cost_factor,
+            portfolio_current_value=self.portfolio_account.get_total_value(self._latest_market_prices),
+            latest_market_prices=self._latest_market_prices
+        )
+
+        for signal, quantity in zip(signals, quantities):
+            if quantity >= 1:
+                self._place_order(signal.symbol, signal.timestamp, Signal.BUY, _to_quantity(quantity), self._latest_market_prices[signal.symbol])
+            else:
+                logger.warning("Jointly sized quantity for %s is %s. Skipping BUY signal on %s.", signal.symbol, quantity, signal.timestamp.date())
+
+    def _short_on_signal_event(
+        self,
+        event: SignalEvent,
+        current_price: Decimal,
+        buying_power_available_for_new_order: Decimal
+    ):
+        calculated_quantity = self.position_sizing_method.calculate_quantity(
+            symbol=event.symbol,
+            direction=event.direction,
+            current_price=current_price,
+            portfolio_cash=buying_power_available_for_new_order,
+            portfolio_holdings=self.portfolio_account.holdings,
+            portfolio_current_value=self.portfolio_account.equity,
+            latest_market_prices=self._latest_market_prices
+        )
+
+        if calculated_quantity <= Decimal("0"):
+            logger.warning("Calculated short quantity for %s is %s. Skipping SELL signal on %s.", event.symbol, calculated_quantity, event.timestamp.date())
+            return
+
+        estimated_fill_price_with_slippage = max(Decimal("0.01"), current_price * (Decimal("1") - self.slippage_percent))
+        estimated_margin = calculated_quantity * estimated_fill_price_with_slippage * (
+            self.portfolio_account.initial_margin + self.portfolio_account.transaction_cost_percent
+        )
+
+        if buying_power_available_for_new_order >= estimated_margin:
+            self._place_order(event.symbol, event.timestamp, Signal.SELL, calculated_quantity, current_price)
+            self._committed_sell_quantities[event.symbol] = self._committed_sell_quantities.get(event.symbol, Decimal("0")) + calculated_quantity
+        else:
+            logger.warning("Not enough buying power to SHORT %s of %s at %.2f on %s. Buying power: $%.2f", calculated_quantity, event.symbol, current_price, event.timestamp.date(), self.portfolio_account.buying_power)
+
+    def _cover_on_signal_event(
+        self,
+        event: SignalEvent,
+        current_holding: Decimal,
+        current_price: Decimal
+    ):
+        if any(order.symbol == event.symbol and order.direction == Signal.BUY for order in self._pending_orders.values()):
+            logger.debug("Already covering %s. Skipping BUY signal on %s.", event.symbol, event.timestamp.date())
+            return
+
+        # Cover the whole short position
+        self._place_order(event.symbol, event.timestamp, Signal.BUY, -current_holding, current_price)
+
+    def _place_deferred_rebalance_buys(self, timestamp: datetime):
+        """
+        Places the held back buys of a rebalance, scaled down together if their estimated cost exceeds the buying power.
+        """
+        deferred_buys = self._deferred_rebalance_buys
+        self._deferred_rebalance_buys = {}
+
+        symbols = list(deferred_buys.keys())
+        quantities = np.array([float(quantity) for quantity in deferred_buys.values()])
+        prices = np.array([float(self._latest_market_prices[symbol]) for symbol in symbols])
+        cost_factor = (1 + float(self.slippage_percent)) * (1 + float(self.portfolio_account.transaction_cost_percent))
+        estimated_cost = quantities * prices * cost_factor
+
+        buying_power = float(self._get_available_buying_power())
+        total_cost = estimated_cost.sum()
+        if total_cost > buying_power:
+            logger.warning("Rebalance buys of $%.2f exceed buying power of $%.2f on %s. Scaling them down.", total_cost, buying_power, timestamp.date())
+            quantities = np.floor(quantities * buying_power / total_cost)
+
+        for symbol, quantity in zip(symbols, quantities):
+            if quantity >= 1:
+                self._place_order(symbol, timestamp, Signal.BUY, _to_quantity(quantity), self._latest_market_prices[symbol])
+
+    def _get_pending_quantities(self) -> Dict[str, Decimal]:
+        """
+        Net quantity of the pending orders per symbol (positive for buys).
+        """
+        pending_quantities: Dict[str, Decimal] = {}
+        for order in self._pending_orders.values():
+            signed_quantity = order.quantity if order.direction == Signal.BUY else -order.quantity
+            pending_quantities[order.symbol] = pending_quantities.get(order.symbol, Decimal("0")) + signed_quantity
+        return pending_quantities
+
+    def _place_order(self, symbol: str, timestamp: datetime, direction: Signal, quantity: Decimal, price: Decimal) -> OrderEvent:
+        order_event = OrderEvent(
+            order_id=str(uuid.uuid4()),
+            symbol=symbol,
+            timestamp=timestamp,
+            direction=direction,
+            quantity=quantity,
+            order_type=OrderType.MARKET,
+            price=price
+        )
+        self.event_queue.put(order_event)
+        self._pending_orders[order_event.order_id] = order_event
+        logger.info("PortfolioManager placed %s order for %s of %s at %.2f on %s", direction.name, quantity, symbol, price, timestamp.date())
+        return order_event
+
+    def _get_available_buying_power(self) -> Decimal:
+        """
+        Buying power (cash for long-only portfolios) net of the estimated cost of pending orders:
+        pending buys use their full cost, pending short sales their initial margin. Only the part of a
+        sell beyond the long holding is a short sale.
+        """
+        if self.margin_config is None:
+            buying_power = self.portfolio_account.cash
+        else:
+            buying_power = self.portfolio_account.buying_power
+
+        for order_id, order in self._pending_orders.items():
+            if order.direction == Signal.BUY:
+                estimated_pending_fill_price = order.price * (Decimal("1") + self.slippage_percent)
+                estimated_pending_fill_price = max(Decimal("0.01"), estimated_pending_fill_price)
+
+                estimated_pending_cost = (order.quantity * estimated_pending_fill_price) * (Decimal("1") + self.portfolio_account.transaction_cost_percent)
+                buying_power -= estimated_pending_cost
+            elif self.margin_config is not None:
+                short_quantity = order.quantity - max(self.portfolio_account.get_holding_quantity(order.symbol), Decimal("0"))
+                if short_quantity > Decimal("0"):
+                    buying_power -= short_quantity * order.price * self.portfolio_account.initial_margin
+                
+        return max(Decimal("0"), buying_power)
 
     # --- Methods to retrieve final performance data for analysis ---
     def get_daily_values(self) -> List[Dict[str, Any]]:
@@ -254,6 +554,22 @@ class PortfolioManager:
     def get_trade_log(self) -> List[Dict[str, Any]]:
         return self._trade_log
 
+    def get_margin_calls(self) -> List[Dict[str, Any]]:
+        return self._margin_calls
+
+    def get_pending_order_count(self) -> int:
+        return len(self._pending_orders)
+
+    def get_latest_timestamp(self) -> Optional[datetime]:
+        return self._latest_timestamp
+
+    def get_online_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the current snapshot of the streaming metrics.
+        Cheap to call at every step (e.g. for reward functions in stepping mode).
+        """
+        return self.online_metrics.get_snapshot()
+
     def get_summary(self) -> Dict[str, Any]:
         """
         Returns a summary of the final portfolio state.
@@ -262,7 +578,9 @@ class PortfolioManager:
         return {
             "cash": self.portfolio_account.cash,
             "holdings": self.portfolio_account.holdings,
-            "total_value": self.portfolio_account.get_total_value(self._latest_market_prices)
+            "total_value": self.portfolio_account.get_total_value(self._latest_market_prices),
+            "realized_pnl": self.portfolio_account.total_realized_pnl,
+            "unrealized_pnl": self.portfolio_account.get_unrealized_pnl(self._latest_market_prices)
         }
 
     def _calculate_and_record_strategy_value(self):
@@ -274,10 +592,15 @@ class PortfolioManager:
             current_portfolio_value = self.portfolio_account.get_total_value(self._latest_market_prices)
         else:
             current_portfolio_value = self.portfolio_account.cash
-            logging.warning(f"No market prices available on {self._current_date} for strategy value calculation. Using cash balance.")
+            logger.warning("No market prices available on %s for strategy value calculation. Using cash balance.", self._current_date)
 
         self._daily_values.append({
             "date": self._current_date,
             "value": current_portfolio_value
         })
-        logging.debug(f"Strategy portfolio value on {self._current_date}: ${current_portfolio_value:.2f}")
\ No newline at end of file
+        if self.margin_config is None:
+            gross_exposure_value = current_portfolio_value - self.portfolio_account.cash
+        else:
+            gross_exposure_value = self.portfolio_account.long_market_value + self.portfolio_account.short_market_value
+        self.online_metrics.update_value(current_portfolio_value, gross_exposure_value=gross_exposure_value)
+        logger.debug("Strategy portfolio value on %s: $%.2f", self._current_date, current_portfolio_value)
\ No newline at end of file
@@ -1,12 +1,18 @@
-
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Any, Dict, Literal
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
 
 from alpheast.models.signal import Signal
+from alpheast.position_sizing.joint_allocation import JointAllocation, allocate_jointly
+from alpheast.position_sizing.risk_estimators import RiskEstimators
 
 
 class BasePositionSizing(ABC):
+    # Shared estimators kept up to date by the PortfolioManager, see set_risk_estimators()
+    risk_estimators: Optional[RiskEstimators] = None
+
     @abstractmethod
     def calculate_quantity(
         self,
@@ -20,4 +26,43 @@ class BasePositionSizing(ABC):
         """
         Calculates the quantity to trade based on the given context.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def set_risk_estimators(self, risk_estimators: RiskEstimators):
+        """
+        Called by the PortfolioManager with the estimators it updates once per bar.
+        Sizing methods that need optional estimators (e.g. the covariance) enable them here.
+        """
+        self.risk_estimators = risk_estimators
+
+    def calculate_quantities(
+        self,
+        symbols: List[str],
+        current_prices: np.ndarray,
+        portfolio_cash: Decimal,
+        portfolio_holdings: Dict[str, Decimal],
+        allocation: JointAllocation = JointAllocation.PROPORTIONAL,
+        volatilities: Optional[np.ndarray] = None,
+        cost_factor: float = 1.0,
+        **kwargs: Any
+    ) -> np.ndarray:
+        """
+        Calculates the quantities of all BUY signals of one timestamp jointly.
+        Each signal is first sized as if it were alone (against the same cash), then the batch
+        is fitted into the cash with `allocation`. `cost_factor` is the estimated cost per unit of
+        notional (slippage and commission) and shrinks the budget accordingly.
+
+        The default implementation calls `calculate_quantity` per signal; subclasses can vectorize it.
+        """
+        desired_quantities = np.array([
+            float(self.calculate_quantity(
+                symbol=symbol,
+                direction=Signal.BUY,
+                current_price=Decimal(str(price)),
+                portfolio_cash=portfolio_cash,
+                portfolio_holdings=portfolio_holdings,
+                **kwargs
+            ))
+            for symbol, price in zip(symbols, current_prices)
+        ])
+        return allocate_jointly(desired_quantities, current_prices, float(portfolio_cash) / cost_factor, allocation, volatilities)
@@ -0,0 +1,52 @@
+from decimal import Decimal
+import logging
+import math
+from typing import Any, Dict
+
+from alpheast.models.signal import Signal
+from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.risk_estimators import RiskEstimators
+
+
+logger = logging.getLogger(__name__)
+
+class AtrSizing(BasePositionSizing):
+    """
+    Sizes each position so that a stop `atr_multiple` ATRs away loses `risk_percent` of the portfolio value.
+    The ATR comes from the shared Wilder ATR estimator.
+    A position never takes more than `max_allocation_percent` of the portfolio value or of the available cash.
+    """
+    def __init__(self, risk_percent: float = 0.01, atr_multiple: float = 2.0, max_allocation_percent: float = 0.25):
+        if risk_percent <= 0 or atr_multiple <= 0:
+            raise ValueError("Risk percent and ATR multiple must be positive.")
+        self.risk_percent = risk_percent
+        self.atr_multiple = atr_multiple
+        self.max_allocation_percent = max_allocation_percent
+
+    def set_risk_estimators(self, risk_estimators: RiskEstimators):
+        super().set_risk_estimators(risk_estimators)
+        risk_estimators.enable_atr()
+
+    def calculate_quantity(
+        self,
+        symbol: str,
+        direction: Signal,
+        current_price: Decimal,
+        portfolio_cash: Decimal,
+        portfolio_holdings: Dict[str, Decimal],
+        **kwargs: Any
+    ) -> Decimal:
+        holding = portfolio_holdings.get(symbol, Decimal("0"))
+        if direction == Signal.SELL and holding > Decimal("0"):
+            return holding
+
+        atr = self.risk_estimators.atr.get_atr(symbol) if self.risk_estimators and self.risk_estimators.atr else math.nan
+        if not atr > 0:
+            logger.debug("No ATR estimate for %s yet. Sizing it at 0.", symbol)
+            return Decimal("0")
+
+        portfolio_value = float(kwargs.get("portfolio_current_value", portfolio_cash))
+        price = float(current_price)
+        quantity = portfolio_value * self.risk_percent / (atr * self.atr_multiple)
+        max_notional = min(portfolio_value, float(portfolio_cash)) * self.max_allocation_percent
+        return Decimal(math.floor(min(quantity, max_notional / price)))
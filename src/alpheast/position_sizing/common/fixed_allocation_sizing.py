@@ -1,8 +1,12 @@
 
 from decimal import Decimal
-from typing import Any, Dict, Literal
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+
 from alpheast.models.signal import Signal
 from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.joint_allocation import JointAllocation, allocate_jointly
 
 
 class FixedAllocationSizing(BasePositionSizing):
@@ -22,5 +26,25 @@ class FixedAllocationSizing(BasePositionSizing):
             cash_to_allocate = portfolio_cash * self.allocation_percent
             return (cash_to_allocate / current_price).quantize(Decimal("1"))
         elif direction == Signal.SELL:
-            return portfolio_holdings.get(symbol, Decimal("0"))
-        return Decimal("0")
\ No newline at end of file
+            holding = portfolio_holdings.get(symbol, Decimal("0"))
+            if holding > Decimal("0"):
+                return holding
+            # Opening a short: allocate the same share of buying power as for a buy
+            cash_to_allocate = portfolio_cash * self.allocation_percent
+            return (cash_to_allocate / current_price).quantize(Decimal("1"))
+        return Decimal("0")
+
+    def calculate_quantities(
+        self,
+        symbols: List[str],
+        current_prices: np.ndarray,
+        portfolio_cash: Decimal,
+        portfolio_holdings: Dict[str, Decimal],
+        allocation: JointAllocation = JointAllocation.PROPORTIONAL,
+        volatilities: Optional[np.ndarray] = None,
+        cost_factor: float = 1.0,
+        **kwargs: Any
+    ) -> np.ndarray:
+        cash_to_allocate = float(portfolio_cash * self.allocation_percent)
+        desired_quantities = np.round(cash_to_allocate / current_prices)
+        return allocate_jointly(desired_quantities, current_prices, float(portfolio_cash) / cost_factor, allocation, volatilities)
\ No newline at end of file
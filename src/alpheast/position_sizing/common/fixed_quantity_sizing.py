@@ -1,8 +1,12 @@
 
 from decimal import Decimal
-from typing import Any, Dict, Literal
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+
 from alpheast.models.signal import Signal
 from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.joint_allocation import JointAllocation, allocate_jointly
 
 
 class FixedQuantitySizing(BasePositionSizing):
@@ -21,5 +25,20 @@ class FixedQuantitySizing(BasePositionSizing):
         if direction == Signal.BUY:
             return self.quantity
         elif direction == Signal.SELL:
-            return portfolio_holdings.get(symbol, Decimal("0"))
-        return Decimal("0")
\ No newline at end of file
+            holding = portfolio_holdings.get(symbol, Decimal("0"))
+            return holding if holding > Decimal("0") else self.quantity
+        return Decimal("0")
+
+    def calculate_quantities(
+        self,
+        symbols: List[str],
+        current_prices: np.ndarray,
+        portfolio_cash: Decimal,
+        portfolio_holdings: Dict[str, Decimal],
+        allocation: JointAllocation = JointAllocation.PROPORTIONAL,
+        volatilities: Optional[np.ndarray] = None,
+        cost_factor: float = 1.0,
+        **kwargs: Any
+    ) -> np.ndarray:
+        desired_quantities = np.full(len(symbols), float(self.quantity))
+        return allocate_jointly(desired_quantities, current_prices, float(portfolio_cash) / cost_factor, allocation, volatilities)
\ No newline at end of file
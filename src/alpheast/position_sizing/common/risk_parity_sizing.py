@@ -0,0 +1,101 @@
+from decimal import Decimal
+import logging
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from alpheast.models.signal import Signal
+from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.risk_estimators import RiskEstimators
+
+
+logger = logging.getLogger(__name__)
+
+class RiskParitySizing(BasePositionSizing):
+    """
+    Sizes each position at its equal-risk-contribution weight of the universe,
+    computed from the shared rolling covariance of returns.
+    The weights are solved once per covariance update and cached, so sizing a signal is O(1).
+    A position never takes more than `max_allocation_percent` of the available cash.
+    """
+    def __init__(
+        self,
+        covariance_window: int = 60,
+        gross_exposure_percent: float = 1.0,
+        max_allocation_percent: float = 0.25,
+        iterations: int = 50
+    ):
+        self.covariance_window = covariance_window
+        self.gross_exposure_percent = gross_exposure_percent
+        self.max_allocation_percent = max_allocation_percent
+        self.iterations = iterations
+
+        self._weights: Optional[Dict[str, float]] = None
+        self._weights_version = -1
+
+    def set_risk_estimators(self, risk_estimators: RiskEstimators):
+        super().set_risk_estimators(risk_estimators)
+        risk_estimators.enable_covariance(self.covariance_window)
+        self._weights = None
+        self._weights_version = -1
+
+    def calculate_quantity(
+        self,
+        symbol: str,
+        direction: Signal,
+        current_price: Decimal,
+        portfolio_cash: Decimal,
+        portfolio_holdings: Dict[str, Decimal],
+        **kwargs: Any
+    ) -> Decimal:
+        holding = portfolio_holdings.get(symbol, Decimal("0"))
+        if direction == Signal.SELL and holding > Decimal("0"):
+            return holding
+
+        weight = self._get_weights().get(symbol, 0.0)
+        if weight <= 0:
+            logger.debug("No risk parity weight for %s yet. Sizing it at 0.", symbol)
+            return Decimal("0")
+
+        portfolio_value = float(kwargs.get("portfolio_current_value", portfolio_cash))
+        notional = min(portfolio_value * self.gross_exposure_percent * weight, float(portfolio_cash) * self.max_allocation_percent)
+        return Decimal(math.floor(notional / float(current_price)))
+
+    def _get_weights(self) -> Dict[str, float]:
+        covariance_estimator = self.risk_estimators.covariance if self.risk_estimators else None
+        if covariance_estimator is None:
+            return {}
+        if self._weights is not None and self._weights_version == covariance_estimator.version:
+            return self._weights
+
+        self._weights = {}
+        self._weights_version = covariance_estimator.version
+        covariance = covariance_estimator.get_covariance()
+        if covariance is None:
+            return self._weights
+
+        active = np.diag(covariance) > 0
+        if active.any():
+            weights = equal_risk_contribution_weights(covariance[np.ix_(active, active)], self.iterations)
+            symbols = [symbol for symbol, is_active in zip(covariance_estimator.symbols, active) if is_active]
+            self._weights = dict(zip(symbols, weights.tolist()))
+        return self._weights
+
+def equal_risk_contribution_weights(covariance: np.ndarray, iterations: int = 50) -> np.ndarray:
+    """
+    Long-only weights (summing to 1) whose risk contributions w_i * (C w)_i are all equal,
+    by cyclical coordinate descent on the risk budgeting problem.
+    """
+    n = len(covariance)
+    variances = np.diag(covariance)
+    weights = 1.0 / np.sqrt(variances)
+    weights /= weights.sum()
+    budget = 1.0 / n
+
+    for _ in range(iterations):
+        for i in range(n):
+            # Covariance of asset i with the rest of the portfolio
+            others = covariance[i] @ weights - variances[i] * weights[i]
+            weights[i] = (-others + math.sqrt(others * others + 4 * variances[i] * budget)) / (2 * variances[i])
+    return weights / weights.sum()
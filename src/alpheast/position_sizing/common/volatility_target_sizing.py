@@ -0,0 +1,51 @@
+from decimal import Decimal
+import logging
+import math
+from typing import Any, Dict
+
+from alpheast.models.signal import Signal
+from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.risk_estimators import RiskEstimators
+
+
+logger = logging.getLogger(__name__)
+
+class VolatilityTargetSizing(BasePositionSizing):
+    """
+    Sizes each position so that its annualized volatility, estimated by the shared
+    EWMA volatility, contributes `target_volatility` of the portfolio value.
+    A position never takes more than `max_allocation_percent` of the portfolio value or of the available cash.
+    """
+    def __init__(self, target_volatility: float = 0.15, max_allocation_percent: float = 0.25, periods_per_year: int = 252):
+        if target_volatility <= 0:
+            raise ValueError("Target volatility must be positive.")
+        self.target_volatility = target_volatility
+        self.max_allocation_percent = max_allocation_percent
+        self.annualization = math.sqrt(periods_per_year)
+
+    def set_risk_estimators(self, risk_estimators: RiskEstimators):
+        super().set_risk_estimators(risk_estimators)
+        risk_estimators.enable_volatility()
+
+    def calculate_quantity(
+        self,
+        symbol: str,
+        direction: Signal,
+        current_price: Decimal,
+        portfolio_cash: Decimal,
+        portfolio_holdings: Dict[str, Decimal],
+        **kwargs: Any
+    ) -> Decimal:
+        holding = portfolio_holdings.get(symbol, Decimal("0"))
+        if direction == Signal.SELL and holding > Decimal("0"):
+            return holding
+
+        volatility = self.risk_estimators.volatility.get_volatility(symbol) if self.risk_estimators and self.risk_estimators.volatility else math.nan
+        if not volatility > 0:
+            logger.debug("No volatility estimate for %s yet. Sizing it at 0.", symbol)
+            return Decimal("0")
+
+        portfolio_value = float(kwargs.get("portfolio_current_value", portfolio_cash))
+        allocation = min(self.target_volatility / (volatility * self.annualization), self.max_allocation_percent)
+        notional = min(portfolio_value * allocation, float(portfolio_cash) * self.max_allocation_percent)
+        return Decimal(math.floor(notional / float(current_price)))
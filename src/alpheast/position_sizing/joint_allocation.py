@@ -0,0 +1,89 @@
+from enum import Enum
+import logging
+from typing import Optional
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+class JointAllocation(Enum):
+    """
+    How the capital of one timestamp is shared between all BUY signals of that timestamp.
+
+    PROPORTIONAL: every desired quantity is scaled down by the same factor until the batch fits the budget.
+    CAPPED: max-min fair share, no signal gets more than a common cap, the budget left by smaller signals goes to the larger ones.
+    VOLATILITY_SCALED: desired positions are scaled by the inverse of their volatility (relative to the batch median), then fitted proportionally.
+    """
+    PROPORTIONAL = "PROPORTIONAL"
+    CAPPED = "CAPPED"
+    VOLATILITY_SCALED = "VOLATILITY_SCALED"
+
+def allocate_jointly(
+    desired_quantities: np.ndarray,
+    current_prices: np.ndarray,
+    budget: float,
+    allocation: JointAllocation = JointAllocation.PROPORTIONAL,
+    volatilities: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Fits the desired quantities of a batch of BUY signals into one budget.
+
+    Args:
+        desired_quantities: Quantity each signal would get on its own.
+        current_prices: Price of each signal's symbol.
+        budget: Total notional available for the batch.
+        allocation: How the budget is shared when the batch does not fit.
+        volatilities: Volatility of each symbol, required for VOLATILITY_SCALED. NaN entries are left unscaled.
+
+    Returns:
+        Whole quantities (as floats), one per signal.
+    """
+    costs = np.maximum(desired_quantities, 0.0) * current_prices
+
+    if allocation == JointAllocation.VOLATILITY_SCALED:
+        costs = _scale_by_inverse_volatility(costs, volatilities)
+
+    budget = max(float(budget), 0.0)
+    if allocation == JointAllocation.CAPPED:
+        costs = _water_fill(costs, budget)
+    else:
+        total_cost = costs.sum()
+        if total_cost > budget:
+            costs = costs * (budget / total_cost)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quantities = np.where(current_prices > 0, np.floor(costs / current_prices), 0.0)
+    return quantities
+
+def _scale_by_inverse_volatility(costs: np.ndarray, volatilities: Optional[np.ndarray]) -> np.ndarray:
+    if volatilities is None:
+        logger.warning("Volatility scaled allocation requested without volatilities. Falling back to proportional allocation.")
+        return costs
+
+    valid = np.isfinite(volatilities) & (volatilities > 0)
+    if not valid.any():
+        logger.debug("No volatility estimates available yet. Falling back to proportional allocation.")
+        return costs
+
+    reference = np.median(volatilities[valid])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(valid, reference / volatilities, 1.0)
+    return costs * scale
+
+def _water_fill(costs: np.ndarray, budget: float) -> np.ndarray:
+    """
+    Caps all costs at the level where the capped total equals the budget (no cap if everything fits).
+    """
+    if costs.sum() <= budget:
+        return costs
+
+    sorted_costs = np.sort(costs)
+    n = len(sorted_costs)
+    spent_below = np.concatenate(([0.0], np.cumsum(sorted_costs)[:-1]))
+    # Total when capping at the k-th smallest cost
+    capped_totals = spent_below + sorted_costs * (n - np.arange(n))
+
+    k = int(np.argmax(capped_totals >= budget))
+    cap = (budget - spent_below[k]) / (n - k)
+    return np.minimum(costs, cap)
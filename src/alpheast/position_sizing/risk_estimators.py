@@ -0,0 +1,228 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from alpheast.indicators.atr import ATR
+
+
+class EwmaVolatility:
+    """
+    Exponentially weighted volatility of close-to-close returns per symbol (RiskMetrics style).
+    Updated in O(1) per bar, so it can be fed every MarketEvent.
+    """
+    def __init__(self, decay: float = 0.94, min_periods: int = 10):
+        if not 0 < decay < 1:
+            raise ValueError("EWMA decay must be between 0 and 1.")
+        self.decay = decay
+        self.min_periods = min_periods
+
+        self._last_price: Dict[str, float] = {}
+        self._variance: Dict[str, float] = {}
+        self._count: Dict[str, int] = {}
+
+    def update(self, symbol: str, price: float):
+        last_price = self._last_price.get(symbol)
+        self._last_price[symbol] = price
+        if last_price is None or last_price <= 0:
+            return
+
+        log_return = math.log(price / last_price)
+        previous_variance = self._variance.get(symbol)
+        if previous_variance is None:
+            self._variance[symbol] = log_return * log_return
+        else:
+            self._variance[symbol] = self.decay * previous_variance + (1 - self.decay) * log_return * log_return
+        self._count[symbol] = self._count.get(symbol, 0) + 1
+
+    def get_volatility(self, symbol: str) -> float:
+        """
+        Per-bar volatility of the symbol, NaN until `min_periods` returns have been seen.
+        """
+        if self._count.get(symbol, 0) < self.min_periods:
+            return math.nan
+        return math.sqrt(self._variance[symbol])
+
+    def get_volatilities(self, symbols: List[str]) -> np.ndarray:
+        return np.array([self.get_volatility(symbol) for symbol in symbols])
+
+    def reset(self):
+        self._last_price.clear()
+        self._variance.clear()
+        self._count.clear()
+
+class WilderAtr:
+    """
+    Average True Range per symbol with Wilder's smoothing, seeded with the simple average of the first `period` true ranges.
+    Updated in O(1) per bar.
+    """
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError("ATR period must be at least 1.")
+        self.period = period
+
+        self._atr: Dict[str, ATR] = {}
+
+    def update(self, symbol: str, high: float, low: float, close: float):
+        atr = self._atr.get(symbol)
+        if atr is None:
+            atr = self._atr[symbol] = ATR(self.period)
+        atr.update(high, low, close)
+
+    def get_atr(self, symbol: str) -> float:
+        """
+        ATR of the symbol in price units, NaN until `period` bars have been seen.
+        """
+        atr = self._atr.get(symbol)
+        if atr is None or not atr.is_ready:
+            return math.nan
+        return atr.value
+
+    def reset(self):
+        self._atr.clear()
+
+class RollingCovariance:
+    """
+    Covariance matrix of log returns over the last `window` timestamps for a fixed universe.
+    Returns of one timestamp are collected with `update` and committed as one row with `commit`;
+    a symbol without a bar at a timestamp contributes a zero return.
+    The running sums are updated in O(n^2) per timestamp (independent of the window)
+    and rebuilt from the ring buffer once per window to shed floating point drift.
+    """
+    def __init__(self, symbols: List[str], window: int = 60):
+        if window < 2:
+            raise ValueError("Covariance window must be at least 2.")
+        self.symbols = list(symbols)
+        self.window = window
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        n = len(self.symbols)
+        self._returns = np.zeros((window, n))
+        self._sum = np.zeros(n)
+        self._cross = np.zeros((n, n))
+        self._pending = np.zeros(n)
+        self._last_price = np.full(n, np.nan)
+        self._has_pending = False
+        self._position = 0
+        self._count = 0
+        self.version = 0
+
+    def update(self, symbol: str, price: float):
+        i = self._index.get(symbol)
+        if i is None:
+            return
+        last_price = self._last_price[i]
+        if last_price > 0 and price > 0:
+            self._pending[i] = math.log(price / last_price)
+        self._last_price[i] = price
+        self._has_pending = True
+
+    def commit(self):
+        if not self._has_pending:
+            return
+
+        row = self._pending.copy()
+        if self._count == self.window:
+            leaving = self._returns[self._position]
+            self._sum -= leaving
+            self._cross -= np.outer(leaving, leaving)
+        self._returns[self._position] = row
+        self._sum += row
+        self._cross += np.outer(row, row)
+
+        self._position = (self._position + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+        if self._position == 0:
+            self._sum = self._returns.sum(axis=0)
+            self._cross = self._returns.T @ self._returns
+
+        self._pending[:] = 0.0
+        self._has_pending = False
+        self.version += 1
+
+    def get_covariance(self) -> Optional[np.ndarray]:
+        """
+        Sample covariance (ddof=1) of the per-timestamp log returns, None before two timestamps have been committed.
+        """
+        if self._count < 2:
+            return None
+        mean = self._sum / self._count
+        return (self._cross - self._count * np.outer(mean, mean)) / (self._count - 1)
+
+    def reset(self):
+        self._returns[:] = 0.0
+        self._sum[:] = 0.0
+        self._cross[:] = 0.0
+        self._pending[:] = 0.0
+        self._last_price[:] = np.nan
+        self._has_pending = False
+        self._position = 0
+        self._count = 0
+        self.version = 0
+
+class RiskEstimators:
+    """
+    The per-symbol risk estimators shared by the risk-aware position sizing methods.
+    Every estimator is off until a sizing method (or the joint allocation) that reads it enables it,
+    so a backtest only pays for the estimates it uses. The PortfolioManager updates the enabled ones
+    once per bar and commits the covariance once per timestamp, so reading an estimate while sizing is O(1).
+    """
+    def __init__(
+        self,
+        symbols: List[str],
+        ewma_decay: Optional[float] = None,
+        atr_period: Optional[int] = None,
+        covariance_window: Optional[int] = None
+    ):
+        self.symbols = list(symbols)
+        self.volatility = EwmaVolatility(ewma_decay) if ewma_decay else None
+        self.atr = WilderAtr(atr_period) if atr_period else None
+        self.covariance = RollingCovariance(self.symbols, covariance_window) if covariance_window else None
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether any estimator is tracked, i.e. whether the bars need to be fed to `update` at all.
+        """
+        return self.volatility is not None or self.atr is not None or self.covariance is not None
+
+    def enable_volatility(self, decay: float = 0.94):
+        """
+        Starts tracking the EWMA volatility (kept as is if it is already tracked).
+        """
+        if self.volatility is None:
+            self.volatility = EwmaVolatility(decay)
+
+    def enable_atr(self, period: int = 14):
+        """
+        Starts tracking the Wilder ATR (kept as is if it is already tracked).
+        """
+        if self.atr is None:
+            self.atr = WilderAtr(period)
+
+    def enable_covariance(self, window: int):
+        """
+        Starts tracking the rolling covariance (it costs O(n^2) per timestamp, so it is off unless a sizing method needs it).
+        """
+        if self.covariance is None or self.covariance.window < window:
+            self.covariance = RollingCovariance(self.symbols, window)
+
+    def update(self, symbol: str, high: float, low: float, close: float):
+        if self.volatility is not None:
+            self.volatility.update(symbol, close)
+        if self.atr is not None:
+            self.atr.update(symbol, high, low, close)
+        if self.covariance is not None:
+            self.covariance.update(symbol, close)
+
+    def on_timestamp_end(self):
+        if self.covariance is not None:
+            self.covariance.commit()
+
+    def reset(self):
+        if self.volatility is not None:
+            self.volatility.reset()
+        if self.atr is not None:
+            self.atr.reset()
+        if self.covariance is not None:
+            self.covariance.reset()
@@ -0,0 +1,127 @@
+import copy
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+from typing import Dict, List, Optional, Union
+
+
+LOGGER_NAME = "alpheast"
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+Level = Union[int, str]
+
+_listener: Optional[QueueListener] = None
+_installed_handlers: List[logging.Handler] = []
+# Levels of the loggers configure_logging() changed, as they were before it
+_previous_levels: Dict[str, int] = {}
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    A QueueHandler that leaves formatting to the listener thread.
+
+    The stock QueueHandler runs the full Formatter (timestamp rendering, format string) in the logging
+    thread. Here only the message itself is interpolated, so later changes to mutable arguments cannot alter it,
+    and the rest of the work (formatting, I/O) happens on the QueueListener's thread.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks keep frames alive and cannot cross threads safely, so render them now
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def configure_logging(
+    level: Level = logging.INFO,
+    component_levels: Optional[Dict[str, Level]] = None,
+    handlers: Optional[List[logging.Handler]] = None,
+    log_format: str = DEFAULT_LOG_FORMAT,
+    asynchronous: bool = True
+) -> Optional[QueueListener]:
+    """
+    Configures the `alpheast` logger hierarchy for production runs.
+
+    Every module logs to its own logger (`alpheast.engine`, `alpheast.portfolio.portfolio_manager`, ...),
+    so whole components can be quietened or opened up by name. With `asynchronous`, log calls only put the
+    record on a queue and a background QueueListener formats and writes it, so slow handlers (terminals, network,
+    busy disks) no longer block the event loop. The listener still shares the interpreter lock, so for CPU time
+    the levels matter most: messages are formatted lazily and skipped entirely below the level.
+    Calling it again replaces the previous configuration.
+
+    Args:
+        level: Level of the `alpheast` logger.
+        component_levels: Logger name -> level, e.g. {"strategy": "WARNING", "handlers.data_handler": "DEBUG"}.
+            Names are relative to `alpheast` unless they start with it.
+        handlers: Where records go (a stderr StreamHandler if None). Handlers without a formatter get `log_format`.
+        log_format: Format of the handlers without a formatter.
+        asynchronous: Whether to write through a queue and a listener thread.
+
+    Returns:
+        The started QueueListener if `asynchronous`, else None. `shutdown_logging()` stops it and flushes.
+    """
+    shutdown_logging()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    _save_level(LOGGER_NAME)
+    logger.setLevel(level)
+    # The hierarchy has its own handlers now; propagating would log every record twice
+    logger.propagate = False
+    for name in component_levels or {}:
+        _save_level(_qualified_name(name))
+    set_component_levels(component_levels or {})
+
+    handlers = handlers if handlers is not None else [logging.StreamHandler()]
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(logging.Formatter(log_format))
+
+    global _listener
+    if asynchronous:
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        installed = [DeferredQueueHandler(log_queue)]
+    else:
+        installed = list(handlers)
+
+    for handler in installed:
+        logger.addHandler(handler)
+    _installed_handlers.extend(installed)
+    return _listener
+
+def set_component_levels(component_levels: Dict[str, Level]):
+    """
+    Sets the level of component loggers, e.g. {"portfolio": "WARNING"} for everything under `alpheast.portfolio`.
+    """
+    for name, level in component_levels.items():
+        logging.getLogger(_qualified_name(name)).setLevel(level)
+
+def shutdown_logging():
+    """
+    Stops the listener started by `configure_logging()`, writing out the queued records, removes its handlers
+    and restores the propagation and the levels it changed.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in _installed_handlers:
+        logger.removeHandler(handler)
+    _installed_handlers.clear()
+    logger.propagate = True
+
+    for name, level in _previous_levels.items():
+        logging.getLogger(name).setLevel(level)
+    _previous_levels.clear()
+
+def _save_level(name: str):
+    _previous_levels.setdefault(name, logging.getLogger(name).level)
+
+def _qualified_name(name: str) -> str:
+    if name == LOGGER_NAME or name.startswith(LOGGER_NAME + "."):
+        return name
+    return f"{LOGGER_NAME}.{name}"
@@ -6,6 +6,11 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+from alpheast.models.price_bar import PriceBar
+from alpheast.shared.trade_analytics import calculate_round_trips, calculate_trade_metrics
+
+
+logger = logging.getLogger(__name__)
 
 TRADING_DAYS_PER_YEAR = 252
 
@@ -13,7 +18,9 @@ def calculate_performance_metrics(
     daily_values: List[Dict[str, Any]],
     trade_log: List[Dict[str, Any]],
     risk_free_rate: float = 0.0,
-    benchmark_daily_values: Optional[List[Dict[str, Any]]] = None
+    benchmark_daily_values: Optional[List[Dict[str, Any]]] = None,
+    price_bar_data: Optional[Dict[str, List[PriceBar]]] = None,
+    round_trips: Optional[Dict[str, np.ndarray]] = None
 ) -> Dict[str, Any]:
     """
     Calculates a set of common backtesting performance metrics for the strategy
@@ -26,6 +33,8 @@ def calculate_performance_metrics(
         risk_free_rate: Annual risk-free rate for Sharpe Ratio calculation.
         benchmark_daily_values: Optional list of dictionaries for benchmark equity.
                                 Each dict should have "date" and "value".
+        price_bar_data: Optional price bars per symbol, used for the MAE/MFE of round trips.
+        round_trips: Optional round trips from calculate_round_trips(), reconstructed from the trade log if not given.
 
     Returns:
         A dictionary containing various performance metrics, potentially nested for strategy and benchmark.
@@ -34,7 +43,7 @@ def calculate_performance_metrics(
 
     # --- Process Strategy Performance ---
     if not daily_values:
-        logging.error("No daily values provided for strategy performance calculation.")
+        logger.error("No daily values provided for strategy performance calculation.")
         results["strategy"] = {"error": "No daily values to calculate metrics."}
     else:
         df_strategy = pd.DataFrame(daily_values)
@@ -43,17 +52,20 @@ def calculate_performance_metrics(
         df_strategy = df_strategy.sort_index() # Ensure chronological order
 
         if df_strategy.empty:
-            logging.warning("Strategy DataFrame is empty after processing. Cannot calculate metrics.")
+            logger.warning("Strategy DataFrame is empty after processing. Cannot calculate metrics.")
             results["strategy"] = {"error": "Not enough data to calculate daily returns or metrics for strategy."}
         else:
             strategy_metrics = _calculate_single_equity_metrics(df_strategy, trade_log, risk_free_rate)
             strategy_metrics["total_trades"] = len(trade_log) 
+            if round_trips is None:
+                round_trips = calculate_round_trips(trade_log, price_bar_data)
+            strategy_metrics.update(calculate_trade_metrics(round_trips))
             results["strategy"] = strategy_metrics
 
     # --- Process Benchmark Performance (if provided) ---
     if benchmark_daily_values:
         if not benchmark_daily_values:
-            logging.warning("Benchmark daily values list is empty, skipping benchmark metrics.")
+            logger.warning("Benchmark daily values list is empty, skipping benchmark metrics.")
         else:
             df_benchmark = pd.DataFrame(benchmark_daily_values)
             df_benchmark["date"] = pd.to_datetime(df_benchmark["date"])
@@ -61,7 +73,7 @@ def calculate_performance_metrics(
             df_benchmark = df_benchmark.sort_index()
 
             if df_benchmark.empty:
-                logging.warning("Benchmark DataFrame is empty after processing. Cannot calculate metrics.")
+                logger.warning("Benchmark DataFrame is empty after processing. Cannot calculate metrics.")
             else:
                 benchmark_metrics = _calculate_single_equity_metrics(df_benchmark, [], risk_free_rate)
                 benchmark_metrics["total_trades"] = "N/A"
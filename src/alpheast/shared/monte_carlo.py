@@ -0,0 +1,194 @@
+from decimal import Decimal
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from alpheast.shared.metrics import TRADING_DAYS_PER_YEAR
+from alpheast.shared.trade_analytics import calculate_round_trips
+
+
+logger = logging.getLogger(__name__)
+
+MONTE_CARLO_FIELDS = ["sharpe_ratio", "max_drawdown", "terminal_wealth"]
+
+def stationary_bootstrap_indices(
+    num_days: int,
+    num_resamples: int,
+    mean_block_length: float,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Index matrix of the stationary bootstrap (Politis & Romano): every resample is a chain of blocks with
+    geometrically distributed lengths (mean `mean_block_length`) starting at uniform random days, wrapping around.
+
+    Returns:
+        An int array of shape (num_resamples, num_days).
+    """
+    if mean_block_length < 1:
+        raise ValueError("Mean block length must be at least 1.")
+
+    positions = np.arange(num_days)
+    new_block = rng.random((num_resamples, num_days)) < 1.0 / mean_block_length
+    new_block[:, 0] = True
+    # Position of the block each day belongs to, and that block's random start day
+    block_position = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    block_start = np.take_along_axis(rng.integers(0, num_days, (num_resamples, num_days)), block_position, axis=1)
+    return (block_start + positions - block_position) % num_days
+
+def bootstrap_daily_returns(
+    daily_values: List[Dict[str, Any]],
+    num_resamples: int = 10_000,
+    mean_block_length: Optional[float] = None,
+    risk_free_rate: float = 0.0,
+    chunk_size: int = 1_000,
+    seed: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Distributions of Sharpe ratio, max drawdown and terminal wealth under a stationary block bootstrap
+    of the daily returns, which keeps short-range autocorrelation and volatility clustering.
+
+    Resamples are evaluated as (resamples x days) matrices, `chunk_size` resamples at a time, so memory
+    stays at O(chunk_size * days). Sharpe ratio and max drawdown are computed like in `calculate_performance_metrics`
+    (compounded annual return over annualized volatility), as fractions rather than rounded percentages.
+
+    Args:
+        daily_values: List of dictionaries from PortfolioManager.get_daily_values().
+                      Each dict should have "date" and "value".
+        num_resamples: Number of resampled return paths.
+        mean_block_length: Mean block length in days (the cube root of the number of returns if None).
+        risk_free_rate: Annual risk-free rate for the Sharpe Ratio calculation.
+        chunk_size: Number of resamples evaluated at once.
+        seed: Seed of the random generator, for reproducible distributions.
+
+    Returns:
+        One array of `num_resamples` values per field of MONTE_CARLO_FIELDS.
+    """
+    values = np.array([float(dv["value"]) if isinstance(dv["value"], Decimal) else dv["value"] for dv in daily_values], dtype=np.float64)
+    if len(values) < 3 or values[0] <= 0:
+        logger.warning("Not enough daily values for a return bootstrap.")
+        return {field: np.full(num_resamples, np.nan) for field in MONTE_CARLO_FIELDS}
+
+    returns = values[1:] / values[:-1] - 1.0
+    if mean_block_length is None:
+        mean_block_length = max(len(returns) ** (1 / 3), 1.0)
+
+    rng = np.random.default_rng(seed)
+    return _evaluate_in_chunks(
+        lambda size: returns[stationary_bootstrap_indices(len(returns), size, mean_block_length, rng)],
+        num_resamples,
+        chunk_size,
+        lambda resampled: _return_path_metrics(resampled, values[0], risk_free_rate)
+    )
+
+def resample_trades(
+    trade_log: List[Dict[str, Any]],
+    initial_cash: float,
+    num_resamples: int = 10_000,
+    replace: bool = False,
+    round_trips: Optional[Dict[str, np.ndarray]] = None,
+    chunk_size: int = 1_000,
+    seed: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Distributions of Sharpe ratio, max drawdown and terminal wealth over reorderings of the round trips.
+
+    Shuffling (the default) keeps the set of trades, so terminal wealth and Sharpe ratio are fixed and the
+    drawdown distribution shows the sequence risk; with `replace` the trades are bootstrapped and all three vary.
+    Each path is the account value after every trade, `initial_cash` plus the cumulative round trip P&L.
+    The Sharpe ratio here is per trade (mean over standard deviation of the round trip returns), not annualized.
+
+    Args:
+        trade_log: List of fills from PortfolioManager.get_trade_log().
+        initial_cash: Account value before the first trade.
+        num_resamples: Number of resampled trade sequences.
+        replace: Whether to draw trades with replacement instead of permuting them.
+        round_trips: Round trips from calculate_round_trips(), reconstructed from the trade log if not given.
+        chunk_size: Number of resamples evaluated at once.
+        seed: Seed of the random generator, for reproducible distributions.
+
+    Returns:
+        One array of `num_resamples` values per field of MONTE_CARLO_FIELDS.
+    """
+    if round_trips is None:
+        round_trips = calculate_round_trips(trade_log)
+    pnl = np.asarray(round_trips["pnl"], dtype=np.float64)
+    trade_returns = np.asarray(round_trips["return"], dtype=np.float64)
+    if len(pnl) < 2:
+        logger.warning("Not enough round trips for a trade resampling.")
+        return {field: np.full(num_resamples, np.nan) for field in MONTE_CARLO_FIELDS}
+
+    rng = np.random.default_rng(seed)
+
+    def draw(size: int) -> np.ndarray:
+        if replace:
+            return rng.integers(0, len(pnl), (size, len(pnl)))
+        return rng.permuted(np.broadcast_to(np.arange(len(pnl)), (size, len(pnl))), axis=1)
+
+    return _evaluate_in_chunks(
+        draw,
+        num_resamples,
+        chunk_size,
+        lambda indices: _trade_path_metrics(pnl[indices], trade_returns[indices], float(initial_cash))
+    )
+
+def summarize_distribution(samples: Dict[str, np.ndarray], percentiles: Sequence[float] = (5, 50, 95)) -> Dict[str, Dict[str, float]]:
+    """
+    Mean, standard deviation and percentiles of every resampled metric, ignoring NaN resamples.
+    """
+    summary = {}
+    for field, values in samples.items():
+        finite = values[np.isfinite(values)]
+        if len(finite) == 0:
+            summary[field] = {"mean": np.nan, "std": np.nan, **{f"p{q:g}": np.nan for q in percentiles}}
+            continue
+        summary[field] = {
+            "mean": float(finite.mean()),
+            "std": float(finite.std(ddof=1)) if len(finite) > 1 else 0.0,
+            **{f"p{q:g}": float(value) for q, value in zip(percentiles, np.percentile(finite, percentiles))},
+        }
+    return summary
+
+def _evaluate_in_chunks(draw, num_resamples: int, chunk_size: int, evaluate) -> Dict[str, np.ndarray]:
+    if num_resamples < 1 or chunk_size < 1:
+        raise ValueError("Number of resamples and chunk size must be at least 1.")
+
+    samples = {field: np.empty(num_resamples) for field in MONTE_CARLO_FIELDS}
+    for start in range(0, num_resamples, chunk_size):
+        end = min(start + chunk_size, num_resamples)
+        for field, values in evaluate(draw(end - start)).items():
+            samples[field][start:end] = values
+    return samples
+
+def _return_path_metrics(returns: np.ndarray, initial_value: float, risk_free_rate: float) -> Dict[str, np.ndarray]:
+    """
+    Metrics of a (resamples x days) return matrix. As in `calculate_performance_metrics`, the drawdown
+    is measured from the value after the first return onwards.
+    """
+    growth = np.cumprod(1.0 + returns, axis=1)
+    num_days = returns.shape[1]
+
+    with np.errstate(invalid="ignore"):
+        annualized_return = np.where(growth[:, -1] >= 0, growth[:, -1] ** (TRADING_DAYS_PER_YEAR / num_days) - 1.0, 0.0)
+    annualized_volatility = returns.std(axis=1, ddof=1) * np.sqrt(TRADING_DAYS_PER_YEAR)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = np.where(annualized_volatility != 0, (annualized_return - risk_free_rate) / annualized_volatility, np.nan)
+
+    peak = np.maximum.accumulate(growth, axis=1)
+    return {
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown": ((growth - peak) / peak).min(axis=1),
+        "terminal_wealth": initial_value * growth[:, -1],
+    }
+
+def _trade_path_metrics(pnl: np.ndarray, trade_returns: np.ndarray, initial_cash: float) -> Dict[str, np.ndarray]:
+    wealth = initial_cash + np.cumsum(pnl, axis=1)
+    peak = np.maximum(np.maximum.accumulate(wealth, axis=1), initial_cash)
+    std = trade_returns.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = np.where(std != 0, trade_returns.mean(axis=1) / std, np.nan)
+    return {
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown": np.minimum(((wealth - peak) / peak).min(axis=1), 0.0),
+        "terminal_wealth": wealth[:, -1],
+    }
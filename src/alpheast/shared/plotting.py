@@ -7,13 +7,15 @@ from matplotlib import pyplot as plt
 import pandas as pd
 
 
+logger = logging.getLogger(__name__)
+
 class PerformancePlotter:
     """
     A class for visualizing backtesting performance metrics
     """
     def __init__(self):
         if plt is None:
-            logging.error("Matplotlib is not available")
+            logger.error("Matplotlib is not available")
             self.plotting_enabled = False
         else:
             plt.style.use('seaborn-v0_8-darkgrid') 
@@ -28,7 +30,7 @@ class PerformancePlotter:
         if not self.plotting_enabled:
             return
         if not daily_values:
-            logging.warning(f"Cannot plot equity curve: No daily values provided for '{title}'.")
+            logger.warning("Cannot plot equity curve: No daily values provided for '%s'.", title)
             return
         
         df_strategy = pd.DataFrame(daily_values)
@@ -46,7 +48,7 @@ class PerformancePlotter:
         # Plot Benchmark Equity Curve if provided
         if benchmark_daily_values:
             if not benchmark_daily_values:
-                logging.warning(f"Benchmark daily values list is empty, skipping benchmark plot for '{title}'.")
+                logger.warning("Benchmark daily values list is empty, skipping benchmark plot for '%s'.", title)
             else:
                 df_benchmark = pd.DataFrame(benchmark_daily_values)
                 df_benchmark["date"] = pd.to_datetime(df_benchmark["date"])
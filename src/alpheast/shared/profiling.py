@@ -0,0 +1,132 @@
+from array import array
+from dataclasses import dataclass, field
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+PROFILE_PERCENTILES = (50, 90, 99)
+
+@dataclass
+class ProfilingReport:
+    """
+    Per-component latencies of one backtest, from the engine's opt-in profiling mode.
+
+    Attributes:
+        components: (component, event type) -> calls, total seconds and latency percentiles in microseconds.
+        event_counts: Events dispatched per event type.
+        queue_depth: Statistics of the event queue depth seen before every dispatch.
+        wall_time_seconds: Time between the first and the last recorded call.
+    """
+    components: Dict[Tuple[str, str], Dict[str, float]] = field(default_factory=dict)
+    event_counts: Dict[str, int] = field(default_factory=dict)
+    queue_depth: Dict[str, float] = field(default_factory=dict)
+    wall_time_seconds: float = 0.0
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        One row per (component, event type), slowest in total first.
+        """
+        if not self.components:
+            return pd.DataFrame()
+        frame = pd.DataFrame.from_dict(self.components, orient="index")
+        frame.index = pd.MultiIndex.from_tuples(frame.index, names=["component", "event_type"])
+        return frame.sort_values("total_seconds", ascending=False)
+
+    def print_summary(self, limit: int = 20):
+        """Prints the components that took the most time."""
+        print("\n--- Profiling Report ---")
+        print(f"Profiled Time: {self.wall_time_seconds:.4f} s")
+        print(f"Events: {self.event_counts}")
+        print(f"Queue Depth: {self.queue_depth}")
+        frame = self.to_frame()
+        if not frame.empty:
+            print(frame.head(limit).to_string(float_format=lambda value: f"{value:.2f}"))
+        print("------------------------")
+
+class EngineProfiler:
+    """
+    Collects the latency of every handler call of the BacktestingEngine, keyed by component and event type.
+    Samples are kept as raw nanosecond durations in compact arrays, so percentiles are exact.
+    """
+    def __init__(self):
+        self._durations: Dict[Tuple[str, str], array] = {}
+        self._event_counts: Dict[str, int] = {}
+        self._queue_depths = array("q")
+        self._first_start = None
+        self._last_end = None
+
+    def call(self, component: str, event_type: str, handler: Callable, *args: Any) -> Any:
+        """
+        Calls `handler(*args)` and records its duration under (component, event type).
+        """
+        start = time.perf_counter_ns()
+        try:
+            return handler(*args)
+        finally:
+            end = time.perf_counter_ns()
+            durations = self._durations.get((component, event_type))
+            if durations is None:
+                durations = self._durations[(component, event_type)] = array("q")
+            durations.append(end - start)
+            if self._first_start is None:
+                self._first_start = start
+            self._last_end = end
+
+    def record_event(self, event_type: str, queue_depth: int):
+        self._event_counts[event_type] = self._event_counts.get(event_type, 0) + 1
+        self._queue_depths.append(queue_depth)
+
+    def report(self) -> ProfilingReport:
+        components = {}
+        for key, durations in self._durations.items():
+            samples = np.frombuffer(durations, dtype=np.int64) / 1e3 # Microseconds
+            percentiles = np.percentile(samples, PROFILE_PERCENTILES)
+            components[key] = {
+                "calls": int(len(samples)),
+                "total_seconds": float(samples.sum() / 1e6),
+                "mean_us": float(samples.mean()),
+                **{f"p{q}_us": float(value) for q, value in zip(PROFILE_PERCENTILES, percentiles)},
+                "max_us": float(samples.max()),
+            }
+
+        queue_depth = {}
+        if self._queue_depths:
+            depths = np.frombuffer(self._queue_depths, dtype=np.int64)
+            queue_depth = {
+                "mean": float(depths.mean()),
+                "p99": float(np.percentile(depths, 99)),
+                "max": int(depths.max()),
+            }
+
+        wall_time = (self._last_end - self._first_start) / 1e9 if self._first_start is not None else 0.0
+        return ProfilingReport(
+            components=components,
+            event_counts=dict(self._event_counts),
+            queue_depth=queue_depth,
+            wall_time_seconds=wall_time
+        )
+
+    def reset(self):
+        self._durations.clear()
+        self._event_counts.clear()
+        self._queue_depths = array("q")
+        self._first_start = None
+        self._last_end = None
+
+def component_names(components: List[Any]) -> List[str]:
+    """
+    Readable, unique names for profiled components: the class name, with the symbol for strategies,
+    and a running number when the same name occurs more than once.
+    """
+    names = []
+    seen: Dict[str, int] = {}
+    for component in components:
+        symbol = getattr(component, "symbol", None)
+        name = f"{type(component).__name__}({symbol})" if symbol else type(component).__name__
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names.append(name if count == 0 else f"{name}#{count + 1}")
+    return names
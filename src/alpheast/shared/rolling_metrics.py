@@ -0,0 +1,186 @@
+
+from decimal import Decimal
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from alpheast.shared.metrics import TRADING_DAYS_PER_YEAR
+
+
+logger = logging.getLogger(__name__)
+
+def calculate_rolling_metrics(
+    daily_values: List[Dict[str, Any]],
+    window: int,
+    benchmark_daily_values: Optional[List[Dict[str, Any]]] = None,
+    risk_free_rate: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Calculates rolling Sharpe ratio, volatility, drawdown and beta to the benchmark
+    over a window of `window` daily values, in O(n) using running sums.
+
+    Args:
+        daily_values: List of dictionaries from PortfolioManager.get_daily_values().
+                      Each dict should have "date" and "value".
+        window: Number of daily values in each rolling window (must be at least 3, so that it
+                spans the 2 returns a sample standard deviation needs).
+        benchmark_daily_values: Optional list of dictionaries for benchmark equity,
+                                needed for the rolling beta.
+        risk_free_rate: Annual risk-free rate for the Sharpe Ratio calculation.
+
+    Returns:
+        A dictionary with the "dates" of the equity curve and one NumPy array per metric,
+        aligned to those dates. Entries without a full window are NaN.
+        Volatility and Sharpe ratio are annualized; drawdown and volatility are fractions.
+    """
+    if window < 3:
+        raise ValueError("Rolling window must be at least 3.")
+
+    dates = [dv["date"] for dv in daily_values]
+    values = _to_float_array(daily_values)
+    n = len(values)
+
+    nan_series = np.full(n, np.nan)
+    results: Dict[str, Any] = {
+        "window": window,
+        "dates": dates,
+        "volatility": nan_series.copy(),
+        "sharpe_ratio": nan_series.copy(),
+        "drawdown": nan_series.copy(),
+        "beta": nan_series.copy(),
+    }
+    if n == 0:
+        logger.warning("No daily values provided for rolling metrics calculation.")
+        return results
+
+    results["drawdown"] = _rolling_drawdown(values, window)
+
+    # A window of `window` values spans `window - 1` returns
+    returns = _simple_returns(values)
+    return_window = window - 1
+    if return_window < 2 or len(returns) < return_window:
+        return results
+
+    mean, variance = _rolling_mean_and_variance(returns, return_window)
+    std = np.sqrt(variance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (mean - risk_free_rate / TRADING_DAYS_PER_YEAR) / std * np.sqrt(TRADING_DAYS_PER_YEAR)
+    sharpe[~np.isfinite(sharpe)] = np.nan
+
+    results["volatility"][1:] = std * np.sqrt(TRADING_DAYS_PER_YEAR)
+    results["sharpe_ratio"][1:] = sharpe
+
+    if benchmark_daily_values:
+        benchmark_values = _align_benchmark_values(dates, benchmark_daily_values)
+        benchmark_returns = _simple_returns(benchmark_values)
+        results["beta"][1:] = _rolling_beta(returns, benchmark_returns, return_window)
+
+    return results
+
+def _to_float_array(daily_values: List[Dict[str, Any]]) -> np.ndarray:
+    return np.fromiter(
+        (float(dv["value"]) if isinstance(dv["value"], Decimal) else dv["value"] for dv in daily_values),
+        dtype=np.float64,
+        count=len(daily_values)
+    )
+
+def _align_benchmark_values(dates: List[Any], benchmark_daily_values: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Returns benchmark values aligned to the strategy dates (NaN where the benchmark has no value).
+    Both series are normally recorded on the same daily updates, so the fast path is a direct conversion.
+    """
+    if len(benchmark_daily_values) == len(dates) and all(
+        bv["date"] == d for bv, d in zip(benchmark_daily_values, dates)
+    ):
+        return _to_float_array(benchmark_daily_values)
+
+    value_by_date = {bv["date"]: float(bv["value"]) for bv in benchmark_daily_values}
+    return np.array([value_by_date.get(d, np.nan) for d in dates], dtype=np.float64)
+
+def _simple_returns(values: np.ndarray) -> np.ndarray:
+    previous = values[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(previous > 0, values[1:] / previous - 1.0, np.nan)
+    return returns
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sum via a cumulative (running) sum: O(n).
+    The result is aligned to the last element of each window, NaN before the first full window.
+    """
+    out = np.full(len(x), np.nan)
+    if len(x) < window:
+        return out
+    cumulative = np.concatenate(([0.0], np.cumsum(x)))
+    out[window - 1:] = cumulative[window:] - cumulative[:-window]
+    return out
+
+def _rolling_mean_and_variance(x: np.ndarray, window: int):
+    """
+    Rolling mean and sample variance (ddof=1) from running sums of x and x^2.
+    The series is centered first to limit cancellation in the sum of squares.
+    """
+    valid = np.isfinite(x)
+    center = x[valid].mean() if valid.any() else 0.0
+    centered = np.where(valid, x - center, 0.0)
+
+    count = _rolling_sum(valid.astype(np.float64), window)
+    s1 = _rolling_sum(centered, window)
+    s2 = _rolling_sum(centered * centered, window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = s1 / count
+        variance = (s2 - s1 * mean) / (count - 1)
+    incomplete = count < window
+    mean[incomplete] = np.nan
+    variance[incomplete] = np.nan
+    return mean + center, np.maximum(variance, 0.0)
+
+def _rolling_beta(returns: np.ndarray, benchmark_returns: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling beta = cov(strategy, benchmark) / var(benchmark), from running sums of the
+    centered returns and their cross products.
+    """
+    valid = np.isfinite(returns) & np.isfinite(benchmark_returns)
+    x = np.where(valid, returns - (returns[valid].mean() if valid.any() else 0.0), 0.0)
+    y = np.where(valid, benchmark_returns - (benchmark_returns[valid].mean() if valid.any() else 0.0), 0.0)
+
+    count = _rolling_sum(valid.astype(np.float64), window)
+    sx = _rolling_sum(x, window)
+    sy = _rolling_sum(y, window)
+    sxy = _rolling_sum(x * y, window)
+    syy = _rolling_sum(y * y, window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = sxy - sx * sy / count
+        benchmark_variance = syy - sy * sy / count
+        beta = covariance / benchmark_variance
+    beta[(count < window) | ~np.isfinite(beta) | (benchmark_variance <= 0)] = np.nan
+    return beta
+
+def _rolling_drawdown(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Drawdown of each value from the peak of its trailing window.
+    The rolling max uses the van Herk/Gil-Werman block scheme: O(n) regardless of the window size.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+
+    num_blocks = -(-n // window)
+    padded = np.full(num_blocks * window, -np.inf)
+    padded[:n] = values
+    blocks = padded.reshape(num_blocks, window)
+
+    prefix_max = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix_max = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    ends = np.arange(window - 1, n)
+    starts = ends - window + 1
+    rolling_peak = np.maximum(suffix_max[starts], prefix_max[ends])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[window - 1:] = np.where(rolling_peak > 0, values[window - 1:] / rolling_peak - 1.0, np.nan)
+    return out
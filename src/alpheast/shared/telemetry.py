@@ -0,0 +1,203 @@
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from alpheast.config.telemetry_config import TelemetryConfig
+
+
+logger = logging.getLogger(__name__)
+
+# Name -> (type, help) of every exported metric
+TELEMETRY_METRICS = {
+    "alpheast_events_total": ("counter", "Events put on the event queue, by type."),
+    "alpheast_events_processed_total": ("counter", "Events taken off the event queue."),
+    "alpheast_events_per_second": ("gauge", "Events processed per wall clock second since the previous sample."),
+    "alpheast_event_queue_depth": ("gauge", "Events waiting in the event queue."),
+    "alpheast_open_orders": ("gauge", "Orders waiting for a fill in the execution handler."),
+    "alpheast_pending_orders": ("gauge", "Orders sent by the portfolio manager and not filled yet."),
+    "alpheast_simulated_time_seconds": ("gauge", "Unix time of the latest market event."),
+    "alpheast_wall_time_seconds": ("gauge", "Unix time of the sample."),
+    "alpheast_lag_seconds": ("gauge", "Wall time minus simulated time."),
+    "alpheast_simulation_speed": ("gauge", "Simulated seconds per wall clock second since the previous sample."),
+    "alpheast_uptime_seconds": ("gauge", "Wall clock seconds since telemetry started."),
+}
+
+class TelemetryExporter:
+    """
+    Samples an event loop from a background thread and publishes the metrics in Prometheus text format.
+
+    `snapshot` is called on the sampling thread and must only read cheap counters (see
+    `BacktestingEngine.get_telemetry_snapshot`), so the event loop never waits for the exporter:
+    it only bumps the counters, and rendering and I/O happen on the exporter's threads.
+    Rates are computed here from the difference between two samples.
+    """
+    def __init__(self, config: TelemetryConfig, snapshot: Callable[[], Dict[str, Any]]):
+        self.config = config
+        self.snapshot = snapshot
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+        self._text = ""
+        self._started_at = 0.0
+        self._previous: Optional[Tuple[float, int, Optional[float]]] = None
+
+    @property
+    def http_port(self) -> Optional[int]:
+        return self._server.server_address[1] if self._server is not None else None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._started_at = time.time()
+        self._previous = None
+
+        if self.config.http_port is not None:
+            self._server = ThreadingHTTPServer((self.config.http_host, self.config.http_port), _handler_for(self))
+            self._server_thread = threading.Thread(target=self._server.serve_forever, name="alpheast-telemetry-http", daemon=True)
+            self._server_thread.start()
+            logger.info("Serving telemetry on http://%s:%s/metrics", self.config.http_host, self.http_port)
+
+        self._thread = threading.Thread(target=self._run, name="alpheast-telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops sampling after publishing one last sample, and shuts the HTTP endpoint down.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server_thread.join()
+            self._server = None
+            self._server_thread = None
+
+    def render(self) -> str:
+        """The latest published sample."""
+        return self._text
+
+    def _run(self):
+        self._publish()
+        while not self._stop.wait(self.config.interval_seconds):
+            self._publish()
+        self._publish()
+
+    def _publish(self):
+        try:
+            self._text = format_prometheus(self._sample(), self.config.labels)
+            if self.config.file_path is not None:
+                _write_atomically(self.config.file_path, self._text)
+        except Exception as e:
+            # Telemetry must never take the backtest down
+            logger.warning("Failed to publish telemetry: %s", e)
+
+    def _sample(self) -> Dict[str, Any]:
+        snapshot = self.snapshot()
+        now = time.time()
+        processed = snapshot["events_processed"]
+        simulated = _to_unix_seconds(snapshot["simulated_time"])
+
+        events_per_second, simulation_speed = 0.0, 0.0
+        if self._previous is not None:
+            previous_time, previous_processed, previous_simulated = self._previous
+            elapsed = now - previous_time
+            if elapsed > 0:
+                events_per_second = (processed - previous_processed) / elapsed
+                if simulated is not None and previous_simulated is not None:
+                    simulation_speed = (simulated - previous_simulated) / elapsed
+        self._previous = (now, processed, simulated)
+
+        metrics = {
+            "alpheast_events_total": [({"type": event_type}, count) for event_type, count in sorted(snapshot["event_counts"].items())],
+            "alpheast_events_processed_total": processed,
+            "alpheast_events_per_second": events_per_second,
+            "alpheast_event_queue_depth": snapshot["queue_depth"],
+            "alpheast_open_orders": snapshot["open_orders"],
+            "alpheast_pending_orders": snapshot["pending_orders"],
+            "alpheast_wall_time_seconds": now,
+            "alpheast_simulation_speed": simulation_speed,
+            "alpheast_uptime_seconds": now - self._started_at,
+        }
+        if simulated is not None:
+            metrics["alpheast_simulated_time_seconds"] = simulated
+            metrics["alpheast_lag_seconds"] = now - simulated
+        return metrics
+
+def format_prometheus(metrics: Dict[str, Any], labels: Optional[Dict[str, str]] = None) -> str:
+    """
+    Renders metrics in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        metrics: Metric name -> value, or a list of (labels, value) samples.
+        labels: Constant labels added to every sample.
+
+    Returns:
+        The exposition text, with HELP and TYPE lines for the metrics of TELEMETRY_METRICS.
+    """
+    lines = []
+    for name, value in metrics.items():
+        metric_type, help_text = TELEMETRY_METRICS.get(name, ("untyped", ""))
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        samples: List[Tuple[Dict[str, str], Any]] = value if isinstance(value, list) else [({}, value)]
+        for sample_labels, sample_value in samples:
+            lines.append(f"{name}{_format_labels({**(labels or {}), **sample_labels})} {float(sample_value)!r}")
+    return "\n".join(lines) + "\n"
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _to_unix_seconds(timestamp: Optional[datetime]) -> Optional[float]:
+    """
+    Naive bar timestamps are taken as UTC.
+    """
+    if timestamp is None:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+def _write_atomically(path: str, text: str):
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as f:
+        f.write(text)
+    os.replace(temporary_path, path)
+
+def _handler_for(exporter: TelemetryExporter):
+    class TelemetryRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = exporter.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("Telemetry request: %s", format % args)
+
+    return TelemetryRequestHandler
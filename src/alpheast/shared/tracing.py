@@ -0,0 +1,116 @@
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from alpheast.config.trace_config import TraceConfig
+
+
+logger = logging.getLogger(__name__)
+
+TRACE_PROCESS_ID = 1
+TRACE_THREAD_ID = 1
+
+class EventTracer:
+    """
+    Records nested spans of sampled timestamps and writes them as Chrome trace events.
+    Outside sampled timestamps `call` only checks a flag, so the overhead is bounded by `sample_every`.
+    """
+    def __init__(self, config: TraceConfig):
+        self.config = config
+        self._spans: List[Tuple[str, str, int, int, Optional[Dict[str, Any]]]] = []
+        self._timestamp_count = 0
+        self._sampled_count = 0
+        self._sampling = False
+        self._in_timestamp = False
+        self._timestamp_start = 0
+
+    @property
+    def in_timestamp(self) -> bool:
+        return self._in_timestamp
+
+    def begin_timestamp(self):
+        """
+        Opens the span of the next timestamp and decides whether it is sampled.
+        """
+        sampled = self._timestamp_count % self.config.sample_every == 0 and (
+            self.config.max_timestamps is None or self._sampled_count < self.config.max_timestamps
+        )
+        self._timestamp_count += 1
+        self._sampled_count += sampled
+        self._sampling = sampled
+        self._in_timestamp = True
+        self._timestamp_start = time.perf_counter_ns()
+
+    def end_timestamp(self, timestamp: Any = None):
+        if self._sampling:
+            end = time.perf_counter_ns()
+            self._spans.append(("timestamp", "timestamp", self._timestamp_start, end - self._timestamp_start, {"timestamp": str(timestamp)}))
+        self._sampling = False
+        self._in_timestamp = False
+
+    def call(self, name: str, category: str, handler: Callable, *args: Any) -> Any:
+        """
+        Calls `handler(*args)`, recorded as a span if the current timestamp is sampled.
+        """
+        if not self._sampling:
+            return handler(*args)
+        start = time.perf_counter_ns()
+        try:
+            return handler(*args)
+        finally:
+            self._spans.append((name, category, start, time.perf_counter_ns() - start, None))
+
+    def to_trace_events(self) -> Dict[str, Any]:
+        """
+        The spans as a Chrome trace event document ("X" complete events, microseconds from the first span).
+        """
+        origin = min((start for _, _, start, _, _ in self._spans), default=0)
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": TRACE_PROCESS_ID, "tid": TRACE_THREAD_ID, "args": {"name": "alpheast"}},
+            {"name": "thread_name", "ph": "M", "pid": TRACE_PROCESS_ID, "tid": TRACE_THREAD_ID, "args": {"name": "event loop"}},
+        ]
+        for name, category, start, duration, args in self._spans:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - origin) / 1e3,
+                "dur": duration / 1e3,
+                "pid": TRACE_PROCESS_ID,
+                "tid": TRACE_THREAD_ID,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "timestamps": self._timestamp_count,
+                "sampled_timestamps": self._sampled_count,
+                "sample_every": self.config.sample_every,
+            },
+        }
+
+    def write(self) -> str:
+        """
+        Writes the trace to the configured file and returns its path.
+        """
+        path = self.config.file_path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "wt") as f:
+            json.dump(self.to_trace_events(), f)
+        logger.info("Wrote trace of %s of %s timestamps (%s spans) to %s", self._sampled_count, self._timestamp_count, len(self._spans), path)
+        return path
+
+    def reset(self):
+        self._spans = []
+        self._timestamp_count = 0
+        self._sampled_count = 0
+        self._sampling = False
+        self._in_timestamp = False
@@ -0,0 +1,274 @@
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from alpheast.models.price_bar import PriceBar
+from alpheast.models.signal import Signal
+
+
+logger = logging.getLogger(__name__)
+
+ROUND_TRIP_FIELDS = [
+    "symbol", "direction", "quantity", "entry_time", "exit_time", "entry_price", "exit_price",
+    "commission", "pnl", "return", "holding_period_days", "mae", "mfe"
+]
+
+def calculate_round_trips(
+    trade_log: List[Dict[str, Any]],
+    price_bar_data: Optional[Dict[str, List[PriceBar]]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Reconstructs round trips from a flat list of fills by FIFO lot matching per symbol.
+
+    FIFO matching pairs the k-th unit bought with the k-th unit sold of the same symbol,
+    so every round trip is the overlap of one BUY fill's and one SELL fill's cumulative quantity range.
+    The overlaps are found with array sorting and searching only, which scales to millions of fills.
+    Round trips whose SELL comes first are short round trips.
+
+    Args:
+        trade_log: List of fills from PortfolioManager.get_trade_log().
+        price_bar_data: Optional price bars per symbol, used for the maximum adverse / favorable excursion (MAE/MFE).
+
+    Returns:
+        A columnar dictionary (field -> NumPy array) with one entry per round trip, ordered by symbol and exit.
+        "direction" is 1 for long and -1 for short round trips; "return", "mae" and "mfe" are fractions of the entry price.
+    """
+    fills = _fills_to_arrays(trade_log)
+    if fills is None:
+        return _empty_round_trips()
+
+    symbols, symbol_codes = fills["symbols"], fills["symbol_codes"]
+    is_buy = fills["is_buy"]
+    quantity = fills["quantity"]
+
+    # Order fills by symbol, keeping the log's (chronological) order within each symbol
+    order = np.lexsort((np.arange(len(quantity)), symbol_codes))
+    buy_index = order[is_buy[order]]
+    sell_index = order[~is_buy[order]]
+
+    # Lay the symbols out on disjoint segments of one quantity axis so all symbols are matched in one pass
+    num_symbols = len(symbols)
+    buy_totals = np.bincount(symbol_codes[buy_index], weights=quantity[buy_index], minlength=num_symbols)
+    sell_totals = np.bincount(symbol_codes[sell_index], weights=quantity[sell_index], minlength=num_symbols)
+    symbol_base = np.concatenate(([0.0], np.cumsum(np.maximum(buy_totals, sell_totals))[:-1]))
+
+    buy_start, buy_end = _cumulative_ranges(buy_index, symbol_codes, quantity, symbol_base)
+    sell_start, sell_end = _cumulative_ranges(sell_index, symbol_codes, quantity, symbol_base)
+    if len(buy_end) == 0 or len(sell_end) == 0:
+        return _empty_round_trips()
+
+    points = np.unique(np.concatenate((buy_start, buy_end, sell_start, sell_end)))
+    segment_low, segment_high = points[:-1], points[1:]
+    midpoints = (segment_low + segment_high) / 2
+
+    buy_position = np.minimum(np.searchsorted(buy_end, midpoints, side="right"), len(buy_end) - 1)
+    sell_position = np.minimum(np.searchsorted(sell_end, midpoints, side="right"), len(sell_end) - 1)
+    matched = (
+        (buy_start[buy_position] <= midpoints) & (midpoints < buy_end[buy_position]) &
+        (sell_start[sell_position] <= midpoints) & (midpoints < sell_end[sell_position])
+    )
+
+    matched_quantity = (segment_high - segment_low)[matched]
+    buy_fill = buy_index[buy_position[matched]]
+    sell_fill = sell_index[sell_position[matched]]
+
+    timestamps, price, commission = fills["timestamps"], fills["price"], fills["commission"]
+    is_long = (timestamps[buy_fill] < timestamps[sell_fill]) | (
+        (timestamps[buy_fill] == timestamps[sell_fill]) & (buy_fill < sell_fill)
+    )
+    entry_fill = np.where(is_long, buy_fill, sell_fill)
+    exit_fill = np.where(is_long, sell_fill, buy_fill)
+
+    # Commissions are attributed pro rata to the matched quantity of each fill
+    commission_per_unit = np.divide(commission, quantity, out=np.zeros_like(commission), where=quantity > 0)
+    trip_commission = matched_quantity * (commission_per_unit[buy_fill] + commission_per_unit[sell_fill])
+
+    entry_price = price[entry_fill]
+    exit_price = price[exit_fill]
+    direction = np.where(is_long, 1, -1)
+    gross_pnl = direction * (exit_price - entry_price) * matched_quantity
+    pnl = gross_pnl - trip_commission
+    cost = entry_price * matched_quantity
+    trip_return = np.divide(pnl, cost, out=np.zeros_like(pnl), where=cost > 0)
+
+    entry_time = timestamps[entry_fill]
+    exit_time = timestamps[exit_fill]
+    holding_period_days = (exit_time - entry_time) / np.timedelta64(1, "D")
+
+    round_trips = {
+        "symbol": symbols[symbol_codes[entry_fill]],
+        "direction": direction,
+        "quantity": matched_quantity,
+        "entry_time": entry_time,
+        "exit_time": exit_time,
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "commission": trip_commission,
+        "pnl": pnl,
+        "return": trip_return,
+        "holding_period_days": holding_period_days,
+    }
+    round_trips["mae"], round_trips["mfe"] = _calculate_excursions(
+        symbol_codes[entry_fill], symbols, direction, entry_time, exit_time, entry_price, price_bar_data
+    )
+    return round_trips
+
+def calculate_trade_metrics(round_trips: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """
+    Summarizes round trips into trade metrics (win rate, profit factor, holding period, MAE/MFE).
+    Percentages are rounded like the ones from `calculate_performance_metrics`.
+    """
+    pnl = round_trips["pnl"]
+    if len(pnl) == 0:
+        return {
+            "round_trips": 0,
+            "win_rate": "N/A",
+            "profit_factor": "N/A",
+            "realized_pnl": 0.0,
+            "average_trade_pnl": "N/A",
+            "average_holding_period_days": "N/A",
+            "average_mae": "N/A",
+            "average_mfe": "N/A",
+        }
+
+    gross_profit = pnl[pnl > 0].sum()
+    gross_loss = -pnl[pnl < 0].sum()
+    profit_factor = round(float(gross_profit / gross_loss), 2) if gross_loss > 0 else "N/A"
+
+    mae, mfe = round_trips["mae"], round_trips["mfe"]
+    has_excursions = np.isfinite(mae)
+
+    return {
+        "round_trips": int(len(pnl)),
+        "win_rate": round(float((pnl > 0).mean()) * 100, 2),
+        "profit_factor": profit_factor,
+        "realized_pnl": round(float(pnl.sum()), 2),
+        "average_trade_pnl": round(float(pnl.mean()), 2),
+        "average_holding_period_days": round(float(round_trips["holding_period_days"].mean()), 2),
+        "average_mae": round(float(mae[has_excursions].mean()) * 100, 2) if has_excursions.any() else "N/A",
+        "average_mfe": round(float(mfe[has_excursions].mean()) * 100, 2) if has_excursions.any() else "N/A",
+    }
+
+def _fills_to_arrays(trade_log: List[Dict[str, Any]]) -> Optional[Dict[str, np.ndarray]]:
+    fills = [trade for trade in trade_log if trade.get("successful", True)]
+    if not fills:
+        return None
+
+    count = len(fills)
+    symbol_codes, symbols = pd.factorize(np.array([trade["symbol"] for trade in fills], dtype=object), sort=True)
+    is_buy = np.fromiter((_is_buy(trade) for trade in fills), dtype=bool, count=count)
+
+    return {
+        "symbols": np.asarray(symbols, dtype=str),
+        "symbol_codes": symbol_codes,
+        "is_buy": is_buy,
+        "timestamps": pd.DatetimeIndex([trade["timestamp"] for trade in fills]).values.astype("datetime64[ns]"),
+        "quantity": np.fromiter((float(trade["quantity"]) for trade in fills), dtype=np.float64, count=count),
+        "price": np.fromiter((float(trade["price"]) for trade in fills), dtype=np.float64, count=count),
+        "commission": np.fromiter((float(trade.get("commission", 0.0)) for trade in fills), dtype=np.float64, count=count),
+    }
+
+def _is_buy(trade: Dict[str, Any]) -> bool:
+    direction = trade["direction"] if "direction" in trade else trade.get("type")
+    return direction is Signal.BUY or direction == "BUY"
+
+def _cumulative_ranges(fill_index: np.ndarray, symbol_codes: np.ndarray, quantity: np.ndarray, symbol_base: np.ndarray):
+    """
+    Returns each fill's [start, end) range on the cumulative quantity axis of its symbol, offset by the symbol's base.
+    `fill_index` must be grouped by symbol.
+    """
+    if len(fill_index) == 0:
+        return np.empty(0), np.empty(0)
+
+    codes = symbol_codes[fill_index]
+    quantities = quantity[fill_index]
+    running = np.cumsum(quantities)
+
+    is_first = np.empty(len(codes), dtype=bool)
+    is_first[0] = True
+    is_first[1:] = codes[1:] != codes[:-1]
+    group_offset = np.maximum.accumulate(np.where(is_first, running - quantities, 0.0))
+
+    end = running - group_offset + symbol_base[codes]
+    return end - quantities, end
+
+def _calculate_excursions(
+    trip_symbol_codes: np.ndarray,
+    symbols: np.ndarray,
+    direction: np.ndarray,
+    entry_time: np.ndarray,
+    exit_time: np.ndarray,
+    entry_price: np.ndarray,
+    price_bar_data: Optional[Dict[str, List[PriceBar]]]
+):
+    """
+    MAE/MFE of each round trip over the bars between entry and exit (inclusive),
+    using a sparse table per symbol for O(1) range min/max queries.
+    """
+    mae = np.full(len(direction), np.nan)
+    mfe = np.full(len(direction), np.nan)
+    if not price_bar_data:
+        return mae, mfe
+
+    for code, symbol in enumerate(symbols):
+        bars = price_bar_data.get(symbol)
+        trips = np.nonzero(trip_symbol_codes == code)[0]
+        if not bars or len(trips) == 0:
+            continue
+
+        bar_times = np.array([bar.timestamp for bar in bars], dtype="datetime64[ns]")
+        bar_order = np.argsort(bar_times, kind="stable")
+        bar_times = bar_times[bar_order]
+        highs = np.array([float(bars[i].high) for i in bar_order])
+        lows = np.array([float(bars[i].low) for i in bar_order])
+
+        first_bar = np.searchsorted(bar_times, entry_time[trips], side="left")
+        last_bar = np.searchsorted(bar_times, exit_time[trips], side="right") - 1
+        has_bars = first_bar <= last_bar
+        if not has_bars.any():
+            logger.debug("No price bars between entry and exit for the round trips of %s.", symbol)
+            continue
+        trips, first_bar, last_bar = trips[has_bars], first_bar[has_bars], last_bar[has_bars]
+
+        highest = _range_query(highs, first_bar, last_bar, np.maximum)
+        lowest = _range_query(lows, first_bar, last_bar, np.minimum)
+
+        price = entry_price[trips]
+        is_long = direction[trips] == 1
+        adverse = np.where(is_long, lowest - price, price - highest)
+        favorable = np.where(is_long, highest - price, price - lowest)
+        mae[trips] = adverse / price
+        mfe[trips] = favorable / price
+
+    return mae, mfe
+
+def _range_query(values: np.ndarray, first: np.ndarray, last: np.ndarray, reduce) -> np.ndarray:
+    """
+    Vectorized inclusive range reduction (min or max) with a sparse table: O(n log n) build, O(1) per query.
+    """
+    table = [values]
+    width = 1
+    while 2 * width <= len(values):
+        previous = table[-1]
+        table.append(reduce(previous[:-width], previous[width:]))
+        width *= 2
+
+    length = last - first + 1
+    level = np.floor(np.log2(length)).astype(np.int64)
+    result = np.empty(len(first))
+    for k in np.unique(level):
+        selected = level == k
+        row = table[k]
+        result[selected] = reduce(row[first[selected]], row[last[selected] - (1 << k) + 1])
+    return result
+
+def _empty_round_trips() -> Dict[str, np.ndarray]:
+    round_trips = {field: np.empty(0) for field in ROUND_TRIP_FIELDS}
+    round_trips["symbol"] = np.empty(0, dtype=str)
+    round_trips["direction"] = np.empty(0, dtype=np.int64)
+    round_trips["entry_time"] = np.empty(0, dtype="datetime64[ns]")
+    round_trips["exit_time"] = np.empty(0, dtype="datetime64[ns]")
+    return round_trips
@@ -2,13 +2,21 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
-from typing import Any, Dict, Optional
+import math
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-from alpheast.events.event import MarketEvent, SignalEvent
+import numpy as np
+
+from alpheast.events.event import MarketEvent, SignalEvent, TargetWeightsEvent
 from alpheast.events.event_queue import EventQueue
+from alpheast.indicators.base_indicator import BaseIndicator
+from alpheast.indicators.declarative import IndicatorSpec
+from alpheast.indicators.indicator_registry import IndicatorRegistry, IndicatorSubscription
 from alpheast.models.signal import Signal
 
 
+logger = logging.getLogger(__name__)
+
 class BaseStrategy(ABC):
     """
     Abstract base class for the trading strategy in the new event-driven backtesting engine.
@@ -20,7 +28,9 @@ class BaseStrategy(ABC):
         self.event_queue: Optional[EventQueue] = None
         self.symbol: str = symbol
         self.params: Dict[str, Any] = kwargs
-        logging.info(f"{self.__class__.__name__} initialized for {symbol} with params: {kwargs}")
+        self._precomputed_indicators: Dict[str, Tuple[Dict[datetime, int], Dict[str, np.ndarray]]] = {}
+        self._indicator_subscriptions: List[IndicatorSubscription] = []
+        logger.info("%s initialized for %s with params: %s", self.__class__.__name__, symbol, kwargs)
 
     @abstractmethod
     def on_market_event(self, event: MarketEvent):
@@ -30,21 +40,100 @@ class BaseStrategy(ABC):
         """
         pass
 
+    @property
+    def requires_short_selling(self) -> bool:
+        """
+        Whether the strategy's SELL signals must be able to open short positions, i.e. it needs a MarginConfig that allows shorting.
+        """
+        return False
+
+    def declare_indicators(self) -> Dict[str, IndicatorSpec]:
+        """
+        Indicators the engine precomputes for this strategy over each symbol's whole series before the event loop,
+        by name, e.g. {"slow_sma": sma("close", 50)}. Read them with `get_indicator()`.
+        """
+        return {}
+
+    def set_precomputed_indicators(self, symbol: str, bar_index: Dict[datetime, int], values: Dict[str, np.ndarray]):
+        self._precomputed_indicators[symbol] = (bar_index, values)
+
+    def get_indicator(self, name: str, event: MarketEvent) -> Optional[float]:
+        """
+        Value of a declared indicator at the event's bar in O(1), None while it is warming up.
+        """
+        precomputed = self._precomputed_indicators.get(event.symbol)
+        if precomputed is None:
+            raise KeyError(f"No precomputed indicators for {event.symbol}. Declare them in declare_indicators().")
+
+        bar_index, values = precomputed
+        position = bar_index.get(event.timestamp)
+        if position is None:
+            return None
+        value = values[name][position]
+        return None if math.isnan(value) else float(value)
+
+    def on_timestamp_end(self):
+        """
+        Called by the engine once all MarketEvents of a timestamp have been delivered.
+        """
+        pass
+
     def set_event_queue(self, event_queue: EventQueue):
         self.event_queue = event_queue
 
+    def set_indicator_registry(self, registry: IndicatorRegistry):
+        """
+        Switches all indicator subscriptions to the registry's shared instances.
+        """
+        for subscription in self._indicator_subscriptions:
+            subscription.attach(registry)
+
+    def _subscribe_indicator(self, indicator_cls: Type[BaseIndicator], *params: Any, symbol: Optional[str] = None) -> IndicatorSubscription:
+        """
+        Subscribes to a streaming indicator, e.g. `self._subscribe_indicator(SMA, 50)`.
+        Inside the engine the indicator is shared with every strategy subscribing to the same (symbol, indicator, params);
+        call `_update_indicators()` at the start of `on_market_event` so it is also fed when the strategy runs on its own.
+        """
+        subscription = IndicatorSubscription(symbol or self.symbol, indicator_cls, params)
+        self._indicator_subscriptions.append(subscription)
+        return subscription
+
+    def _update_indicators(self, event: MarketEvent):
+        for subscription in self._indicator_subscriptions:
+            subscription.update(event)
+
     def _put_signal_event(
         self,
         timestamp: datetime,
-        direction: Signal
+        direction: Signal,
+        symbol: Optional[str] = None
     ):
+        """
+        Emits a signal for `symbol`, by default the strategy's own symbol.
+        """
         if self.event_queue is None:
             raise RuntimeError("Event queue not set for strategy. Call set_event_queue() first.")
         
+        symbol = symbol or self.symbol
         signal_event = SignalEvent(
-            symbol=self.symbol,
+            symbol=symbol,
             timestamp=timestamp,
             direction=direction
         )
         self.event_queue.put(signal_event)
-        logging.debug(f"Strategy for {self.symbol} issued {direction} signal on {timestamp.date()}.")
\ No newline at end of file
+        logger.debug("Strategy for %s issued %s signal on %s.", symbol, direction, timestamp.date())
+
+    def _put_target_weights_event(
+        self,
+        timestamp: datetime,
+        weights: Dict[str, float]
+    ):
+        """
+        Submits target weights (fractions of portfolio value, negative for shorts, NaN to keep the current position) for the whole universe.
+        The PortfolioManager rebalances to them in one batch of orders.
+        """
+        if self.event_queue is None:
+            raise RuntimeError("Event queue not set for strategy. Call set_event_queue() first.")
+
+        self.event_queue.put(TargetWeightsEvent(timestamp=timestamp, weights=weights))
+        logger.debug("Strategy for %s issued target weights %s on %s.", self.symbol, weights, timestamp.date())
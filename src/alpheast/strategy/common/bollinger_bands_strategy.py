@@ -1,13 +1,15 @@
 
-from collections import deque
 from decimal import Decimal
 import logging
 from typing import Any
 from alpheast.events.event import MarketEvent
+from alpheast.indicators.rolling_std import RollingStd
 from alpheast.models.signal import Signal
 from alpheast.strategy.base_strategy import BaseStrategy
 
 
+logger = logging.getLogger(__name__)
+
 class BollingerBandsStrategy(BaseStrategy):
     """
     A Bollinger Bands trading strategy.
@@ -30,62 +32,35 @@ class BollingerBandsStrategy(BaseStrategy):
         self.bb_period = bb_period
         self.num_std_dev = num_std_dev
 
-        self._closes_history = deque(maxlen=self.bb_period)
+        self._rolling_std = self._subscribe_indicator(RollingStd, bb_period)
+        self._num_std_dev = float(num_std_dev)
         self._has_position = False
 
-        logging.info(
-            f"BollingerBandsStrategy initialized for {self.symbol} with period={bb_period}, "
-            f"std_dev={num_std_dev}"
-        )
+        logger.info("BollingerBandsStrategy initialized for %s with period=%s, std_dev=%s", self.symbol, bb_period, num_std_dev)
 
     def on_market_event(self, event: MarketEvent):
         if event.symbol != self.symbol:
             return
         
-        current_close = Decimal(str(event.data["close"]))
-        self._closes_history.append(current_close)
+        current_close = float(event.data["close"])
+        self._update_indicators(event)
+        std_dev = self._rolling_std.value
 
-        if len(self._closes_history) < self.bb_period:
-            logging.debug(f"Not enough history for {self.symbol} on {event.timestamp.date()}. Need {self.bb_period} closes for BB calculation. Have {len(self._closes_history)}.")
-            return
-        if len(self._closes_history) < 2 and self.bb_period >= 2:
-            logging.debug(f"Insufficient data points for standard deviation calculation for {self.symbol} on {event.timestamp.date()}. Need at least 2.")
+        if std_dev is None:
+            logger.debug("Not enough history for %s on %s. Need %s closes for BB calculation.", self.symbol, event.timestamp.date(), self.bb_period)
             return
 
-        middle_band = self._calculate_sma(self._closes_history)
-        std_dev = self._calculate_std_dev(self._closes_history, middle_band)
-
-        upper_band = middle_band + (std_dev * self.num_std_dev)
-        lower_band = middle_band - (std_dev * self.num_std_dev)
-
-        lower_band = max(Decimal("0"), lower_band)
+        middle_band = self._rolling_std.mean
+        upper_band = middle_band + std_dev * self._num_std_dev
+        lower_band = max(0.0, middle_band - std_dev * self._num_std_dev)
 
         if current_close < lower_band and not self._has_position:
             self._put_signal_event(event.timestamp, Signal.BUY)
             self._has_position = True
-            logging.info(
-                f"BB BUY signal for {self.symbol} at {event.timestamp.date()}. "
-                f"Close: {current_close:.2f} < Lower Band: {lower_band:.2f}"
-            )
+            logger.info("BB BUY signal for %s at %s. Close: %.2f < Lower Band: %.2f", self.symbol, event.timestamp.date(), current_close, lower_band)
         elif current_close > upper_band and self._has_position:
             self._put_signal_event(event.timestamp, Signal.SELL)
             self._has_position = False
-            logging.info(
-                f"BB SELL signal for {self.symbol} at {event.timestamp.date()}. "
-                f"Close: {current_close:.2f} > Upper Band: {upper_band:.2f}"
-            )
+            logger.info("BB SELL signal for %s at %s. Close: %.2f > Upper Band: %.2f", self.symbol, event.timestamp.date(), current_close, upper_band)
         else:
             pass
-
-    def _calculate_sma(self, prices: deque) -> Decimal:
-        """Calculates the Simple Moving Average (SMA)."""
-        if not prices:
-            return Decimal("0")
-        return sum(prices, Decimal("0")) / Decimal(len(prices))
-    
-    def _calculate_std_dev(self, prices: deque, sma: Decimal) -> Decimal:
-        """Calculates the standard deviation."""
-        if not prices or len(prices) < 2:
-            return Decimal("0")
-        variance = sum([(p - sma) ** 2 for p in prices], Decimal("0")) / Decimal(len(prices) - 1)
-        return variance.sqrt()
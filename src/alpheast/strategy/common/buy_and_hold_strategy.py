@@ -7,6 +7,8 @@ from alpheast.strategy.base_strategy import BaseStrategy
 from alpheast.models.signal import Signal
 
 
+logger = logging.getLogger(__name__)
+
 class BuyAndHoldStrategy(BaseStrategy):
     """
     A simple Buy and Hold trading strategy.
@@ -20,7 +22,7 @@ class BuyAndHoldStrategy(BaseStrategy):
     def __init__(self, symbol: str, **kwargs: Any):
         super().__init__(symbol, **kwargs)
         self._bought_initial_position = False
-        logging.info(f"BuyAndHoldStrategy initialized for {self.symbol}")
+        logger.info("BuyAndHoldStrategy initialized for %s", self.symbol)
 
     def on_market_event(self, event: MarketEvent):
         if event.symbol != self.symbol:
@@ -29,7 +31,7 @@ class BuyAndHoldStrategy(BaseStrategy):
         if not self._bought_initial_position:
             self._put_signal_event(event.timestamp, Signal.BUY)
             self._bought_initial_position = True
-            logging.info(f"BuyAndHoldStrategy: Initial BUY signal for {self.symbol} at {event.timestamp.date()}")
+            logger.info("BuyAndHoldStrategy: Initial BUY signal for %s at %s", self.symbol, event.timestamp.date())
         else:
             # Hold the position
             pass
\ No newline at end of file
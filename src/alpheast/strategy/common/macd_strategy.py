@@ -1,13 +1,14 @@
-from collections import deque
-from decimal import Decimal
 import logging
-from typing import Any, Optional
+from typing import Any
 
 from alpheast.events.event import MarketEvent
+from alpheast.indicators.macd import MACD
 from alpheast.strategy.base_strategy import BaseStrategy
 from alpheast.models.signal import Signal
 
 
+logger = logging.getLogger(__name__)
+
 class MACDStrategy(BaseStrategy):
     """
     A Moving Average Convergence Divergence (MACD) trading strategy.
@@ -32,39 +33,10 @@ class MACDStrategy(BaseStrategy):
         self.slow_period = slow_period
         self.signal_period = signal_period
 
-        self._closes_history = deque(maxlen=self.slow_period)
-        self._macd_history = deque(maxlen=self.signal_period) 
-        
-        self._prev_fast_ema: Optional[Decimal] = None
-        self._prev_slow_ema: Optional[Decimal] = None
-        self._prev_signal_line: Optional[Decimal] = None
-
+        self._macd = self._subscribe_indicator(MACD, fast_period, slow_period, signal_period)
         self._has_position = False
 
-        logging.info(
-            f"MACDStrategy initialized for {self.symbol} with Fast={fast_period}, "
-            f"Slow={slow_period}, Signal={signal_period}"
-        )
-
-    def _calculate_ema(self, prices: deque, period: int, prev_ema: Optional[Decimal]) -> Decimal:
-        """
-        Calculates the Exponential Moving Average (EMA).
-        Uses simple average for the initial EMA.
-        """
-        if not prices:
-            return Decimal("0")
-
-        # Smoothing factor
-        k = Decimal("2") / Decimal(period + 1)
-
-        if prev_ema is None:
-            if len(prices) < period:
-                return Decimal("0")
-            initial_sma = sum(list(prices)[-period:], Decimal("0")) / Decimal(period)
-            return initial_sma
-        else:
-            # EMA formula: (Current_Price - Previous_EMA) * K + Previous_EMA
-            return (prices[-1] - prev_ema) * k + prev_ema
+        logger.info("MACDStrategy initialized for %s with Fast=%s, Slow=%s, Signal=%s", self.symbol, fast_period, slow_period, signal_period)
 
     def on_market_event(self, event: MarketEvent):
         """
@@ -75,52 +47,21 @@ class MACDStrategy(BaseStrategy):
         if event.symbol != self.symbol:
             return
         
-        current_close = Decimal(str(event.data["close"]))
-        self._closes_history.append(current_close)
-
-        if len(self._closes_history) < self.slow_period:
-            logging.debug(f"Not enough history for {self.symbol} on {event.timestamp.date()}. Need {self.slow_period} closes for initial MACD. Have {len(self._closes_history)}.")
+        self._update_indicators(event)
+        if not self._macd.is_ready:
+            logger.debug("Not enough history for %s on %s. Need %s closes for the initial Signal Line.", self.symbol, event.timestamp.date(), self.slow_period + self.signal_period - 1)
             return
 
-        # Calculate Fast and Slow EMA
-        current_fast_ema = self._calculate_ema(self._closes_history, self.fast_period, self._prev_fast_ema)
-        if current_fast_ema == Decimal("0") and len(self._closes_history) < self.fast_period:
-            return 
-        
-        current_slow_ema = self._calculate_ema(self._closes_history, self.slow_period, self._prev_slow_ema)
-        if current_slow_ema == Decimal("0") and len(self._closes_history) < self.slow_period:
-            return 
-        
-        # Update previous EMAs for next iteration
-        self._prev_fast_ema = current_fast_ema
-        self._prev_slow_ema = current_slow_ema
-
-        # Calculate MACD Line
-        macd_line = current_fast_ema - current_slow_ema
-        self._macd_history.append(macd_line)
-
-        if len(self._macd_history) < self.signal_period:
-            logging.debug(f"Not enough MACD history for {self.symbol} on {event.timestamp.date()}. Need {self.signal_period} MACD values for initial Signal Line.")
-            return
-        signal_line = self._calculate_ema(self._macd_history, self.signal_period, self._prev_signal_line)
-        if signal_line == Decimal("0") and len(self._macd_history) < self.signal_period:
-            return
-        
-        self._prev_signal_line = signal_line
+        macd_line = self._macd.macd_line
+        signal_line = self._macd.signal_line
 
         if macd_line > signal_line and not self._has_position:
             self._put_signal_event(event.timestamp, Signal.BUY)
             self._has_position = True
-            logging.info(
-                f"MACD BUY signal for {self.symbol} at {event.timestamp.date()}. "
-                f"MACD: {macd_line:.4f} > Signal: {signal_line:.4f}"
-            )
+            logger.info("MACD BUY signal for %s at %s. MACD: %.4f > Signal: %.4f", self.symbol, event.timestamp.date(), macd_line, signal_line)
         elif macd_line < signal_line and self._has_position:
             self._put_signal_event(event.timestamp, Signal.SELL)
             self._has_position = False
-            logging.info(
-                f"MACD SELL signal for {self.symbol} at {event.timestamp.date()}. "
-                f"MACD: {macd_line:.4f} < Signal: {signal_line:.4f}"
-            )
+            logger.info("MACD SELL signal for %s at %s. MACD: %.4f < Signal: %.4f", self.symbol, event.timestamp.date(), macd_line, signal_line)
         else:
             pass
\ No newline at end of file
@@ -0,0 +1,106 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict
+
+import numpy as np
+
+from alpheast.models.signal import Signal
+from alpheast.strategy.multi_symbol_strategy import MultiSymbolStrategy
+
+
+logger = logging.getLogger(__name__)
+
+class PairsTradingStrategy(MultiSymbolStrategy):
+    """
+    A mean-reversion pairs trading strategy on the log price spread of two symbols.
+
+    The hedge ratio is the least squares slope of the first leg's log price on the second's over the lookback window.
+    When the spread's z-score falls below -entry_z, the spread is bought (BUY first leg, SELL second leg);
+    above entry_z it is sold. The position is closed once the z-score is back within exit_z.
+    The short leg needs a MarginConfig that allows shorting on the engine; with `allow_short=False`
+    only the long leg of the spread is traded.
+
+    :param first_symbol: The first leg of the pair.
+    :param second_symbol: The second leg of the pair.
+    :param lookback: Number of aligned bars used for the hedge ratio and the z-score (e.g., 60).
+    :param entry_z: Absolute z-score at which a position is opened (e.g., 2).
+    :param exit_z: Absolute z-score at which the position is closed (e.g., 0.5).
+    :param allow_short: Whether the short leg is traded (e.g., False without a MarginConfig).
+    :param kwargs: Arbitrary keyword arguments passed to the base strategy.
+    """
+    def __init__(
+        self,
+        first_symbol: str,
+        second_symbol: str,
+        lookback: int = 60,
+        entry_z: float = 2.0,
+        exit_z: float = 0.5,
+        allow_short: bool = True,
+        **kwargs: Any
+    ):
+        super().__init__([first_symbol, second_symbol], window=lookback, **kwargs)
+        if lookback < 3:
+            raise ValueError("Lookback must be at least 3 bars.")
+        if not (0 <= exit_z < entry_z):
+            raise ValueError("Exit z-score must be non-negative and less than the entry z-score.")
+
+        self.lookback = lookback
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+        self.allow_short = allow_short
+        self._spread_position = 0 # 1 long spread, -1 short spread
+        self._entry_signals: Dict[str, Signal] = {} # Signal sent per leg at entry, undone at exit
+
+        logger.info("PairsTradingStrategy initialized for %s/%s with lookback=%s, entry_z=%s, exit_z=%s, allow_short=%s", first_symbol, second_symbol, lookback, entry_z, exit_z, allow_short)
+
+    @property
+    def requires_short_selling(self) -> bool:
+        return self.allow_short
+
+    def on_bars(self, timestamp: datetime):
+        if self.history_length < self.lookback:
+            return
+
+        closes = self.get_history("close")
+        if (closes <= 0).any():
+            return
+        log_prices = np.log(closes)
+        first, second = log_prices[:, 0], log_prices[:, 1]
+
+        second_variance = np.var(second)
+        if second_variance == 0:
+            return
+        hedge_ratio = np.cov(first, second, bias=True)[0, 1] / second_variance
+        spread = first - hedge_ratio * second
+        spread_std = spread.std()
+        if spread_std == 0:
+            return
+        z_score = (spread[-1] - spread.mean()) / spread_std
+
+        first_leg, second_leg = self.legs
+        if self._spread_position == 0:
+            if z_score < -self.entry_z:
+                self._open_spread(timestamp, {first_leg: Signal.BUY, second_leg: Signal.SELL})
+                self._spread_position = 1
+            elif z_score > self.entry_z:
+                self._open_spread(timestamp, {first_leg: Signal.SELL, second_leg: Signal.BUY})
+                self._spread_position = -1
+            else:
+                return
+            logger.info("Pairs entry for %s/%s at %s. Z-Score: %.2f, Hedge Ratio: %.3f", first_leg, second_leg, timestamp.date(), z_score, hedge_ratio)
+        elif abs(z_score) < self.exit_z:
+            for leg, direction in self._entry_signals.items():
+                self._put_signal_event(timestamp, Signal.BUY if direction == Signal.SELL else Signal.SELL, leg)
+            self._entry_signals = {}
+            self._spread_position = 0
+            logger.info("Pairs exit for %s/%s at %s. Z-Score: %.2f", first_leg, second_leg, timestamp.date(), z_score)
+
+    def _open_spread(self, timestamp: datetime, signals: Dict[str, Signal]):
+        """
+        Sends the entry signals of the legs that are traded, so that the exit only closes positions that were opened.
+        """
+        self._entry_signals = {
+            leg: direction for leg, direction in signals.items() if self.allow_short or direction == Signal.BUY
+        }
+        for leg, direction in self._entry_signals.items():
+            self._put_signal_event(timestamp, direction, leg)
@@ -1,13 +1,15 @@
 
-from collections import deque
 from decimal import Decimal
 import logging
 from typing import Any
 from alpheast.events.event import MarketEvent
+from alpheast.indicators.rsi import RSI
 from alpheast.models.signal import Signal
 from alpheast.strategy.base_strategy import BaseStrategy
 
 
+logger = logging.getLogger(__name__)
+
 class RSIStrategy(BaseStrategy):
     """
     A Relative Strength Index (RSI) trading strategy.
@@ -39,17 +41,12 @@ class RSIStrategy(BaseStrategy):
         self.oversold_threshold = oversold_threshold
         self.overbought_threshold = overbought_threshold
 
-        self._closes_history = deque(maxlen=rsi_period + 1)
+        self._rsi = self._subscribe_indicator(RSI, rsi_period)
+        self._oversold = float(oversold_threshold)
+        self._overbought = float(overbought_threshold)
         self._has_position = False
-        self._gains = deque(maxlen=rsi_period)
-        self._losses = deque(maxlen=rsi_period)
-        self._avg_gain = Decimal("0")
-        self._avg_loss = Decimal("0")
 
-        logging.info(
-            f"RSIStrategy initialized for {self.symbol} with period={rsi_period}, "
-            f"oversold={oversold_threshold}, overbought={overbought_threshold}"
-        )
+        logger.info("RSIStrategy initialized for %s with period=%s, oversold=%s, overbought=%s", self.symbol, rsi_period, oversold_threshold, overbought_threshold)
 
     def on_market_event(self, event: MarketEvent):
         """
@@ -60,53 +57,20 @@ class RSIStrategy(BaseStrategy):
         if event.symbol != self.symbol:
             return
         
-        current_close = Decimal(str(event.data["close"]))
-        self._closes_history.append(current_close)
+        self._update_indicators(event)
+        rsi = self._rsi.value
 
-        if len(self._closes_history) <= 1:
-            logging.debug(f"Not enough history for {self.symbol} on {event.timestamp.date()}. Need at least 2 closes.")
+        if rsi is None:
+            logger.debug("Not enough history to calculate RSI for %s on %s. Need %s price changes for the initial average.", self.symbol, event.timestamp.date(), self.rsi_period)
             return
-        
-        price_diff = self._closes_history[-1] - self._closes_history[-2]
-        current_gain = price_diff if price_diff > 0 else Decimal("0")
-        current_loss = -price_diff if price_diff < 0 else Decimal("0")
-
-        self._update_avg_gain_loss(current_gain, current_loss)
 
-        if len(self._gains) < self.rsi_period:
-            logging.debug(f"Not enough history to calculate RSI for {self.symbol} on {event.timestamp.date()}. "
-                          f"Need {self.rsi_period} full periods for initial average.")
-            return
-        
-        rsi = self._calculate_rsi()
-
-        if rsi < self.oversold_threshold and not self._has_position:
+        if rsi < self._oversold and not self._has_position:
             self._put_signal_event(event.timestamp, Signal.BUY)
             self._has_position = True
-            logging.info(f"RSI BUY signal for {self.symbol} at {event.timestamp.date()}, RSI: {rsi:.2f}")
-        elif rsi > self.overbought_threshold and self._has_position:
+            logger.info("RSI BUY signal for %s at %s, RSI: %.2f", self.symbol, event.timestamp.date(), rsi)
+        elif rsi > self._overbought and self._has_position:
             self._put_signal_event(event.timestamp, Signal.SELL)
             self._has_position = False
-            logging.info(f"RSI SELL signal for {self.symbol} at {event.timestamp.date()}, RSI: {rsi:.2f}")
+            logger.info("RSI SELL signal for %s at %s, RSI: %.2f", self.symbol, event.timestamp.date(), rsi)
         else:
             pass
-
-    def _calculate_rsi(self) -> Decimal:
-        """Calculates the Relative Strength Index (RSI)."""
-        if len(self._gains) == 0 or len(self._losses) == 0:
-            return Decimal("50")
-
-        rs = self._avg_gain / self._avg_loss if self._avg_loss != Decimal("0") else Decimal("999999")
-        rsi = Decimal("100") - (Decimal("100") / (Decimal("1") + rs))
-        return rsi
-    
-    def _update_avg_gain_loss(self, current_gain: Decimal, current_loss: Decimal):
-        """Updates average gain and loss for RSI calculation."""
-        if len(self._gains) < self.rsi_period:
-            self._gains.append(current_gain)
-            self._losses.append(current_loss)
-            self._avg_gain = sum(self._gains, Decimal("0")) / Decimal(len(self._gains))
-            self._avg_loss = sum(self._losses, Decimal("0")) / Decimal(len(self._losses))
-        else:
-            self._avg_gain = ((self._avg_gain * (self.rsi_period - 1)) + current_gain) / self.rsi_period
-            self._avg_loss = ((self._avg_loss * (self.rsi_period - 1)) + current_loss) / self.rsi_period
\ No newline at end of file
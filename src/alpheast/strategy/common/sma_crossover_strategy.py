@@ -1,13 +1,14 @@
 
-from collections import deque
-from decimal import Decimal
 import logging
 from typing import Any
 from alpheast.events.event import MarketEvent
+from alpheast.indicators.sma import SMA
 from alpheast.strategy.base_strategy import BaseStrategy
 from alpheast.models.signal import Signal
 
 
+logger = logging.getLogger(__name__)
+
 class SMACrossoverStrategy(BaseStrategy):
     """
     A Simple Moving Average (SMA) Crossover trading strategy.
@@ -20,26 +21,22 @@ class SMACrossoverStrategy(BaseStrategy):
         self.fast_period = fast_period
         self.slow_period = slow_period
 
-        self._closes_history = deque(maxlen=self.slow_period)
+        self._fast_sma = self._subscribe_indicator(SMA, fast_period)
+        self._slow_sma = self._subscribe_indicator(SMA, slow_period)
         self._has_position = False
 
     def on_market_event(self, event: MarketEvent):
         if event.symbol != self.symbol:
             return
         
-        current_close = Decimal(str(event.data["close"]))
-        self._closes_history.append(current_close)
+        self._update_indicators(event)
+        fast_sma = self._fast_sma.value
+        slow_sma = self._slow_sma.value
 
-        if len(self._closes_history) < self.slow_period:
-            logging.debug(f"Not enough history for {self.symbol} on {event.timestamp.date()}. Need {self.slow_period}, have {len(self._closes_history)}.")
+        if slow_sma is None:
+            logger.debug("Not enough history for %s on %s. Need %s closes.", self.symbol, event.timestamp.date(), self.slow_period)
             return
         
-        fast_sma_sum_list = list(self._closes_history)[-self.fast_period:]
-        fast_sma = sum(fast_sma_sum_list, Decimal("0")) / self.fast_period
-        
-        slow_sma_sum_list = list(self._closes_history)
-        slow_sma = sum(slow_sma_sum_list, Decimal("0")) / self.slow_period
-        
         if fast_sma > slow_sma and not self._has_position:
             self._put_signal_event(event.timestamp, Signal.BUY)
             self._has_position = True
@@ -0,0 +1,96 @@
+from abc import abstractmethod
+from datetime import datetime
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from alpheast.events.event import MarketEvent
+from alpheast.models.cross_section import CrossSection
+from alpheast.models.signal import Signal
+from alpheast.strategy.base_strategy import BaseStrategy
+
+
+logger = logging.getLogger(__name__)
+
+_FIELDS = ("open", "high", "low", "close", "volume")
+
+class CrossSectionalStrategy(BaseStrategy):
+    """
+    Base class for strategies that trade a whole universe at once (ranking, momentum, long/short baskets).
+    The bars of each timestamp are collected into aligned arrays, and `on_cross_section` is called once
+    the engine has delivered all bars of that timestamp. Signals or target weights are then emitted in one batch.
+
+    :param symbols: The universe of the strategy. Bars of other symbols are ignored.
+    :param kwargs: Arbitrary keyword arguments passed to the base strategy.
+    """
+    def __init__(self, symbols: List[str], **kwargs: Any):
+        if not symbols:
+            raise ValueError("Cross-sectional strategy must be initialized with at least one symbol.")
+        super().__init__(symbols[0], **kwargs)
+        self.symbols: List[str] = list(symbols)
+        self._symbol_index: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        self._current_timestamp: Optional[datetime] = None
+        self._bars = np.full((len(_FIELDS), len(self.symbols)), np.nan)
+        self._valid = np.zeros(len(self.symbols), dtype=bool)
+
+    @abstractmethod
+    def on_cross_section(self, cross_section: CrossSection):
+        """
+        Called once per timestamp with the bars of all symbols in the universe.
+        """
+        pass
+
+    def on_market_event(self, event: MarketEvent):
+        i = self._symbol_index.get(event.symbol)
+        if i is None:
+            return
+        if self._current_timestamp is not None and event.timestamp != self._current_timestamp:
+            # The engine did not close the previous timestamp (e.g. the strategy is driven by hand)
+            self.on_timestamp_end()
+
+        self._current_timestamp = event.timestamp
+        data = event.data
+        for row, field in enumerate(_FIELDS):
+            self._bars[row, i] = float(data[field])
+        self._valid[i] = True
+
+    def on_timestamp_end(self):
+        if self._current_timestamp is None:
+            return
+
+        bars = self._bars
+        cross_section = CrossSection(
+            timestamp=self._current_timestamp,
+            symbols=self.symbols,
+            open=bars[0],
+            high=bars[1],
+            low=bars[2],
+            close=bars[3],
+            volume=bars[4],
+            valid=self._valid
+        )
+        # Hand the arrays over and start fresh ones, so the strategy may keep them
+        self._current_timestamp = None
+        self._bars = np.full((len(_FIELDS), len(self.symbols)), np.nan)
+        self._valid = np.zeros(len(self.symbols), dtype=bool)
+
+        self.on_cross_section(cross_section)
+
+    def _put_signal_events(self, timestamp: datetime, signals: Dict[str, Signal]):
+        """
+        Emits one signal per symbol of the batch.
+        """
+        for symbol, direction in signals.items():
+            self._put_signal_event(timestamp, direction, symbol)
+        logger.debug("%s issued %s signals on %s.", self.__class__.__name__, len(signals), timestamp.date())
+
+    def _put_target_weight_array(self, timestamp: datetime, weights: np.ndarray):
+        """
+        Submits target weights aligned to `symbols`. A NaN entry keeps the symbol's current position
+        (e.g. a symbol without a score at this timestamp), it is not closed.
+        """
+        if len(weights) != len(self.symbols):
+            raise ValueError(f"Expected {len(self.symbols)} weights, got {len(weights)}.")
+        self._put_target_weights_event(timestamp, dict(zip(self.symbols, np.asarray(weights, dtype=float).tolist())))
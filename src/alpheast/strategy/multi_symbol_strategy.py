@@ -0,0 +1,92 @@
+from abc import abstractmethod
+from datetime import datetime
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from alpheast.events.event import MarketEvent
+from alpheast.strategy.base_strategy import BaseStrategy
+
+
+logger = logging.getLogger(__name__)
+
+_FIELDS = ("open", "high", "low", "close", "volume")
+
+class MultiSymbolStrategy(BaseStrategy):
+    """
+    Base class for strategies over a fixed set of legs (pairs, spreads, baskets).
+    The bars of all legs are kept in one preallocated ring buffer of the last `window` timestamps, aligned by timestamp.
+    `on_bars` is called as soon as every leg's bar of a timestamp has arrived; timestamps where a leg has no bar are dropped.
+    Signals can be sent for any leg with `_put_signal_event(timestamp, direction, symbol)`.
+
+    :param symbols: The legs of the strategy.
+    :param window: Number of aligned timestamps kept in the buffer.
+    :param kwargs: Arbitrary keyword arguments passed to the base strategy.
+    """
+    def __init__(self, symbols: List[str], window: int = 100, **kwargs: Any):
+        if len(symbols) < 2:
+            raise ValueError("Multi-symbol strategy must be initialized with at least two symbols.")
+        if len(set(symbols)) != len(symbols):
+            raise ValueError("Multi-symbol strategy legs must be distinct.")
+        if window < 1:
+            raise ValueError("Buffer window must be at least 1.")
+        super().__init__(symbols[0], **kwargs)
+        self.legs: List[str] = list(symbols)
+        self.window = window
+        self._leg_index: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.legs)}
+
+        self._buffer = np.full((len(_FIELDS), window, len(self.legs)), np.nan)
+        self._position = 0
+        self._count = 0
+
+        self._pending = np.full((len(_FIELDS), len(self.legs)), np.nan)
+        self._arrived = np.zeros(len(self.legs), dtype=bool)
+        self._pending_timestamp: Optional[datetime] = None
+
+    @abstractmethod
+    def on_bars(self, timestamp: datetime):
+        """
+        Called once per timestamp at which all legs have a bar, after the bars were added to the buffer.
+        """
+        pass
+
+    def on_market_event(self, event: MarketEvent):
+        i = self._leg_index.get(event.symbol)
+        if i is None:
+            return
+
+        if event.timestamp != self._pending_timestamp:
+            if self._pending_timestamp is not None and self._arrived.any():
+                logger.debug("%s dropped incomplete bars of %s for legs %s.", self.__class__.__name__, self._pending_timestamp, self.legs)
+            self._pending_timestamp = event.timestamp
+            self._arrived[:] = False
+
+        data = event.data
+        for row, field in enumerate(_FIELDS):
+            self._pending[row, i] = float(data[field])
+        self._arrived[i] = True
+
+        if self._arrived.all():
+            self._buffer[:, self._position, :] = self._pending
+            self._position = (self._position + 1) % self.window
+            self._count = min(self._count + 1, self.window)
+            self._arrived[:] = False
+            self.on_bars(event.timestamp)
+
+    @property
+    def history_length(self) -> int:
+        return self._count
+
+    def get_history(self, field: str = "close", length: Optional[int] = None) -> np.ndarray:
+        """
+        The last `length` aligned values of `field` (default: the whole buffer), oldest first, with shape (length, legs).
+        """
+        length = self._count if length is None else min(length, self._count)
+        positions = np.arange(self._position - length, self._position) % self.window
+        return self._buffer[_FIELDS.index(field), positions, :]
+
+    def get_latest(self, field: str = "close") -> np.ndarray:
+        if self._count == 0:
+            raise RuntimeError("No aligned bars received yet.")
+        return self._buffer[_FIELDS.index(field), (self._position - 1) % self.window, :].copy()
@@ -0,0 +1,257 @@
+import argparse
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import gc
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.synthetic import bars_per_year, generate_bar_store
+from alpheast.engine import BacktestingEngine
+from alpheast.models.interval import Interval
+from alpheast.position_sizing.common.fixed_allocation_sizing import FixedAllocationSizing
+from alpheast.strategy.common.bollinger_bands_strategy import BollingerBandsStrategy
+from alpheast.strategy.common.buy_and_hold_strategy import BuyAndHoldStrategy
+from alpheast.strategy.common.macd_strategy import MACDStrategy
+from alpheast.strategy.common.rsi_strategy import RSIStrategy
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+STRATEGIES = {
+    "sma": SMACrossoverStrategy,
+    "rsi": RSIStrategy,
+    "bollinger": BollingerBandsStrategy,
+    "macd": MACDStrategy,
+    "buy_and_hold": BuyAndHoldStrategy,
+}
+# Lower is better for these measurements, higher for events_per_second
+REGRESSION_MEASUREMENTS = ("wall_time_seconds", "peak_rss_mb", "events_per_second")
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One benchmark: `num_symbols` synthetic symbols over `years` of `interval` bars, each traded by one `strategy`.
+    """
+    num_symbols: int
+    years: float
+    interval: Interval = Interval.DAILY
+    strategy: str = "sma"
+
+    @property
+    def name(self) -> str:
+        return f"{self.strategy}_{self.num_symbols}sym_{self.years:g}y_{self.interval.name.lower()}"
+
+    @property
+    def num_bars(self) -> int:
+        return max(int(round(self.years * bars_per_year(self.interval))), 1)
+
+def build_scenarios(profile: str) -> List[Scenario]:
+    """
+    The scenario matrix of a profile. "quick" runs in about a minute and suits CI, "full" sweeps up to
+    2,000 symbols and takes a long time.
+    """
+    if profile == "quick":
+        return [
+            *(Scenario(num_symbols, 1) for num_symbols in (1, 10, 50)),
+            Scenario(1, 5),
+            Scenario(2, 0.25, Interval.HOURLY),
+            *(Scenario(10, 1, strategy=strategy) for strategy in ("rsi", "bollinger", "macd")),
+        ]
+    if profile == "full":
+        return [
+            *(Scenario(num_symbols, years) for num_symbols in (1, 10, 100, 500, 2000) for years in (1, 5)),
+            *(Scenario(num_symbols, 1, Interval.HOURLY) for num_symbols in (1, 10, 100)),
+            Scenario(1, 0.25, Interval.MINUTE_5),
+            *(Scenario(100, 1, strategy=strategy) for strategy in ("rsi", "bollinger", "macd", "buy_and_hold")),
+        ]
+    raise ValueError(f"Unknown benchmark profile '{profile}'. Must be one of: quick, full")
+
+def run_scenario(scenario: Scenario, repeat: int = 3, measure_allocations: bool = True, seed: int = 7) -> Dict[str, Any]:
+    """
+    Runs one scenario in the current process and returns its measurements.
+    Wall time is the fastest of `repeat` runs and covers engine construction and the run, not data generation.
+    Peak RSS is the process maximum; the allocation pass runs once more under tracemalloc, which slows it down,
+    so it is kept out of the timed runs.
+    """
+    logging.disable(logging.CRITICAL)
+    bar_store = generate_bar_store(scenario.num_symbols, scenario.num_bars, scenario.interval, seed=seed)
+    last_day = pd.Timestamp(bar_store.timeline[-1]).date()
+    options = BacktestingOptions(
+        symbols=bar_store.symbols,
+        start_date=pd.Timestamp(bar_store.timeline[0]).date(),
+        end_date=last_day + timedelta(days=1),
+        interval=scenario.interval,
+        initial_cash=1_000_000.0,
+        transaction_cost_percent=0.001,
+        slippage_percent=0.0005
+    )
+
+    def create_engine() -> BacktestingEngine:
+        return BacktestingEngine(
+            options=options,
+            data_source=DataSource(type=DataSourceType.DIRECT, bar_store=bar_store),
+            strategies=[STRATEGIES[scenario.strategy](symbol) for symbol in bar_store.symbols],
+            position_sizing_method=FixedAllocationSizing(0.5 / scenario.num_symbols)
+        )
+
+    wall_times = []
+    for _ in range(repeat):
+        gc.collect()
+        start_time = time.perf_counter()
+        engine = create_engine()
+        results = engine.run()
+        wall_times.append(time.perf_counter() - start_time)
+    wall_time = min(wall_times)
+    events = engine.event_queue.total_events
+
+    measurements = {
+        "bars": scenario.num_symbols * scenario.num_bars,
+        "events": events,
+        "trades": len(results.trade_log) if results is not None else 0,
+        "wall_time_seconds": wall_time,
+        "wall_time_seconds_all": wall_times,
+        "events_per_second": events / wall_time if wall_time > 0 else float("nan"),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+    if measure_allocations:
+        del engine, results
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        engine = create_engine()
+        engine.run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        measurements["allocated_peak_mb"] = peak / 1e6
+        measurements["allocated_blocks"] = sys.getallocatedblocks() - blocks_before
+    return measurements
+
+def _scenario_worker(scenario: Scenario, repeat: int, measure_allocations: bool, connection):
+    try:
+        connection.send(run_scenario(scenario, repeat, measure_allocations))
+    except Exception as e:
+        connection.send({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        connection.close()
+
+def run_suite(scenarios: List[Scenario], repeat: int = 3, measure_allocations: bool = True) -> Dict[str, Any]:
+    """
+    Runs every scenario in a fresh process, so the peak RSS of one does not carry over to the next.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for scenario in scenarios:
+        print(f"Running {scenario.name} ({scenario.num_symbols * scenario.num_bars:,} bars)...", flush=True)
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_scenario_worker, args=(scenario, repeat, measure_allocations, sender))
+        process.start()
+        sender.close()
+        try:
+            measurements = receiver.recv()
+        except EOFError:
+            measurements = {"error": f"Worker exited with code {process.exitcode}"}
+        process.join()
+
+        results[scenario.name] = {"scenario": {**asdict(scenario), "interval": scenario.interval.name}, **measurements}
+        if "error" in measurements:
+            print(f"  failed: {measurements['error']}")
+        else:
+            print(
+                f"  {measurements['wall_time_seconds']:.3f} s, {measurements['events_per_second']:,.0f} events/s, "
+                f"{measurements['peak_rss_mb']:.0f} MB peak RSS"
+            )
+
+    return {
+        "metadata": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "repeat": repeat,
+        },
+        "scenarios": results,
+    }
+
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[str]:
+    """
+    Scenarios that got slower (wall time, events/sec) or bigger (peak RSS) than the baseline by more than `threshold`.
+    Scenarios missing from either side are skipped; a scenario failing now is a regression.
+
+    Returns:
+        One message per regression.
+    """
+    regressions = []
+    for name, baseline_measurements in baseline.get("scenarios", {}).items():
+        measurements = results["scenarios"].get(name)
+        if measurements is None or "error" in baseline_measurements:
+            continue
+        if "error" in measurements:
+            regressions.append(f"{name}: failed ({measurements['error']})")
+            continue
+        for measurement in REGRESSION_MEASUREMENTS:
+            current, reference = measurements.get(measurement), baseline_measurements.get(measurement)
+            if not current or not reference:
+                continue
+            # Change in the "worse" direction as a fraction of the baseline
+            change = reference / current - 1.0 if measurement == "events_per_second" else current / reference - 1.0
+            if change > threshold:
+                regressions.append(f"{name}: {measurement} {reference:.4g} -> {current:.4g} ({change:+.0%} worse)")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scaling benchmarks of the backtesting engine on synthetic data.")
+    parser.add_argument("--profile", choices=["quick", "full"], default="quick")
+    parser.add_argument("--filter", default=None, help="Only run scenarios whose name contains this text.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario; the fastest counts.")
+    parser.add_argument("--no-allocations", action="store_true", help="Skip the tracemalloc pass.")
+    parser.add_argument("--output", default=os.path.join(os.path.dirname(__file__), "results", "benchmark_results.json"))
+    parser.add_argument("--baseline", default=None, help="Results JSON to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed fractional regression, e.g. 0.2 for 20%%.")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to the --baseline path.")
+    args = parser.parse_args(argv)
+
+    scenarios = [scenario for scenario in build_scenarios(args.profile) if args.filter is None or args.filter in scenario.name]
+    results = run_suite(scenarios, args.repeat, not args.no_allocations)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline is None:
+        return 0
+    if args.save_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%} against {args.baseline}:")
+        for regression in regressions:
+            print(f"- {regression}")
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.models.interval import Interval
+from alpheast.models.price_bar import PriceBar
+from alpheast.position_sizing.common.fixed_allocation_sizing import FixedAllocationSizing
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+@pytest.fixture
+def quiet_logging():
+    """
+    Silences logging for the whole test, opt in with `pytestmark = pytest.mark.usefixtures("quiet_logging")`.
+    """
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+@pytest.fixture
+def options():
+    return BacktestingOptions(
+        symbols=["AAPL"], start_date=datetime(2022, 1, 1), end_date=datetime(2023, 1, 1), interval=Interval.DAILY,
+        initial_cash=100_000.0
+    )
+
+@pytest.fixture
+def random_walk_bars():
+    """
+    Factory of seeded daily AAPL bars on a geometric random walk from 2022-01-03:
+    random_walk_bars(seed, num_bars, spread=0.0), with high and low `spread` above and below the close.
+    """
+    return _random_walk_bars
+
+@pytest.fixture
+def sma_strategies():
+    """
+    Strategy factory of the parameter sweeps, {"fast": ..., "slow": ...} -> one SMA crossover on AAPL.
+    """
+    return _sma_strategies
+
+@pytest.fixture
+def sizing():
+    """
+    Position sizing factory of the parameter sweeps.
+    """
+    return _fixed_sizing
+
+# Module level, so worker processes can unpickle the factories
+def _sma_strategies(params: Dict[str, Any]) -> List[SMACrossoverStrategy]:
+    return [SMACrossoverStrategy("AAPL", params["fast"], params["slow"])]
+
+def _fixed_sizing(params: Dict[str, Any]) -> FixedAllocationSizing:
+    return FixedAllocationSizing(0.3)
+
+def _random_walk_bars(seed: int, num_bars: int, spread: float = 0.0) -> Dict[str, List[PriceBar]]:
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, num_bars)))
+    start = datetime(2022, 1, 3)
+    return {"AAPL": [
+        PriceBar("AAPL", start + timedelta(days=i), _price(c), _price(c * (1 + spread)), _price(c * (1 - spread)), _price(c), Decimal("1000"))
+        for i, c in enumerate(closes)
+    ]}
+
+def _price(value: float) -> Decimal:
+    return Decimal(str(round(value, 4)))
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.bar_store import BarStore
+from alpheast.events.event_queue import EventQueue
+from alpheast.handlers.data_handler import DataHandler
+from alpheast.models.interval import Interval
+from alpheast.models.price_bar import PriceBar
+
+
+@pytest.fixture
+def price_bar_data():
+    start = datetime(2023, 1, 2, 9, 30)
+    return {
+        "AAPL": [
+            PriceBar("AAPL", start + timedelta(days=i), Decimal("100.1") + i, Decimal("101.25") + i, Decimal("99.5") + i, Decimal("100.75") + i, Decimal("1000"))
+            for i in reversed(range(3))
+        ],
+        "MSFT": [
+            PriceBar("MSFT", start + timedelta(days=i), Decimal("200.5"), Decimal("201"), Decimal("199"), Decimal("200.3333"), Decimal("50000"))
+            for i in range(2)
+        ],
+    }
+
+def test_round_trip_to_price_bars(price_bar_data):
+    store = BarStore.from_price_bar_data(price_bar_data)
+
+    rebuilt = store.to_price_bar_data()
+    assert rebuilt["AAPL"] == sorted(price_bar_data["AAPL"], key=lambda bar: bar.timestamp)
+    assert rebuilt["MSFT"] == price_bar_data["MSFT"]
+    assert store.to_price_bar_data() is rebuilt
+    np.testing.assert_array_equal(store.get_column("AAPL", "close"), [100.75, 101.75, 102.75])
+
+def test_frame_matches_data_handler_frame(price_bar_data):
+    symbols = ["AAPL", "MSFT"]
+    args = dict(symbols=symbols, start_date=datetime(2023, 1, 1), end_date=datetime(2023, 2, 1), interval=Interval.DAILY)
+    from_bars = DataHandler(EventQueue(), data_source=DataSource(DataSourceType.DIRECT, price_bar_data=price_bar_data), **args)
+    from_store = DataHandler(
+        EventQueue(), data_source=DataSource(DataSourceType.DIRECT, bar_store=BarStore.from_price_bar_data(price_bar_data)), **args
+    )
+
+    assert list(from_store._all_data_df.itertuples(index=False)) == list(from_bars._all_data_df.itertuples(index=False))
+    assert from_store.price_bar_data["MSFT"] == from_bars.price_bar_data["MSFT"]
+
+def test_frame_skips_unknown_symbols(price_bar_data):
+    store = BarStore.from_price_bar_data(price_bar_data)
+    assert store.to_frame(["TSLA"]).empty
+    assert set(store.to_frame(["MSFT", "TSLA"])["symbol"]) == {"MSFT"}
+
+def test_slice_is_a_view_on_the_timeline(price_bar_data):
+    store = BarStore.from_price_bar_data(price_bar_data)
+    assert len(store.timeline) == 3
+
+    sliced = store.slice(1, 3)
+
+    assert np.shares_memory(sliced.get_column("AAPL", "close"), store.get_column("AAPL", "close"))
+    np.testing.assert_array_equal(sliced.get_column("AAPL", "close"), [101.75, 102.75])
+    np.testing.assert_array_equal(sliced.get_column("MSFT", "close"), [200.3333])
+    assert sliced.to_price_bar_data()["AAPL"] == store.to_price_bar_data()["AAPL"][1:]
+    assert list(sliced.to_frame(["AAPL", "MSFT"])["close"]) == [101.75, 200.3333, 102.75]
+
+    with pytest.raises(ValueError):
+        store.slice(3, 5)
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.synthetic import (
+    GeometricBrownianMotion, JumpDiffusion, RegimeSwitching, bars_per_year, generate_bar_store, synthetic_timestamps
+)
+from alpheast.engine import BacktestingEngine
+from alpheast.models.interval import Interval
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+def test_intervals_are_distinct():
+    assert Interval.MINUTE_1 is not Interval.MONTHLY
+    assert len({interval.value for interval in Interval}) == len(Interval)
+
+@pytest.mark.parametrize("interval, first, last", [
+    (Interval.DAILY, "2024-01-01", "2024-01-12"),
+    (Interval.WEEKLY, "2024-01-05", "2024-03-08"),
+    (Interval.MONTHLY, "2024-01-31", "2024-10-31"),
+    (Interval.HOURLY, "2024-01-01 09:30", "2024-01-02 11:30"),
+])
+def test_timestamps_follow_the_interval(interval, first, last):
+    timestamps = synthetic_timestamps(datetime(2024, 1, 1), 10, interval)
+
+    assert len(timestamps) == 10
+    assert timestamps[0] == np.datetime64(pd.Timestamp(first))
+    assert timestamps[-1] == np.datetime64(pd.Timestamp(last))
+    assert np.all(np.diff(timestamps) > np.timedelta64(0, "ns"))
+
+def test_monthly_bars_fall_on_business_month_ends():
+    store = generate_bar_store(["AAPL"], 6, interval=Interval.MONTHLY, start=datetime(2024, 1, 1), seed=1)
+
+    # March 31st is a Sunday and June 30th a Sunday, so those bars fall on the Friday before
+    expected = ["2024-01-31", "2024-02-29", "2024-03-29", "2024-04-30", "2024-05-31", "2024-06-28"]
+    np.testing.assert_array_equal(store.get_column("AAPL", "timestamp"), np.array(expected, dtype="datetime64[ns]"))
+    assert bars_per_year(Interval.MONTHLY) == 12
+
+@pytest.mark.parametrize("model", [GeometricBrownianMotion(), JumpDiffusion(), RegimeSwitching()])
+def test_bars_are_reproducible_and_consistent(model):
+    store = generate_bar_store(3, 500, model=model, seed=42)
+    again = generate_bar_store(3, 500, model=model, seed=42)
+
+    assert store.symbols == ["SYN0000", "SYN0001", "SYN0002"]
+    for symbol in store.symbols:
+        open_, high, low, close = (store.get_column(symbol, field) for field in ("open", "high", "low", "close"))
+        np.testing.assert_array_equal(close, again.get_column(symbol, "close"))
+        assert np.all(high >= np.maximum(open_, close)) and np.all(low <= np.minimum(open_, close))
+        assert np.all(low > 0)
+        np.testing.assert_array_equal(open_[1:], close[:-1])
+    assert not np.array_equal(store.get_column("SYN0000", "close"), generate_bar_store(3, 500, model=model, seed=43).get_column("SYN0000", "close"))
+
+def test_correlation_and_volatility_are_reproduced():
+    store = generate_bar_store(["A", "B"], 20_000, model=GeometricBrownianMotion(0.0, 0.2), correlation=0.7, seed=1)
+
+    returns = np.diff(np.log([store.get_column(symbol, "close") for symbol in ("A", "B")]), axis=1)
+    assert np.corrcoef(returns)[0, 1] == pytest.approx(0.7, abs=0.03)
+    assert returns.std(axis=1) * np.sqrt(252) == pytest.approx([0.2, 0.2], rel=0.05)
+
+def test_regime_path_switches_between_regimes():
+    path = RegimeSwitching().regime_path(100_000, np.random.default_rng(3))
+
+    # Stationary share of the volatile regime is 0.01 / (0.01 + 0.03)
+    assert path.mean() == pytest.approx(0.25, abs=0.05)
+    assert np.count_nonzero(np.diff(path)) > 100
+
+def test_engine_runs_on_generated_bars():
+    store = generate_bar_store(["AAPL", "MSFT"], 300, seed=9)
+    options = BacktestingOptions(
+        symbols=["AAPL", "MSFT"], start_date=datetime(2020, 1, 1), end_date=datetime(2021, 3, 1), interval=Interval.DAILY,
+        initial_cash=100_000.0
+    )
+
+    results = BacktestingEngine(
+        options=options,
+        data_source=DataSource(type=DataSourceType.DIRECT, bar_store=store),
+        strategies=[SMACrossoverStrategy(symbol) for symbol in options.symbols]
+    ).run()
+
+    assert len(results.daily_values) == 300
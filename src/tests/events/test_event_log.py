@@ -0,0 +1,168 @@
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.config.recording_config import RecordingConfig
+from alpheast.data.synthetic import generate_bar_store
+from alpheast.engine import BacktestingEngine
+from alpheast.events.event import DailyUpdateEvent, FillEvent, MarketEvent, OrderEvent, SignalEvent, TargetWeightsEvent
+from alpheast.events.event_enums import EventType, OrderType
+from alpheast.events.event_log import EventLogReader, EventLogWriter, read_bar_store
+from alpheast.models.interval import Interval
+from alpheast.models.signal import Signal
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+SYMBOLS = ["AAPL", "MSFT"]
+
+pytestmark = pytest.mark.usefixtures("quiet_logging")
+
+def _options():
+    return BacktestingOptions(
+        symbols=SYMBOLS, start_date=datetime(2020, 1, 1), end_date=datetime(2021, 1, 1), interval=Interval.DAILY,
+        initial_cash=100_000.0
+    )
+
+def _strategies():
+    return [SMACrossoverStrategy(symbol, fast_period=5, slow_period=20) for symbol in SYMBOLS]
+
+def _record(path):
+    store = generate_bar_store(SYMBOLS, 200, seed=4)
+    engine = BacktestingEngine(
+        options=_options(),
+        data_source=DataSource(type=DataSourceType.DIRECT, bar_store=store),
+        strategies=_strategies(),
+        record=RecordingConfig(str(path))
+    )
+    return store, engine.run()
+
+def _without_order_ids(trade_log):
+    return [{key: value for key, value in trade.items() if key != "order_id"} for trade in trade_log]
+
+@pytest.mark.parametrize("file_name", ["events.log", "events.log.gz"])
+def test_events_round_trip(tmp_path, file_name):
+    timestamp = datetime(2024, 3, 1, 15, 30)
+    events = [
+        MarketEvent("AAPL", timestamp, {"open": 1.5, "high": 2.0, "low": 1.25, "close": 1.75, "volume": 1000.0}),
+        MarketEvent("MSFT", timestamp, {"close": 0.1}),
+        SignalEvent("AAPL", timestamp, Signal.BUY),
+        TargetWeightsEvent(timestamp, {"AAPL": 0.6, "MSFT": -0.4}),
+        OrderEvent("order-1", "AAPL", timestamp, Signal.SELL, Decimal("10"), OrderType.LIMIT, Decimal("1.7500")),
+        FillEvent("order-1", "AAPL", timestamp, Signal.SELL, Decimal("10"), Decimal("1.75087500"), Decimal("0.0175087500")),
+        FillEvent("order-2", "MSFT", timestamp, Signal.BUY, Decimal("12345678901234567890.5"), Decimal("3"), successful=False),
+        DailyUpdateEvent(datetime(2024, 3, 1)),
+    ]
+    writer = EventLogWriter(str(tmp_path / file_name), metadata={"run": "test"})
+    for event in events:
+        writer.record(event)
+    writer.close()
+
+    reader = EventLogReader(str(tmp_path / file_name))
+    replayed = list(reader)
+
+    assert reader.metadata == {"run": "test"}
+    assert [vars(event) for event in replayed] == [vars(event) for event in events]
+    # Decimals keep their exact representation, trailing zeros included
+    assert str(replayed[4].price) == "1.7500"
+    assert str(replayed[5].fill_price) == "1.75087500"
+    assert [event.type for event in reader.events([EventType.FILL])] == [EventType.FILL, EventType.FILL]
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.log"
+    path.write_bytes(b"not an event log")
+
+    with pytest.raises(ValueError):
+        EventLogReader(str(path))
+
+def test_recording_captures_the_event_stream(tmp_path):
+    path = tmp_path / "run.log"
+    store, results = _record(path)
+
+    events = list(EventLogReader(str(path)))
+    types = {event.type for event in events}
+
+    assert {EventType.MARKET, EventType.SIGNAL, EventType.ORDER, EventType.FILL, EventType.DAILY_UPDATE} <= types
+    assert sum(event.type == EventType.MARKET for event in events) == len(SYMBOLS) * 200
+    assert [event.order_id for event in events if event.type == EventType.FILL] == [trade["order_id"] for trade in results.trade_log]
+
+    replayed_store = read_bar_store(str(path))
+    for symbol in SYMBOLS:
+        np.testing.assert_array_equal(replayed_store.get_column(symbol, "timestamp"), store.get_column(symbol, "timestamp"))
+        np.testing.assert_array_equal(replayed_store.get_column(symbol, "close"), store.get_column(symbol, "close"))
+
+def test_market_replay_reproduces_the_run(tmp_path):
+    path = tmp_path / "run.log"
+    _, recorded = _record(path)
+
+    replayed = BacktestingEngine(
+        options=_options(),
+        data_source=DataSource(type=DataSourceType.REPLAY, event_log_path=str(path)),
+        strategies=_strategies()
+    ).run()
+
+    assert recorded.trade_log
+    assert _without_order_ids(replayed.trade_log) == _without_order_ids(recorded.trade_log)
+    assert replayed.daily_values == recorded.daily_values
+
+def test_fill_replay_reproduces_the_portfolio(tmp_path):
+    path = tmp_path / "run.log"
+    _, recorded = _record(path)
+
+    replayed = BacktestingEngine(
+        options=_options(),
+        data_source=DataSource(type=DataSourceType.REPLAY, event_log_path=str(path)),
+        strategies=[],
+        replay_fills=True
+    ).run()
+
+    assert replayed.trade_log == recorded.trade_log
+    assert replayed.daily_values == recorded.daily_values
+
+def test_fill_replay_needs_a_replay_source():
+    with pytest.raises(ValueError):
+        BacktestingEngine(
+            options=_options(),
+            data_source=DataSource(type=DataSourceType.DIRECT, bar_store=generate_bar_store(SYMBOLS, 10, seed=1)),
+            strategies=[],
+            replay_fills=True
+        )
+
+def test_reset_records_the_next_session_to_a_new_file(tmp_path):
+    path = tmp_path / "run.log.gz"
+    engine = BacktestingEngine(
+        options=_options(),
+        data_source=DataSource(type=DataSourceType.DIRECT, bar_store=generate_bar_store(SYMBOLS, 50, seed=4)),
+        strategies=_strategies(),
+        is_stepping_mode=True,
+        record=RecordingConfig(str(path))
+    )
+    while engine.step_forward():
+        pass
+    engine.reset()
+    for _ in range(10):
+        engine.step_forward()
+    engine.stop_recording()
+
+    first_session = list(EventLogReader(str(path)).events([EventType.MARKET]))
+    second_session = list(EventLogReader(str(tmp_path / "run.1.log.gz")).events([EventType.MARKET]))
+    assert len(first_session) == len(SYMBOLS) * 50
+    assert len(second_session) == len(SYMBOLS) * 10
+    assert [vars(event) for event in second_session] == [vars(event) for event in first_session[:len(SYMBOLS) * 10]]
+
+def test_fill_replay_profiles_the_replay_handler(tmp_path):
+    path = tmp_path / "run.log"
+    _record(path)
+
+    report = BacktestingEngine(
+        options=_options(),
+        data_source=DataSource(type=DataSourceType.REPLAY, event_log_path=str(path)),
+        strategies=[],
+        replay_fills=True,
+        profile=True
+    ).run().profiling_report
+
+    assert report.components[("ReplayExecutionHandler", "MARKET")]["calls"] == report.event_counts["MARKET"]
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from alpheast.events.event import MarketEvent
+from alpheast.indicators.atr import ATR
+from alpheast.indicators.declarative import atr, ema, macd, precompute_indicators, rolling_max, rolling_min, rolling_std, rsi, sma
+from alpheast.indicators.ema import EMA
+from alpheast.indicators.macd import MACD
+from alpheast.indicators.rolling_extremes import RollingMax, RollingMin
+from alpheast.indicators.rolling_std import RollingStd
+from alpheast.indicators.rsi import RSI
+from alpheast.indicators.sma import SMA
+from alpheast.models.price_bar import PriceBar
+from alpheast.strategy.base_strategy import BaseStrategy
+
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(8)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, 250))
+    return {
+        "open": close + rng.normal(0, 0.2, 250),
+        "high": close + rng.uniform(0, 2, 250),
+        "low": close - rng.uniform(0, 2, 250),
+        "close": close,
+        "volume": rng.uniform(1000, 2000, 250),
+    }
+
+def _stream(indicator, *inputs):
+    return np.array([np.nan if (v := indicator.update(*args)) is None else v for args in zip(*inputs)])
+
+@pytest.mark.parametrize("spec, indicator", [
+    (sma("close", 20), SMA(20)),
+    (ema("close", 10), EMA(10)),
+    (rolling_std("close", 20), RollingStd(20)),
+    (rolling_max("close", 15), RollingMax(15)),
+    (rolling_min("close", 15), RollingMin(15)),
+    (rsi("close", 14), RSI(14)),
+    (macd("close", 12, 26, 9), MACD(12, 26, 9)),
+])
+def test_precomputed_matches_streaming(spec, indicator, columns):
+    np.testing.assert_allclose(spec.compute(columns), _stream(indicator, columns["close"]), rtol=1e-8, atol=1e-10, equal_nan=True)
+
+def test_precomputed_atr_matches_streaming(columns):
+    expected = _stream(ATR(14), columns["high"], columns["low"], columns["close"])
+    np.testing.assert_allclose(atr(14).compute(columns), expected, rtol=1e-10, equal_nan=True)
+
+def test_macd_outputs(columns):
+    streaming = MACD(12, 26, 9)
+    _stream(streaming, columns["close"])
+    assert macd("close", output="macd").compute(columns)[-1] == pytest.approx(streaming.macd_line)
+    assert macd("close", output="signal").compute(columns)[-1] == pytest.approx(streaming.signal_line)
+
+@pytest.mark.parametrize("spec", [sma("close", 20), ema("close", 10), rolling_std("close", 20), rsi("close"), macd("close"), atr(), rolling_max("high", 5)])
+def test_no_look_ahead(spec, columns):
+    """
+    Values computed on the full series equal those computed on any prefix, so no bar sees later data.
+    """
+    full = spec.compute(columns)
+    for end in (1, 30, 40, 120):
+        prefix = spec.compute({name: values[:end] for name, values in columns.items()})
+        np.testing.assert_allclose(prefix, full[:end], rtol=1e-10, equal_nan=True)
+
+def test_nan_inputs_do_not_leak_backwards(columns):
+    close = columns["close"].copy()
+    close[100] = np.nan
+    values = sma("close", 5).compute({**columns, "close": close})
+    assert np.isfinite(values[95:100]).all()
+    assert np.isnan(values[100:105]).all()
+    assert np.isfinite(values[105])
+
+def test_invalid_specs():
+    with pytest.raises(ValueError):
+        sma("adj_close", 20)
+    with pytest.raises(ValueError):
+        sma("close", 0)
+    with pytest.raises(ValueError):
+        macd("close", 26, 12)
+    with pytest.raises(ValueError):
+        macd("close", output="line")
+
+def test_specs_are_deduplicated_and_aligned_to_sorted_bars():
+    start = datetime(2023, 1, 1)
+    bars = [
+        PriceBar("AAPL", start + timedelta(days=i), Decimal("1"), Decimal("1"), Decimal("1"), Decimal(str(100 + i)), Decimal("1"))
+        for i in range(5)
+    ]
+    bar_index, values = precompute_indicators([sma("close", 2), sma("close", 2)], list(reversed(bars)))
+
+    assert list(values) == [sma("close", 2)]
+    assert bar_index[start + timedelta(days=4)] == 4
+    np.testing.assert_array_equal(values[sma("close", 2)], [np.nan, 100.5, 101.5, 102.5, 103.5])
+    assert not values[sma("close", 2)].flags.writeable
+
+class DeclaringStrategy(BaseStrategy):
+    def declare_indicators(self):
+        return {"fast": sma("close", 2)}
+
+    def on_market_event(self, event):
+        pass
+
+def test_strategy_reads_indicator_by_timestamp():
+    start = datetime(2023, 1, 1)
+    strategy = DeclaringStrategy("AAPL")
+    bar_index = {start + timedelta(days=i): i for i in range(3)}
+    strategy.set_precomputed_indicators("AAPL", bar_index, {"fast": np.array([np.nan, 1.5, 2.5])})
+
+    assert strategy.get_indicator("fast", MarketEvent("AAPL", start, {})) is None
+    assert strategy.get_indicator("fast", MarketEvent("AAPL", start + timedelta(days=2), {})) == 2.5
+    assert strategy.get_indicator("fast", MarketEvent("AAPL", start + timedelta(days=9), {})) is None
+    with pytest.raises(KeyError):
+        strategy.get_indicator("fast", MarketEvent("MSFT", start, {}))
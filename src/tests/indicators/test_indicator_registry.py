@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from alpheast.events.event import MarketEvent
+from alpheast.indicators.atr import ATR
+from alpheast.indicators.indicator_registry import IndicatorRegistry
+from alpheast.indicators.sma import SMA
+from alpheast.strategy.common.rsi_strategy import RSIStrategy
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+@pytest.fixture
+def events():
+    rng = np.random.default_rng(2)
+    closes = 100.0 + np.cumsum(rng.normal(0, 1, 80))
+    start = datetime(2023, 1, 1)
+    return [
+        MarketEvent(symbol, start + timedelta(days=i), {"open": c, "high": c + 1, "low": c - 1, "close": c, "volume": 1000})
+        for i, c in enumerate(closes)
+        for symbol in ("AAPL", "MSFT")
+    ]
+
+def test_same_key_shares_one_instance():
+    registry = IndicatorRegistry()
+    first = registry.subscribe("AAPL", SMA, 50)
+    second = registry.subscribe("AAPL", SMA, 50)
+
+    assert first is second
+    assert registry.subscribe("AAPL", SMA, 20) is not first
+    assert registry.subscribe("MSFT", SMA, 50) is not first
+    assert registry.get_stats() == {"indicators": 3, "subscriptions": 4}
+
+def test_registry_updates_each_indicator_once_per_bar(events):
+    registry = IndicatorRegistry()
+    shared_sma = registry.subscribe("AAPL", SMA, 10)
+    shared_atr = registry.subscribe("AAPL", ATR, 14)
+    registry.subscribe("AAPL", SMA, 10)
+
+    reference_sma, reference_atr = SMA(10), ATR(14)
+    for event in events:
+        registry.on_market_event(event)
+        if event.symbol == "AAPL":
+            reference_sma.update(event.data["close"])
+            reference_atr.update(event.data["high"], event.data["low"], event.data["close"])
+
+    assert shared_sma.value == pytest.approx(reference_sma.value)
+    assert shared_atr.value == pytest.approx(reference_atr.value)
+
+    registry.reset()
+    assert shared_sma.value is None
+
+def test_strategies_share_indicators_through_registry():
+    registry = IndicatorRegistry()
+    strategies = [RSIStrategy("AAPL", 14, threshold, 100 - threshold) for threshold in (20, 25, 30, 35)]
+    for strategy in strategies:
+        strategy.set_indicator_registry(registry)
+
+    assert registry.get_stats() == {"indicators": 1, "subscriptions": 4}
+    assert len({id(strategy._rsi.indicator) for strategy in strategies}) == 1
+
+def test_strategy_without_registry_feeds_private_indicators(events):
+    standalone = SMACrossoverStrategy("AAPL", 5, 20)
+    shared = SMACrossoverStrategy("AAPL", 5, 20)
+    registry = IndicatorRegistry()
+    shared.set_indicator_registry(registry)
+
+    for event in events:
+        registry.on_market_event(event)
+        standalone._update_indicators(event)
+        shared._update_indicators(event)
+
+    assert not standalone._slow_sma.is_shared
+    assert shared._slow_sma.is_shared
+    assert standalone._slow_sma.value == pytest.approx(shared._slow_sma.value)
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpheast.indicators.atr import ATR
+from alpheast.indicators.ema import EMA
+from alpheast.indicators.macd import MACD
+from alpheast.indicators.rolling_extremes import RollingMax, RollingMin
+from alpheast.indicators.rolling_std import RollingStd
+from alpheast.indicators.rsi import RSI
+from alpheast.indicators.sma import SMA
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(3)
+    return 100.0 + np.cumsum(rng.normal(0, 1, 300))
+
+def _feed(indicator, values):
+    return np.array([np.nan if (v := indicator.update(x)) is None else v for x in values])
+
+def test_sma_matches_pandas_rolling_mean(closes):
+    result = _feed(SMA(20), closes)
+    expected = pd.Series(closes).rolling(20).mean().to_numpy()
+    np.testing.assert_allclose(result, expected, rtol=1e-10, equal_nan=True)
+
+def test_ema_seeded_with_sma(closes):
+    result = _feed(EMA(10), closes)
+    alpha = 2 / 11
+    expected = np.full(len(closes), np.nan)
+    expected[9] = closes[:10].mean()
+    for i in range(10, len(closes)):
+        expected[i] = expected[i - 1] + alpha * (closes[i] - expected[i - 1])
+    np.testing.assert_allclose(result, expected, rtol=1e-10, equal_nan=True)
+
+def test_rolling_std_matches_pandas(closes):
+    indicator = RollingStd(20)
+    result = _feed(indicator, closes)
+    series = pd.Series(closes)
+    np.testing.assert_allclose(result, series.rolling(20).std().to_numpy(), rtol=1e-8, equal_nan=True)
+    assert indicator.mean == pytest.approx(closes[-20:].mean())
+
+def test_rsi_matches_wilder_reference(closes):
+    result = _feed(RSI(14), closes)
+
+    changes = np.diff(closes)
+    gains, losses = np.maximum(changes, 0), np.maximum(-changes, 0)
+    avg_gain, avg_loss = gains[:14].mean(), losses[:14].mean()
+    expected = [100 - 100 / (1 + avg_gain / avg_loss)]
+    for gain, loss in zip(gains[14:], losses[14:]):
+        avg_gain = (avg_gain * 13 + gain) / 14
+        avg_loss = (avg_loss * 13 + loss) / 14
+        expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+
+    assert np.isnan(result[:14]).all()
+    np.testing.assert_allclose(result[14:], expected, rtol=1e-10)
+
+def test_rsi_is_100_without_losses():
+    result = _feed(RSI(3), [1.0, 2.0, 3.0, 4.0])
+    assert result[-1] == 100.0
+
+def test_macd_lines(closes):
+    macd = MACD(12, 26, 9)
+    result = _feed(macd, closes)
+
+    # Both EMAs start at the slow warm-up, each seeded with the SMA of its own last closes
+    fast_ema, slow_ema = closes[14:26].mean(), closes[:26].mean()
+    macd_line = []
+    for close in closes[26:]:
+        fast_ema += (close - fast_ema) * 2 / 13
+        slow_ema += (close - slow_ema) * 2 / 27
+        macd_line.append(fast_ema - slow_ema)
+    macd_line = np.array([closes[14:26].mean() - closes[:26].mean()] + macd_line)
+
+    signal = np.full(len(macd_line), np.nan)
+    signal[8] = macd_line[:9].mean()
+    for i in range(9, len(macd_line)):
+        signal[i] = signal[i - 1] + (macd_line[i] - signal[i - 1]) * 2 / 10
+
+    assert np.isnan(result[:33]).all()
+    np.testing.assert_allclose(result[33:], (macd_line - signal)[8:], rtol=1e-8, atol=1e-12)
+    assert macd.macd_line == pytest.approx(macd_line[-1])
+    assert macd.signal_line == pytest.approx(signal[-1])
+
+def test_atr_matches_wilder_reference():
+    rng = np.random.default_rng(5)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, 60))
+    high = close + rng.uniform(0, 2, 60)
+    low = close - rng.uniform(0, 2, 60)
+
+    atr = ATR(14)
+    values = [atr.update(h, l, c) for h, l, c in zip(high, low, close)]
+
+    previous_close = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.nanmax(np.vstack([high - low, np.abs(high - previous_close), np.abs(low - previous_close)]), axis=0)
+    expected = true_range[:14].mean()
+    for tr in true_range[14:]:
+        expected = (expected * 13 + tr) / 14
+
+    assert values[12] is None
+    assert values[-1] == pytest.approx(expected)
+
+def test_rolling_extremes_match_pandas(closes):
+    series = pd.Series(closes)
+    np.testing.assert_array_equal(_feed(RollingMax(15), closes), series.rolling(15).max().to_numpy())
+    np.testing.assert_array_equal(_feed(RollingMin(15), closes), series.rolling(15).min().to_numpy())
+
+@pytest.mark.parametrize("indicator", [SMA(5), EMA(5), RollingStd(5), RSI(5), MACD(3, 5, 2), RollingMax(5), RollingMin(5)])
+def test_reset_restarts_warm_up(indicator, closes):
+    first = _feed(indicator, closes[:50])
+    indicator.reset()
+    assert indicator.value is None
+    assert not indicator.is_ready
+    np.testing.assert_array_equal(_feed(indicator, closes[:50]), first)
+
+def test_invalid_period():
+    with pytest.raises(ValueError):
+        SMA(0)
+    with pytest.raises(ValueError):
+        RollingStd(1)
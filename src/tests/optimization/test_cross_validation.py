@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from alpheast.data.bar_store import BarStore
+from alpheast.optimization.cross_validation import (
+    PurgedCrossValidator, combinatorial_purged_masks, mask_segments, purged_kfold_masks
+)
+from alpheast.optimization.parameter_sweep import ParameterSweep, expand_parameter_grid
+
+
+pytestmark = pytest.mark.usefixtures("quiet_logging")
+
+@pytest.fixture
+def bar_store(random_walk_bars):
+    return BarStore.from_price_bar_data(random_walk_bars(23, 240))
+
+def test_purged_kfold_masks_drop_purge_and_embargo_around_the_test_block():
+    splits = purged_kfold_masks(12, n_splits=3, purge=1, embargo=2)
+
+    assert [mask_segments(test) for _, test in splits] == [[(0, 4)], [(4, 8)], [(8, 12)]]
+    assert [mask_segments(train) for train, _ in splits] == [[(6, 12)], [(0, 3), (10, 12)], [(0, 7)]]
+
+def test_combinatorial_masks_cover_every_group_combination():
+    splits = combinatorial_purged_masks(12, n_groups=4, n_test_groups=2)
+
+    assert len(splits) == 6
+    for train, test in splits:
+        assert test.sum() == 6
+        assert not (train & test).any()
+    # Every timestamp is tested in the same number of combinations
+    assert np.all(np.sum([test for _, test in splits], axis=0) == 3)
+
+    with pytest.raises(ValueError):
+        combinatorial_purged_masks(12, n_groups=4, n_test_groups=4)
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_cross_validation_matches_plain_sweeps_per_segment(options, bar_store, sma_strategies, sizing, max_workers):
+    parameter_sets = expand_parameter_grid({"fast": [5, 10], "slow": [20, 30]})
+    splits = purged_kfold_masks(len(bar_store.timeline), n_splits=3, purge=5)
+    validator = PurgedCrossValidator(
+        options, bar_store, sma_strategies, parameter_sets, splits, position_sizing_factory=sizing, max_workers=max_workers
+    )
+
+    result = validator.run()
+
+    assert len(result.records) == 3 * 2 * 4
+    assert all(record.error is None for record in result.records)
+
+    # A single-segment test part is exactly a plain sweep over that slice
+    returns = result.metric_distribution("total_return")
+    plain = ParameterSweep(options, bar_store.slice(80, 160), sma_strategies, parameter_sets, sizing, max_workers=1).run_all()
+    assert returns[1] == pytest.approx([run.metrics["total_return"] for run in plain])
+
+    # The train part of the middle split has two segments, which are stitched
+    middle_train = [record for record in result.records if record.split == 1 and record.sample == "train"]
+    assert middle_train[0].metrics["total_trades"] == sum(
+        run.metrics["total_trades"] for run in ParameterSweep(
+            options, bar_store, sma_strategies, [parameter_sets[0]] * 2, sizing, max_workers=1, time_windows=[(0, 75), (160, 240)]
+        ).run_all()
+    )
+
+    selected = result.selected_test_scores("total_return")
+    train_returns = result.metric_distribution("total_return", "train")
+    assert selected[0] == returns[0, int(np.nanargmax(train_returns[0]))]
+
+def test_masks_must_cover_the_timeline(options, bar_store, sma_strategies):
+    with pytest.raises(ValueError):
+        PurgedCrossValidator(options, bar_store, sma_strategies, [{"fast": 5, "slow": 20}], purged_kfold_masks(100, 2))
@@ -0,0 +1,41 @@
+import pytest
+
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.engine import BacktestingEngine
+from alpheast.optimization.grid_evaluation import GRID_METRIC_FIELDS, evaluate_sma_crossover_grid
+
+
+@pytest.fixture
+def price_bars(random_walk_bars):
+    return random_walk_bars(21, 250, spread=0.01)["AAPL"]
+
+def test_only_valid_pairs_are_evaluated(price_bars):
+    result = evaluate_sma_crossover_grid(price_bars, [5, 10, 30], [10, 30])
+
+    assert list(result) == GRID_METRIC_FIELDS
+    assert list(zip(result["fast_period"], result["slow_period"])) == [(5, 10), (5, 30), (10, 30)]
+    assert all(len(values) == 3 for values in result.values())
+
+def test_empty_grid(price_bars):
+    result = evaluate_sma_crossover_grid(price_bars, [30], [10])
+    assert all(len(values) == 0 for values in result.values())
+
+@pytest.mark.usefixtures("quiet_logging")
+def test_grid_matches_engine_runs(options, price_bars, sma_strategies, sizing):
+    result = evaluate_sma_crossover_grid(price_bars, [5, 12], [20, 40], allocation_percent=0.3)
+
+    for i, (fast, slow) in enumerate(zip(result["fast_period"], result["slow_period"])):
+        params = {"fast": int(fast), "slow": int(slow)}
+        engine = BacktestingEngine(
+            options,
+            DataSource(type=DataSourceType.DIRECT, price_bar_data={"AAPL": price_bars}),
+            sma_strategies(params),
+            sizing(params)
+        )
+        metrics = engine.run().performance_metrics["strategy"]
+
+        assert result["total_trades"][i] == metrics["total_trades"]
+        assert result["final_portfolio_value"][i] == pytest.approx(metrics["final_portfolio_value"], abs=0.01)
+        assert round(result["total_return"][i], 2) == pytest.approx(metrics["total_return"])
+        assert round(result["max_drawdown"][i], 2) == pytest.approx(metrics["max_drawdown"])
+        assert round(result["annualized_volatility"][i], 2) == pytest.approx(metrics["annualized_volatility"])
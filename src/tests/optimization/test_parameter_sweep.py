@@ -0,0 +1,44 @@
+
+import pytest
+
+from alpheast.optimization.parameter_sweep import ParameterSweep, expand_parameter_grid
+
+
+pytestmark = pytest.mark.usefixtures("quiet_logging")
+
+@pytest.fixture
+def price_bar_data(random_walk_bars):
+    return random_walk_bars(13, 200)
+
+def test_expand_parameter_grid():
+    assert expand_parameter_grid({"fast": [5, 10], "slow": [50]}) == [{"fast": 5, "slow": 50}, {"fast": 10, "slow": 50}]
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sweep_isolates_failed_runs(options, price_bar_data, sma_strategies, sizing, max_workers):
+    # fast >= slow makes the strategy raise in its constructor
+    parameter_sets = expand_parameter_grid({"fast": [5, 60], "slow": [20, 40]})
+    sweep = ParameterSweep(options, price_bar_data, sma_strategies, parameter_sets, sizing, max_workers=max_workers)
+
+    progress = []
+    results = sweep.run_all(lambda completed, total: progress.append((completed, total)))
+
+    assert [result.run_index for result in results] == [0, 1, 2, 3]
+    assert [result.succeeded for result in results] == [True, True, False, False]
+    assert "Fast period must be less than slow period" in results[2].error
+    assert isinstance(results[0].metrics["final_portfolio_value"], float)
+    assert progress[-1] == (4, 4)
+
+def test_parallel_results_match_serial(options, price_bar_data, sma_strategies, sizing):
+    parameter_sets = expand_parameter_grid({"fast": [5, 10], "slow": [30, 50]})
+    serial = ParameterSweep(options, price_bar_data, sma_strategies, parameter_sets, sizing, max_workers=1).run_all()
+    parallel = ParameterSweep(options, price_bar_data, sma_strategies, parameter_sets, sizing, max_workers=2).run_all()
+
+    assert [result.metrics for result in parallel] == [result.metrics for result in serial]
+
+def test_cancel_stops_sweep(options, price_bar_data, sma_strategies, sizing):
+    parameter_sets = expand_parameter_grid({"fast": [2, 3, 4, 5, 6, 7], "slow": [30]})
+    sweep = ParameterSweep(options, price_bar_data, sma_strategies, parameter_sets, sizing, max_workers=1)
+
+    results = sweep.run_all(lambda completed, total: sweep.cancel() if completed == 2 else None)
+
+    assert len(results) == 2
@@ -0,0 +1,54 @@
+import pytest
+
+from alpheast.data.bar_store import BarStore
+from alpheast.optimization.parameter_sweep import ParameterSweep, expand_parameter_grid
+from alpheast.optimization.walk_forward import WalkForwardOptimizer, walk_forward_windows
+
+
+pytestmark = pytest.mark.usefixtures("quiet_logging")
+
+@pytest.fixture
+def bar_store(random_walk_bars):
+    return BarStore.from_price_bar_data(random_walk_bars(17, 300))
+
+def test_rolling_and_anchored_windows():
+    assert walk_forward_windows(10, 4, 3) == [((0, 4), (4, 7)), ((3, 7), (7, 10))]
+    assert walk_forward_windows(11, 4, 3, anchored=True) == [((0, 4), (4, 7)), ((0, 7), (7, 10)), ((0, 10), (10, 11))]
+    assert walk_forward_windows(4, 4, 3) == []
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_walk_forward_picks_in_sample_best_and_stitches(options, bar_store, sma_strategies, sizing, max_workers):
+    parameter_sets = expand_parameter_grid({"fast": [5, 10], "slow": [20, 40]})
+    optimizer = WalkForwardOptimizer(
+        options, bar_store, sma_strategies, parameter_sets, in_sample_size=120, out_of_sample_size=90,
+        position_sizing_factory=sizing, objective="total_return", max_workers=max_workers
+    )
+
+    progress = []
+    result = optimizer.run(lambda completed, total: progress.append((completed, total)))
+
+    assert [(fold.in_sample, fold.out_of_sample) for fold in result.folds] == [((0, 120), (120, 210)), ((90, 210), (210, 300))]
+    assert progress[-1] == (10, 10)
+
+    # The chosen parameters are the best of a plain sweep over the same in-sample slice
+    first_fold = ParameterSweep(options, bar_store.slice(0, 120), sma_strategies, parameter_sets, sizing, max_workers=1).run_all()
+    best = max(first_fold, key=lambda run: run.metrics["total_return"])
+    assert result.folds[0].best_params == best.params
+    assert result.folds[0].in_sample_score == best.metrics["total_return"]
+
+    # Out-of-sample curves are chained: the second fold continues from the first fold's final equity
+    stitched = result.results
+    assert len(stitched.daily_values) == 180
+    second_fold_start = _fold_first_value(options, bar_store, sma_strategies, sizing, result.folds[1])
+    assert stitched.daily_values[90]["value"] == pytest.approx(
+        float(second_fold_start) * stitched.daily_values[89]["value"] / 100_000.0
+    )
+    assert len(stitched.trade_log) == sum(fold.out_of_sample_metrics["total_trades"] for fold in result.folds)
+    assert stitched.performance_metrics["strategy"]["final_portfolio_value"] == pytest.approx(stitched.daily_values[-1]["value"], abs=0.01)
+
+def _fold_first_value(options, bar_store, sma_strategies, sizing, fold):
+    run = ParameterSweep(
+        options, bar_store, sma_strategies, [fold.best_params], sizing, max_workers=1,
+        time_windows=[fold.out_of_sample], keep_backtest_results=True
+    ).run_all()[0]
+    return run.backtest_results.daily_values[0]["value"]
@@ -0,0 +1,49 @@
+from performance_tests.benchmark_suite import find_regressions
+
+
+def _results(**scenarios):
+    return {"scenarios": scenarios}
+
+def test_within_threshold_is_no_regression():
+    baseline = _results(sma={"wall_time_seconds": 1.0, "peak_rss_mb": 100.0, "events_per_second": 1000.0})
+    results = _results(sma={"wall_time_seconds": 1.15, "peak_rss_mb": 110.0, "events_per_second": 900.0})
+
+    assert find_regressions(results, baseline, threshold=0.2) == []
+
+def test_slower_and_bigger_are_regressions():
+    baseline = _results(sma={"wall_time_seconds": 1.0, "peak_rss_mb": 100.0})
+    results = _results(sma={"wall_time_seconds": 1.5, "peak_rss_mb": 130.0})
+
+    regressions = find_regressions(results, baseline, threshold=0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("sma: wall_time_seconds") and "+50% worse" in regressions[0]
+    assert regressions[1].startswith("sma: peak_rss_mb") and "+30% worse" in regressions[1]
+
+def test_events_per_second_is_worse_when_lower():
+    baseline = _results(sma={"events_per_second": 1000.0})
+
+    # Higher throughput is an improvement, however large
+    assert find_regressions(_results(sma={"events_per_second": 5000.0}), baseline) == []
+    regressions = find_regressions(_results(sma={"events_per_second": 500.0}), baseline, threshold=0.2)
+    assert regressions == ["sma: events_per_second 1000 -> 500 (+100% worse)"]
+
+def test_failing_scenario_is_a_regression():
+    baseline = _results(sma={"wall_time_seconds": 1.0})
+    results = _results(sma={"error": "MemoryError"})
+
+    assert find_regressions(results, baseline) == ["sma: failed (MemoryError)"]
+
+def test_baseline_errors_and_missing_scenarios_are_skipped():
+    baseline = _results(
+        sma={"error": "MemoryError"},
+        rsi={"wall_time_seconds": 1.0},
+        macd={"wall_time_seconds": 1.0, "peak_rss_mb": None}
+    )
+    results = _results(
+        sma={"wall_time_seconds": 100.0},
+        bollinger={"wall_time_seconds": 100.0},
+        macd={"wall_time_seconds": 1.0, "peak_rss_mb": 500.0}
+    )
+
+    assert find_regressions(results, baseline) == []
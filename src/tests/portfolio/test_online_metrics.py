@@ -0,0 +1,61 @@
+
+import math
+
+import numpy as np
+import pytest
+
+from alpheast.portfolio.online_metrics import OnlineMetrics
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(7)
+    return list(100_000.0 * np.cumprod(1 + rng.normal(0.0005, 0.01, 250)))
+
+def test_online_metrics_initial_snapshot():
+    metrics = OnlineMetrics(initial_value=10_000.0)
+    snapshot = metrics.get_snapshot()
+
+    assert snapshot["current_value"] == 10_000.0
+    assert snapshot["num_returns"] == 0
+    assert snapshot["return_variance"] == 0.0
+    assert snapshot["sharpe_ratio"] is None
+    assert snapshot["max_drawdown"] == 0.0
+    assert snapshot["turnover"] == 0.0
+
+def test_online_metrics_matches_batch_statistics(values):
+    metrics = OnlineMetrics(initial_value=100_000.0)
+    for value in values:
+        metrics.update_value(value)
+
+    returns = np.diff(values) / np.array(values[:-1])
+    peaks = np.maximum.accumulate(values)
+    drawdowns = (np.array(values) - peaks) / peaks
+
+    assert metrics.mean_return == pytest.approx(returns.mean(), rel=1e-9)
+    assert metrics.return_variance == pytest.approx(returns.var(ddof=1), rel=1e-9)
+    assert metrics.sharpe_ratio == pytest.approx(returns.mean() / returns.std(ddof=1) * math.sqrt(252), rel=1e-9)
+    assert metrics.max_drawdown == pytest.approx(drawdowns.min())
+    assert metrics.current_drawdown == pytest.approx(drawdowns[-1])
+    assert metrics.peak_value == pytest.approx(peaks[-1])
+    assert metrics.total_return == pytest.approx(values[-1] / 100_000.0 - 1)
+
+def test_online_metrics_exposure_and_turnover():
+    metrics = OnlineMetrics(initial_value=1_000.0)
+    metrics.record_fill(500.0)
+    metrics.update_value(1_000.0, gross_exposure_value=500.0)
+    metrics.record_fill(-500.0)
+    metrics.update_value(1_000.0, gross_exposure_value=0.0)
+
+    assert metrics.exposure == 0.0
+    assert metrics.average_exposure == pytest.approx(0.25)
+    assert metrics.turnover == pytest.approx(1.0)
+    assert metrics.get_snapshot()["num_fills"] == 2
+
+def test_online_metrics_reset(values):
+    metrics = OnlineMetrics(initial_value=100_000.0)
+    for value in values[:10]:
+        metrics.update_value(value)
+    metrics.reset()
+
+    assert metrics.get_snapshot() == OnlineMetrics(initial_value=100_000.0).get_snapshot()
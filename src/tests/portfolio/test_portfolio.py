@@ -4,6 +4,8 @@ from decimal import Decimal, getcontext
 
 import pytest
 
+from alpheast.config.margin_config import MarginConfig
+from alpheast.models.lot_method import LotMethod
 from alpheast.portfolio.portfolio import Portfolio
 
 
@@ -151,3 +153,127 @@ def test_get_summary(portfolio):
     assert summary["cash"] == float(Decimal("9418.5"))
     assert summary["holdings"] == {"GHI": float(Decimal("3"))}
     assert summary["total_trades"] == 2
+
+def _buy_two_lots_and_sell(lot_method: LotMethod) -> Portfolio:
+    portfolio = Portfolio(initial_cash=10000.0, transaction_cost_percent=Decimal("0.001"), lot_method=lot_method)
+    portfolio.buy("AAPL", Decimal("10"), Decimal("100.0"), datetime(2023, 1, 1), Decimal("0"))
+    portfolio.buy("AAPL", Decimal("10"), Decimal("120.0"), datetime(2023, 1, 2), Decimal("0"))
+    portfolio.sell("AAPL", Decimal("15"), Decimal("130.0"), datetime(2023, 1, 3), Decimal("0"))
+    return portfolio
+
+def test_sell_realized_pnl_fifo():
+    portfolio = _buy_two_lots_and_sell(LotMethod.FIFO)
+
+    # Sells the 10 @ 100 lot and 5 of the 10 @ 120 lot: 15 * 130 - (1000 + 600) = 350
+    assert portfolio.total_realized_pnl == Decimal("350")
+    assert portfolio.trade_log[-1]["realized_pnl"] == Decimal("350")
+    lots = portfolio.get_lots("AAPL")
+    assert len(lots) == 1
+    assert lots[0].quantity == Decimal("5")
+    assert lots[0].unit_cost == Decimal("120")
+    assert portfolio.cost_basis["AAPL"] == Decimal("600")
+
+def test_sell_realized_pnl_lifo():
+    portfolio = _buy_two_lots_and_sell(LotMethod.LIFO)
+
+    # Sells the 10 @ 120 lot and 5 of the 10 @ 100 lot: 15 * 130 - (1200 + 500) = 250
+    assert portfolio.total_realized_pnl == Decimal("250")
+    lots = portfolio.get_lots("AAPL")
+    assert lots[0].quantity == Decimal("5")
+    assert lots[0].unit_cost == Decimal("100")
+    assert portfolio.cost_basis["AAPL"] == Decimal("500")
+
+def test_sell_realized_pnl_average_cost():
+    portfolio = _buy_two_lots_and_sell(LotMethod.AVERAGE_COST)
+
+    # Average cost of 110: 15 * (130 - 110) = 300
+    assert portfolio.total_realized_pnl == Decimal("300")
+    assert len(portfolio.get_lots("AAPL")) == 1
+    assert portfolio.cost_basis["AAPL"] == Decimal("550")
+
+def test_lots_include_commissions_and_close_out(portfolio):
+    portfolio.buy("MSFT", Decimal("4"), Decimal("50.0"), datetime(2023, 1, 1), Decimal("2.0"))
+    assert portfolio.cost_basis["MSFT"] == Decimal("202.0")
+
+    portfolio.sell("MSFT", Decimal("4"), Decimal("60.0"), datetime(2023, 1, 2), Decimal("1.0"))
+    assert portfolio.realized_pnl["MSFT"] == Decimal("37.0")
+    assert portfolio.get_lots("MSFT") == []
+    assert "MSFT" not in portfolio.cost_basis
+    assert portfolio.get_summary()["realized_pnl"] == 37.0
+
+def test_get_unrealized_pnl_and_lot_report(portfolio):
+    portfolio.buy("TSLA", Decimal("2"), Decimal("200.0"), datetime(2023, 1, 1), Decimal("0"))
+    portfolio.buy("TSLA", Decimal("3"), Decimal("210.0"), datetime(2023, 1, 2), Decimal("0"))
+
+    assert portfolio.get_unrealized_pnl({"TSLA": Decimal("220.0")}) == Decimal("70")
+    report = portfolio.get_lot_report()
+    assert [row["quantity"] for row in report] == [2.0, 3.0]
+    assert report[1]["unit_cost"] == 210.0
+
+@pytest.fixture
+def margin_portfolio():
+    return Portfolio(
+        initial_cash=10000.0,
+        transaction_cost_percent=Decimal("0.001"),
+        margin_config=MarginConfig(initial_margin=0.5, maintenance_margin=0.3, borrow_fee_rate=0.252)
+    )
+
+def test_sell_without_holding_is_rejected_when_long_only(portfolio):
+    assert portfolio.sell("AMZN", Decimal("5"), Decimal("100.0"), datetime(2023, 1, 1)) is None
+    assert portfolio.holdings == {}
+
+def test_short_sale_and_cover_realized_pnl(margin_portfolio):
+    margin_portfolio.sell("TSLA", Decimal("10"), Decimal("200.0"), datetime(2023, 1, 1), Decimal("2.0"))
+    assert margin_portfolio.holdings["TSLA"] == Decimal("-10")
+    assert margin_portfolio.cash == Decimal("11998.0")
+    assert margin_portfolio.cost_basis["TSLA"] == Decimal("-1998.0")
+
+    margin_portfolio.buy("TSLA", Decimal("10"), Decimal("150.0"), datetime(2023, 1, 2), Decimal("1.5"))
+    assert margin_portfolio.holdings == {}
+    assert margin_portfolio.realized_pnl["TSLA"] == Decimal("496.5")
+    assert margin_portfolio.trade_log[-1]["realized_pnl"] == Decimal("496.5")
+    assert margin_portfolio.short_market_value == Decimal("0")
+
+def test_buy_through_short_reverses_position(margin_portfolio):
+    margin_portfolio.sell("TSLA", Decimal("5"), Decimal("100.0"), datetime(2023, 1, 1))
+    margin_portfolio.buy("TSLA", Decimal("8"), Decimal("90.0"), datetime(2023, 1, 2))
+
+    assert margin_portfolio.holdings["TSLA"] == Decimal("3")
+    assert margin_portfolio.total_realized_pnl == Decimal("50")
+    assert margin_portfolio.cost_basis["TSLA"] == Decimal("270")
+    assert margin_portfolio.long_market_value == Decimal("270")
+    assert margin_portfolio.short_market_value == Decimal("0")
+
+def test_market_values_and_buying_power_are_incremental(margin_portfolio):
+    margin_portfolio.buy("AAPL", Decimal("10"), Decimal("100.0"), datetime(2023, 1, 1))
+    margin_portfolio.sell("TSLA", Decimal("20"), Decimal("50.0"), datetime(2023, 1, 1))
+    margin_portfolio.update_market_price("AAPL", Decimal("110.0"))
+    margin_portfolio.update_market_price("TSLA", Decimal("60.0"))
+
+    assert margin_portfolio.long_market_value == Decimal("1100")
+    assert margin_portfolio.short_market_value == Decimal("1200")
+    assert margin_portfolio.equity == margin_portfolio.get_total_value({"AAPL": Decimal("110.0"), "TSLA": Decimal("60.0")})
+    # Cash 10000 - 1000 + 1000, less 1.5x the short market value
+    assert margin_portfolio.buying_power == Decimal("8200")
+    assert margin_portfolio.maintenance_requirement == Decimal("360")
+
+def test_borrow_fee_is_charged_on_short_market_value(margin_portfolio):
+    margin_portfolio.sell("TSLA", Decimal("10"), Decimal("100.0"), datetime(2023, 1, 1))
+    fee = margin_portfolio.charge_borrow_fee(datetime(2023, 1, 2))
+
+    assert fee == Decimal("1")
+    assert margin_portfolio.cash == Decimal("10999")
+    assert margin_portfolio.get_summary()["borrow_fees"] == 1.0
+
+def test_margin_call_covers_shorts_proportionally():
+    portfolio = Portfolio(initial_cash=1000.0, margin_config=MarginConfig(initial_margin=0.5, maintenance_margin=0.3))
+    portfolio.sell("AAA", Decimal("10"), Decimal("100.0"), datetime(2023, 1, 1))
+    portfolio.sell("BBB", Decimal("10"), Decimal("100.0"), datetime(2023, 1, 1))
+    assert not portfolio.is_margin_call()
+
+    portfolio.update_market_price("AAA", Decimal("140.0"))
+    portfolio.update_market_price("BBB", Decimal("140.0"))
+
+    # Equity 3000 - 2800 = 200 < 0.3 * 2800, covers until 0.5 * shorts <= 200
+    assert portfolio.is_margin_call()
+    assert portfolio.get_margin_call_covers() == {"AAA": Decimal("9"), "BBB": Decimal("9")}
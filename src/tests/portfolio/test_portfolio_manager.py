@@ -8,7 +8,8 @@ from unittest.mock import Mock, patch
 import pytest
 from pytest_mock import mocker
 
-from alpheast.events.event import FillEvent, MarketEvent, OrderEvent, SignalEvent
+from alpheast.config.margin_config import MarginConfig
+from alpheast.events.event import FillEvent, MarketEvent, OrderEvent, SignalEvent, TargetWeightsEvent
 from alpheast.events.event_enums import OrderType
 from alpheast.events.event_queue import EventQueue
 from alpheast.models.signal import Signal
@@ -16,6 +17,9 @@ from alpheast.portfolio.benchmark_calculator import BenchmarkCalculator
 from alpheast.portfolio.portfolio import Portfolio
 from alpheast.portfolio.portfolio_manager import PortfolioManager
 from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.common.fixed_allocation_sizing import FixedAllocationSizing
+from alpheast.position_sizing.common.fixed_quantity_sizing import FixedQuantitySizing
+from alpheast.position_sizing.joint_allocation import JointAllocation
 
 
 getcontext().prec = 10
@@ -280,3 +284,166 @@ def test_on_signal_event_buy_with_pending_order_deduction(portfolio_manager, moc
     assert placed_order.quantity == Decimal("5")
     assert placed_order.price == Decimal("100.0")
     assert placed_order.direction == Signal.BUY
+
+def test_short_signal_and_batched_margin_call():
+    """
+    Test that a SELL signal on a flat symbol opens a short and that a margin call
+    is turned into covering orders at the end of the timestamp.
+    """
+    event_queue = EventQueue()
+    pm = PortfolioManager(
+        event_queue=event_queue,
+        symbols=["AAPL"],
+        initial_cash=1_000.0,
+        slippage_percent=Decimal("0"),
+        position_sizing_method=FixedQuantitySizing(10),
+        margin_config=MarginConfig(initial_margin=0.5, maintenance_margin=0.3)
+    )
+    pm.on_market_event(MarketEvent("AAPL", datetime(2023, 1, 1), {"close": 100.0}))
+    pm.on_signal_event(SignalEvent("AAPL", datetime(2023, 1, 1), Signal.SELL))
+
+    order = event_queue.get()
+    assert order.direction == Signal.SELL and order.quantity == Decimal("10")
+    pm.on_fill_event(FillEvent(order.order_id, "AAPL", datetime(2023, 1, 2), Signal.SELL, Decimal("10"), Decimal("100.0"), Decimal("0")))
+    assert pm.portfolio_account.get_holding_quantity("AAPL") == Decimal("-10")
+
+    pm.on_timestamp_end()
+    assert event_queue.empty()
+
+    pm.on_market_event(MarketEvent("AAPL", datetime(2023, 1, 3), {"close": 180.0}))
+    pm.on_timestamp_end()
+
+    cover = event_queue.get()
+    assert cover.direction == Signal.BUY
+    assert cover.quantity == Decimal("8")
+    assert len(pm.get_margin_calls()) == 1
+
+    # The pending cover is not duplicated on the next check
+    pm.on_timestamp_end()
+    assert event_queue.empty()
+
+def test_pending_sell_reserves_margin_only_beyond_the_holding():
+    event_queue = EventQueue()
+    pm = PortfolioManager(
+        event_queue=event_queue,
+        symbols=["AAPL"],
+        initial_cash=10_000.0,
+        slippage_percent=Decimal("0"),
+        margin_config=MarginConfig(initial_margin=0.5, maintenance_margin=0.3)
+    )
+    pm.on_market_event(MarketEvent("AAPL", datetime(2023, 1, 1), {"close": 100.0}))
+    pm.portfolio_account.buy("AAPL", Decimal("10"), Decimal("100.0"), datetime(2023, 1, 1))
+    buying_power = pm._get_available_buying_power()
+
+    # Selling 15 of a 10 share holding closes the long and shorts 5
+    pm._place_order("AAPL", datetime(2023, 1, 1), Signal.SELL, Decimal("15"), Decimal("100.0"))
+
+    assert pm._get_available_buying_power() == buying_power - Decimal("5") * Decimal("100.0") * Decimal("0.5")
+
+def _drain(event_queue):
+    events = []
+    while not event_queue.empty():
+        events.append(event_queue.get())
+    return events
+
+def _fill(pm, order, price):
+    pm.on_fill_event(FillEvent(order.order_id, order.symbol, order.timestamp, order.direction, order.quantity, Decimal(price), Decimal("0")))
+
+def test_target_weights_rebalance_sells_before_buys():
+    """
+    Test that a rebalance nets the deltas, places the sells first and only
+    places the buys once the batch's sells have filled.
+    """
+    event_queue = EventQueue()
+    pm = PortfolioManager(event_queue=event_queue, symbols=["AAA", "BBB", "CCC"], initial_cash=10_000.0, slippage_percent=Decimal("0"))
+    for symbol, price in [("AAA", 10.0), ("BBB", 20.0), ("CCC", 50.0)]:
+        pm.on_market_event(MarketEvent(symbol, datetime(2023, 1, 1), {"close": price}))
+    pm.portfolio_account.buy("AAA", Decimal("500"), Decimal("10.0"), datetime(2023, 1, 1))
+
+    pm.on_target_weights_event(TargetWeightsEvent(datetime(2023, 1, 2), {"AAA": 0.2, "BBB": 0.3, "CCC": 0.3}))
+
+    sells = _drain(event_queue)
+    assert [(o.symbol, o.direction, o.quantity) for o in sells] == [("AAA", Signal.SELL, Decimal("300"))]
+
+    _fill(pm, sells[0], "10.0")
+    buys = _drain(event_queue)
+    assert sorted((o.symbol, o.direction, o.quantity) for o in buys) == [
+        ("BBB", Signal.BUY, Decimal("150")), ("CCC", Signal.BUY, Decimal("60"))
+    ]
+
+    # Pending orders are netted: submitting the same targets again places nothing
+    pm.on_target_weights_event(TargetWeightsEvent(datetime(2023, 1, 2), {"AAA": 0.2, "BBB": 0.3, "CCC": 0.3}))
+    assert event_queue.empty()
+
+def test_unfilled_rebalance_sell_does_not_hold_back_later_batches():
+    """
+    Test that the buys of a new batch only wait for that batch's sells, not for
+    a sell of an earlier batch that never fills.
+    """
+    event_queue = EventQueue()
+    pm = PortfolioManager(event_queue=event_queue, symbols=["AAA", "BBB"], initial_cash=10_000.0, slippage_percent=Decimal("0"))
+    pm.on_market_event(MarketEvent("AAA", datetime(2023, 1, 1), {"close": 10.0}))
+    pm.on_market_event(MarketEvent("BBB", datetime(2023, 1, 1), {"close": 20.0}))
+    pm.portfolio_account.buy("AAA", Decimal("500"), Decimal("10.0"), datetime(2023, 1, 1))
+
+    pm.on_target_weights_event(TargetWeightsEvent(datetime(2023, 1, 2), {"AAA": 0.2, "BBB": 0.3}))
+    sells = _drain(event_queue)
+    assert [(o.symbol, o.direction, o.quantity) for o in sells] == [("AAA", Signal.SELL, Decimal("300"))]
+
+    # The sell never fills; the next batch nets it and has no sells of its own, so its buys go out at once
+    pm.on_target_weights_event(TargetWeightsEvent(datetime(2023, 1, 3), {"AAA": 0.2, "BBB": 0.3}))
+    buys = _drain(event_queue)
+    assert [(o.symbol, o.direction, o.quantity) for o in buys] == [("BBB", Signal.BUY, Decimal("150"))]
+
+    # A late fill of the earlier batch's sell places nothing more
+    _fill(pm, sells[0], "10.0")
+    assert event_queue.empty()
+
+def test_nan_target_weight_keeps_the_position():
+    event_queue = EventQueue()
+    pm = PortfolioManager(event_queue=event_queue, symbols=["AAA", "BBB"], initial_cash=10_000.0, slippage_percent=Decimal("0"))
+    pm.on_market_event(MarketEvent("AAA", datetime(2023, 1, 1), {"close": 10.0}))
+    pm.on_market_event(MarketEvent("BBB", datetime(2023, 1, 1), {"close": 20.0}))
+    pm.portfolio_account.buy("AAA", Decimal("100"), Decimal("10.0"), datetime(2023, 1, 1))
+
+    pm.on_target_weights_event(TargetWeightsEvent(datetime(2023, 1, 2), {"AAA": float("nan"), "BBB": 0.2}))
+
+    orders = _drain(event_queue)
+    assert [(o.symbol, o.direction, o.quantity) for o in orders] == [("BBB", Signal.BUY, Decimal("100"))]
+
+def test_target_weights_scale_buys_to_buying_power():
+    event_queue = EventQueue()
+    pm = PortfolioManager(event_queue=event_queue, symbols=["AAA", "BBB"], initial_cash=1_000.0, slippage_percent=Decimal("0"))
+    pm.on_market_event(MarketEvent("AAA", datetime(2023, 1, 1), {"close": 10.0}))
+    pm.on_market_event(MarketEvent("BBB", datetime(2023, 1, 1), {"close": 10.0}))
+
+    pm.on_target_weights_event(TargetWeightsEvent(datetime(2023, 1, 2), {"AAA": 0.5, "BBB": 0.5}))
+
+    buys = _drain(event_queue)
+    assert [o.direction for o in buys] == [Signal.BUY, Signal.BUY]
+    assert sum(o.quantity * o.price for o in buys) * Decimal("1.001") <= Decimal("1000")
+
+def test_buy_signals_are_sized_jointly_at_timestamp_end():
+    """
+    Test that with a joint allocation, the BUY signals of a timestamp share the cash
+    instead of being served first-come-first-served.
+    """
+    event_queue = EventQueue()
+    pm = PortfolioManager(
+        event_queue=event_queue,
+        symbols=["AAA", "BBB", "CCC"],
+        initial_cash=1_000.0,
+        slippage_percent=Decimal("0"),
+        transaction_cost_percent=Decimal("0"),
+        position_sizing_method=FixedAllocationSizing(0.5),
+        joint_allocation=JointAllocation.PROPORTIONAL
+    )
+    for symbol in ["AAA", "BBB", "CCC"]:
+        pm.on_market_event(MarketEvent(symbol, datetime(2023, 1, 1), {"close": 10.0}))
+        pm.on_signal_event(SignalEvent(symbol, datetime(2023, 1, 1), Signal.BUY))
+    assert event_queue.empty()
+
+    pm.on_timestamp_end()
+
+    orders = _drain(event_queue)
+    assert [(o.symbol, o.quantity) for o in orders] == [("AAA", Decimal("33")), ("BBB", Decimal("33")), ("CCC", Decimal("33"))]
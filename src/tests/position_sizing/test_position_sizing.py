@@ -0,0 +1,151 @@
+from decimal import Decimal
+import math
+
+import numpy as np
+import pytest
+
+from alpheast.models.signal import Signal
+from alpheast.position_sizing.base_position_sizing import BasePositionSizing
+from alpheast.position_sizing.common.fixed_allocation_sizing import FixedAllocationSizing
+from alpheast.position_sizing.common.atr_sizing import AtrSizing
+from alpheast.position_sizing.common.fixed_quantity_sizing import FixedQuantitySizing
+from alpheast.position_sizing.common.risk_parity_sizing import RiskParitySizing, equal_risk_contribution_weights
+from alpheast.position_sizing.common.volatility_target_sizing import VolatilityTargetSizing
+from alpheast.position_sizing.joint_allocation import JointAllocation, allocate_jointly
+from alpheast.position_sizing.risk_estimators import EwmaVolatility, RiskEstimators
+
+
+def test_allocate_jointly_leaves_fitting_batch_unchanged():
+    quantities = allocate_jointly(np.array([10.0, 5.0]), np.array([10.0, 20.0]), 1_000.0)
+    np.testing.assert_array_equal(quantities, [10, 5])
+
+def test_allocate_jointly_proportional():
+    # Desired costs 600 and 1400 for a budget of 1000: both halved
+    quantities = allocate_jointly(np.array([60.0, 70.0]), np.array([10.0, 20.0]), 1_000.0, JointAllocation.PROPORTIONAL)
+    np.testing.assert_array_equal(quantities, [30, 35])
+
+def test_allocate_jointly_capped():
+    # Desired costs 200, 600 and 1200 for a budget of 1000: the small one is kept, the others capped at 400
+    quantities = allocate_jointly(np.array([20.0, 60.0, 120.0]), np.array([10.0, 10.0, 10.0]), 1_000.0, JointAllocation.CAPPED)
+    np.testing.assert_array_equal(quantities, [20, 40, 40])
+
+def test_allocate_jointly_volatility_scaled():
+    quantities = allocate_jointly(
+        np.array([50.0, 50.0, 50.0]), np.array([10.0, 10.0, 10.0]), 10_000.0,
+        JointAllocation.VOLATILITY_SCALED, volatilities=np.array([0.01, 0.02, np.nan])
+    )
+    np.testing.assert_array_equal(quantities, [75, 37, 50])
+
+def test_fixed_allocation_batch_matches_scalar_sizing():
+    sizing = FixedAllocationSizing(0.1)
+    prices = np.array([12.5, 40.0, 99.0])
+    quantities = sizing.calculate_quantities(["A", "B", "C"], prices, Decimal("10000"), {})
+
+    expected = [
+        float(sizing.calculate_quantity(s, Signal.BUY, Decimal(str(p)), Decimal("10000"), {}))
+        for s, p in zip(["A", "B", "C"], prices)
+    ]
+    np.testing.assert_array_equal(quantities, expected)
+
+def test_fixed_allocation_batch_shares_cash():
+    sizing = FixedAllocationSizing(0.5)
+    quantities = sizing.calculate_quantities(["A", "B", "C", "D"], np.full(4, 10.0), Decimal("1000"), {})
+
+    assert (quantities * 10.0).sum() <= 1_000.0
+    np.testing.assert_array_equal(quantities, [25, 25, 25, 25])
+
+def test_fixed_quantity_batch_with_cost_factor():
+    quantities = FixedQuantitySizing(10).calculate_quantities(["A", "B"], np.array([50.0, 50.0]), Decimal("1000"), {}, cost_factor=1.25)
+    np.testing.assert_array_equal(quantities, [8, 8])
+
+def test_default_batch_sizing_uses_scalar_method():
+    class HalfCashSizing(BasePositionSizing):
+        def calculate_quantity(self, symbol, direction, current_price, portfolio_cash, portfolio_holdings, **kwargs):
+            return (portfolio_cash / 2 / current_price).quantize(Decimal("1"))
+
+    quantities = HalfCashSizing().calculate_quantities(["A", "B"], np.array([10.0, 10.0]), Decimal("1000"), {})
+    np.testing.assert_array_equal(quantities, [50, 50])
+
+def test_ewma_volatility():
+    estimator = EwmaVolatility(decay=0.9, min_periods=3)
+    prices = [100.0, 101.0, 99.0, 102.0, 103.0]
+    for price in prices:
+        estimator.update("A", price)
+
+    returns = np.diff(np.log(prices))
+    variance = returns[0] ** 2
+    for r in returns[1:]:
+        variance = 0.9 * variance + 0.1 * r ** 2
+
+    assert estimator.get_volatility("A") == pytest.approx(math.sqrt(variance))
+    assert math.isnan(estimator.get_volatility("B"))
+
+def _warmed_up_estimators(symbols, bars=40, covariance_window=None):
+    rng = np.random.default_rng(1)
+    estimators = RiskEstimators(symbols, ewma_decay=0.94, atr_period=14, covariance_window=covariance_window)
+    volatilities = np.linspace(0.01, 0.03, len(symbols))
+    prices = np.full(len(symbols), 100.0)
+    for _ in range(bars):
+        prices = prices * np.exp(rng.normal(0, volatilities))
+        for symbol, price in zip(symbols, prices):
+            estimators.update(symbol, price * 1.01, price * 0.99, price)
+        estimators.on_timestamp_end()
+    return estimators
+
+def test_volatility_target_sizing():
+    estimators = _warmed_up_estimators(["A"])
+    sizing = VolatilityTargetSizing(target_volatility=0.1)
+    sizing.set_risk_estimators(estimators)
+
+    volatility = estimators.volatility.get_volatility("A") * math.sqrt(252)
+    quantity = sizing.calculate_quantity("A", Signal.BUY, Decimal("50"), Decimal("100000"), {}, portfolio_current_value=Decimal("100000"))
+
+    assert quantity == Decimal(math.floor(100000 * min(0.1 / volatility, 0.25) / 50))
+
+def test_risk_sizing_without_estimates_is_zero():
+    sizing = VolatilityTargetSizing()
+    estimators = RiskEstimators(["A"])
+    sizing.set_risk_estimators(estimators)
+    # Only the estimator the sizing method reads is enabled
+    assert estimators.volatility is not None and estimators.atr is None
+    assert sizing.calculate_quantity("A", Signal.BUY, Decimal("50"), Decimal("1000"), {}) == Decimal("0")
+    assert AtrSizing().calculate_quantity("A", Signal.BUY, Decimal("50"), Decimal("1000"), {}) == Decimal("0")
+
+def test_atr_sizing_risks_fixed_fraction():
+    estimators = _warmed_up_estimators(["A"])
+    sizing = AtrSizing(risk_percent=0.01, atr_multiple=2.0)
+    sizing.set_risk_estimators(estimators)
+
+    atr = estimators.atr.get_atr("A")
+    quantity = sizing.calculate_quantity("A", Signal.BUY, Decimal("100"), Decimal("100000"), {}, portfolio_current_value=Decimal("100000"))
+
+    assert quantity == Decimal(math.floor(1000 / (2 * atr)))
+    # Sells of held positions return the holding
+    assert sizing.calculate_quantity("A", Signal.SELL, Decimal("100"), Decimal("0"), {"A": Decimal("7")}) == Decimal("7")
+
+def test_equal_risk_contribution_weights():
+    rng = np.random.default_rng(2)
+    returns = rng.normal(0, [0.01, 0.02, 0.04], (500, 3))
+    covariance = np.cov(returns, rowvar=False)
+
+    weights = equal_risk_contribution_weights(covariance)
+    contributions = weights * (covariance @ weights)
+
+    assert weights.sum() == pytest.approx(1.0)
+    np.testing.assert_allclose(contributions, contributions.mean(), rtol=1e-6)
+
+def test_risk_parity_sizing_favors_low_volatility():
+    sizing = RiskParitySizing(covariance_window=30, max_allocation_percent=1.0)
+    estimators = RiskEstimators(["A", "B", "C"])
+    sizing.set_risk_estimators(estimators)
+    assert estimators.covariance is not None
+
+    warmed_up = _warmed_up_estimators(["A", "B", "C"], covariance_window=30)
+    estimators.covariance = warmed_up.covariance
+
+    quantities = [
+        sizing.calculate_quantity(symbol, Signal.BUY, Decimal("100"), Decimal("100000"), {}, portfolio_current_value=Decimal("100000"))
+        for symbol in ["A", "B", "C"]
+    ]
+    assert quantities[0] > quantities[1] > quantities[2] > Decimal("0")
+    assert sum(quantities) * 100 <= Decimal("100000")
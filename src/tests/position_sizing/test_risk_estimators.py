@@ -0,0 +1,94 @@
+import math
+
+import numpy as np
+import pytest
+
+from alpheast.position_sizing.risk_estimators import RiskEstimators, RollingCovariance, WilderAtr
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    return 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, (200, 3)), axis=0))
+
+def test_wilder_atr_matches_reference():
+    rng = np.random.default_rng(5)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, 60))
+    high = close + rng.uniform(0, 2, 60)
+    low = close - rng.uniform(0, 2, 60)
+
+    atr = WilderAtr(period=14)
+    for h, l, c in zip(high, low, close):
+        atr.update("A", h, l, c)
+
+    previous_close = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.nanmax(np.vstack([high - low, np.abs(high - previous_close), np.abs(low - previous_close)]), axis=0)
+    expected = true_range[:14].mean()
+    for tr in true_range[14:]:
+        expected = (expected * 13 + tr) / 14
+
+    assert atr.get_atr("A") == pytest.approx(expected)
+
+def test_wilder_atr_warm_up():
+    atr = WilderAtr(period=3)
+    atr.update("A", 11.0, 9.0, 10.0)
+    atr.update("A", 12.0, 10.0, 11.0)
+    assert math.isnan(atr.get_atr("A"))
+    atr.update("A", 12.0, 11.0, 11.5)
+    assert atr.get_atr("A") == pytest.approx((2.0 + 2.0 + 1.0) / 3)
+
+def test_rolling_covariance_matches_numpy(prices):
+    window = 30
+    covariance = RollingCovariance(["A", "B", "C"], window=window)
+    for row in prices:
+        for symbol, price in zip(["A", "B", "C"], row):
+            covariance.update(symbol, price)
+        covariance.commit()
+
+    log_returns = np.diff(np.log(prices), axis=0)
+    # The first committed row has no returns yet (zero)
+    all_rows = np.vstack([np.zeros(3), log_returns])
+    expected = np.cov(all_rows[-window:], rowvar=False)
+
+    np.testing.assert_allclose(covariance.get_covariance(), expected, rtol=1e-9, atol=1e-14)
+    assert covariance.version == len(prices)
+
+def test_rolling_covariance_commit_without_updates_is_ignored():
+    covariance = RollingCovariance(["A"], window=5)
+    covariance.update("A", 100.0)
+    covariance.commit()
+    covariance.commit()
+    assert covariance.version == 1
+    assert covariance.get_covariance() is None
+
+def test_risk_estimators_are_opt_in():
+    estimators = RiskEstimators(["A"])
+    assert not estimators.enabled
+    assert estimators.volatility is None and estimators.atr is None and estimators.covariance is None
+
+    estimators.enable_atr(5)
+    atr = estimators.atr
+    estimators.enable_atr()
+    assert estimators.enabled
+    assert estimators.atr is atr and atr.period == 5
+    assert estimators.volatility is None
+
+def test_risk_estimators_enable_covariance_and_reset(prices):
+    estimators = RiskEstimators(["A", "B", "C"])
+    assert estimators.covariance is None
+    estimators.enable_volatility()
+    estimators.enable_atr()
+    estimators.enable_covariance(20)
+
+    for row in prices[:50]:
+        for symbol, price in zip(["A", "B", "C"], row):
+            estimators.update(symbol, price * 1.01, price * 0.99, price)
+        estimators.on_timestamp_end()
+
+    assert estimators.covariance.get_covariance().shape == (3, 3)
+    assert estimators.volatility.get_volatility("A") > 0
+    assert estimators.atr.get_atr("A") > 0
+
+    estimators.reset()
+    assert estimators.covariance.get_covariance() is None
+    assert math.isnan(estimators.volatility.get_volatility("A"))
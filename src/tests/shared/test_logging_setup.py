@@ -0,0 +1,112 @@
+import ast
+from datetime import timedelta
+import logging
+import pathlib
+import threading
+
+import pandas as pd
+import pytest
+
+import alpheast
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.synthetic import generate_bar_store
+from alpheast.engine import BacktestingEngine
+from alpheast.models.interval import Interval
+from alpheast.shared.logging_setup import LOGGER_NAME, configure_logging, shutdown_logging
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.get_ident())
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    yield
+    shutdown_logging()
+    for name in (LOGGER_NAME, f"{LOGGER_NAME}.strategy", f"{LOGGER_NAME}.portfolio"):
+        logging.getLogger(name).setLevel(logging.NOTSET)
+
+def test_async_handler_writes_on_the_listener_thread():
+    handler = RecordingHandler()
+    configure_logging(logging.INFO, handlers=[handler])
+    logger = logging.getLogger(f"{LOGGER_NAME}.test")
+
+    arguments = ["before"]
+    logger.info("Arguments: %s", arguments)
+    arguments.append("after")
+    logger.debug("Below the level")
+    shutdown_logging()
+
+    assert [record.getMessage() for record in handler.records] == ["Arguments: ['before']"]
+    assert threading.get_ident() not in handler.threads
+
+def test_component_levels():
+    handler = RecordingHandler()
+    configure_logging(logging.DEBUG, component_levels={"strategy": "WARNING"}, handlers=[handler], asynchronous=False)
+
+    logging.getLogger(f"{LOGGER_NAME}.strategy.base_strategy").info("strategy info")
+    logging.getLogger(f"{LOGGER_NAME}.strategy.base_strategy").warning("strategy warning")
+    logging.getLogger(f"{LOGGER_NAME}.portfolio.portfolio").debug("portfolio debug")
+
+    assert [record.getMessage() for record in handler.records] == ["strategy warning", "portfolio debug"]
+
+def test_shutdown_restores_propagation_and_levels():
+    logging.getLogger(f"{LOGGER_NAME}.portfolio").setLevel(logging.WARNING)
+    configure_logging(logging.DEBUG, component_levels={"portfolio": "DEBUG", "strategy": "ERROR"}, handlers=[RecordingHandler()])
+    # Reconfiguring keeps the levels from before the first call
+    configure_logging(logging.INFO, component_levels={"portfolio": "INFO"}, handlers=[RecordingHandler()])
+    assert not logging.getLogger(LOGGER_NAME).propagate
+
+    shutdown_logging()
+
+    assert logging.getLogger(LOGGER_NAME).propagate
+    assert not logging.getLogger(LOGGER_NAME).handlers
+    assert logging.getLogger(LOGGER_NAME).level == logging.NOTSET
+    assert logging.getLogger(f"{LOGGER_NAME}.portfolio").level == logging.WARNING
+    assert logging.getLogger(f"{LOGGER_NAME}.strategy").level == logging.NOTSET
+
+def test_engine_logs_per_component():
+    bar_store = generate_bar_store(["AAA"], 60, seed=1)
+    options = BacktestingOptions(
+        symbols=bar_store.symbols,
+        start_date=pd.Timestamp(bar_store.timeline[0]).date(),
+        end_date=pd.Timestamp(bar_store.timeline[-1]).date() + timedelta(days=1),
+        interval=Interval.DAILY,
+        initial_cash=100_000.0
+    )
+    handler = RecordingHandler()
+    configure_logging(logging.INFO, handlers=[handler])
+
+    BacktestingEngine(
+        options=options,
+        data_source=DataSource(type=DataSourceType.DIRECT, bar_store=bar_store),
+        strategies=[SMACrossoverStrategy("AAA", fast_period=5, slow_period=20)]
+    ).run()
+    shutdown_logging()
+
+    names = {record.name for record in handler.records}
+    assert {"alpheast.engine", "alpheast.handlers.data_handler", "alpheast.portfolio.portfolio_manager"} <= names
+    assert all(name.startswith(f"{LOGGER_NAME}.") for name in names)
+
+def test_log_messages_are_formatted_lazily():
+    # f-strings in log calls are formatted even when the level is disabled
+    offenders = []
+    for path in pathlib.Path(alpheast.__file__).parent.rglob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr in ("debug", "info", "warning", "error", "exception", "critical")
+                and node.args
+                and isinstance(node.args[0], ast.JoinedStr)
+            ):
+                offenders.append(f"{path.name}:{node.lineno}")
+    assert offenders == []
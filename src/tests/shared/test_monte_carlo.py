@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from alpheast.shared.monte_carlo import (
+    bootstrap_daily_returns, resample_trades, stationary_bootstrap_indices, summarize_distribution
+)
+
+
+@pytest.fixture
+def daily_values():
+    rng = np.random.default_rng(7)
+    values = 100_000.0 * np.cumprod(np.concatenate(([1.0], 1 + rng.normal(0.0005, 0.01, 250))))
+    return [{"date": date(2023, 1, 1) + timedelta(days=i), "value": v} for i, v in enumerate(values)]
+
+def _trade_log(pnls):
+    trades = []
+    for i, pnl in enumerate(pnls):
+        timestamp = date(2023, 1, 1) + timedelta(days=2 * i)
+        trades.append({"timestamp": timestamp, "symbol": "AAPL", "direction": "BUY", "quantity": 10, "price": 100.0, "commission": 0.0})
+        trades.append({"timestamp": timestamp + timedelta(days=1), "symbol": "AAPL", "direction": "SELL", "quantity": 10, "price": 100.0 + pnl / 10, "commission": 0.0})
+    return trades
+
+def test_stationary_bootstrap_continues_blocks_and_wraps():
+    indices = stationary_bootstrap_indices(50, 200, 5.0, np.random.default_rng(1))
+
+    assert indices.shape == (200, 50)
+    assert indices.min() >= 0 and indices.max() < 50
+    steps = np.diff(indices, axis=1)
+    continued = (steps == 1) | (steps == -49)
+    # About one block start in every mean_block_length days
+    assert continued.mean() == pytest.approx(0.8, abs=0.03)
+
+def test_return_bootstrap_distributions_bracket_the_realized_path(daily_values):
+    chunked = bootstrap_daily_returns(daily_values, num_resamples=500, chunk_size=64, seed=3)
+    whole = bootstrap_daily_returns(daily_values, num_resamples=500, chunk_size=500, seed=3)
+
+    assert set(chunked) == {"sharpe_ratio", "max_drawdown", "terminal_wealth"}
+    assert len(chunked["sharpe_ratio"]) == 500
+    assert np.all(chunked["max_drawdown"] <= 0)
+    final_value = daily_values[-1]["value"]
+    assert np.percentile(chunked["terminal_wealth"], 5) < final_value < np.percentile(chunked["terminal_wealth"], 95)
+    assert np.median(chunked["sharpe_ratio"]) == pytest.approx(np.median(whole["sharpe_ratio"]), abs=0.3)
+
+def test_whole_series_blocks_keep_sharpe_and_terminal_wealth(daily_values):
+    # One block per resample only rotates the returns, which keeps their product and dispersion
+    samples = bootstrap_daily_returns(daily_values, num_resamples=50, mean_block_length=1e12, seed=5)
+
+    values = np.array([dv["value"] for dv in daily_values])
+    returns = values[1:] / values[:-1] - 1
+    expected_sharpe = ((values[-1] / values[0]) ** (252 / len(returns)) - 1) / (returns.std(ddof=1) * np.sqrt(252))
+    np.testing.assert_allclose(samples["terminal_wealth"], values[-1])
+    np.testing.assert_allclose(samples["sharpe_ratio"], expected_sharpe)
+
+def test_trade_shuffling_only_moves_the_drawdown():
+    trade_log = _trade_log([500.0, -300.0, 200.0, -800.0, 400.0, -100.0, 900.0, -600.0])
+
+    shuffled = resample_trades(trade_log, 10_000.0, num_resamples=300, chunk_size=100, seed=11)
+    np.testing.assert_allclose(shuffled["terminal_wealth"], 10_200.0)
+    assert np.ptp(shuffled["sharpe_ratio"]) == pytest.approx(0.0, abs=1e-12)
+    # Worst case: all losses in a row at the start
+    assert shuffled["max_drawdown"].min() >= -0.18 - 1e-12
+    assert np.ptp(shuffled["max_drawdown"]) > 0
+
+    bootstrapped = resample_trades(trade_log, 10_000.0, num_resamples=300, replace=True, seed=11)
+    assert np.ptp(bootstrapped["terminal_wealth"]) > 0
+
+    summary = summarize_distribution(bootstrapped)
+    assert summary["terminal_wealth"]["p5"] <= summary["terminal_wealth"]["p50"] <= summary["terminal_wealth"]["p95"]
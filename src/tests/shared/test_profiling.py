@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.synthetic import generate_bar_store
+from alpheast.engine import BacktestingEngine
+from alpheast.models.interval import Interval
+from alpheast.shared.profiling import EngineProfiler, component_names
+from alpheast.strategy.common.rsi_strategy import RSIStrategy
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+pytestmark = pytest.mark.usefixtures("quiet_logging")
+
+def _run(profile):
+    store = generate_bar_store(["AAPL", "MSFT"], 200, seed=4)
+    options = BacktestingOptions(
+        symbols=["AAPL", "MSFT"], start_date=datetime(2020, 1, 1), end_date=datetime(2021, 1, 1), interval=Interval.DAILY,
+        initial_cash=100_000.0
+    )
+    return BacktestingEngine(
+        options=options,
+        data_source=DataSource(type=DataSourceType.DIRECT, bar_store=store),
+        strategies=[SMACrossoverStrategy("AAPL", 5, 20), SMACrossoverStrategy("MSFT", 5, 20), RSIStrategy("AAPL")],
+        profile=profile
+    ).run()
+
+def test_profiler_records_calls_and_percentiles():
+    profiler = EngineProfiler()
+    for _ in range(10):
+        assert profiler.call("PortfolioManager", "FILL", lambda x: x + 1, 1) == 2
+    profiler.record_event("FILL", 3)
+    profiler.record_event("FILL", 1)
+
+    report = profiler.report()
+
+    stats = report.components[("PortfolioManager", "FILL")]
+    assert stats["calls"] == 10
+    assert 0 <= stats["p50_us"] <= stats["p99_us"] <= stats["max_us"]
+    assert report.event_counts == {"FILL": 2}
+    assert report.queue_depth["max"] == 3
+    assert report.to_frame().index.names == ["component", "event_type"]
+
+def test_component_names_are_unique():
+    strategies = [SMACrossoverStrategy("AAPL"), SMACrossoverStrategy("AAPL"), RSIStrategy("MSFT")]
+    assert component_names(strategies) == ["SMACrossoverStrategy(AAPL)", "SMACrossoverStrategy(AAPL)#2", "RSIStrategy(MSFT)"]
+
+def test_profiled_run_reports_components_without_changing_results():
+    plain = _run(profile=False)
+    profiled = _run(profile=True)
+
+    assert plain.profiling_report is None
+    without_order_ids = lambda trade_log: [{k: v for k, v in trade.items() if k != "order_id"} for trade in trade_log]
+    assert without_order_ids(profiled.trade_log) == without_order_ids(plain.trade_log)
+    assert profiled.daily_values == plain.daily_values
+
+    report = profiled.profiling_report
+    market_events = report.event_counts["MARKET"]
+    assert market_events == 400
+    for component in ["IndicatorRegistry", "SMACrossoverStrategy(AAPL)", "RSIStrategy(AAPL)", "PortfolioManager", "SimulatedExecutionHandler"]:
+        assert report.components[(component, "MARKET")]["calls"] == market_events
+    assert report.components[("PortfolioManager", "FILL")]["calls"] == report.event_counts["FILL"] == len(profiled.trade_log)
+    assert report.components[("DataHandler", "STREAM")]["calls"] >= 200
+    assert report.components[("PortfolioManager", "TIMESTAMP_END")]["calls"] >= 200
+    assert report.queue_depth["max"] >= 1
+    assert report.wall_time_seconds > 0
@@ -0,0 +1,88 @@
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.synthetic import generate_bar_store
+from alpheast.engine import BacktestingEngine
+from alpheast.models.interval import Interval
+from alpheast.shared.rolling_metrics import calculate_rolling_metrics
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+@pytest.fixture
+def equity_curves():
+    rng = np.random.default_rng(42)
+    benchmark_returns = rng.normal(0.0004, 0.012, 300)
+    strategy_returns = 0.6 * benchmark_returns + rng.normal(0.0002, 0.006, 300)
+    dates = [date(2023, 1, 1) + timedelta(days=i) for i in range(301)]
+
+    strategy_values = 100_000.0 * np.cumprod(np.concatenate(([1.0], 1 + strategy_returns)))
+    benchmark_values = 100_000.0 * np.cumprod(np.concatenate(([1.0], 1 + benchmark_returns)))
+
+    daily_values = [{"date": d, "value": Decimal(str(v))} for d, v in zip(dates, strategy_values)]
+    benchmark_daily_values = [{"date": d, "value": Decimal(str(v))} for d, v in zip(dates, benchmark_values)]
+    return daily_values, benchmark_daily_values
+
+def test_rolling_metrics_match_pandas(equity_curves):
+    daily_values, benchmark_daily_values = equity_curves
+    window = 21
+
+    result = calculate_rolling_metrics(daily_values, window, benchmark_daily_values)
+
+    values = pd.Series([float(dv["value"]) for dv in daily_values])
+    benchmark = pd.Series([float(bv["value"]) for bv in benchmark_daily_values])
+    returns = values.pct_change()
+    benchmark_returns = benchmark.pct_change()
+
+    expected_volatility = returns.rolling(window - 1).std() * np.sqrt(252)
+    expected_sharpe = returns.rolling(window - 1).mean() / returns.rolling(window - 1).std() * np.sqrt(252)
+    expected_drawdown = values / values.rolling(window).max() - 1
+    expected_beta = returns.rolling(window - 1).cov(benchmark_returns) / benchmark_returns.rolling(window - 1).var()
+
+    assert result["window"] == window
+    assert len(result["dates"]) == len(daily_values)
+    np.testing.assert_allclose(result["volatility"], expected_volatility, rtol=1e-8, equal_nan=True)
+    np.testing.assert_allclose(result["sharpe_ratio"], expected_sharpe, rtol=1e-7, equal_nan=True)
+    np.testing.assert_allclose(result["drawdown"], expected_drawdown, rtol=1e-10, atol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(result["beta"], expected_beta, rtol=1e-7, equal_nan=True)
+
+def test_rolling_metrics_warm_up_is_nan(equity_curves):
+    daily_values, _ = equity_curves
+    result = calculate_rolling_metrics(daily_values, 10)
+
+    assert np.isnan(result["volatility"][:9]).all()
+    assert np.isfinite(result["volatility"][9:]).all()
+    assert np.isnan(result["drawdown"][:9]).all()
+    assert np.isnan(result["beta"]).all()
+
+def test_rolling_metrics_short_series():
+    daily_values = [{"date": date(2023, 1, d), "value": 100.0} for d in range(1, 4)]
+    result = calculate_rolling_metrics(daily_values, 10)
+
+    assert np.isnan(result["volatility"]).all()
+    assert np.isnan(result["drawdown"]).all()
+
+def test_rolling_metrics_invalid_window(equity_curves):
+    daily_values, _ = equity_curves
+    with pytest.raises(ValueError, match="Rolling window must be at least 3."):
+        calculate_rolling_metrics(daily_values, 1)
+    # Two values span a single return, which has no sample standard deviation
+    with pytest.raises(ValueError, match="Rolling window must be at least 3."):
+        calculate_rolling_metrics(daily_values, 2)
+
+@pytest.mark.parametrize("rolling_windows", [[21, 2], [2.5], ["21"]])
+def test_engine_rejects_invalid_windows_at_construction(rolling_windows):
+    options = BacktestingOptions(
+        symbols=["AAPL"], start_date=datetime(2020, 1, 1), end_date=datetime(2021, 1, 1), interval=Interval.DAILY,
+        initial_cash=100_000.0
+    )
+    data_source = DataSource(type=DataSourceType.DIRECT, bar_store=generate_bar_store(["AAPL"], 50, seed=1))
+
+    with pytest.raises(ValueError, match="at least 3"):
+        BacktestingEngine(options, data_source, [SMACrossoverStrategy("AAPL", 5, 20)], rolling_windows=rolling_windows)
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+import urllib.request
+
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.config.telemetry_config import TelemetryConfig
+from alpheast.data.synthetic import generate_bar_store
+from alpheast.engine import BacktestingEngine
+from alpheast.models.interval import Interval
+from alpheast.shared.telemetry import TelemetryExporter, format_prometheus
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+pytestmark = pytest.mark.usefixtures("quiet_logging")
+
+def _snapshot(processed=10):
+    return {
+        "event_counts": {"MARKET": 8, "FILL": 2},
+        "events_processed": processed,
+        "queue_depth": 3,
+        "open_orders": 1,
+        "pending_orders": 2,
+        "simulated_time": datetime(2024, 1, 2),
+    }
+
+def _parse(text):
+    return {line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if not line.startswith("#")}
+
+def test_prometheus_text_format():
+    text = format_prometheus(
+        {"alpheast_events_total": [({"type": "MARKET"}, 8)], "alpheast_event_queue_depth": 3},
+        labels={"run": 'a"b'}
+    )
+
+    assert "# TYPE alpheast_events_total counter" in text
+    assert "# TYPE alpheast_event_queue_depth gauge" in text
+    assert 'alpheast_events_total{run="a\\"b",type="MARKET"} 8.0' in text
+    assert text.endswith("\n")
+
+def test_config_needs_an_output():
+    with pytest.raises(ValueError):
+        TelemetryConfig()
+
+def test_exporter_serves_metrics_over_http(tmp_path):
+    config = TelemetryConfig(interval_seconds=60, file_path=str(tmp_path / "metrics.prom"), http_port=0)
+    exporter = TelemetryExporter(config, _snapshot)
+    exporter.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{exporter.http_port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    finally:
+        exporter.stop()
+
+    samples = _parse(body)
+    assert samples['alpheast_events_total{type="FILL"}'] == 2
+    assert samples["alpheast_pending_orders"] == 2
+    assert samples["alpheast_simulated_time_seconds"] == datetime(2024, 1, 2, tzinfo=timezone.utc).timestamp()
+    assert samples["alpheast_lag_seconds"] > 0
+    assert (tmp_path / "metrics.prom").read_text().startswith("# HELP")
+    assert exporter.http_port is None
+
+def test_engine_publishes_final_counters_to_file(tmp_path):
+    store = generate_bar_store(["AAPL"], 150, seed=2)
+    path = tmp_path / "alpheast.prom"
+    engine = BacktestingEngine(
+        options=BacktestingOptions(
+            symbols=["AAPL"], start_date=datetime(2020, 1, 1), end_date=datetime(2021, 1, 1), interval=Interval.DAILY,
+            initial_cash=100_000.0
+        ),
+        data_source=DataSource(type=DataSourceType.DIRECT, bar_store=store),
+        strategies=[SMACrossoverStrategy("AAPL", 5, 20)],
+        telemetry=TelemetryConfig(interval_seconds=0.01, file_path=str(path), labels={"run": "test"})
+    )
+
+    results = engine.run()
+
+    samples = _parse(path.read_text())
+    assert samples['alpheast_events_total{run="test",type="MARKET"}'] == 150
+    assert samples['alpheast_events_total{run="test",type="FILL"}'] == len(results.trade_log)
+    assert samples['alpheast_events_processed_total{run="test"}'] == engine.event_queue.total_events
+    assert samples['alpheast_event_queue_depth{run="test"}'] == 0
+    assert not engine.telemetry.is_running
@@ -0,0 +1,65 @@
+from datetime import datetime
+import gzip
+import json
+
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.config.trace_config import TraceConfig
+from alpheast.data.synthetic import generate_bar_store
+from alpheast.engine import BacktestingEngine
+from alpheast.models.interval import Interval
+from alpheast.shared.tracing import EventTracer
+from alpheast.strategy.common.sma_crossover_strategy import SMACrossoverStrategy
+
+
+pytestmark = pytest.mark.usefixtures("quiet_logging")
+
+def _engine(trace, profile=False):
+    store = generate_bar_store(["AAPL", "MSFT"], 120, seed=6)
+    return BacktestingEngine(
+        options=BacktestingOptions(
+            symbols=["AAPL", "MSFT"], start_date=datetime(2020, 1, 1), end_date=datetime(2021, 1, 1), interval=Interval.DAILY,
+            initial_cash=100_000.0
+        ),
+        data_source=DataSource(type=DataSourceType.DIRECT, bar_store=store),
+        strategies=[SMACrossoverStrategy("AAPL", 5, 20), SMACrossoverStrategy("MSFT", 5, 20)],
+        profile=profile,
+        trace=trace
+    )
+
+def test_tracer_only_records_sampled_timestamps():
+    tracer = EventTracer(TraceConfig("unused.json", sample_every=3, max_timestamps=2))
+    for i in range(9):
+        tracer.begin_timestamp()
+        assert tracer.call("Strategy", "MARKET", lambda x: x * 2, i) == 2 * i
+        tracer.end_timestamp(i)
+
+    events = [event for event in tracer.to_trace_events()["traceEvents"] if event["ph"] == "X"]
+    assert [event["args"]["timestamp"] for event in events if event["name"] == "timestamp"] == ["0", "3"]
+    assert sum(event["name"] == "Strategy" for event in events) == 2
+
+def test_engine_writes_nested_chrome_trace(tmp_path):
+    path = tmp_path / "trace.json.gz"
+    results = _engine(TraceConfig(str(path), sample_every=10), profile=True).run()
+
+    with gzip.open(path, "rt") as f:
+        trace = json.load(f)
+
+    assert trace["otherData"]["timestamps"] == 120
+    assert trace["otherData"]["sampled_timestamps"] == 12
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    timestamps = [span for span in spans if span["name"] == "timestamp"]
+    assert len(timestamps) == 12
+
+    # Every handler span lies inside an event span, and every event span inside a timestamp span
+    events = [span for span in spans if span["cat"] == "event"]
+    handlers = [span for span in spans if span["cat"] not in ("event", "timestamp")]
+    contains = lambda outer, inner: outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1e-3
+    assert all(any(contains(timestamp, event) for timestamp in timestamps) for event in events)
+    assert all(any(contains(event, handler) for event in events) or handler["cat"] in ("STREAM", "TIMESTAMP_END") for handler in handlers)
+    assert {"SMACrossoverStrategy(AAPL)", "PortfolioManager", "DataHandler"} <= {span["name"] for span in handlers}
+
+    # Profiling still sees every timestamp
+    assert results.profiling_report.event_counts["MARKET"] == 240
@@ -0,0 +1,131 @@
+
+from collections import deque
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from alpheast.models.price_bar import PriceBar
+from alpheast.models.signal import Signal
+from alpheast.shared.trade_analytics import calculate_round_trips, calculate_trade_metrics
+
+
+def _fill(day: int, symbol: str, direction: Signal, quantity: str, price: str, commission: str = "0"):
+    return {
+        "timestamp": datetime(2023, 1, 1) + timedelta(days=day),
+        "symbol": symbol,
+        "direction": direction,
+        "quantity": Decimal(quantity),
+        "price": Decimal(price),
+        "commission": Decimal(commission),
+        "successful": True,
+    }
+
+def _reference_realized_pnl(trade_log):
+    """Plain lot-by-lot FIFO matching, long only."""
+    lots = {}
+    realized = 0.0
+    for trade in trade_log:
+        symbol_lots = lots.setdefault(trade["symbol"], deque())
+        quantity, price = float(trade["quantity"]), float(trade["price"])
+        if trade["direction"] == Signal.BUY:
+            symbol_lots.append([quantity, price])
+            continue
+        while quantity > 0:
+            lot = symbol_lots[0]
+            matched = min(lot[0], quantity)
+            realized += matched * (price - lot[1])
+            lot[0] -= matched
+            quantity -= matched
+            if lot[0] == 0:
+                symbol_lots.popleft()
+    return realized
+
+def test_round_trips_partial_fifo_matching():
+    trade_log = [
+        _fill(0, "AAPL", Signal.BUY, "10", "100", "1"),
+        _fill(1, "AAPL", Signal.BUY, "5", "110"),
+        _fill(2, "AAPL", Signal.SELL, "12", "120", "1.2"),
+        _fill(3, "AAPL", Signal.SELL, "3", "90"),
+    ]
+    round_trips = calculate_round_trips(trade_log)
+
+    np.testing.assert_allclose(round_trips["quantity"], [10, 2, 3])
+    np.testing.assert_allclose(round_trips["entry_price"], [100, 110, 110])
+    np.testing.assert_allclose(round_trips["exit_price"], [120, 120, 90])
+    np.testing.assert_allclose(round_trips["commission"], [1 + 1.0, 0.2, 0.0])
+    np.testing.assert_allclose(round_trips["pnl"], [200 - 2.0, 20 - 0.2, -60])
+    np.testing.assert_allclose(round_trips["holding_period_days"], [2, 1, 2])
+    assert (round_trips["direction"] == 1).all()
+
+def test_round_trips_short_positions():
+    trade_log = [
+        _fill(0, "TSLA", Signal.SELL, "4", "200"),
+        _fill(3, "TSLA", Signal.BUY, "4", "150"),
+    ]
+    round_trips = calculate_round_trips(trade_log)
+
+    assert round_trips["direction"].tolist() == [-1]
+    assert round_trips["entry_price"][0] == 200
+    assert round_trips["pnl"][0] == pytest.approx(200.0)
+    assert round_trips["holding_period_days"][0] == 3
+
+def test_round_trips_match_reference_fifo():
+    rng = np.random.default_rng(3)
+    trade_log = []
+    holdings = {"A": 0, "B": 0, "C": 0}
+    for day in range(400):
+        symbol = str(rng.choice(list(holdings)))
+        if holdings[symbol] > 0 and rng.random() < 0.45:
+            quantity = int(rng.integers(1, holdings[symbol] + 1))
+            holdings[symbol] -= quantity
+            trade_log.append(_fill(day, symbol, Signal.SELL, str(quantity), str(round(rng.uniform(50, 150), 2))))
+        else:
+            quantity = int(rng.integers(1, 20))
+            holdings[symbol] += quantity
+            trade_log.append(_fill(day, symbol, Signal.BUY, str(quantity), str(round(rng.uniform(50, 150), 2))))
+
+    round_trips = calculate_round_trips(trade_log)
+
+    assert round_trips["pnl"].sum() == pytest.approx(_reference_realized_pnl(trade_log))
+    sold = sum(float(t["quantity"]) for t in trade_log if t["direction"] == Signal.SELL)
+    assert round_trips["quantity"].sum() == pytest.approx(sold)
+    assert (round_trips["holding_period_days"] >= 0).all()
+
+def test_round_trips_excursions_from_price_bars():
+    bars = {
+        "MSFT": [
+            PriceBar("MSFT", datetime(2023, 1, 1) + timedelta(days=d), Decimal("100"), Decimal(high), Decimal(low), Decimal("100"), Decimal("1000"))
+            for d, (high, low) in enumerate([("101", "99"), ("108", "95"), ("112", "97"), ("130", "60")])
+        ]
+    }
+    trade_log = [
+        _fill(0, "MSFT", Signal.BUY, "1", "100"),
+        _fill(2, "MSFT", Signal.SELL, "1", "105"),
+    ]
+    round_trips = calculate_round_trips(trade_log, bars)
+
+    assert round_trips["mae"][0] == pytest.approx(-0.05)
+    assert round_trips["mfe"][0] == pytest.approx(0.12)
+
+def test_trade_metrics_summary():
+    trade_log = [
+        _fill(0, "AAPL", Signal.BUY, "10", "100"),
+        _fill(1, "AAPL", Signal.SELL, "10", "110"),
+        _fill(2, "AAPL", Signal.BUY, "10", "100"),
+        _fill(4, "AAPL", Signal.SELL, "10", "95"),
+    ]
+    metrics = calculate_trade_metrics(calculate_round_trips(trade_log))
+
+    assert metrics["round_trips"] == 2
+    assert metrics["win_rate"] == 50.0
+    assert metrics["profit_factor"] == 2.0
+    assert metrics["realized_pnl"] == 50.0
+    assert metrics["average_holding_period_days"] == 1.5
+    assert metrics["average_mae"] == "N/A"
+
+def test_trade_metrics_empty_trade_log():
+    metrics = calculate_trade_metrics(calculate_round_trips([]))
+    assert metrics["round_trips"] == 0
+    assert metrics["win_rate"] == "N/A"
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from alpheast.events.event import MarketEvent
+from alpheast.events.event_enums import EventType
+from alpheast.events.event_queue import EventQueue
+from alpheast.models.signal import Signal
+from alpheast.strategy.cross_sectional_strategy import CrossSectionalStrategy
+
+
+class RecordingStrategy(CrossSectionalStrategy):
+    def __init__(self, symbols, **kwargs):
+        super().__init__(symbols, **kwargs)
+        self.cross_sections = []
+
+    def on_cross_section(self, cross_section):
+        self.cross_sections.append(cross_section)
+
+@pytest.fixture
+def strategy():
+    strategy = RecordingStrategy(["AAPL", "MSFT", "GOOG"])
+    strategy.set_event_queue(Mock(spec=EventQueue))
+    return strategy
+
+def _bar(symbol, timestamp, close):
+    return MarketEvent(symbol, timestamp, {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 100})
+
+def test_cross_section_is_aligned_with_validity_mask(strategy):
+    timestamp = datetime(2023, 1, 2)
+    strategy.on_market_event(_bar("GOOG", timestamp, 30.0))
+    strategy.on_market_event(_bar("TSLA", timestamp, 99.0))
+    strategy.on_market_event(_bar("AAPL", timestamp, 10.0))
+    assert strategy.cross_sections == []
+
+    strategy.on_timestamp_end()
+
+    cross_section = strategy.cross_sections[0]
+    assert cross_section.timestamp == timestamp
+    np.testing.assert_array_equal(cross_section.close, [10.0, np.nan, 30.0])
+    np.testing.assert_array_equal(cross_section.high, [11.0, np.nan, 31.0])
+    np.testing.assert_array_equal(cross_section.valid, [True, False, True])
+
+def test_one_call_per_timestamp_and_fresh_arrays(strategy):
+    start = datetime(2023, 1, 2)
+    for day in range(2):
+        for symbol in strategy.symbols:
+            strategy.on_market_event(_bar(symbol, start + timedelta(days=day), 10.0 + day))
+        strategy.on_timestamp_end()
+    strategy.on_timestamp_end()
+
+    assert len(strategy.cross_sections) == 2
+    np.testing.assert_array_equal(strategy.cross_sections[0].close, [10.0, 10.0, 10.0])
+    np.testing.assert_array_equal(strategy.cross_sections[1].close, [11.0, 11.0, 11.0])
+
+def test_timestamp_change_flushes_without_engine(strategy):
+    strategy.on_market_event(_bar("AAPL", datetime(2023, 1, 2), 10.0))
+    strategy.on_market_event(_bar("AAPL", datetime(2023, 1, 3), 11.0))
+
+    assert len(strategy.cross_sections) == 1
+    assert strategy.cross_sections[0].timestamp == datetime(2023, 1, 2)
+
+def test_batch_signals_and_target_weights(strategy):
+    timestamp = datetime(2023, 1, 2)
+    strategy._put_signal_events(timestamp, {"AAPL": Signal.BUY, "GOOG": Signal.SELL})
+    strategy._put_target_weight_array(timestamp, np.array([0.5, np.nan, -0.25]))
+
+    events = [call.args[0] for call in strategy.event_queue.put.call_args_list]
+    assert [(e.symbol, e.direction) for e in events[:2]] == [("AAPL", Signal.BUY), ("GOOG", Signal.SELL)]
+    assert events[2].type == EventType.TARGET_WEIGHTS
+    weights = events[2].weights
+    assert list(weights) == ["AAPL", "MSFT", "GOOG"]
+    assert weights["AAPL"] == 0.5 and weights["GOOG"] == -0.25
+    # NaN is passed on, so the PortfolioManager keeps the position instead of closing it
+    assert np.isnan(weights["MSFT"])
+
+    with pytest.raises(ValueError):
+        strategy._put_target_weight_array(timestamp, np.array([0.5]))
+
+def test_requires_symbols():
+    with pytest.raises(ValueError):
+        RecordingStrategy([])
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from alpheast.config.backtest_config import BacktestingOptions
+from alpheast.config.data_source import DataSource, DataSourceType
+from alpheast.data.bar_store import BarStore
+from alpheast.data.synthetic import synthetic_timestamps
+from alpheast.engine import BacktestingEngine
+from alpheast.events.event import MarketEvent
+from alpheast.events.event_queue import EventQueue
+from alpheast.models.interval import Interval
+from alpheast.models.signal import Signal
+from alpheast.strategy.common.pairs_trading_strategy import PairsTradingStrategy
+from alpheast.strategy.multi_symbol_strategy import MultiSymbolStrategy
+
+
+class RecordingStrategy(MultiSymbolStrategy):
+    def __init__(self, symbols, **kwargs):
+        super().__init__(symbols, **kwargs)
+        self.fired = []
+
+    def on_bars(self, timestamp):
+        self.fired.append(timestamp)
+
+def _bar(symbol, timestamp, close):
+    return MarketEvent(symbol, timestamp, {"open": close, "high": close, "low": close, "close": close, "volume": 1})
+
+def test_fires_once_all_legs_arrived():
+    strategy = RecordingStrategy(["AAPL", "MSFT"], window=3)
+    timestamp = datetime(2023, 1, 2)
+
+    strategy.on_market_event(_bar("AAPL", timestamp, 10.0))
+    strategy.on_market_event(_bar("GOOG", timestamp, 99.0))
+    assert strategy.fired == []
+
+    strategy.on_market_event(_bar("MSFT", timestamp, 20.0))
+    assert strategy.fired == [timestamp]
+    np.testing.assert_array_equal(strategy.get_latest("close"), [10.0, 20.0])
+
+def test_incomplete_timestamp_is_dropped():
+    strategy = RecordingStrategy(["AAPL", "MSFT"], window=3)
+    start = datetime(2023, 1, 2)
+
+    strategy.on_market_event(_bar("AAPL", start, 10.0))
+    strategy.on_market_event(_bar("AAPL", start + timedelta(days=1), 11.0))
+    strategy.on_market_event(_bar("MSFT", start + timedelta(days=1), 21.0))
+
+    assert strategy.fired == [start + timedelta(days=1)]
+    assert strategy.history_length == 1
+    np.testing.assert_array_equal(strategy.get_history("close"), [[11.0, 21.0]])
+
+def test_ring_buffer_keeps_last_window_in_order():
+    strategy = RecordingStrategy(["AAPL", "MSFT"], window=3)
+    start = datetime(2023, 1, 2)
+    for day in range(5):
+        strategy.on_market_event(_bar("AAPL", start + timedelta(days=day), float(day)))
+        strategy.on_market_event(_bar("MSFT", start + timedelta(days=day), float(10 + day)))
+
+    assert strategy.history_length == 3
+    np.testing.assert_array_equal(strategy.get_history("close"), [[2.0, 12.0], [3.0, 13.0], [4.0, 14.0]])
+    np.testing.assert_array_equal(strategy.get_history("close", length=2)[:, 0], [3.0, 4.0])
+
+def test_invalid_legs():
+    with pytest.raises(ValueError):
+        RecordingStrategy(["AAPL"])
+    with pytest.raises(ValueError):
+        RecordingStrategy(["AAPL", "AAPL"])
+
+def test_pairs_strategy_trades_both_legs_on_divergence():
+    strategy = PairsTradingStrategy("AAPL", "MSFT", lookback=20, entry_z=2.0, exit_z=0.5)
+    strategy.set_event_queue(Mock(spec=EventQueue))
+
+    rng = np.random.default_rng(4)
+    common = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 40)))
+    first = common * np.exp(rng.normal(0, 0.001, 40))
+    first[30] *= 1.05 # first leg spikes away from the second
+    start = datetime(2023, 1, 2)
+    for day in range(31):
+        strategy.on_market_event(_bar("AAPL", start + timedelta(days=day), first[day]))
+        strategy.on_market_event(_bar("MSFT", start + timedelta(days=day), common[day]))
+
+    signals = [(call.args[0].symbol, call.args[0].direction) for call in strategy.event_queue.put.call_args_list]
+    assert signals == [("AAPL", Signal.SELL), ("MSFT", Signal.BUY)]
+
+def _pair_engine(strategy, margin_config=None):
+    rng = np.random.default_rng(4)
+    common = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 120)))
+    first = common.copy()
+    first[60:63] *= 0.95 # the spread drops for three days, then reverts
+    timestamps = synthetic_timestamps(datetime(2023, 1, 2), 120, Interval.DAILY)
+    store = BarStore({
+        symbol: {"timestamp": timestamps, "open": close, "high": close, "low": close, "close": close, "volume": np.ones(120)}
+        for symbol, close in [("AAPL", first), ("MSFT", common)]
+    })
+    options = BacktestingOptions(
+        symbols=["AAPL", "MSFT"], start_date=datetime(2023, 1, 1), end_date=datetime(2024, 1, 1), interval=Interval.DAILY,
+        initial_cash=100_000.0
+    )
+    return BacktestingEngine(options=options, data_source=DataSource(type=DataSourceType.DIRECT, bar_store=store), strategies=[strategy], margin_config=margin_config)
+
+def test_pairs_strategy_without_shorting_ends_flat():
+    engine = _pair_engine(PairsTradingStrategy("AAPL", "MSFT", lookback=20, entry_z=2.0, exit_z=0.5, allow_short=False))
+    results = engine.run()
+
+    # Only the long leg is traded, and the exit closes it without opening the other leg
+    assert [(trade["symbol"], trade["direction"]) for trade in results.trade_log] == [("AAPL", Signal.BUY), ("AAPL", Signal.SELL)]
+    assert all(quantity == Decimal("0") for quantity in engine.portfolio_manager.portfolio_account.holdings.values())
+
+def test_pairs_strategy_needs_shorting_to_trade_both_legs():
+    with pytest.raises(ValueError):
+        _pair_engine(PairsTradingStrategy("AAPL", "MSFT", lookback=20))